@@ -5,6 +5,15 @@ The heavy data lives in two places:
   * `analysis/_cache/*.parquet` — the SCD2 ownership ledger and KTC pick values,
     pre-built locally because the silver versions aren't deployed yet
     (PR #4 jobs haven't run). Rebuild via the prebuild script if stale.
+  * `analysis/_cache/value_cube/` — the ledger valued per lens on a date grid
+    (`load_value_cube`), which the measures read; refreshed incrementally on load.
+  * `analysis/_cache/objects/` — the bronze read cache that `_read_prefix` goes through. It is
+    keyed by GCS generation, so it is never stale. Size it via `LAKE_CACHE_MAX_BYTES` and
+    check it with `lake_cache_stats()`.
+  * process memory — the `load_*` loaders keep their results for the session, re-reading
+    only when the source's generations move or `LOADER_CACHE_TTL` passes. Size it via
+    `LOADER_CACHE_MAX_BYTES`, check it with `loader_cache_stats()`, drop it with
+    `clear_loader_cache()`.
 
 Value lenses: KTC (deep history, ~2022→ players / ~2020→ picks) and FantasyCalc
 (better market signal, only ~2025-10→). Picks are valued at the ROUND level for both
@@ -13,97 +22,294 @@ standings-based tier/slot refinement is a documented v2 knob, not baked in here.
 """
 from __future__ import annotations
 
-import re
+import functools
+import inspect
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
 
 import polars as pl
-from google.cloud import storage
 
 BUCKET = "nfl-data-bronze"
 CACHE = Path(__file__).resolve().parent / "_cache"
+os.environ.setdefault("LAKE_CACHE_DIR", str(CACHE / "objects"))
 
 # default valuation lens (these leagues are superflex; verified via dim_league_settings)
 DEFAULT_QB_FORMAT = "SF"
 DEFAULT_TE_PREMIUM = "Standard"
 DEFAULT_MARKET = "DYNASTY"
+# dates of holdings the measures value at once (bounds memory on daily grids)
+HOLDINGS_CHUNK_DAYS = 64
+# session loader cache: results older than LOADER_CACHE_TTL seconds are reloaded, sources are
+# re-checked for new generations after LOADER_CACHE_RECHECK seconds, and least recently used
+# results are dropped past LOADER_CACHE_MAX_BYTES (estimated frame sizes)
+LOADER_CACHE_TTL = float(os.environ.get("LOADER_CACHE_TTL", 12 * 3600))
+LOADER_CACHE_RECHECK = float(os.environ.get("LOADER_CACHE_RECHECK", 60))
+LOADER_CACHE_MAX_BYTES = int(os.environ.get("LOADER_CACHE_MAX_BYTES", 4 * 1024 ** 3))
 
 
 # --------------------------------------------------------------------------- IO
-def _read_prefix(prefix: str, suffix: str = ".parquet", how: str = "diagonal_relaxed") -> pl.DataFrame:
-    """Read+concat every blob under a GCS prefix (robust vs glob path-expansion).
-    Recovers hive partition columns (``key=value`` path segments) that aren't in the files."""
-    client = storage.Client()
-    names = sorted(b.name for b in client.bucket(BUCKET).list_blobs(prefix=prefix)
-                   if b.name.endswith(suffix))
-    if not names:
-        return pl.DataFrame()
-    frames = []
-    for n in names:
-        df = pl.read_parquet(f"gs://{BUCKET}/{n}")
-        for seg in n.split("/"):
-            if "=" in seg:
-                k, v = seg.split("=", 1)
-                if k not in df.columns:
-                    df = df.with_columns(pl.lit(v).alias(k))
-        frames.append(df)
-    return pl.concat(frames, how=how)
+_SILVER = Path(__file__).resolve().parent.parent / "data_engineering" / "silver_fantasy"
+_silver_modules: dict = {}
+
+
+def _silver_module(name: str):
+    """Import a silver_fantasy module by file path (the silver jobs aren't a package). The
+    directory goes on ``sys.path`` for the library modules' bare imports of each other."""
+    if name not in _silver_modules:
+        import importlib.util
+        import sys
+        if str(_SILVER) not in sys.path:
+            sys.path.append(str(_SILVER))
+        spec = importlib.util.spec_from_file_location(name, _SILVER / f"{name}.py")
+        m = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(m)
+        _silver_modules[name] = m
+    return _silver_modules[name]
 
 
-def load_ledger() -> pl.DataFrame:
-    """SCD2 ownership ledger from production silver (franchise_id, asset_type, asset_id,
-    valid_from, valid_to, is_current). Bare-blob parquet."""
-    return pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/fact_roster_membership")
+def _uri(name: str) -> str:
+    """``gs://BUCKET/<name>`` for the active lake backend (``LAKE_STORAGE``; a local
+    directory mirror lets the notebooks run offline)."""
+    return _silver_module("lake_io").lake_uri(BUCKET, name)
 
 
+def _read_prefix(prefix: str, suffix: str = ".parquet", how: str = "diagonal_relaxed",
+                 columns: list[str] | None = None, predicate: pl.Expr | None = None) -> pl.DataFrame:
+    """Read+concat every blob under a GCS prefix (robust vs glob path-expansion).
+    Recovers hive partition columns (``key=value`` path segments) that aren't in the files.
+    Objects come from the bronze manifest and are fetched concurrently by the shared
+    ``lake_io.read_objects``; ``columns``/``predicate`` are applied per file."""
+    lake_io = _silver_module("lake_io")
+    names = [n for n in lake_io.partition_objects(lake_io.get_bucket(BUCKET), prefix)
+             if n.endswith(suffix)]
+    return lake_io.read_objects(BUCKET, names, columns=columns, predicate=predicate, how=how)
+
+
+def _scan(name: str) -> pl.LazyFrame:
+    """Lazy hive-aware scan of a silver output (single object or partitioned directory).
+    Filter/select on it before ``collect()`` so partitions, row groups and columns the
+    loader doesn't need are skipped at the reader."""
+    return _silver_module("lake_io").scan_dataset(f"gs://{BUCKET}/{name}")
+
+
+def lake_cache_stats() -> dict:
+    """Hit/miss/byte counters of the bronze read cache for this session."""
+    return _silver_module("lake_io").cache_stats()
+
+
+# ---------------------------------------------------------------- session cache
+# (loader, arguments) -> [value, bytes, loaded_at, checked_at, source generations], LRU first
+_loaded: OrderedDict = OrderedDict()
+_loaded_bytes = 0                  # sum of the entries' bytes, kept as they come and go
+_loader_stats = {"hits": 0, "misses": 0, "stale": 0, "evicted": 0}
+# the ledger's version pointer: every ledger run writes it last, so its generation stamps
+# whatever was read from the ledger (listing the ledger prefix would also list the change
+# feed and the state sidecar, which only grow)
+_LEDGER_POINTER = "silver/fantasy/fact_roster_membership.version.json"
+
+
+def _source_generations(prefix: str) -> tuple:
+    """What a cached load of ``prefix`` is valid for: a bronze entity's manifest generation
+    (every commit rewrites the manifest), else the generation of each object under it. Give
+    silver directories with their trailing ``/`` so a sibling's objects aren't listed."""
+    lake_io = _silver_module("lake_io")
+    bucket = lake_io.get_bucket(BUCKET)
+    if prefix.startswith("bronze/"):
+        manifest = bucket.get_blob(f"{lake_io.entity_root(prefix)}/{lake_io.MANIFEST_NAME}")
+        if manifest is not None:
+            return ((manifest.name, manifest.generation),)
+    return tuple((b.name, b.generation) for b in bucket.list_blobs(prefix=prefix))
+
+
+def _nbytes(value) -> int:
+    if isinstance(value, pl.DataFrame):
+        return value.estimated_size()
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(v) for v in value)
+    return 0
+
+
+def _put(key: tuple, entry: list) -> None:
+    global _loaded_bytes
+    _loaded[key] = entry
+    _loaded_bytes += entry[1]
+
+
+def _drop(key: tuple) -> None:
+    global _loaded_bytes
+    _loaded_bytes -= _loaded.pop(key)[1]
+
+
+def _evict(budget: int) -> None:
+    global _loaded_bytes
+    while _loaded and _loaded_bytes > budget:
+        _loaded_bytes -= _loaded.popitem(last=False)[1][1]
+        _loader_stats["evicted"] += 1
+
+
+def _memoized(*prefixes: str):
+    """Keep a loader's results for the session, keyed by loader and arguments, while the lake
+    objects under ``prefixes`` keep their generations. A hit within ``LOADER_CACHE_RECHECK``
+    seconds of the last check costs nothing; after it, one listing (or bronze manifest GET)
+    per prefix. Results are shared between callers: derive new frames, don't mutate them."""
+    def wrap(fn):
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def cached(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__name__, *(tuple(v) if isinstance(v, list) else v for v in bound.arguments.values()))
+            now = time.monotonic()
+            entry = _loaded.get(key)
+            if entry is not None and now - entry[2] < LOADER_CACHE_TTL:
+                if now - entry[3] < LOADER_CACHE_RECHECK:
+                    _loaded.move_to_end(key)
+                    _loader_stats["hits"] += 1
+                    return entry[0]
+                gens = tuple(_source_generations(p) for p in prefixes)
+                if gens == entry[4]:
+                    entry[3] = now
+                    _loaded.move_to_end(key)
+                    _loader_stats["hits"] += 1
+                    return entry[0]
+            if entry is not None:
+                _drop(key)
+                _loader_stats["stale"] += 1
+            _loader_stats["misses"] += 1
+            gens = tuple(_source_generations(p) for p in prefixes)   # before the read: a write
+            value = fn(*args, **kwargs)                              # during it reloads next time
+            size = _nbytes(value)
+            if size <= LOADER_CACHE_MAX_BYTES:
+                _put(key, [value, size, now, now, gens])
+                _evict(LOADER_CACHE_MAX_BYTES)
+            return value
+        return cached
+    return wrap
+
+
+def clear_loader_cache(loader: str | None = None) -> None:
+    """Drop the session cache's results: all of them, or one loader's (by function name).
+    Clearing all of them also zeroes the ``loader_cache_stats()`` counters; clearing one
+    loader keeps them."""
+    for key in [k for k in _loaded if loader is None or k[0] == loader]:
+        _drop(key)
+    if loader is None:
+        _loader_stats.update(dict.fromkeys(_loader_stats, 0))
+
+
+def loader_cache_stats() -> dict:
+    """Session loader cache: entries, bytes held and hit/miss/stale/evicted counters."""
+    return {"entries": len(_loaded), "bytes": _loaded_bytes, **_loader_stats}
+
+
+@_memoized(_LEDGER_POINTER)
+def load_ledger() -> pl.DataFrame:
+    """SCD2 ownership ledger from production silver (franchise_id, asset_type, asset_id,
+    valid_from, valid_to, is_current). Bare blob or ``asset_type=`` partitions."""
+    return _scan("silver/fantasy/fact_roster_membership").collect()
+
+
+def ledger_version() -> dict:
+    """The ledger's version pointer (``version``, ``run_id``, ``change_counts``...); ``{}``
+    before the first versioned run."""
+    lake_io = _silver_module("lake_io")
+    blob = lake_io.get_bucket(BUCKET).get_blob(_LEDGER_POINTER)
+    return json.loads(blob.download_as_text()) if blob is not None else {}
+
+
+def load_ledger_changes(since_version: int = 0) -> pl.DataFrame:
+    """The ledger's change feed after ``since_version``: ``version``, ``run_id``,
+    ``change_type`` (open / close / retract) + the ledger columns, in version order."""
+    return (_scan("silver/fantasy/fact_roster_membership_changes")
+            .filter(pl.col("version") > since_version)
+            .collect().sort("version", maintain_order=True))
+
+
+def refresh_ledger(ledger: pl.DataFrame, since_version: int) -> tuple[pl.DataFrame, int]:
+    """Bring a ledger loaded at ``since_version`` up to the current version by replaying the
+    change feed one run at a time -> ``(ledger, version)``. Rows of the returned ledger
+    that changed are exactly those in ``load_ledger_changes(since_version)``."""
+    apply = _silver_module("_ledger_changes").apply_ledger_changes
+    changes = load_ledger_changes(since_version)
+    version = since_version
+    for (version,), run in changes.partition_by("version", as_dict=True, maintain_order=True).items():
+        ledger = apply(ledger, run).collect()
+    return ledger, version
+
+
+def load_ownership_index(ledger: pl.DataFrame | None = None, rebuild: bool = False):
+    """Binary-searchable as-of ownership index (``_ownership_index.OwnershipIndex``) for
+    holder / roster / history lookups without a ledger scan per date.
+
+    With no ``ledger`` the production ledger is indexed into ``_cache/ownership_index/``,
+    stamped with the generation of the ledger's version pointer, and memory-mapped from there
+    while it matches; a ledger run rewrites the pointer and the next call re-indexes
+    (``rebuild=True`` forces it). A ``ledger`` frame you pass is indexed in memory and not
+    cached."""
+    OwnershipIndex = _silver_module("_ownership_index").OwnershipIndex
+    if ledger is not None:
+        return OwnershipIndex.build(ledger)
+    path = CACHE / "ownership_index"
+    stamp = [list(g) for g in _source_generations(_LEDGER_POINTER)]
+    if not rebuild and (path / "meta.json").exists() and OwnershipIndex.saved_source(path) == stamp:
+        return OwnershipIndex.load(path)
+    idx = OwnershipIndex.build(_scan("silver/fantasy/fact_roster_membership"))
+    idx.save(path, source=stamp)
+    return idx
+
+
+@_memoized("silver/fantasy/dim_dates/", "silver/fantasy/dim_league_events/",
+           "silver/fantasy/dim_leagues_meta/", "silver/fantasy/dim_league_settings/",
+           "bronze/nflverse/schedules/", "bronze/sleeper/drafts/drafts/")
 def load_calendar() -> tuple[pl.DataFrame, pl.DataFrame]:
     """(dim_dates, dim_league_events) for graph overlays.
 
     Reads the production silver calendar dims if they exist; otherwise builds them on the
     fly from bronze using the silver modules (so this works before PR #7 is deployed)."""
     try:
-        dd = pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/dim_dates/data.parquet")
-        le = pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/dim_league_events/data.parquet")
+        dd = pl.read_parquet(_uri("silver/fantasy/dim_dates/data.parquet"))
+        le = pl.read_parquet(_uri("silver/fantasy/dim_league_events/data.parquet"))
         return dd, le
     except Exception:
         pass
-    import importlib.util
-    sf = Path(__file__).resolve().parent.parent / "data_engineering" / "silver_fantasy"
-
-    def _imp(name):
-        spec = importlib.util.spec_from_file_location(name, sf / f"{name}.py")
-        m = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(m)
-        return m
-
-    DD, LE = _imp("dim_dates"), _imp("dim_league_events")
+    DD, LE = _silver_module("dim_dates"), _silver_module("dim_league_events")
     sched = _read_prefix("bronze/nflverse/schedules/").select("season", "game_type", "week", "gameday")
-    leagues = pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/dim_leagues_meta/data.parquet")
-    settings = pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/dim_league_settings/data.parquet")
+    leagues = pl.read_parquet(_uri("silver/fantasy/dim_leagues_meta/data.parquet"))
+    settings = pl.read_parquet(_uri("silver/fantasy/dim_league_settings/data.parquet"))
     drafts = _read_prefix("bronze/sleeper/drafts/drafts/")
     dd = DD.build_dim_dates(sched)
     le = LE.build_dim_league_events(drafts, settings, leagues, sched)
     return dd, le
 
 
+@_memoized("silver/fantasy/dim_franchises_meta/", "silver/fantasy/dim_players_master/")
 def load_dims() -> tuple[pl.DataFrame, pl.DataFrame]:
     """(franchises, players). franchises: franchise_id -> current_team_name, lineage."""
-    fr = pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/dim_franchises_meta/data.parquet")
-    pm = pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/dim_players_master/data.parquet")
+    fr = pl.read_parquet(_uri("silver/fantasy/dim_franchises_meta/data.parquet"))
+    pm = pl.read_parquet(_uri("silver/fantasy/dim_players_master/data.parquet"))
     return fr, pm
 
 
+@_memoized("silver/fantasy/dim_league_events/")
 def load_league_events() -> pl.DataFrame:
     """League calendar events from `dim_league_events`
     -> (league_lineage_id, season:Int, event_type, event_date:Date), sorted by date.
 
     event_type in {startup_draft, rookie_draft, fantasy_end} — the offseason draft days
     (the inaugural startup draft = the lineage's start) and each season's end."""
-    df = pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/dim_league_events/**/*.parquet")
-    return (df.select("league_lineage_id", pl.col("season").cast(pl.Int64),
-                      "event_type", pl.col("event_date").cast(pl.Date))
-            .sort("event_date"))
+    return (_scan("silver/fantasy/dim_league_events")
+            .select("league_lineage_id", pl.col("season").cast(pl.Int64),
+                    "event_type", pl.col("event_date").cast(pl.Date))
+            .sort("event_date")
+            .collect())
 
 
+@_memoized("bronze/nflverse/schedules/")
 def load_nfl_season_starts() -> pl.DataFrame:
     """NFL regular-season Week 1 date per season from nflverse schedules
     -> (season:Int, season_start:Date). Pair with `fantasy_end` from dim_league_events
@@ -124,12 +330,20 @@ def load_player_values(qb_format: str = DEFAULT_QB_FORMAT,
     Defaults to SF / Standard. Pass te_premium='TEP' (and qb_format='SF') for a superflex
     TE-premium league — the lens KTC's power rankings use. KTC history is continuous back to
     2020 (the fact reads `dynasty/full_load`); FC is the daily era (~2025-10+)."""
-    df = pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/fact_asset_values_daily")
+    return _player_values(qb_format, [te_premium]).drop("te_premium")
+
+
+@_memoized("silver/fantasy/fact_asset_values_daily/")
+def _player_values(qb_format: str, te_premiums: list[str]) -> pl.DataFrame:
+    """One pushed-down scan of `fact_asset_values_daily` for the given TE-premium lenses."""
     return (
-        df.filter((pl.col("market_type") == DEFAULT_MARKET) & (pl.col("qb_format") == qb_format)
-                  & (pl.col("te_premium") == te_premium))
-        .select("valuation_date", "player_id", "name", "position", "ktc_value", "fc_value")
+        _scan("silver/fantasy/fact_asset_values_daily")
+        .filter((pl.col("market_type") == DEFAULT_MARKET) & (pl.col("qb_format") == qb_format)
+                & pl.col("te_premium").is_in(te_premiums))
+        .select("valuation_date", "player_id", "name", "position", "ktc_value", "fc_value",
+                "te_premium")
         .with_columns(pl.col("valuation_date").cast(pl.Date))
+        .collect()
     )
 
 
@@ -140,14 +354,16 @@ def load_player_values_blend(qb_format: str = "SF") -> pl.DataFrame:
     exists. This returns one continuous series: SF/TEP from the TEP era onward, SF/Standard
     before it — the lens KTC's power rankings use, extended back over the full history. Shape
     matches load_player_values (valuation_date, player_id, name, position, ktc_value, fc_value)."""
-    std = load_player_values(qb_format, "Standard")
-    tep = load_player_values(qb_format, "TEP")
+    both = _player_values(qb_format, ["Standard", "TEP"])
+    std = both.filter(pl.col("te_premium") == "Standard").drop("te_premium")
+    tep = both.filter(pl.col("te_premium") == "TEP").drop("te_premium")
     if tep.is_empty():
         return std
     tstart = tep["valuation_date"].min()
     return pl.concat([std.filter(pl.col("valuation_date") < tstart), tep], how="vertical_relaxed")
 
 
+@_memoized("silver/fantasy/fact_pick_values/")
 def load_pick_values_round(source: str, qb_format: str = DEFAULT_QB_FORMAT,
                            te_premium: str = DEFAULT_TE_PREMIUM,
                            carry_forward_seasons: int = 2) -> pl.DataFrame:
@@ -167,17 +383,18 @@ def load_pick_values_round(source: str, qb_format: str = DEFAULT_QB_FORMAT,
     (2yr-out) value. When the source later publishes a real class it becomes the new furthest
     season and the proxy shifts out automatically (no overlap), so real values backfill with
     no code change. Set 0 to disable (strictly faithful to published data)."""
-    df = pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/fact_pick_values")
     if source == "ktc":
-        f = df.filter((pl.col("source_system") == "ktc") & (pl.col("market_type") == DEFAULT_MARKET)
-                      & (pl.col("qb_format") == qb_format) & (pl.col("te_premium") == te_premium)
-                      & (pl.col("tier") == "Mid"))
+        pred = ((pl.col("source_system") == "ktc") & (pl.col("market_type") == DEFAULT_MARKET)
+                & (pl.col("qb_format") == qb_format) & (pl.col("te_premium") == te_premium)
+                & (pl.col("tier") == "Mid"))
     elif source == "fc":
-        f = df.filter(pl.col("source_system") == "fantasycalc")
+        pred = pl.col("source_system") == "fantasycalc"
     else:
         raise ValueError(f"unknown source {source!r}")
-    out = f.select(pl.col("season").cast(pl.Utf8), pl.col("round").cast(pl.Int64),
+    out = (_scan("silver/fantasy/fact_pick_values").filter(pred)
+           .select(pl.col("season").cast(pl.Utf8), pl.col("round").cast(pl.Int64),
                    pl.col("valuation_date").cast(pl.Date), pl.col("value").cast(pl.Int64))
+           .collect())
     if carry_forward_seasons and out.height:
         max_s = int(out["season"].cast(pl.Int64).max())             # furthest priced class
         furthest = out.filter(pl.col("season").cast(pl.Int64) == max_s)
@@ -192,26 +409,25 @@ def load_pick_values_round(source: str, qb_format: str = DEFAULT_QB_FORMAT,
     return out
 
 
-_ORD = {"1st": 1, "2nd": 2, "3rd": 3, "4th": 4}
+@_memoized("bronze/fantasycalc/values/daily/")
+def _fc_picks() -> tuple[pl.DataFrame, pl.DataFrame]:
+    """FantasyCalc's PICK rows, read and parsed once while the feed is unchanged
+    (``fact_pick_values.split_fc_picks``) -> (round-level, exact-slot) rows."""
+    fc = _read_prefix("bronze/fantasycalc/values/daily/", columns=["name", "value", "load_date"],
+                      predicate=pl.col("position") == "PICK")
+    return _silver_module("fact_pick_values").split_fc_picks(
+        fc.select("name", "value", pl.col("load_date").cast(pl.Date).alias("valuation_date")))
 
 
 def _fc_pick_values_round() -> pl.DataFrame:
-    """Parse FantasyCalc round-generic pick rows ('2027 1st') into a value series.
+    """FantasyCalc round-generic pick rows ('2027 1st') as a value series.
     (FC also has exact-slot rows '2026 Pick 1.09' — see fc_pick_values_slot.)"""
-    fc = _read_prefix("bronze/fantasycalc/values/daily/")
-    picks = fc.filter(pl.col("position") == "PICK").select(
-        "name", "value", pl.col("load_date").cast(pl.Date).alias("valuation_date"))
-    rows = []
-    for name, value, vd in picks.iter_rows():
-        m = re.fullmatch(r"(\d{4})\s+(1st|2nd|3rd|4th)", str(name).strip())
-        if not m:
-            continue  # skip exact-slot "Pick R.SS" rows for the round-level series
-        rows.append({"season": m.group(1), "round": _ORD[m.group(2)],
-                     "valuation_date": vd, "value": int(value)})
-    return pl.DataFrame(rows, schema={"season": pl.Utf8, "round": pl.Int64,
-                                      "valuation_date": pl.Date, "value": pl.Int64})
+    rounds, _ = _fc_picks()
+    return rounds.select(pl.col("season").cast(pl.Utf8), "round", "valuation_date",
+                         pl.col("value").cast(pl.Int64))
 
 
+@_memoized("bronze/sleeper/drafts/drafts/", "bronze/sleeper/drafts/draft_picks/")
 def load_rookie_draft_picks() -> pl.DataFrame:
     """Actual rookie-draft selections -> (season:Int, round, pick_no, player_id, draft_slot,
     is_startup). `is_startup` flags inaugural startup drafts (auction OR linear/snake) by their
@@ -233,25 +449,25 @@ def load_rookie_draft_picks() -> pl.DataFrame:
 def fc_pick_values_slot() -> pl.DataFrame:
     """FantasyCalc exact-slot pick values '2026 Pick R.SS' -> (season, round, slot, date, value).
     Used for the pick-EV analysis (not the round-level team-value measure)."""
-    fc = _read_prefix("bronze/fantasycalc/values/daily/")
-    picks = fc.filter(pl.col("position") == "PICK").select(
-        "name", "value", pl.col("load_date").cast(pl.Date).alias("valuation_date"))
-    rows = []
-    for name, value, vd in picks.iter_rows():
-        m = re.fullmatch(r"(\d{4})\s+Pick\s+(\d+)\.(\d+)", str(name).strip())
-        if not m:
-            continue
-        rows.append({"season": m.group(1), "round": int(m.group(2)), "slot": int(m.group(3)),
-                     "valuation_date": vd, "value": int(value)})
-    return pl.DataFrame(rows, schema={"season": pl.Utf8, "round": pl.Int64, "slot": pl.Int64,
-                                      "valuation_date": pl.Date, "value": pl.Int64})
+    _, slots = _fc_picks()
+    return slots.select(pl.col("season").cast(pl.Utf8), "round", "slot", "valuation_date",
+                        pl.col("value").cast(pl.Int64))
 
 
 # ---------------------------------------------------------------------- measure
 def held_on(ledger: pl.DataFrame, date: str) -> pl.DataFrame:
-    """Assets held on a given ISO date: valid_from <= date < valid_to (null = still open)."""
-    return ledger.filter((pl.col("valid_from") <= date)
-                         & (pl.col("valid_to").is_null() | (pl.col("valid_to") > date)))
+    """Assets held on a given ISO date: valid_from <= date < valid_to (null = still open).
+    A full scan; for repeated point lookups use ``load_ownership_index()``."""
+    return ledger.filter(_silver_module("_intervals").covering(date))
+
+
+def iter_holdings(ledger: pl.DataFrame, dates: list[str],
+                  chunk_days: int = HOLDINGS_CHUNK_DAYS) -> Iterator[pl.DataFrame]:
+    """(franchise_id, asset_type, asset_id, date) for every (asset, date) held, streamed as
+    one frame per ``chunk_days`` consecutive grid dates in date order."""
+    for chunk in _silver_module("_intervals").points_in_chunks(ledger, dates, chunk_days):
+        yield chunk.select("franchise_id", "asset_type", "asset_id",
+                           pl.col("date").str.to_date().alias("date"))
 
 
 def weekly_dates(start: str, end: str) -> list[str]:
@@ -260,72 +476,93 @@ def weekly_dates(start: str, end: str) -> list[str]:
     return [d.isoformat() for d in rng]
 
 
-def _holdings_by_date(ledger: pl.DataFrame, dates: list[str]) -> pl.DataFrame:
-    """Explode the SCD2 intervals onto a date grid: (franchise_id, asset_type, asset_id, date)
-    for every (asset, date) the asset was held. Cross+filter — small enough (intervals x dates)."""
-    dgrid = pl.DataFrame({"date": dates})
-    return (
-        ledger.join(dgrid, how="cross")
-        .filter((pl.col("valid_from") <= pl.col("date"))
-                & (pl.col("valid_to").is_null() | (pl.col("valid_to") > pl.col("date"))))
-        .select("franchise_id", "asset_type", "asset_id", pl.col("date").str.to_date().alias("date"))
-    )
+def compact_ledger(ledger: pl.DataFrame | None = None) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """Integer-keyed ledger with Date bounds and parsed pick columns -> (ledger, franchise
+    dim, player dim); see ``_ledger_keys``. Keys are only valid with the dims returned
+    alongside them."""
+    return _silver_module("_ledger_keys").encode_ledger(ledger if ledger is not None else load_ledger())
+
+
+def _value_frame(player_values: pl.DataFrame, value_col: str) -> pl.DataFrame:
+    """The cube's ``(valuation_date, player_id, value)`` in one value column."""
+    return player_values.select("valuation_date", "player_id", pl.col(value_col).alias("value"))
+
+
+def _lens_values(source: str, qb_format: str, te_premium: str) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """(player values, round pick values) of a cube lens. The TEP lens is the blend (SF/TEP,
+    Standard before the TEP era); picks are priced at TE-premium Standard, as KTC shows them."""
+    players = (load_player_values_blend(qb_format) if te_premium == "TEP"
+               else load_player_values(qb_format, te_premium))
+    return (_value_frame(players, "ktc_value" if source == "ktc" else "fc_value"),
+            load_pick_values_round(source, qb_format, "Standard"))
+
+
+def load_value_cube(source: str = "ktc", qb_format: str = DEFAULT_QB_FORMAT,
+                    te_premium: str = DEFAULT_TE_PREMIUM, dates: list[str] | None = None,
+                    refresh: bool = True, rebuild: bool = False,
+                    chunk_days: int = HOLDINGS_CHUNK_DAYS):
+    """The production ledger valued on a date grid under one lens
+    (``_value_cube.ValueCube``); the measures below read it instead of a ledger.
+
+    Cached per lens in ``_cache/value_cube/<source>_<qb_format>_<te_premium>/``. With
+    ``refresh`` each call first brings the cache up to date: new grid dates and valuation
+    dates are valued, the ledger's change feed since the cached version is replayed for the
+    assets it names, and a restated value history rebuilds it. ``refresh=False`` reads the
+    cache as saved. ``dates`` defaults to a weekly grid from the cached grid's first date (else
+    the first valuation date) through the latest valuation date. Without a ledger version pointer ledger changes
+    can't be seen: pass ``rebuild=True`` after one."""
+    ValueCube = _silver_module("_value_cube").ValueCube
+    path = CACHE / "value_cube" / f"{source}_{qb_format}_{te_premium}"
+    cube = ValueCube.load(path) if not rebuild and (path / "meta.json").exists() else None
+    if cube is not None and not refresh:
+        return cube
+    players, picks = _lens_values(source, qb_format, te_premium)
+    if dates is None:
+        end = players["valuation_date"].max().isoformat()
+        start = cube.dates[0] if cube is not None else players["valuation_date"].min().isoformat()
+        dates = sorted(set(weekly_dates(start, end) + [end]))
+    version = ledger_version().get("version")
+    if cube is not None and cube.is_current(dates, players, picks, version):
+        return cube
+    if cube is None:
+        cube = ValueCube.build(load_ledger(), dates, players, picks, chunk_days,
+                               ledger_version=version, lens=path.name)
+    else:
+        changes = load_ledger_changes(cube.ledger_version) if cube.ledger_version is not None else None
+        cube = cube.update(load_ledger(), dates, players, picks, changes=changes,
+                           ledger_version=version, chunk_days=chunk_days)
+    cube.save(path)
+    return cube
+
 
+def _is_cube(x) -> bool:
+    return isinstance(x, _silver_module("_value_cube").ValueCube)
 
-def team_value_timeseries(ledger: pl.DataFrame, source: str, dates: list[str],
+
+def team_value_timeseries(ledger, source: str, dates: list[str],
                           player_values: pl.DataFrame | None = None,
-                          pick_values: pl.DataFrame | None = None) -> pl.DataFrame:
+                          pick_values: pl.DataFrame | None = None,
+                          chunk_days: int = HOLDINGS_CHUNK_DAYS) -> pl.DataFrame:
     """Team value per (franchise_id, date) for one value source ('ktc' | 'fc').
 
     Joins each held player to its value (as-of nearest date <= grid date) and each held
     pick to its round-level value, then sums. Returns
-    (franchise_id, date, player_value, pick_value, total_value).
+    (franchise_id, date, player_value, n_player, pick_value, n_pick, total_value).
+
+    ``ledger`` is a ledger frame, valued here ``chunk_days`` grid dates at a time, or a
+    ``load_value_cube()`` cube, whose team sums are read on ``dates`` (the cube's lens
+    replaces ``source`` and the value frames, which must then be omitted).
     """
+    if _is_cube(ledger):
+        if player_values is not None or pick_values is not None:
+            raise ValueError("a value cube carries its own values; don't pass value frames")
+        return ledger.team_values(dates)
     value_col = "ktc_value" if source == "ktc" else "fc_value"
-    pv = (player_values if player_values is not None else load_player_values())
-    pv = pv.select("valuation_date", "player_id", pl.col(value_col).alias("v")).drop_nulls("v") \
-           .filter(pl.col("v") > 0).sort("valuation_date")
-    pk = (pick_values if pick_values is not None else load_pick_values_round(source)).sort("valuation_date")
-
-    hold = _holdings_by_date(ledger, dates).sort("date")
-
-    # players: as-of join held player -> value
-    players = (
-        hold.filter(pl.col("asset_type") == "player")
-        .join_asof(pv, left_on="date", right_on="valuation_date", by_left="asset_id",
-                   by_right="player_id", strategy="backward")
-        .select("franchise_id", "date", pl.col("v").fill_null(0).alias("player_value"))
-    )
-    # picks: parse asset_id "season:round:orig" -> (season, round); as-of join round value.
-    # BACKFILL: KTC only starts pricing a draft class ~3yr out, but the ledger holds the pick
-    # from mint, so a backward as-of reads null (->0) before KTC's window and snaps to full
-    # value in one week. Coalesce those pre-window nulls to the pick's FIRST-priced value so the
-    # series is smooth; inside the window the point-in-time backward value still applies.
-    first_priced = pk.sort("valuation_date").group_by("season", "round").agg(
-        pl.col("value").first().alias("_first"))
-    picks = (
-        hold.filter(pl.col("asset_type") == "pick")
-        .with_columns(pl.col("asset_id").str.split(":").alias("_p"))
-        .with_columns(pl.col("_p").list.get(0).alias("season"),
-                      pl.col("_p").list.get(1).cast(pl.Int64).alias("round"))
-        .sort("date")
-        .join_asof(pk, left_on="date", right_on="valuation_date", by=["season", "round"],
-                   strategy="backward")
-        .join(first_priced, on=["season", "round"], how="left")
-        .select("franchise_id", "date",
-                pl.coalesce(["value", "_first"]).fill_null(0).alias("pick_value"))
-    )
-    pl_sum = players.group_by("franchise_id", "date").agg(
-        pl.col("player_value").sum(), (pl.col("player_value") > 0).sum().alias("n_player"))
-    pk_sum = picks.group_by("franchise_id", "date").agg(
-        pl.col("pick_value").sum(), (pl.col("pick_value") > 0).sum().alias("n_pick"))
-    return (
-        pl_sum.join(pk_sum, on=["franchise_id", "date"], how="full", coalesce=True)
-        .with_columns(pl.col("player_value").fill_null(0), pl.col("pick_value").fill_null(0),
-                      pl.col("n_player").fill_null(0), pl.col("n_pick").fill_null(0))
-        .with_columns((pl.col("player_value") + pl.col("pick_value")).alias("total_value"))
-        .sort("franchise_id", "date")
-    )
+    cube = _silver_module("_value_cube").ValueCube.build(
+        ledger, dates,
+        _value_frame(player_values if player_values is not None else load_player_values(), value_col),
+        pick_values if pick_values is not None else load_pick_values_round(source), chunk_days)
+    return cube.team_values()
 
 
 def _pr_adjval(val: pl.Expr, slotavg: pl.Expr) -> pl.Expr:
@@ -338,9 +575,11 @@ def _pr_adjval(val: pl.Expr, slotavg: pl.Expr) -> pl.Expr:
     return r * ((2.0 * s + (a / 10200.0).pow(1.2)) / 3.0 * 0.7 + 0.3)
 
 
-def team_power_index(ledger: pl.DataFrame, dates: list[str], player_values: pl.DataFrame,
+def team_power_index(ledger, dates: list[str], player_values: pl.DataFrame | None,
                      fr_meta: pl.DataFrame, value_col: str = "ktc_value",
-                     pick_values: pl.DataFrame | None = None) -> pl.DataFrame:
+                     pick_values: pl.DataFrame | None = None,
+                     chunk_days: int = HOLDINGS_CHUNK_DAYS,
+                     include_picks: bool | None = None) -> pl.DataFrame:
     """KTC's league POWER RANKING (the /power-rankings/teams page), replicated from KTC's JS.
 
     This is NOT total roster value: each team's assets are ranked by value, each is adjusted
@@ -351,61 +590,60 @@ def team_power_index(ledger: pl.DataFrame, dates: list[str], player_values: pl.D
     Picks: if `pick_values` (round-level) is given, picks are folded into the SAME prProcessV
     pipeline as extra assets (KTC's default ``hrdp=0`` "Include Picks" view — verified vs the
     live page). Omit it for the players-only view (KTC's ``hrdp=1``). Returns
-    (franchise_id, league_lineage_id, date, adj_total, power_index).
+    (franchise_id, league_lineage_id, date, adj_total, power_index). Every step is per date,
+    so holdings are ranked ``chunk_days`` grid dates at a time.
+
+    ``ledger`` may also be a ``load_value_cube()`` cube: pass ``player_values=None``; picks
+    are then included unless ``include_picks=False``.
     """
-    pv = (player_values.select("valuation_date", "player_id", pl.col(value_col).alias("val"))
-          .drop_nulls("val").filter(pl.col("val") > 0).sort("valuation_date"))
-    lin = fr_meta.select("franchise_id", "league_lineage_id").unique(subset=["franchise_id"])
-    hold = _holdings_by_date(ledger, dates).sort("date").join(lin, on="franchise_id", how="left")
-    players = (
-        hold.filter(pl.col("asset_type") == "player")
-        .join_asof(pv, left_on="date", right_on="valuation_date", by_left="asset_id",
-                   by_right="player_id", strategy="backward")
-        .select("franchise_id", "league_lineage_id", "date", pl.col("val"))
-    )
-    parts = [players]
-    if pick_values is not None:
-        # mirror team_value_timeseries' pick valuation: parse asset_id "season:round:orig",
-        # as-of join the round value, backfill pre-window nulls to the first-priced value.
-        pk = pick_values.sort("valuation_date")
-        first_priced = pk.group_by("season", "round").agg(pl.col("value").first().alias("_first"))
-        picks = (
-            hold.filter(pl.col("asset_type") == "pick")
-            .with_columns(pl.col("asset_id").str.split(":").alias("_p"))
-            .with_columns(pl.col("_p").list.get(0).alias("season"),
-                          pl.col("_p").list.get(1).cast(pl.Int64).alias("round"))
-            .sort("date")
-            .join_asof(pk, left_on="date", right_on="valuation_date", by=["season", "round"],
-                       strategy="backward")
-            .join(first_priced, on=["season", "round"], how="left")
-            .select("franchise_id", "league_lineage_id", "date",
-                    pl.coalesce(["value", "_first"]).alias("val"))
+    if _is_cube(ledger):
+        if player_values is not None or pick_values is not None:
+            raise ValueError("a value cube carries its own values; don't pass value frames")
+        cube, picks = ledger, include_picks is not False
+    else:
+        picks = pick_values is not None if include_picks is None else include_picks
+        cube = _silver_module("_value_cube").ValueCube.build(
+            ledger, dates, _value_frame(player_values, value_col), pick_values if picks else None, chunk_days)
+    lin = fr_meta.select(pl.col("franchise_id").cast(pl.Categorical),
+                         "league_lineage_id").unique(subset=["franchise_id"])
+    grid = sorted(set(cube.dates) & {str(d) for d in dates})
+
+    ranked = []
+    for lo in range(0, len(grid), chunk_days):
+        held = cube.on(grid[lo:lo + chunk_days])
+        if not picks:
+            held = held.filter(pl.col("asset_type") == "player")
+        assets = (
+            held.filter(pl.col("value") > 0).join(lin, on="franchise_id", how="left")
+            # slot index within each team (0 = best), then the league-average value at that slot
+            .with_columns((pl.col("value").rank("ordinal", descending=True).over("date", "franchise_id") - 1)
+                          .alias("slot"))
+            .with_columns(pl.col("value").mean().over("league_lineage_id", "date", "slot").alias("slotavg"))
+            .with_columns(_pr_adjval(pl.col("value"), pl.col("slotavg")).alias("adjval"))
         )
-        parts.append(picks)
-    assets = (
-        pl.concat(parts, how="vertical").filter(pl.col("val") > 0)
-        # slot index within each team (0 = best), then the league-average value at that slot
-        .with_columns((pl.col("val").rank("ordinal", descending=True).over("date", "franchise_id") - 1)
-                      .alias("slot"))
-        .with_columns(pl.col("val").mean().over("league_lineage_id", "date", "slot").alias("slotavg"))
-        .with_columns(_pr_adjval(pl.col("val"), pl.col("slotavg")).alias("adjval"))
-    )
-    adj = assets.group_by("franchise_id", "league_lineage_id", "date").agg(
-        pl.col("adjval").sum().alias("adj_total"))
-    return (
-        adj.with_columns(
+        adj = assets.group_by("franchise_id", "league_lineage_id", "date").agg(
+            pl.col("adjval").sum().alias("adj_total"))
+        ranked.append(adj.with_columns(
             (pl.col("adj_total") / pl.col("adj_total").max().over("league_lineage_id", "date") * 99)
-            .floor().alias("power_index"))
+            .floor().alias("power_index")))
+    schema = {"franchise_id": pl.Categorical, "league_lineage_id": lin.schema["league_lineage_id"],
+              "date": pl.Date, "adj_total": pl.Float64, "power_index": pl.Float64}
+    return (
+        pl.concat(ranked or [pl.DataFrame(schema=schema)], how="vertical")
+        .select(pl.col("franchise_id").cast(pl.Utf8), "league_lineage_id", "date", "adj_total", "power_index")
         .sort("franchise_id", "date")
     )
 
 
-def league_diagnostics(tv: pl.DataFrame, fr_meta: pl.DataFrame):
+def league_diagnostics(tv, fr_meta: pl.DataFrame):
     """Per (lineage, date) aggregates for spotting GLOBAL (synchronized) moves vs real ones.
     Returns (tv_plus, agg) where tv_plus adds `share` (value / league-mean that week), `idx`
     (value / the franchise's first non-zero value), and `ktc_index` (KTC's 1-99 scale: top
     team = 99 each date, computed on player_value to mirror KTC), and `agg` has the league
-    mean/total, the league-wide valued-player count, avg value per valued player, and week-over-week %."""
+    mean/total, the league-wide valued-player count, avg value per valued player, and week-over-week %.
+    ``tv`` is ``team_value_timeseries`` output or a ``load_value_cube()`` cube (its whole grid)."""
+    if _is_cube(tv):
+        tv = tv.team_values()
     if "league_lineage_id" not in tv.columns:
         tv = tv.join(fr_meta.select("franchise_id", "league_lineage_id", "current_team_name"),
                      on="franchise_id", how="left")
@@ -454,34 +692,32 @@ def team_bags(lineage_id: str | None = None, as_of: str | None = None,
     distribution, which the summed/indexed measures (team_value_timeseries, team_power_index)
     don't expose. Handy for ad-hoc "what does each team hold and what's it worth" inspection.
     Picks are valued at round level. Loaders are called lazily; pass frames to reuse them."""
-    led = ledger if ledger is not None else load_ledger()
+    idx = load_ownership_index(ledger)
     fr, _ = load_dims()
     pv = player_values if player_values is not None else load_player_values()
     pk = pick_values if pick_values is not None else load_pick_values_round("ktc")
     as_of = as_of or pv["valuation_date"].max().isoformat()
     cutoff = pl.lit(as_of).str.to_date()
 
-    held = held_on(led, as_of)
-    if lineage_id:
-        held = held.filter(pl.col("franchise_id").str.starts_with(lineage_id))
+    held = idx.rosters_on(as_of, lineage_id)
     pl_latest = (pv.filter(pl.col("valuation_date") <= cutoff).sort("valuation_date")
                  .group_by("player_id").agg(pl.col("ktc_value").last().alias("v")))
     players = (held.filter(pl.col("asset_type") == "player")
                .join(pl_latest, left_on="asset_id", right_on="player_id", how="left"))
-    pk_latest = (pk.filter(pl.col("valuation_date") <= cutoff).sort("valuation_date")
-                 .group_by("season", "round").agg(pl.col("value").last().alias("v")))
+    cls = ["pick_season", "pick_round"]
+    pk_latest = (pk.with_columns(pl.col("season").cast(pl.Int16, strict=False).alias("pick_season"),
+                                 pl.col("round").cast(pl.Int8, strict=False).alias("pick_round"))
+                 .filter(pl.col("valuation_date") <= cutoff).sort("valuation_date")
+                 .group_by(cls).agg(pl.col("value").last().alias("v")))
     picks = (held.filter(pl.col("asset_type") == "pick")
-             .with_columns(pl.col("asset_id").str.split(":").alias("_p"))
-             .with_columns(pl.col("_p").list.get(0).alias("season"),
-                           pl.col("_p").list.get(1).cast(pl.Int64).alias("round"))
-             .join(pk_latest, on=["season", "round"], how="left"))
+             .with_columns(_silver_module("_ledger_keys").pick_parts())
+             .join(pk_latest, on=cls, how="left"))
     allv = pl.concat([players.select("franchise_id", "v"), picks.select("franchise_id", "v")],
                      how="vertical")
     names = dict(zip(fr["franchise_id"].to_list(), fr["current_team_name"].to_list()))
-    out = {}
-    for fid in allv["franchise_id"].unique().to_list():
-        vals = [float(x) for x in allv.filter(pl.col("franchise_id") == fid)["v"].drop_nulls().to_list()
-                if x and x > 0]
-        out[fid] = {"name": names.get(fid, fid), "values": sorted(vals, reverse=True),
-                    "naive_sum": float(sum(vals)), "n": len(vals)}
-    return out
+    bags = (allv.with_columns(pl.col("v").cast(pl.Float64))
+            .group_by("franchise_id")
+            .agg(pl.col("v").filter(pl.col("v") > 0).sort(descending=True).alias("values")))
+    return {fid: {"name": names.get(fid, fid), "values": vals, "naive_sum": float(sum(vals)),
+                  "n": len(vals)}
+            for fid, vals in bags.iter_rows()}
@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 import random
 from dotenv import load_dotenv
 
+from lake_io import write_bronze
+
 load_dotenv()
     
 def flatten_player_data(player_data: list[dict]) -> pl.DataFrame:
@@ -154,7 +156,7 @@ def save_df_to_gcs(df: pl.DataFrame):
     )
     
     print(file_path)
-    df.write_parquet(file_path)
+    write_bronze(df, file_path)
     
     print(f"✅ Saved {len(df)} records to {file_path}")
 
@@ -8,6 +8,8 @@ import polars as pl
 from dotenv import load_dotenv
 import adbc_driver_postgresql.dbapi as adbc
 
+from lake_io import write_bronze
+
 load_dotenv(env_path)
 
 def get_local_data(conn: adbc.Connection) -> pl.DataFrame:
@@ -33,7 +35,7 @@ def save_player_to_gcs(df: pl.DataFrame, bucket_name: str, base_date: str):
     file_path = f"gs://{bucket_name}/bronze/ktc/dynasty/local_load/load_date={base_date}/data.parquet"  
 
     try:
-        df.write_parquet(file_path)
+        write_bronze(df, file_path)
         print(f"Saved historic data to GCS: {file_path}")
     except Exception as e:
         print(f"Failed to save historic data to GCS: {e}")
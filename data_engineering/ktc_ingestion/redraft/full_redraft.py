@@ -17,6 +17,7 @@ from utils import (
     parse_historic_SFplayer_data,
     transform_player_data
 )
+from lake_io import write_bronze
 
 load_dotenv(env_path)
 
@@ -24,7 +25,7 @@ def save_player_to_gcs(df: pl.DataFrame, bucket_name: str, slug: str, base_date:
     file_path = f"gs://{bucket_name}/bronze/ktc/redraft/full_load/load_date={base_date}/{slug}.parquet"  
 
     try:
-        df.write_parquet(file_path)
+        write_bronze(df, file_path)
         
     except Exception as e:
         print(f"Failed to save {slug} to GCS: {e}")
@@ -12,6 +12,7 @@ from utils import (
     flatten_player_data,
     set_dtypes,
 )
+from lake_io import write_bronze
 
 load_dotenv(env_path)
 
@@ -19,7 +20,7 @@ def save_player_to_gcs(df: pl.DataFrame, bucket_name: str,  base_date: str):
     file_path = f"gs://{bucket_name}/bronze/ktc/redraft/daily_load/load_date={base_date}/player_data.parquet"  
     
     try:
-        df.write_parquet(file_path)
+        write_bronze(df, file_path)
         
     except Exception as e:
         print(f"Failed to save to GCS: {e}")
@@ -7,6 +7,8 @@ import polars as pl
 import nflreadpy as nfl
 from dotenv import load_dotenv
 
+from lake_io import write_bronze
+
 load_dotenv()
 
 # Configuration constants
@@ -153,7 +155,7 @@ def fetch_and_save_dataset(name: str, config: Dict, current_season: int, bucket_
             load_date = datetime.now().strftime('%Y-%m-%d')
             path = f"gs://{bucket_name}/bronze/nflverse/{config['folder']}/load_date={load_date}/data.parquet"
         
-        df.write_parquet(path)
+        write_bronze(df, path)
         
         result['success'] = True
         print(f"  ✓ {df.height:,} rows → {path}")
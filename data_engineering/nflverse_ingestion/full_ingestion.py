@@ -7,6 +7,8 @@ import polars as pl
 import nflreadpy as nfl
 from dotenv import load_dotenv
 
+from lake_io import write_bronze
+
 load_dotenv()
 
 
@@ -37,7 +39,7 @@ def fetch_and_save_seasonal_dataset(name: str, loader_func: callable,
             # No season column - save with load_date partition instead
             load_date = datetime.now().strftime('%Y-%m-%d')
             path = f"gs://{bucket_name}/bronze/nflverse/{folder}/load_date={load_date}/{name}.parquet"
-            df.write_parquet(path)
+            write_bronze(df, path)
             print(f"  ⚠ No season column - saved to load_date partition: {path}")
             result['success'] = True
             result['seasons_loaded'] = 1
@@ -51,7 +53,7 @@ def fetch_and_save_seasonal_dataset(name: str, loader_func: callable,
         for season in seasons_in_data:
             season_df = df.filter(pl.col('season') == season)
             path = f"gs://{bucket_name}/bronze/nflverse/{folder}/season={season}/{name}.parquet"
-            season_df.write_parquet(path)
+            write_bronze(season_df, path)
             result['seasons_loaded'] += 1
         
         print(f"  ✓ Saved {result['seasons_loaded']} seasons to bronze/nflverse/{folder}/season=YYYY/")
@@ -86,7 +88,7 @@ def fetch_and_save_non_seasonal_dataset(name: str, loader_func: callable,
         # Save with load_date partition
         load_date = datetime.now().strftime('%Y-%m-%d')
         path = f"gs://{bucket_name}/bronze/nflverse/{folder}/load_date={load_date}/{name}.parquet"
-        df.write_parquet(path)
+        write_bronze(df, path)
         
         print(f"  ✓ {df.height:,} rows → {path}")
         result['success'] = True
@@ -0,0 +1,216 @@
+"""silver_fantasy/_intervals.py
+
+Interval algebra over SCD2 intervals and snapshot stints.
+
+The ledger job and the analysis layer keep doing the same few things to intervals: truncate
+the reconstructed era at the snapshot boundary, cut rollover windows out of stints, merge a
+key's touching stints, expand holdings onto a date grid, look up who held what on a day and
+find intervals that overlap. This module does each once, vectorized, so the call sites share
+one definition of the edge cases.
+
+An interval is the half-open ``[start, end)`` of two columns: ISO date strings, dates or
+integer day indexes (sweeps run ISO strings as dates and hand back strings). A null ``end``
+is an interval that is still open and runs past every point; a null ``start`` is malformed
+and dropped by the set operations. A stint (closed ``[first_date, last_date]`` over a
+snapshot calendar) is an interval in calendar-index space: ``index_on`` maps its days to
+``[idx(first), idx(last) + 1)``.
+
+Nothing expands intervals to days or crosses them with a grid. Sets are swept in
+``(key, start)`` order against a running max of ``end`` and grids are matched with binary
+search, so the cost is the sort plus the rows produced. Like ``_ownership_index``, this
+module depends on polars only.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import date
+
+import polars as pl
+
+Frame = pl.DataFrame | pl.LazyFrame
+
+
+def _bound(x) -> pl.Expr:
+    """A bound given as a column expression or a scalar."""
+    return x if isinstance(x, pl.Expr) else pl.lit(x)
+
+
+def _ordered(df: Frame, col: str) -> tuple[pl.Expr, pl.Expr | None]:
+    """``col`` in a dtype with a running max (ISO strings parse to dates) -> (expression,
+    the value after every real end that stands in for a null ``end``)."""
+    dtype = df.collect_schema()[col]
+    if dtype == pl.Utf8:
+        return pl.col(col).str.to_date("%Y-%m-%d"), pl.lit(date.max)
+    if dtype == pl.Date:
+        return pl.col(col), pl.lit(date.max)
+    if dtype.is_integer():
+        return pl.col(col), dtype.max()
+    raise TypeError(f"interval column {col!r} has unsupported dtype {dtype}")
+
+
+def covering(point, start: str = "valid_from", end: str = "valid_to") -> pl.Expr:
+    """Point probe: the intervals that hold ``point`` (a scalar or a column expression)."""
+    p = _bound(point)
+    return (pl.col(start) <= p) & (pl.col(end).is_null() | (pl.col(end) > p))
+
+
+def overlapping(lo, hi=None, start: str = "valid_from", end: str = "valid_to") -> pl.Expr:
+    """Range probe: the intervals that share a point with ``[lo, hi)`` (``hi=None`` is open)."""
+    after_lo = pl.col(end).is_null() | (pl.col(end) > _bound(lo))
+    return after_lo if hi is None else after_lo & (pl.col(start) < _bound(hi))
+
+
+def clip(df: Frame, lo=None, hi=None, start: str = "valid_from", end: str = "valid_to") -> Frame:
+    """Intersect each interval with ``[lo, hi)`` and drop the ones left empty.
+
+    Bounds are scalars or per-row column expressions; a missing (``None`` or null) bound
+    leaves that side alone, so an open interval clipped at ``hi`` ends there."""
+    out = df.filter(pl.col(start).is_not_null())
+    if lo is not None:
+        out = out.with_columns(pl.max_horizontal(pl.col(start), _bound(lo)).alias(start))
+    if hi is not None:
+        out = out.with_columns(pl.min_horizontal(pl.col(end), _bound(hi)).alias(end))
+    return out.filter(pl.col(end).is_null() | (pl.col(start) < pl.col(end)))
+
+
+def subtract(df: Frame, lo, hi, start: str = "valid_from", end: str = "valid_to") -> Frame:
+    """Remove the window ``[lo, hi)`` (per-row column expressions or scalars) from each
+    interval: the parts before and after it remain, so one interval can become two. Rows
+    whose ``lo`` is null have no window and are kept whole."""
+    lo, hi = _bound(lo), _bound(hi)
+    cut = lo.is_not_null()
+    return pl.concat([
+        df.filter(~cut),
+        df.filter(cut & (pl.col(start) < lo)).with_columns(pl.min_horizontal(pl.col(end), lo).alias(end)),
+        df.filter(cut & (pl.col(end).is_null() | (pl.col(end) > hi)))
+        .with_columns(pl.max_horizontal(pl.col(start), hi).alias(start)),
+    ], how="vertical")
+
+
+def coalesce(df: Frame, by: list[str], start: str = "valid_from", end: str = "valid_to") -> Frame:
+    """Union of each ``by`` key's intervals: overlapping or touching intervals merge into one
+    -> ``by + [start, end]``. An interval starts a new island when it starts after the
+    furthest end of the key's earlier intervals."""
+    schema = df.collect_schema()
+    f, _ = _ordered(df, start)
+    e, s = _ordered(df, end)
+    return (
+        df.filter(pl.col(start).is_not_null())
+        .select(*by, f.alias("_f"), e.fill_null(s).alias("_e"))
+        .sort(*by, "_f")
+        .with_columns(pl.col("_e").cum_max().shift(1).over(by).alias("_reach"))
+        .with_columns((pl.col("_reach").is_null() | (pl.col("_f") > pl.col("_reach")))
+                      .cum_sum().over(by).alias("_isl"))
+        .group_by(*by, "_isl")
+        .agg(pl.col("_f").min(), pl.col("_e").max())
+        .select(*by, pl.col("_f").cast(schema[start]).alias(start),
+                pl.when(pl.col("_e") != s).then(pl.col("_e")).cast(schema[end]).alias(end))
+    )
+
+
+def union(frames: list[Frame], by: list[str], start: str = "valid_from",
+          end: str = "valid_to") -> Frame:
+    """``coalesce`` over the intervals of several frames together."""
+    return coalesce(pl.concat([f.select(*by, start, end) for f in frames], how="vertical_relaxed"),
+                    by, start, end)
+
+
+def _sweep(df: Frame, by: list[str], start: str, end: str, carry: str | None = None) -> Frame:
+    """Rows in ``(by, start)`` order with ``_f`` (``start`` in sweep dtype), ``_reach``, the
+    furthest end of the key's earlier intervals (null for the first), and ``_by`` = ``carry``
+    of the interval reaching it."""
+    f, _ = _ordered(df, start)
+    e, s = _ordered(df, end)
+    e = e.fill_null(s)
+    cols = [e.cum_max().shift(1).over(by).alias("_reach")]
+    if carry is not None:
+        cols.append(pl.when(e == e.cum_max()).then(pl.col(carry))
+                    .forward_fill().shift(1).over(by).alias("_by"))
+    return (df.filter(pl.col(start).is_not_null()).with_columns(f.alias("_f"))
+            .sort(*by, "_f", e, maintain_order=True).with_columns(cols))
+
+
+def overlaps(df: Frame, by: list[str], start: str = "valid_from", end: str = "valid_to",
+             carry: str | None = None, carry_as: str = "other") -> Frame:
+    """Intervals that start before an earlier interval of the same ``by`` key has ended.
+    With ``carry``, ``carry_as`` holds that column of the earlier interval (the one reaching
+    furthest)."""
+    out = _sweep(df, by, start, end, carry).filter(pl.col("_f") < pl.col("_reach"))
+    if carry is not None:
+        out = out.rename({"_by": carry_as})
+    return out.drop("_f", "_reach")
+
+
+def gaps(df: Frame, by: list[str], start: str = "valid_from", end: str = "valid_to") -> Frame:
+    """Uncovered stretches between a ``by`` key's intervals: one row per gap, carrying the
+    columns of the interval that ends it with ``[start, end)`` set to the gap."""
+    schema = df.collect_schema()
+    return (
+        _sweep(df, by, start, end)
+        .filter(pl.col("_f") > pl.col("_reach"))
+        .with_columns(pl.col("_reach").cast(schema[start]).alias(start),
+                      pl.col(start).cast(schema[end]).alias(end))
+        .drop("_f", "_reach")
+    )
+
+
+def index_on(df: Frame, points, cols: dict[str, str]) -> Frame:
+    """Add, for each ``{column: index_column}``, the position in the sorted ``points`` of
+    the first point at or after the value (binary search). For a value that is one of the
+    points this is its index."""
+    p = pl.Series(points).unique().sort()
+    return df.with_columns(pl.lit(p).search_sorted(pl.col(c), side="left").alias(i)
+                           for c, i in cols.items())
+
+
+def point_at(points, idx: str | pl.Expr) -> pl.Expr:
+    """The sorted ``points`` value at index ``idx`` (a column name or expression): the
+    inverse of ``index_on``."""
+    return pl.lit(pl.Series(points).unique().sort()).gather(pl.col(idx) if isinstance(idx, str) else idx)
+
+
+def _slices(df: Frame, p: pl.Series, start: str, end: str) -> Frame:
+    """Each interval's slice ``[_lo, _hi)`` of the sorted points ``p``; empty slices dropped."""
+    grid = pl.lit(p)
+    return (
+        df.filter(pl.col(start).is_not_null())
+        .with_columns(
+            grid.search_sorted(pl.col(start), side="left").alias("_lo"),
+            pl.when(pl.col(end).is_null()).then(pl.lit(p.len(), pl.UInt32))
+              .otherwise(grid.search_sorted(pl.col(end), side="left")).alias("_hi"),
+        )
+        .filter(pl.col("_hi") > pl.col("_lo"))
+    )
+
+
+def _explode(slices: Frame, p: pl.Series, point_col: str) -> Frame:
+    return (
+        slices.with_columns(pl.int_ranges("_lo", "_hi", dtype=pl.UInt32).alias("_i"))
+        .explode("_i")
+        .with_columns(pl.lit(p).gather(pl.col("_i")).alias(point_col))
+        .drop("_lo", "_hi", "_i")
+    )
+
+
+def points_in(df: Frame, points, start: str = "valid_from", end: str = "valid_to",
+              point_col: str = "date") -> Frame:
+    """Intersect intervals with a calendar: one row per (interval, point it holds), the
+    interval's columns plus ``point_col``. Each interval's slice of the sorted ``points`` is
+    found by binary search and only that slice is emitted."""
+    p = pl.Series(points).cast(df.collect_schema()[start]).unique().sort()
+    return _explode(_slices(df, p, start, end), p, point_col)
+
+
+def points_in_chunks(df: Frame, points, size: int, start: str = "valid_from",
+                     end: str = "valid_to", point_col: str = "date") -> Iterator[pl.DataFrame]:
+    """``points_in`` one run of ``size`` consecutive points at a time, in point order. Only
+    the current chunk's rows exist, so a daily grid over the whole history streams in
+    bounded memory (with no points, one empty chunk). The slices are searched once; each
+    chunk clips them to its points."""
+    p = pl.Series(points).cast(df.collect_schema()[start]).unique().sort()
+    slices = _slices(df, p, start, end).lazy().collect()
+    for lo in range(0, max(p.len(), 1), size):
+        hi = min(lo + size, p.len())
+        chunk = (slices.filter((pl.col("_hi") > lo) & (pl.col("_lo") < hi))
+                 .with_columns(pl.col("_lo").clip(lower_bound=lo), pl.col("_hi").clip(upper_bound=hi)))
+        yield _explode(chunk, p, point_col)
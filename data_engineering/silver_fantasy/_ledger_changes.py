@@ -0,0 +1,68 @@
+"""silver_fantasy/_ledger_changes.py
+
+Change feed of the SCD2 ``fact_roster_membership`` ledger.
+
+Every ledger run replaces the ledger object, so a consumer that only has the new version
+has to recompute everything it derived from the old one. The job therefore also writes the
+difference between the two versions: one row per interval change, keyed by run id.
+
+An interval is identified by ``(franchise_id, asset_type, asset_id, valid_from)``:
+
+* ``open``    — an interval the previous version didn't have.
+* ``close``   — a previously open interval (``valid_to`` null) that now has a ``valid_to``;
+  the row carries the new end.
+* ``retract`` — an interval of the previous version that is gone (history rewritten by a
+  late event, an override or a full rebuild). The row is the interval as it was.
+
+Extending an open interval (another snapshot day of the same holding) is not a change, so an
+incremental run's feed is the handful of holdings that started or ended since the last run.
+``apply_ledger_changes(prev, changes)`` reproduces the new version, which is what a
+downstream measure replays to stay current. Like ``_ownership_index``, this module depends
+on polars only, so the analysis layer can import it without the job's lake setup.
+"""
+from __future__ import annotations
+
+import polars as pl
+
+LEDGER_COLS = ["franchise_id", "asset_type", "asset_id", "valid_from", "valid_to", "is_current"]
+INTERVAL_KEY = ["franchise_id", "asset_type", "asset_id", "valid_from"]
+CHANGE_TYPES = ("open", "close", "retract")
+
+_ROW = INTERVAL_KEY + ["valid_to"]
+
+
+def ledger_changes(prev: pl.LazyFrame | pl.DataFrame | None,
+                   new: pl.LazyFrame | pl.DataFrame) -> pl.LazyFrame:
+    """Interval changes turning ``prev`` into ``new``: ``change_type`` + the ledger columns.
+    With no previous version every interval is an ``open``."""
+    new = new.lazy().select(LEDGER_COLS)
+    if prev is None:
+        return new.select(pl.lit("open").alias("change_type"), *LEDGER_COLS)
+    prev = prev.lazy().select(LEDGER_COLS)
+    added = new.join(prev.select(_ROW), on=_ROW, how="anti", nulls_equal=True)
+    removed = prev.join(new.select(_ROW), on=_ROW, how="anti", nulls_equal=True)
+    closed = added.filter(pl.col("valid_to").is_not_null()).join(
+        removed.filter(pl.col("valid_to").is_null()).select(INTERVAL_KEY), on=INTERVAL_KEY, how="semi")
+    return pl.concat([
+        added.join(closed.select(INTERVAL_KEY), on=INTERVAL_KEY, how="anti")
+        .select(pl.lit("open").alias("change_type"), *LEDGER_COLS),
+        closed.select(pl.lit("close").alias("change_type"), *LEDGER_COLS),
+        removed.join(closed.select(INTERVAL_KEY), on=INTERVAL_KEY, how="anti")
+        .select(pl.lit("retract").alias("change_type"), *LEDGER_COLS),
+    ], how="vertical")
+
+
+def apply_ledger_changes(ledger: pl.LazyFrame | pl.DataFrame,
+                         changes: pl.LazyFrame | pl.DataFrame) -> pl.LazyFrame:
+    """Replay a change feed onto the ledger version it was taken against.
+
+    Feeds of consecutive runs apply in run order. A ``close`` replaces the open interval
+    with the same key; a ``retract`` removes the exact interval."""
+    changes = changes.lazy()
+    kind = pl.col("change_type")
+    gone = pl.concat([
+        changes.filter(kind == "retract").select(_ROW),
+        changes.filter(kind == "close").select(*INTERVAL_KEY, pl.lit(None, pl.Utf8).alias("valid_to")),
+    ], how="vertical_relaxed")
+    kept = ledger.lazy().select(LEDGER_COLS).join(gone, on=_ROW, how="anti", nulls_equal=True)
+    return pl.concat([kept, changes.filter(kind != "retract").select(LEDGER_COLS)], how="vertical_relaxed")
@@ -0,0 +1,114 @@
+"""silver_fantasy/_ledger_keys.py
+
+Integer-keyed, typed form of the SCD2 ``fact_roster_membership`` ledger.
+
+The stored ledger keeps readable string keys: ``franchise_id`` is ``"<lineage>_<roster>"``,
+a pick's ``asset_id`` is ``"season:round:original_roster"`` and the interval bounds are ISO
+strings. That is the right shape for the lake (the change feed and the incremental state
+key on it), but the measures join, sort and window the ledger against value series many
+times per call, and re-split the pick ids each time. ``encode_ledger`` does the string work
+once and returns:
+
+* the compact ledger: ``franchise_key`` / ``player_key`` (Int32), ``asset_type`` (Enum),
+  the pick's ``pick_season`` / ``pick_round`` / ``pick_roster`` (null for players),
+  ``valid_from`` / ``valid_to`` as ``Date`` and ``is_current``;
+* the franchise dim (``franchise_key, franchise_id, lineage_id, roster_id``) and the player
+  dim (``player_key, player_id``) that decode the keys.
+
+A key is the position of the id in its dim's sorted ids, as the ownership index codes
+them, so ``encode`` / ``decode`` are a binary search and a gather. Keys are deterministic
+for one ledger but not across ledger versions: decode through the dims, don't persist them.
+Like ``_ownership_index``, this module depends on polars only.
+"""
+from __future__ import annotations
+
+import polars as pl
+
+ASSET_TYPES = pl.Enum(["pick", "player"])
+COMPACT_SCHEMA = {
+    "franchise_key": pl.Int32, "asset_type": ASSET_TYPES, "player_key": pl.Int32,
+    "pick_season": pl.Int16, "pick_round": pl.Int8, "pick_roster": pl.Int16,
+    "valid_from": pl.Date, "valid_to": pl.Date, "is_current": pl.Boolean,
+}
+LEDGER_COLS = ["franchise_id", "asset_type", "asset_id", "valid_from", "valid_to", "is_current"]
+
+
+def pick_parts(asset_id: pl.Expr | str = "asset_id") -> list[pl.Expr]:
+    """``"season:round:original_roster"`` -> ``pick_season``, ``pick_round``, ``pick_roster``."""
+    p = (pl.col(asset_id) if isinstance(asset_id, str) else asset_id).str.split_exact(":", 2)
+    return [p.struct.field("field_0").cast(pl.Int16, strict=False).alias("pick_season"),
+            p.struct.field("field_1").cast(pl.Int8, strict=False).alias("pick_round"),
+            p.struct.field("field_2").cast(pl.Int16, strict=False).alias("pick_roster")]
+
+
+def pick_id(season="pick_season", rnd="pick_round", roster="pick_roster") -> pl.Expr:
+    """Inverse of ``pick_parts``."""
+    return pl.format("{}:{}:{}", pl.col(season), pl.col(rnd), pl.col(roster))
+
+
+def encode(ids: pl.Expr | str, keys: pl.Series) -> pl.Expr:
+    """Int32 key of each id in the sorted dim ids ``keys``; null for an id not in the dim."""
+    ids = pl.col(ids) if isinstance(ids, str) else ids
+    if keys.len() == 0:
+        return pl.lit(None, pl.Int32)
+    k = pl.lit(keys).search_sorted(ids).cast(pl.Int32)
+    found = pl.lit(keys).gather(k.clip(0, keys.len() - 1)) == ids
+    return pl.when(found).then(k)
+
+
+def decode(key: pl.Expr | str, keys: pl.Series) -> pl.Expr:
+    """The id of each key (the dim's sorted ids ``keys`` at that position)."""
+    return pl.lit(keys).gather(pl.col(key) if isinstance(key, str) else key)
+
+
+def franchise_dim(franchise_ids: pl.Series) -> pl.DataFrame:
+    """``franchise_key, franchise_id, lineage_id, roster_id`` over the distinct ids."""
+    ids = franchise_ids.cast(pl.Utf8).drop_nulls().unique().sort()
+    return pl.DataFrame({"franchise_id": ids}).with_row_index("franchise_key").select(
+        pl.col("franchise_key").cast(pl.Int32),
+        "franchise_id",
+        pl.col("franchise_id").str.replace(r"_[^_]*$", "").alias("lineage_id"),
+        pl.col("franchise_id").str.extract(r"_([^_]*)$").cast(pl.Int32, strict=False).alias("roster_id"),
+    )
+
+
+def player_dim(player_ids: pl.Series) -> pl.DataFrame:
+    """``player_key, player_id`` over the distinct ids."""
+    ids = player_ids.cast(pl.Utf8).drop_nulls().unique().sort()
+    return pl.DataFrame({"player_id": ids}).with_row_index("player_key").with_columns(
+        pl.col("player_key").cast(pl.Int32))
+
+
+def encode_ledger(ledger: pl.DataFrame | pl.LazyFrame
+                  ) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """String-keyed ledger -> (compact ledger, franchise dim, player dim)."""
+    led = ledger.lazy().select(LEDGER_COLS).collect()
+    is_player = pl.col("asset_type") == "player"
+    franchises = franchise_dim(led["franchise_id"])
+    players = player_dim(led.filter(is_player)["asset_id"])
+    compact = led.select(
+        encode("franchise_id", franchises["franchise_id"]).alias("franchise_key"),
+        pl.col("asset_type").cast(ASSET_TYPES),
+        pl.when(is_player).then(encode("asset_id", players["player_id"])).alias("player_key"),
+        *(pl.when(~is_player).then(p) for p in pick_parts()),
+        pl.col("valid_from").cast(pl.Utf8).str.to_date("%Y-%m-%d"),
+        pl.col("valid_to").cast(pl.Utf8).str.to_date("%Y-%m-%d"),
+        "is_current",
+    )
+    return compact.cast(COMPACT_SCHEMA), franchises, players
+
+
+def decode_ledger(compact: pl.DataFrame | pl.LazyFrame, franchises: pl.DataFrame,
+                  players: pl.DataFrame) -> pl.LazyFrame:
+    """Inverse of ``encode_ledger``: the string-keyed ledger columns."""
+    return compact.lazy().select(
+        decode("franchise_key", franchises["franchise_id"]).alias("franchise_id"),
+        pl.col("asset_type").cast(pl.Utf8),
+        pl.when(pl.col("asset_type") == "player")
+          .then(decode(pl.col("player_key").fill_null(0), players["player_id"]) if players.height
+                else pl.lit(None, pl.Utf8))
+          .otherwise(pick_id()).alias("asset_id"),
+        pl.col("valid_from").cast(pl.Utf8),
+        pl.col("valid_to").cast(pl.Utf8),
+        "is_current",
+    )
@@ -0,0 +1,247 @@
+"""silver_fantasy/_ownership_index.py
+
+As-of ownership lookups over the SCD2 ``fact_roster_membership`` ledger.
+
+Like ``_pick_projection`` this is a library for the analysis/measure layer, not a deployed
+job. ``held_on`` answers "who held what on D" by filtering every interval of the ledger; the
+index answers the same questions by binary search over two sort orders of the intervals:
+
+* **by asset**: rows sorted by (asset, lineage, valid_from). A player sits on at most one
+  roster per league lineage at a time, so within an (asset, lineage) segment the intervals
+  are disjoint and the holder on day D is the last interval opened by D, if it is still
+  open. One ``searchsorted`` over a packed ``segment << 32 | valid_from`` key answers it,
+  for one query or a whole column of them.
+* **by franchise**: rows sorted by (franchise, valid_from). A roster on D is the franchise's
+  intervals opened by D that haven't closed yet; only that prefix is masked.
+
+Ids are dictionary-encoded against sorted string arrays and days are int32 epoch days, so
+the index is a handful of flat numpy arrays. ``save`` writes them as ``.npy`` files and
+``OwnershipIndex.load`` memory-maps them back, so a notebook opens the index without reading
+the ledger.
+"""
+from __future__ import annotations
+
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+INDEX_VERSION = 1
+_OPEN = np.iinfo(np.int32).max          # valid_to of an interval that is still open
+_LAST = "\U0010ffff"                    # sorts after every id character (prefix ranges)
+_ARRAYS = ("franchises", "seg_keys", "seg_off", "a_key", "a_to", "a_fr",
+           "fr_off", "f_from", "f_to", "f_seg")
+
+
+def _epoch_days(col: str) -> pl.Expr:
+    """ISO-string or Date column -> int32 days since 1970-01-01."""
+    return pl.col(col).cast(pl.Utf8).str.to_date().cast(pl.Int32)
+
+
+def _day(on: str | date) -> int:
+    if isinstance(on, str):
+        on = date.fromisoformat(on)
+    elif isinstance(on, datetime):
+        on = on.date()
+    return on.toordinal() - date(1970, 1, 1).toordinal()
+
+
+def _offsets(codes: np.ndarray, n: int) -> np.ndarray:
+    """CSR offsets of sorted ``codes`` in ``range(n)``: rows of code c are ``off[c]:off[c+1]``."""
+    return np.searchsorted(codes, np.arange(n + 1)).astype(np.int64)
+
+
+def _strings(s: pl.Series) -> np.ndarray:
+    return np.asarray(s.to_list(), dtype=str) if s.len() else np.array([], dtype="<U1")
+
+
+class OwnershipIndex:
+    """Binary-searchable ownership index built from the SCD2 ledger (``build``) or
+    memory-mapped from disk (``load``).
+
+    Scalar queries (``holder``, ``holders``, ``roster``, ``history``) touch one segment;
+    bulk queries (``holders_at``, ``rosters_on``) answer a whole frame in one vectorized
+    pass. Days are ISO strings or dates; ``valid_to`` is exclusive and null while open.
+    """
+
+    def __init__(self, **arrays: np.ndarray):
+        missing = set(_ARRAYS) - set(arrays)
+        if missing:
+            raise ValueError(f"ownership index is missing arrays: {sorted(missing)}")
+        for name in _ARRAYS:
+            setattr(self, name, arrays[name])
+
+    def __len__(self) -> int:
+        return len(self.a_key)
+
+    # ------------------------------------------------------------------ build / io
+    @classmethod
+    def build(cls, ledger: pl.DataFrame | pl.LazyFrame) -> OwnershipIndex:
+        """Index a ledger with ``franchise_id, asset_type, asset_id, valid_from, valid_to``."""
+        iv = (
+            ledger.lazy()
+            .select(
+                pl.col("franchise_id").cast(pl.Utf8),
+                pl.concat_str(pl.col("asset_type"), pl.lit(":"), pl.col("asset_id").cast(pl.Utf8),
+                              pl.lit("@"), pl.col("franchise_id").str.replace(r"_[^_]*$", ""))
+                .alias("seg"),
+                _epoch_days("valid_from").alias("vf"),
+                _epoch_days("valid_to").fill_null(_OPEN).alias("vt"),
+            )
+            # dense ranks follow byte order, which is the code-point order numpy sorts by
+            .with_columns((pl.col("seg").rank("dense") - 1).cast(pl.Int64).alias("s"),
+                          (pl.col("franchise_id").rank("dense") - 1).cast(pl.Int32).alias("f"))
+            .collect()
+        )
+        franchises = _strings(iv["franchise_id"].unique().sort())
+        seg_keys = _strings(iv["seg"].unique().sort())
+        by_a = iv.sort("s", "vf")
+        by_f = iv.sort("f", "vf")
+        return cls(
+            franchises=franchises,
+            seg_keys=seg_keys,
+            seg_off=_offsets(by_a["s"].to_numpy(), len(seg_keys)),
+            a_key=(by_a["s"] * (1 << 32) + by_a["vf"]).to_numpy().astype(np.int64),
+            a_to=by_a["vt"].to_numpy(),
+            a_fr=by_a["f"].to_numpy(),
+            fr_off=_offsets(by_f["f"].to_numpy(), len(franchises)),
+            f_from=by_f["vf"].to_numpy(),
+            f_to=by_f["vt"].to_numpy(),
+            f_seg=by_f["s"].to_numpy().astype(np.int32),
+        )
+
+    def save(self, path: str | Path, source=None) -> Path:
+        """Write the arrays as ``<path>/<name>.npy`` plus a ``meta.json`` version stamp.
+        ``source`` (JSON) records what the index was built from; see ``saved_source``. Each
+        file is written beside its target and renamed over it, so an index already mapped
+        from ``path`` keeps reading the old arrays."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in _ARRAYS:
+            with open(path / f"{name}.npy.tmp", "wb") as f:
+                np.save(f, np.ascontiguousarray(getattr(self, name)))
+            os.replace(path / f"{name}.npy.tmp", path / f"{name}.npy")
+        (path / "meta.json.tmp").write_text(json.dumps({"version": INDEX_VERSION, "rows": len(self),
+                                                        "source": source}))
+        os.replace(path / "meta.json.tmp", path / "meta.json")
+        return path
+
+    @staticmethod
+    def saved_source(path: str | Path):
+        """The ``source`` a saved index was stamped with (``None`` if there is none)."""
+        meta = Path(path) / "meta.json"
+        return json.loads(meta.read_text()).get("source") if meta.exists() else None
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> OwnershipIndex:
+        """Open a saved index; with ``mmap`` the arrays are paged in on first touch."""
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        if meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"{path}: ownership index version {meta.get('version')}, "
+                             f"expected {INDEX_VERSION}; rebuild it")
+        mode = "r" if mmap else None
+        return cls(**{name: np.load(path / f"{name}.npy", mmap_mode=mode) for name in _ARRAYS})
+
+    # -------------------------------------------------------------------- helpers
+    @staticmethod
+    def _code(keys: np.ndarray, key: str) -> int:
+        i = int(np.searchsorted(keys, key))
+        return i if i < len(keys) and keys[i] == key else -1
+
+    def _holder_in(self, s: int, d: int) -> str | None:
+        i = int(np.searchsorted(self.a_key, (s << 32) + d, side="right")) - 1
+        if i < self.seg_off[s] or self.a_to[i] <= d:
+            return None
+        return str(self.franchises[self.a_fr[i]])
+
+    def _segments(self, asset_type: str, asset_id: str) -> tuple[int, int]:
+        prefix = f"{asset_type}:{asset_id}@"
+        lo, hi = np.searchsorted(self.seg_keys, [prefix, prefix + _LAST])
+        return int(lo), int(hi)
+
+    def _assets(self, segs: np.ndarray) -> tuple[list[str], list[str]]:
+        keys = [str(k).rpartition("@")[0].partition(":") for k in self.seg_keys[segs]]
+        return [k[0] for k in keys], [k[2] for k in keys]
+
+    # -------------------------------------------------------------------- queries
+    def holder(self, asset_type: str, asset_id: str, on: str | date, lineage_id: str) -> str | None:
+        """Franchise holding the asset in one league lineage on ``on`` (None if unheld)."""
+        s = self._code(self.seg_keys, f"{asset_type}:{asset_id}@{lineage_id}")
+        return self._holder_in(s, _day(on)) if s >= 0 else None
+
+    def holders(self, asset_type: str, asset_id: str, on: str | date) -> list[str]:
+        """Every franchise holding the asset on ``on``, one per lineage at most."""
+        lo, hi = self._segments(asset_type, asset_id)
+        d = _day(on)
+        return [h for s in range(lo, hi) if (h := self._holder_in(s, d)) is not None]
+
+    def roster(self, franchise_id: str, on: str | date) -> list[tuple[str, str]]:
+        """``(asset_type, asset_id)`` pairs the franchise held on ``on``."""
+        f = self._code(self.franchises, franchise_id)
+        if f < 0:
+            return []
+        lo, hi, d = int(self.fr_off[f]), int(self.fr_off[f + 1]), _day(on)
+        opened = lo + int(np.searchsorted(self.f_from[lo:hi], d, side="right"))
+        live = self.f_seg[lo + np.flatnonzero(self.f_to[lo:opened] > d)]
+        return list(zip(*self._assets(live)))
+
+    def history(self, asset_type: str, asset_id: str, lineage_id: str | None = None) -> pl.DataFrame:
+        """Ownership intervals of one asset (in every lineage unless one is given)."""
+        if lineage_id is None:
+            lo, hi = self._segments(asset_type, asset_id)
+        else:
+            s = self._code(self.seg_keys, f"{asset_type}:{asset_id}@{lineage_id}")
+            lo, hi = (s, s + 1) if s >= 0 else (0, 0)
+        rows = slice(int(self.seg_off[lo]), int(self.seg_off[hi])) if hi > lo else slice(0, 0)
+        vt = self.a_to[rows]
+        n = len(vt)
+        return pl.DataFrame([
+            pl.Series("franchise_id", self.franchises[self.a_fr[rows]].tolist(), dtype=pl.Utf8),
+            pl.Series("asset_type", [asset_type] * n, dtype=pl.Utf8),
+            pl.Series("asset_id", [str(asset_id)] * n, dtype=pl.Utf8),
+            pl.Series("valid_from", (self.a_key[rows] & 0xFFFFFFFF).astype(np.int32)).cast(pl.Date),
+            pl.Series("valid_to", vt.astype(np.int32)).cast(pl.Date)
+            .scatter(np.flatnonzero(vt == _OPEN), None),
+        ]).sort("valid_from", "franchise_id")
+
+    def holders_at(self, queries: pl.DataFrame, date_col: str = "date") -> pl.DataFrame:
+        """Bulk ``holder``: ``queries`` with ``asset_type, asset_id, lineage_id, <date_col>``
+        gains a ``franchise_id`` column (null where nobody held the asset)."""
+        if queries.height == 0 or len(self) == 0:
+            return queries.with_columns(pl.lit(None, dtype=pl.Utf8).alias("franchise_id"))
+        keys = queries.select(
+            pl.concat_str(pl.col("asset_type"), pl.lit(":"), pl.col("asset_id").cast(pl.Utf8),
+                          pl.lit("@"), pl.col("lineage_id").cast(pl.Utf8)).alias("k"),
+            _epoch_days(date_col).alias("d"),
+        )
+        k, d = _strings(keys["k"]), keys["d"].to_numpy().astype(np.int64)
+        s = np.minimum(np.searchsorted(self.seg_keys, k), len(self.seg_keys) - 1)
+        i = np.searchsorted(self.a_key, (s.astype(np.int64) << 32) + d, side="right") - 1
+        i_ok = np.maximum(i, 0)
+        hit = (self.seg_keys[s] == k) & (i >= self.seg_off[s]) & (self.a_to[i_ok] > d)
+        return queries.with_columns(
+            pl.when(pl.Series(hit)).then(pl.Series(self.franchises[self.a_fr[i_ok]].tolist(),
+                                                   dtype=pl.Utf8))
+            .alias("franchise_id"))
+
+    def rosters_on(self, on: str | date, lineage_id: str | None = None) -> pl.DataFrame:
+        """Every holding on ``on`` -> ``(franchise_id, asset_type, asset_id)``; with
+        ``lineage_id`` only that lineage's franchises are looked at."""
+        if lineage_id is None:
+            lo, hi = 0, len(self.franchises)
+        else:
+            prefix = f"{lineage_id}_"
+            lo, hi = (int(x) for x in np.searchsorted(self.franchises, [prefix, prefix + _LAST]))
+        rows = slice(int(self.fr_off[lo]), int(self.fr_off[hi]))
+        d = _day(on)
+        live = rows.start + np.flatnonzero((self.f_from[rows] <= d) & (self.f_to[rows] > d))
+        f = np.searchsorted(self.fr_off, live, side="right") - 1
+        types, ids = self._assets(self.f_seg[live])
+        return pl.DataFrame({"franchise_id": self.franchises[f].tolist(), "asset_type": types,
+                             "asset_id": ids},
+                            schema={"franchise_id": pl.Utf8, "asset_type": pl.Utf8,
+                                    "asset_id": pl.Utf8})
@@ -2,10 +2,12 @@ import os
 import polars as pl
 from dotenv import load_dotenv
 
+from lake_io import lake_uri, write_parquet
+
 load_dotenv()
 
 BUCKET_NAME = os.environ.get('GCS_BUCKET_NAME')
-BUCKET_ROOT = f"gs://{BUCKET_NAME}"
+BUCKET_ROOT = lake_uri(BUCKET_NAME)
 
 MAIN_STAGING_PATH = f"{BUCKET_ROOT}/silver/fantasy/_staging/asset_values_long"
 DEVY_STAGING_PATH = f"{BUCKET_ROOT}/silver/fantasy/_staging/devy_values.parquet"
@@ -121,14 +123,15 @@ def main():
 
     print(f"Collecting and Writing Main Data to {MAIN_STAGING_PATH}...")
     # Use collect() + write_parquet to support partition_by safely
-    main_lf.collect().write_parquet(
+    write_parquet(
+        main_lf.collect(),
         MAIN_STAGING_PATH,
         partition_by="market_type",
         use_pyarrow=True
     )
 
     print(f"Writing Devy Data to {DEVY_STAGING_PATH}...")
-    lf_ktc_devy_long.collect().write_parquet(DEVY_STAGING_PATH)
+    write_parquet(lf_ktc_devy_long.collect(), DEVY_STAGING_PATH)
 
     print("Done.")
 
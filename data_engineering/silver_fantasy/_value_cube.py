@@ -0,0 +1,256 @@
+"""silver_fantasy/_value_cube.py
+
+Materialized team value cube: every asset a franchise held, valued on every date of a grid,
+for one value lens (source x QB format x TE premium).
+
+``team_value_timeseries``, ``team_power_index`` and ``league_diagnostics`` all start from the
+same rows: the ledger exploded onto the grid, each held player as-of joined to its value and
+each held pick to its round value (backfilled to the class's first-priced value before the
+source prices it). The cube keeps those rows (``date, franchise_id, asset_type, asset_id,
+value``; ``value`` is null for an asset with no price) and the per-(franchise, date) team
+sums, so a chart aggregates instead of re-valuing the ledger. ``update`` keeps it current
+without a rebuild:
+
+* grid dates it lacks are valued, and so are grid dates after the last player valuation date
+  it saw once newer valuations arrive (their as-of values were provisional);
+* assets named in the ledger's change feed (``_ledger_changes``) are revalued over the grid;
+* if value history it already used changed (a restatement, or a newly priced draft class
+  moving the pick backfill), it rebuilds.
+
+Ids are categorical strings rather than ``_ledger_keys`` keys, which don't survive a ledger
+version. ``save`` writes the rows sorted by date with the team sums and a ``meta.json`` stamp;
+``ValueCube.load`` reads them back. Like ``_ownership_index`` this is a library for the
+analysis/measure layer; it depends on polars only.
+"""
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+
+from _intervals import points_in_chunks
+from _ledger_keys import ASSET_TYPES, decode, encode, encode_ledger, pick_id
+
+CUBE_VERSION = 1
+ROW_COLS = ["date", "franchise_id", "asset_type", "asset_id", "value"]
+TEAM_COLS = ["franchise_id", "date", "player_value", "n_player", "pick_value", "n_pick", "total_value"]
+_IDS = {"franchise_id": pl.Categorical, "asset_type": ASSET_TYPES, "asset_id": pl.Categorical}
+_CLASS = ["pick_season", "pick_round"]
+
+
+def _grid(dates) -> pl.Series:
+    """ISO strings or dates -> sorted distinct ``Date`` series."""
+    s = pl.Series("date", list(dates))
+    return (s.str.to_date("%Y-%m-%d") if s.dtype == pl.Utf8 else s.cast(pl.Date)).unique().sort()
+
+
+def _prices(player_values: pl.DataFrame, pick_values: pl.DataFrame | None
+            ) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """-> positive player values ``(valuation_date, player_id, value)`` and round pick values
+    ``(pick_season, pick_round, valuation_date, value)``, both in date order."""
+    pv = (player_values.select(pl.col("valuation_date").cast(pl.Date),
+                               pl.col("player_id").cast(pl.Utf8), "value")
+          .drop_nulls().filter(pl.col("value") > 0).sort("valuation_date"))
+    if pick_values is None:
+        pick_values = pl.DataFrame(schema={"season": pl.Utf8, "round": pl.Int64,
+                                           "valuation_date": pl.Date, "value": pl.Int64})
+    pk = pick_values.select(pl.col("season").cast(pl.Int16, strict=False).alias("pick_season"),
+                            pl.col("round").cast(pl.Int8, strict=False).alias("pick_round"),
+                            pl.col("valuation_date").cast(pl.Date), "value").sort("valuation_date")
+    return pv, pk
+
+
+def _through(pv: pl.DataFrame) -> date | None:
+    """The last player valuation date: grid dates after it only have provisional values."""
+    return pv["valuation_date"].max()
+
+
+def _fingerprint(pv: pl.DataFrame, pk: pl.DataFrame, through: date | None) -> str:
+    """Order-insensitive hash of the value history up to ``through`` plus each pick class's
+    first-priced value (which backfills every earlier date). Two wrapping sums of row hashes;
+    a polars upgrade can change them once, which costs one rebuild."""
+    first = pk.group_by(_CLASS).agg(pl.col("value").first())
+    if through is not None:
+        pv = pv.filter(pl.col("valuation_date") <= through)
+        pk = pk.filter(pl.col("valuation_date") <= through)
+    parts = []
+    for df in (pv, pk, first):
+        parts += [df.height, df.hash_rows(seed=0).sum(), df.hash_rows(seed=1, seed_1=2).sum()]
+    return ":".join(str(p or 0) for p in parts)
+
+
+def _value_rows(ledger: pl.DataFrame | pl.LazyFrame, grid: pl.Series, pv: pl.DataFrame,
+                pk: pl.DataFrame, chunk_days: int) -> pl.DataFrame:
+    """Value every (asset, grid date) the ledger holds, ``chunk_days`` dates at a time."""
+    led, franchises, players = encode_ledger(ledger)
+    keyed = (pv.select("valuation_date", encode("player_id", players["player_id"]).alias("player_key"),
+                       "value").drop_nulls("player_key"))
+    first = pk.group_by(_CLASS).agg(pl.col("value").first().alias("_first"))
+    is_player = pl.col("asset_type") == "player"
+    parts = []
+    for hold in points_in_chunks(led, grid, chunk_days):
+        # the as-of joins need both sides in date order (``_prices`` sorts the right); polars can't
+        # verify that within ``by`` groups and would warn on every chunk
+        hold = hold.sort("date")
+        held_players = (
+            hold.filter(is_player)
+            .join_asof(keyed, left_on="date", right_on="valuation_date", by="player_key", strategy="backward",
+                       check_sortedness=False)
+            .select("date", "franchise_key", "asset_type",
+                    decode("player_key", players["player_id"]).alias("asset_id"), "value")
+        )
+        # before the source prices a class the backward as-of is null: use its first price
+        held_picks = (
+            hold.filter(~is_player)
+            .join_asof(pk, left_on="date", right_on="valuation_date", by=_CLASS, strategy="backward",
+                       check_sortedness=False)
+            .join(first, on=_CLASS, how="left")
+            .select("date", "franchise_key", "asset_type", pick_id().alias("asset_id"),
+                    pl.coalesce("value", "_first").alias("value"))
+        )
+        parts.append(
+            pl.concat([held_players, held_picks], how="vertical_relaxed")
+            .select("date", decode("franchise_key", franchises["franchise_id"]).alias("franchise_id"),
+                    "asset_type", "asset_id", "value")
+            .cast(_IDS)
+        )
+    return pl.concat(parts, how="vertical_relaxed")
+
+
+def _teams(rows: pl.DataFrame) -> pl.DataFrame:
+    """Per (franchise, date): the player and pick value sums and the counts of priced assets."""
+    player = pl.col("asset_type") == "player"
+    priced = pl.col("value") > 0
+    return (
+        rows.group_by("franchise_id", "date")
+        .agg(pl.col("value").filter(player).fill_null(0).sum().alias("player_value"),
+             (player & priced).sum().alias("n_player"),
+             pl.col("value").filter(~player).fill_null(0).sum().alias("pick_value"),
+             (~player & priced).sum().alias("n_pick"))
+        .with_columns((pl.col("player_value") + pl.col("pick_value")).alias("total_value"))
+        .select(TEAM_COLS)
+    )
+
+
+class ValueCube:
+    """Valued holdings of one lens on a date grid, built from the ledger (``build``), kept
+    current (``update``) or read from disk (``load``).
+
+    ``player_values`` are ``(valuation_date, player_id, value)`` in the lens's value column;
+    ``pick_values`` are round-level ``(season, round, valuation_date, value)`` (``None``
+    leaves picks unpriced). Dates are ISO strings or dates; the cube stores ``Date``.
+    """
+
+    def __init__(self, rows: pl.DataFrame, meta: dict, teams: pl.DataFrame | None = None):
+        self.rows = rows
+        self.meta = meta
+        self.teams = teams if teams is not None else _teams(rows)
+
+    def __len__(self) -> int:
+        return self.rows.height
+
+    @property
+    def dates(self) -> list[str]:
+        """The grid, as ISO strings."""
+        return list(self.meta["dates"])
+
+    @property
+    def ledger_version(self) -> int | None:
+        return self.meta["ledger_version"]
+
+    # ------------------------------------------------------------------ build / io
+    @classmethod
+    def _meta(cls, grid: pl.Series, pv: pl.DataFrame, pk: pl.DataFrame,
+              ledger_version: int | None, lens: str | None) -> dict:
+        through = _through(pv)
+        return {"version": CUBE_VERSION, "lens": lens, "ledger_version": ledger_version,
+                "dates": [d.isoformat() for d in grid],
+                "values_through": through.isoformat() if through is not None else None,
+                "values_fingerprint": _fingerprint(pv, pk, through)}
+
+    @classmethod
+    def build(cls, ledger: pl.DataFrame | pl.LazyFrame, dates, player_values: pl.DataFrame,
+              pick_values: pl.DataFrame | None = None, chunk_days: int = 64,
+              ledger_version: int | None = None, lens: str | None = None) -> ValueCube:
+        """Value every holding of ``ledger`` on ``dates``. ``ledger_version`` (the ledger's
+        version pointer) is what ``update`` replays the change feed from."""
+        grid = _grid(dates)
+        pv, pk = _prices(player_values, pick_values)
+        return cls(_value_rows(ledger, grid, pv, pk, chunk_days),
+                   cls._meta(grid, pv, pk, ledger_version, lens))
+
+    def is_current(self, dates, player_values: pl.DataFrame, pick_values: pl.DataFrame | None = None,
+                   ledger_version: int | None = None) -> bool:
+        """True when ``update`` would change nothing (without reading the ledger)."""
+        grid = _grid(dates)
+        pv, pk = _prices(player_values, pick_values)
+        return self._meta(grid, pv, pk, ledger_version, self.meta["lens"]) == self.meta
+
+    def update(self, ledger: pl.DataFrame | pl.LazyFrame, dates, player_values: pl.DataFrame,
+               pick_values: pl.DataFrame | None = None, changes: pl.DataFrame | None = None,
+               ledger_version: int | None = None, chunk_days: int = 64) -> ValueCube:
+        """The cube on grid ``dates`` for the current ``ledger`` and values, revaluing only what
+        moved: new grid dates, provisional dates once newer valuations exist, and the assets in
+        ``changes`` (the change feed since this cube's ``ledger_version``). Dates dropped from
+        the grid are dropped. Without ``changes`` a different ``ledger_version`` rebuilds, as
+        does any change to the value history the cube used."""
+        grid = _grid(dates)
+        pv, pk = _prices(player_values, pick_values)
+        lens = self.meta["lens"]
+        old_through = self.meta["values_through"]
+        old_through = date.fromisoformat(old_through) if old_through is not None else None
+        if (_fingerprint(pv, pk, old_through) != self.meta["values_fingerprint"]
+                or (changes is None and ledger_version != self.ledger_version)):
+            return ValueCube(_value_rows(ledger, grid, pv, pk, chunk_days),
+                             self._meta(grid, pv, pk, ledger_version, lens))
+
+        keep = _grid(self.dates).filter(_grid(self.dates).is_in(grid))
+        if old_through is None or _through(pv) != old_through:
+            keep = keep.filter(keep <= old_through) if old_through is not None else keep.clear()
+        rows = self.rows.filter(pl.col("date").is_in(keep))
+        parts = [rows]
+        if changes is not None and changes.height:
+            moved = changes.select(pl.col("asset_type").cast(pl.Utf8), pl.col("asset_id").cast(pl.Utf8)).unique()
+            parts[0] = rows.join(moved.cast({c: _IDS[c] for c in moved.columns}), on=["asset_type", "asset_id"], how="anti")
+            held = (ledger.lazy()
+                    .with_columns(pl.col("asset_type").cast(pl.Utf8), pl.col("asset_id").cast(pl.Utf8))
+                    .join(moved.lazy(), on=["asset_type", "asset_id"], how="semi"))
+            parts.append(_value_rows(held, keep, pv, pk, chunk_days))
+        parts.append(_value_rows(ledger, grid.filter(~grid.is_in(keep)), pv, pk, chunk_days))
+        return ValueCube(pl.concat(parts, how="vertical_relaxed"),
+                         self._meta(grid, pv, pk, ledger_version, lens))
+
+    def save(self, path: str | Path) -> Path:
+        """Write ``rows.parquet`` (sorted by date, so date filters skip row groups),
+        ``teams.parquet`` and a ``meta.json`` version stamp under ``path``."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        self.rows.sort("date", "franchise_id").write_parquet(path / "rows.parquet", statistics=True)
+        self.teams.sort("date", "franchise_id").write_parquet(path / "teams.parquet")
+        (path / "meta.json").write_text(json.dumps(self.meta))
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> ValueCube:
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        if meta.get("version") != CUBE_VERSION:
+            raise ValueError(f"{path}: value cube version {meta.get('version')}, "
+                             f"expected {CUBE_VERSION}; rebuild it")
+        return cls(pl.read_parquet(path / "rows.parquet"), meta,
+                   teams=pl.read_parquet(path / "teams.parquet"))
+
+    # -------------------------------------------------------------------- queries
+    def on(self, dates=None) -> pl.DataFrame:
+        """The valued holdings on ``dates`` (all of the grid when ``None``)."""
+        if dates is None:
+            return self.rows
+        return self.rows.filter(pl.col("date").is_in(_grid(dates)))
+
+    def team_values(self, dates=None) -> pl.DataFrame:
+        """(franchise_id, date, player_value, n_player, pick_value, n_pick, total_value) per
+        franchise holding anything on a grid date, for ``dates`` (all when ``None``)."""
+        teams = self.teams if dates is None else self.teams.filter(pl.col("date").is_in(_grid(dates)))
+        return teams.with_columns(pl.col("franchise_id").cast(pl.Utf8)).sort("franchise_id", "date")
@@ -84,22 +84,21 @@ def build_dim_dates(schedules: pl.DataFrame, end_date: date | None = None) -> pl
 
 
 def _read_schedules(bucket_name: str) -> pl.DataFrame:
-    from google.cloud import storage
-    client = storage.Client()
-    names = sorted(b.name for b in client.bucket(bucket_name).list_blobs(prefix="bronze/nflverse/schedules/")
-                   if b.name.endswith(".parquet"))
-    return pl.concat([pl.read_parquet(f"gs://{bucket_name}/{n}").select("season", "game_type", "gameday")
-                      for n in names], how="vertical_relaxed")
+    from lake_io import get_bucket, partition_objects, read_objects
+    names = partition_objects(get_bucket(bucket_name), "bronze/nflverse/schedules/")
+    return read_objects(bucket_name, names, columns=["season", "game_type", "gameday"],
+                        hive_columns=False, how="vertical_relaxed")
 
 
 def main():
+    from lake_io import lake_uri, write_parquet
     bucket_name = os.environ.get("GCS_BUCKET_NAME")
     print("Reading nflverse schedules...")
     schedules = _read_schedules(bucket_name)
     dim = build_dim_dates(schedules)
-    path = f"gs://{bucket_name}/silver/fantasy/dim_dates/data.parquet"
+    path = lake_uri(bucket_name, "silver/fantasy/dim_dates/data.parquet")
     print(f"Writing {dim.height} dates ({dim['date'].min()} -> {dim['date'].max()}) to {path}...")
-    dim.write_parquet(path)
+    write_parquet(dim, path)
     print("Done.")
 
 
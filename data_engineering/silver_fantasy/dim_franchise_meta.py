@@ -5,6 +5,7 @@ import os
 import polars as pl
 from dotenv import load_dotenv
 
+from lake_io import lake_uri, write_parquet
 from utils import get_latest_bronze_path, merge_full_and_incremental
 
 load_dotenv()
@@ -12,8 +13,8 @@ load_dotenv()
 def transform_dim_franchises_meta() -> pl.DataFrame:
     bucket_name = os.environ.get('GCS_BUCKET_NAME')
 
-    leagues_path = f"gs://{bucket_name}/silver/fantasy/dim_leagues_meta/data.parquet"
-    users_path = f"gs://{bucket_name}/silver/fantasy/dim_users/data.parquet"
+    leagues_path = lake_uri(bucket_name, "silver/fantasy/dim_leagues_meta/data.parquet")
+    users_path = lake_uri(bucket_name, "silver/fantasy/dim_users/data.parquet")
     rosters_path = get_latest_bronze_path(bucket_name, "rosters/team_state/daily")
 
     leagues_df = pl.read_parquet(leagues_path)
@@ -79,9 +80,9 @@ def transform_dim_franchises_meta() -> pl.DataFrame:
     )
 
 def save_df_to_gcs(df: pl.DataFrame, bucket_name: str):
-    file_path = f"gs://{bucket_name}/silver/fantasy/dim_franchises_meta/data.parquet"
+    file_path = lake_uri(bucket_name, "silver/fantasy/dim_franchises_meta/data.parquet")
     try:
-        df.write_parquet(file_path)
+        write_parquet(df, file_path)
         print(f"✅ Saved franchises meta to {file_path}")
     except Exception as e:
         print(f"Failed to save to GCS: {e}")
@@ -85,26 +85,25 @@ def build_dim_league_events(drafts, settings, leagues, schedules) -> pl.DataFram
 
 def _read_drafts_schedules(bucket_name: str):
     from utils import get_latest_bronze_path
-    from google.cloud import storage
+    from lake_io import get_bucket, partition_objects, read_objects
     drafts = pl.read_parquet(get_latest_bronze_path(bucket_name, "drafts/drafts", source="sleeper"))
-    client = storage.Client()
-    sched_names = sorted(b.name for b in client.bucket(bucket_name).list_blobs(prefix="bronze/nflverse/schedules/")
-                         if b.name.endswith(".parquet"))
-    schedules = pl.concat([pl.read_parquet(f"gs://{bucket_name}/{n}").select("season", "game_type", "week", "gameday")
-                           for n in sched_names], how="vertical_relaxed")
+    sched_names = partition_objects(get_bucket(bucket_name), "bronze/nflverse/schedules/")
+    schedules = read_objects(bucket_name, sched_names, columns=["season", "game_type", "week", "gameday"],
+                             hive_columns=False, how="vertical_relaxed")
     return drafts, schedules
 
 
 def main():
+    from lake_io import lake_uri, write_parquet
     bucket_name = os.environ.get("GCS_BUCKET_NAME")
-    leagues = pl.read_parquet(f"gs://{bucket_name}/silver/fantasy/dim_leagues_meta/data.parquet")
-    settings = pl.read_parquet(f"gs://{bucket_name}/silver/fantasy/dim_league_settings/data.parquet")
+    leagues = pl.read_parquet(lake_uri(bucket_name, "silver/fantasy/dim_leagues_meta/data.parquet"))
+    settings = pl.read_parquet(lake_uri(bucket_name, "silver/fantasy/dim_league_settings/data.parquet"))
     drafts, schedules = _read_drafts_schedules(bucket_name)
 
     dim = build_dim_league_events(drafts, settings, leagues, schedules)
-    path = f"gs://{bucket_name}/silver/fantasy/dim_league_events/data.parquet"
+    path = lake_uri(bucket_name, "silver/fantasy/dim_league_events/data.parquet")
     print(f"Writing {dim.height} league events ({dim['event_type'].unique().to_list()}) to {path}...")
-    dim.write_parquet(path)
+    write_parquet(dim, path)
     print("Done.")
 
 
@@ -5,6 +5,7 @@ import os
 import polars as pl
 from dotenv import load_dotenv
 
+from lake_io import lake_uri, write_parquet
 from utils import get_latest_bronze_path, merge_full_and_incremental
 
 load_dotenv()
@@ -22,7 +23,7 @@ def transform_dim_league_settings_scd2() -> pl.DataFrame:
     full_settings_path = get_latest_bronze_path(bucket_name, "league/settings/full_load")
     daily_settings_path = get_latest_bronze_path(bucket_name, "league/settings/incremental")
     
-    existing_silver_path = f"gs://{bucket_name}/silver/fantasy/dim_league_settings/data.parquet"
+    existing_silver_path = lake_uri(bucket_name, "silver/fantasy/dim_league_settings/data.parquet")
 
     # scoring (the base)
     scoring_df = merge_full_and_incremental(
@@ -198,10 +199,10 @@ def transform_dim_league_settings_scd2() -> pl.DataFrame:
     return result_df
 
 def save_df_to_gcs(df: pl.DataFrame, bucket_name: str):
-    file_path = f"gs://{bucket_name}/silver/fantasy/dim_league_settings/data.parquet"
+    file_path = lake_uri(bucket_name, "silver/fantasy/dim_league_settings/data.parquet")
     
     try:
-        df.write_parquet(file_path)
+        write_parquet(df, file_path)
         print(f"✅ Saved league settings SCD2 table to {file_path}") 
     except Exception as e:
         print(f"Failed to save to GCS: {e}")
@@ -5,6 +5,7 @@ import os
 import polars as pl
 from dotenv import load_dotenv
 
+from lake_io import lake_uri, write_parquet
 from utils import get_latest_bronze_path, merge_full_and_incremental
 
 load_dotenv()
@@ -89,10 +90,10 @@ def transform_dim_leagues_meta() -> pl.DataFrame:
     return dim_leagues_meta.select(target_cols)
 
 def save_df_to_gcs(df: pl.DataFrame, bucket_name: str):
-    file_path = f"gs://{bucket_name}/silver/fantasy/dim_leagues_meta/data.parquet"
+    file_path = lake_uri(bucket_name, "silver/fantasy/dim_leagues_meta/data.parquet")
     
     try:
-        df.write_parquet(file_path)
+        write_parquet(df, file_path)
         print(f"✅ Saved leagues meta table to {file_path}") 
     except Exception as e:
         print(f"Failed to save to GCS: {e}")
@@ -3,6 +3,7 @@ from datetime import datetime
 import os
 import polars as pl
 from dotenv import load_dotenv
+from lake_io import lake_uri, write_parquet
 from utils import get_latest_bronze_path
 
 load_dotenv()
@@ -131,9 +132,9 @@ def transform_dim_players_master() -> pl.DataFrame:
     return dim_players.select(existing_cols)
 
 def save_df_to_gcs(df: pl.DataFrame, bucket_name: str):
-    file_path = f"gs://{bucket_name}/silver/fantasy/dim_players_master/data.parquet"
+    file_path = lake_uri(bucket_name, "silver/fantasy/dim_players_master/data.parquet")
     try:
-        df.write_parquet(file_path)
+        write_parquet(df, file_path)
         print(f"✅ Saved master player table to {file_path}") 
     except Exception as e:
         print(f"Failed to save to GCS: {e}")
@@ -6,6 +6,7 @@ import polars as pl
 import pandas as pd # Used for reliable URL fetching
 from dotenv import load_dotenv
 
+from lake_io import lake_uri, write_parquet
 from utils import get_latest_bronze_path, merge_full_and_incremental
 
 load_dotenv()
@@ -78,9 +79,9 @@ def transform_dim_users() -> pl.DataFrame:
     return dim_users.select([c for c in target_cols if c in dim_users.columns])
 
 def save_df_to_gcs(df: pl.DataFrame, bucket_name: str):
-    file_path = f"gs://{bucket_name}/silver/fantasy/dim_users/data.parquet"
+    file_path = lake_uri(bucket_name, "silver/fantasy/dim_users/data.parquet")
     try:
-        df.write_parquet(file_path)
+        write_parquet(df, file_path)
         print(f"✅ Saved global dim_users to {file_path}") 
     except Exception as e:
         print(f"Failed to save to GCS: {e}")
@@ -2,17 +2,23 @@ import os
 import polars as pl
 from dotenv import load_dotenv
 
+from lake_io import lake_uri, scan_dataset, write_dataset, write_parquet
+
 load_dotenv()
 
 BUCKET_NAME = os.environ.get('GCS_BUCKET_NAME')
-BUCKET_ROOT = f"gs://{BUCKET_NAME}"
+BUCKET_ROOT = lake_uri(BUCKET_NAME)
 
 # INPUTS
 STAGING_PATH = f"{BUCKET_ROOT}/silver/fantasy/_staging/asset_values_long"
 DIM_PLAYERS_PATH = f"{BUCKET_ROOT}/silver/fantasy/dim_players_master/data.parquet"
 
 # OUTPUTS
+# hive partitions market_type=/qb_format=; files sorted by (player_id, te_premium,
+# valuation_date) with row-group stats so single-player and date-range reads prune
 FACT_PATH = f"{BUCKET_ROOT}/silver/fantasy/fact_asset_values_daily"
+FACT_PARTITION_BY = ["market_type", "qb_format"]
+FACT_SORT_BY = ["player_id", "te_premium", "valuation_date"]
 QUARANTINE_PATH = f"{BUCKET_ROOT}/silver/fantasy/quarantine/unmapped_players.parquet"
 
 COLS_TO_KEEP = ["valuation_date", "player_id", "name", "position",
@@ -102,16 +108,16 @@ def build_fact(df_valid: pl.DataFrame) -> pl.DataFrame:
 
 def main():
     print(f"Reading Staging Data from {STAGING_PATH}...")
-    df_staging = pl.read_parquet(STAGING_PATH).filter(pl.col("asset_type") == "PLAYER")
+    df_staging = scan_dataset(STAGING_PATH).filter(pl.col("asset_type") == "PLAYER").collect()
 
     print(f"Reading Dimensions from {DIM_PLAYERS_PATH}...")
-    df_dim = pl.read_parquet(DIM_PLAYERS_PATH).select([
+    df_dim = scan_dataset(DIM_PLAYERS_PATH).select([
         pl.col("player_key").alias("player_id"),
         pl.col("display_name").alias("name"),
         "ktc_id",
         "espn_id",
         "position",
-    ])
+    ]).collect()
 
     print("Resolving Player IDs...")
     df_valid, df_unmapped = resolve_and_split(df_staging, df_dim)
@@ -120,7 +126,7 @@ def main():
     if df_unmapped.height > 0:
         print(f"WARNING: Found {df_unmapped.height} unmapped players!")
         print(f"Writing quarantine data to: {QUARANTINE_PATH}")
-        df_unmapped.write_parquet(QUARANTINE_PATH)
+        write_parquet(df_unmapped, QUARANTINE_PATH)
         print("Writing local report to: unmapped_players_report.csv")
         df_unmapped.write_csv("unmapped_players_report.csv")
     else:
@@ -130,7 +136,7 @@ def main():
     df_fact = build_fact(df_valid)
 
     print(f"Writing Fact Table to {FACT_PATH}...")
-    df_fact.write_parquet(FACT_PATH, partition_by=["market_type"], use_pyarrow=True)
+    write_dataset(df_fact, FACT_PATH, partition_by=FACT_PARTITION_BY, sort_by=FACT_SORT_BY)
     print("Done.")
 
 
@@ -22,6 +22,10 @@ KTC feeds are unioned in precedence order **daily > full_load > local_load**:
   carries.
 Higher-precedence feeds win on overlapping keys.
 
+Layout: hive partitions ``market_type=/qb_format=``. Files are sorted by the pick key
+(``source_system, season, round, tier, te_premium``) and then ``valuation_date``, with
+row-group stats, so one pick's series or one date range reads only a few row groups.
+
 FantasyCalc pick values are also folded in (``source_system='fantasycalc'``), stored
 at the round level (``tier='NA'``) since FC has no Early/Mid/Late tiers.
 """
@@ -31,8 +35,13 @@ from datetime import datetime
 import polars as pl
 from dotenv import load_dotenv
 
+from lake_io import get_bucket, lake_uri, partition_objects, read_objects, write_dataset
+
 load_dotenv()
 
+PARTITION_BY = ["market_type", "qb_format"]
+SORT_BY = ["source_system", "season", "round", "tier", "te_premium", "valuation_date"]
+
 _ROUND_WORDS = {"1st": 1, "2nd": 2, "3rd": 3, "4th": 4}
 # KTC daily value columns -> (qb_format, te_premium)
 _KTC_VALUE_COLS = {
@@ -123,6 +132,36 @@ def parse_ktc_local_pick_values(local_df: pl.DataFrame, max_date: str | None = N
 
 
 _FC_ROUND_WORDS = {"1st": 1, "2nd": 2, "3rd": 3, "4th": 4}
+_FC_PICK = (r"^(?P<season>20\d{2})\s+(?:(?P<round_word>1st|2nd|3rd|4th)"
+            r"|Pick\s+(?P<round>\d+)\.(?P<slot>\d+))$")
+
+
+def split_fc_picks(fc_df: pl.DataFrame) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """FantasyCalc pick rows -> (round-level rows, exact-slot rows), one vectorized parse.
+
+    FC names a pick either round-generic (``2026 1st``) or by exact slot
+    (``2026 Pick 1.09``). Both get ``season`` and ``round`` (Int64), slot rows also
+    ``slot``; other names are dropped and the input's remaining columns are kept. Every
+    daily file repeats the same ~100 names, so each distinct name is parsed once.
+    """
+    g = pl.col("_g")
+    names = (
+        fc_df.select(pl.col("name").cast(pl.Utf8).unique())
+        .with_columns(pl.col("name").str.strip_chars().str.extract_groups(_FC_PICK).alias("_g"))
+        .filter(g.struct.field("season").is_not_null())
+        .select(
+            "name",
+            g.struct.field("season").cast(pl.Int64).alias("season"),
+            pl.coalesce(g.struct.field("round_word").replace_strict(_FC_ROUND_WORDS, default=None),
+                        g.struct.field("round")).cast(pl.Int64).alias("round"),
+            g.struct.field("slot").cast(pl.Int64).alias("slot"),
+        )
+    )
+    parsed = (fc_df.drop("season", "round", "slot", strict=False)
+              .with_columns(pl.col("name").cast(pl.Utf8))
+              .join(names, on="name", how="inner", maintain_order="left"))
+    is_slot = pl.col("slot").is_not_null()
+    return parsed.filter(~is_slot).drop("slot"), parsed.filter(is_slot)
 
 
 def parse_fc_pick_values(fc_df: pl.DataFrame) -> pl.DataFrame:
@@ -133,17 +172,11 @@ def parse_fc_pick_values(fc_df: pl.DataFrame) -> pl.DataFrame:
     rows (``2026 Pick 1.09``) are ignored here. FC's single ``value`` is its dynasty
     value -> recorded as DYNASTY / SF / Standard.
     """
-    pat = r"^(?P<season>20\d{2})\s+(?P<round>1st|2nd|3rd|4th)$"
+    rounds, _ = split_fc_picks(fc_df.filter(pl.col("position") == "PICK"))
     return (
-        fc_df
-        .filter(pl.col("position") == "PICK")
-        .with_columns(pl.col("name").str.extract_groups(pat).alias("_g"))
-        .filter(pl.col("_g").struct.field("season").is_not_null())
+        rounds
         .with_columns(
             pl.col("valuation_date").cast(pl.Utf8),
-            pl.col("_g").struct.field("season").cast(pl.Int64).alias("season"),
-            pl.col("_g").struct.field("round").replace_strict(_FC_ROUND_WORDS, default=None)
-              .cast(pl.Int64).alias("round"),
             pl.lit("NA").alias("tier"),
             pl.lit("DYNASTY").alias("market_type"),
             pl.lit("SF").alias("qb_format"),
@@ -168,26 +201,16 @@ def build_pick_values(daily_df: pl.DataFrame, local_df: pl.DataFrame) -> pl.Data
 
 def _read_ktc_prefix(bucket_name: str, prefix: str, suffix: str,
                      add_valuation_date_from_partition: bool) -> pl.DataFrame:
-    """Read every parquet under a KTC prefix and concat. For the daily feed the
-    valuation_date comes from the ``load_date=`` partition; the archive carries its
-    own ``date`` column."""
-    from google.cloud import storage
-
-    client = storage.Client()
-    names = [
-        b.name for b in client.bucket(bucket_name).list_blobs(prefix=prefix)
-        if b.name.endswith(suffix)
-    ]
-    if not names:
-        return pl.DataFrame()
-    frames = []
-    for name in names:
-        df = pl.read_parquet(f"gs://{bucket_name}/{name}")
-        if add_valuation_date_from_partition and "load_date=" in name:
-            load_date = name.split("load_date=")[1].split("/")[0]
-            df = df.with_columns(pl.lit(load_date).alias("valuation_date"))
-        frames.append(df)
-    return pl.concat(frames, how="diagonal_relaxed")
+    """Read every parquet under a KTC prefix and concat (objects fetched concurrently).
+    For the daily feed the valuation_date comes from the ``load_date=`` partition; the
+    archive carries its own ``date`` column."""
+
+    bucket = get_bucket(bucket_name)
+    names = [n for n in partition_objects(bucket, prefix) if n.endswith(suffix)]
+    df = read_objects(bucket_name, names, hive_columns=add_valuation_date_from_partition)
+    if add_valuation_date_from_partition and "load_date" in df.columns:
+        df = df.with_columns(pl.col("load_date").alias("valuation_date"))
+    return df
 
 
 def _read_fullload_picks(bucket_name: str) -> pl.DataFrame:
@@ -197,7 +220,7 @@ def _read_fullload_picks(bucket_name: str) -> pl.DataFrame:
 
     Uses a single lazy glob scan (``extra_columns='ignore'`` — the per-player files have
     heterogeneous rank columns) rather than reading ~499 files one-by-one."""
-    glob = f"gs://{bucket_name}/bronze/ktc/dynasty/full_load/load_date=*/*.parquet"
+    glob = lake_uri(bucket_name, "bronze/ktc/dynasty/full_load/load_date=*/*.parquet")
     try:
         lf = pl.scan_parquet(glob, extra_columns="ignore")
     except Exception:
@@ -245,10 +268,10 @@ def main():
     fact = pl.concat([ktc, fc], how="vertical_relaxed").with_columns(
         pl.lit(datetime.now()).alias("loaded_at"))
 
-    fact_path = f"gs://{bucket_name}/silver/fantasy/fact_pick_values"
+    fact_path = lake_uri(bucket_name, "silver/fantasy/fact_pick_values")
     print(f"Writing {fact.height} rows to {fact_path} "
           f"(ktc={ktc.height}, fantasycalc={fc.height})...")
-    fact.write_parquet(fact_path, partition_by=["market_type"], use_pyarrow=True)
+    write_dataset(fact, fact_path, partition_by=PARTITION_BY, sort_by=SORT_BY)
     print("Done.")
 
 
@@ -10,20 +10,108 @@ trades Sleeper never recorded). A reconciliation step enforces conservation
 invariants (no asset owned twice, every league/season/round resolves to exactly
 ``total_rosters`` picks, every moved pick lands on a real franchise) and routes
 any violation to a quarantine parquet rather than dropping it silently.
+The written ledger gets the same treatment at interval level (``validate_ledger``:
+overlapping or zero-length intervals, pick gaps, picks alive past their draft, pick counts
+per season/round), swept over interval ends rather than expanded to days.
 
 Output grain: one row per ``snapshot_date x franchise_id x asset_id`` with
 ``asset_type in {player, pick}``.
+
+The SCD2 ledger is maintained incrementally. A run loads the previous ledger and its state
+sidecar (``<ledger>.state.json``: high-water marks, snapshot-day counts, a fingerprint of the
+closed-history inputs). It then resolves only the snapshot days after the high-water mark,
+closing or extending the open stints. A full rebuild happens when nothing can be carried
+over: no state yet, a backfilled snapshot day, a new season-rollover gap, or late events,
+overrides or drafts that change history before the high-water mark. Set
+``LEDGER_FULL_REBUILD=1`` to force one. Late events are found without reading the event
+history: the bronze manifests say which event objects moved since the last run, and only
+those are read (``_check_event_feeds``); the event stream itself is read by full rebuilds.
+
+Snapshot presence is never held as one row per asset per day: the readers fold each chunk
+of days into run-length stints (first/last snapshot day per holding), and the rollover repair
+and interval building work on those, so memory follows the number of holding changes.
+The ledger itself is a LazyFrame plan streamed into the output (closed intervals of an
+incremental run go straight from the old file to the new one). ``LEDGER_MEMORY_MB`` caps
+the build: it sizes the snapshot chunks, and the run logs its peak RSS (``LEDGER_EXPLAIN=1``
+also prints the streaming plan).
+
+Each run also appends a change feed (``<ledger>_changes/run_id=<run>/``: the intervals
+opened, closed or retracted against the version it replaced, see ``_ledger_changes``) and
+then bumps the version pointer ``<ledger>.version.json``, so consumers can catch up from the
+changes instead of reloading the ledger.
+
+A full rebuild is split by league lineage, since nothing in the ledger crosses lineages. The
+partitions are built by ``LEDGER_WORKERS`` processes (default: one per core) sharing the
+memory cap, each from its own pre-filtered inputs, and their parts are unioned into the
+output. The daily snapshots are read once, by the parent, and spooled per partition.
 """
+import hashlib
+import json
+import multiprocessing
 import os
-from datetime import datetime
-
+import resource
+import shutil
+import site
+import tempfile
+import weakref
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
 import polars as pl
 from dotenv import load_dotenv
 
-from utils import get_latest_bronze_path
+from _intervals import clip, coalesce, gaps, index_on, overlaps, point_at, subtract
+from _ledger_changes import ledger_changes
+from lake_io import (entity_root, get_bucket, hive_values, lake_uri, latest_object, load_manifest,
+                     partition_objects, read_objects, resolve, scan_dataset, sink_parquet,
+                     write_parquet)
 
 load_dotenv()
 
+# A per-lineage gap of at least this many days between snapshots is a season rollover
+# (see reconstruct_rollover_presence).
+ROLLOVER_GAP_DAYS = 3
+
+# Incremental ledger state, stored next to the ledger. Bump the version to force one full
+# rebuild after a change to how intervals are derived.
+LEDGER_STATE_SUFFIX = ".state.json"
+LEDGER_STATE_VERSION = 3
+
+# Change feed and version pointer, also next to the ledger (env LEDGER_CHANGES_PATH overrides
+# the feed): every run appends ``<ledger>_changes/run_id=<run>/`` with the intervals it
+# opened, closed or retracted (see _ledger_changes), then bumps ``<ledger>.version.json``.
+LEDGER_CHANGES_SUFFIX = "_changes"
+LEDGER_VERSION_SUFFIX = ".version.json"
+
+# Memory cap for the ledger build, in MiB (env LEDGER_MEMORY_MB). It sizes the snapshot chunks;
+# the output is streamed, and the run reports its peak RSS against the cap.
+LEDGER_MEMORY_MB = 1024
+
+# Interval-invariant violations of the written ledger (validate_ledger); rewritten every run
+# (env LEDGER_QUARANTINE_PATH overrides).
+LEDGER_QUARANTINE = "silver/fantasy/quarantine/roster_membership_intervals.parquet"
+
+# Resolver intermediates (lineage map, current-league metadata, pick grid) are memoized by a
+# content fingerprint of their inputs; past this many entries the least recently used goes
+# (env PICK_MEMO_SIZE).
+PICK_MEMO_SIZE = 64
+
+_PLAYER_DAYS_PREFIX = "bronze/sleeper/rosters/roster_players/daily/"
+_PICK_DAYS_PREFIX = "bronze/sleeper/rosters/traded_picks/daily/"
+
+# Event feeds an incremental run checks for late arrivals (see _check_event_feeds). The
+# full_load transactions and the draft picks are whole-history dumps by load_date; the daily
+# transaction tables are rewritten per league (``league_id=``) whenever it has new moves.
+_TXN_TABLES = ("transactions", "transaction_players", "draft_picks")
+_EVENT_DUMP_PREFIXES = (*(f"bronze/sleeper/transactions/{t}/full_load/" for t in _TXN_TABLES),
+                        "bronze/sleeper/drafts/draft_picks/")
+_EVENT_DAILY_PREFIXES = tuple(f"bronze/sleeper/transactions/{t}/daily/" for t in _TXN_TABLES)
+_LEDGER_COLS = ["franchise_id", "asset_type", "asset_id", "valid_from", "valid_to", "is_current"]
+
 # Canonical key types shared by every pick source. Pick identity is
 # (league_id, season, round, original_roster_id) everywhere.
 _PICK_KEY = ["league_id", "season", "round", "original_roster_id"]
@@ -193,10 +281,93 @@ def _rookie_rounds(drafts_df, lineage_map: pl.DataFrame):
     )
 
 
+def build_pick_grid(current_meta: pl.DataFrame, years_ahead: int = 3) -> pl.DataFrame:
+    """The deterministic pick grid as one row per current league instead of one per pick.
+
+    Dynasty picks are minted ``years_ahead`` seasons out at each draft, so a league's live
+    picks are a dense ``years_ahead x rookie_rounds x total_rosters`` block starting at
+    ``first_season = cutoff_season + 1``. Each league's block is laid out flat (season
+    offset, then round, then roster) at ``offset`` in one array over all leagues of
+    ``size`` picks; ``_grid_index`` maps a pick key to its position and ``_grid_rows``
+    explodes the block into pick rows. Leagues without a known cutoff or rookie rounds
+    have no block (``build_pick_universe`` covers them from observed picks)."""
+    return (
+        current_meta.filter(pl.col("cutoff_season").is_not_null() & pl.col("rookie_rounds").is_not_null())
+        .select(
+            pl.col("league_id"),
+            (pl.col("cutoff_season").cast(pl.Int64) + 1).alias("first_season"),
+            pl.lit(years_ahead, pl.Int64).alias("seasons"),
+            pl.col("rookie_rounds").cast(pl.Int64).alias("rounds"),
+            pl.col("total_rosters").cast(pl.Int64).alias("rosters"),
+        )
+        .sort("league_id")
+        .with_columns((pl.col("seasons") * pl.col("rounds") * pl.col("rosters")).alias("size"))
+        .with_columns((pl.col("size").cum_sum() - pl.col("size")).alias("offset"))
+    )
+
+
+def _grid_index(keys: pl.DataFrame, grid: pl.DataFrame) -> pl.DataFrame:
+    """``keys`` (``_PICK_KEY`` columns) plus ``_idx``, the pick's position in the flat grid
+    array (null outside its league's block)."""
+    s_off = pl.col("season").cast(pl.Int64, strict=False) - pl.col("first_season")
+    inside = (s_off.is_between(0, pl.col("seasons") - 1)
+              & pl.col("round").is_between(1, pl.col("rounds"))
+              & pl.col("original_roster_id").is_between(1, pl.col("rosters")))
+    flat = (pl.col("offset") + (s_off * pl.col("rounds") + pl.col("round") - 1) * pl.col("rosters")
+            + pl.col("original_roster_id") - 1)
+    return (
+        keys.join(grid.drop("size"), on="league_id", how="left")
+        .with_columns(pl.when(inside).then(flat).alias("_idx"))
+        .drop("first_season", "seasons", "rounds", "rosters", "offset")
+    )
+
+
+def _grid_rows(grid: pl.DataFrame, owner: np.ndarray | None = None) -> pl.DataFrame:
+    """Explode the grid into ``_PICK_KEY`` rows in flat order, with ``owner_roster_id`` from
+    ``owner`` (one entry per grid position) when given."""
+    idx = np.arange(int(grid["size"].sum()) if grid.height else 0, dtype=np.int64)
+    lg = np.repeat(np.arange(grid.height), grid["size"].to_numpy())
+    local = idx - grid["offset"].to_numpy()[lg]
+    per_season = (grid["rounds"] * grid["rosters"]).to_numpy()[lg]
+    rosters = grid["rosters"].to_numpy()[lg]
+    out = pl.DataFrame({
+        "league_id": grid["league_id"].gather(lg),
+        "season": pl.Series(grid["first_season"].to_numpy()[lg] + local // per_season).cast(pl.Utf8),
+        "round": pl.Series(local % per_season // rosters + 1, dtype=pl.Int64),
+        "original_roster_id": pl.Series(local % rosters + 1, dtype=pl.Int64),
+    }, schema={"league_id": pl.Utf8, "season": pl.Utf8, "round": pl.Int64, "original_roster_id": pl.Int64})
+    if owner is not None:
+        out = out.with_columns(pl.Series("owner_roster_id", owner, dtype=pl.Int64))
+    return out
+
+
+def _observed_universe(observed: pl.DataFrame | None, current_meta: pl.DataFrame) -> pl.DataFrame:
+    """Observed ``(league, season, round)`` crossed with rosters, minus spent seasons."""
+    schema = {"league_id": pl.Utf8, "season": pl.Utf8, "round": pl.Int64, "original_roster_id": pl.Int64}
+    if observed is None or observed.height == 0:
+        return pl.DataFrame(schema=schema)
+    return (
+        observed
+        .join(current_meta.select("league_id", "total_rosters", "cutoff_season"), on="league_id", how="inner")
+        .filter(pl.col("cutoff_season").is_null()
+                | (pl.col("season").cast(pl.Int64) > pl.col("cutoff_season")))
+        .with_columns(pl.int_ranges(1, pl.col("total_rosters") + 1).alias("original_roster_id"))
+        .explode("original_roster_id")
+        .select(
+            pl.col("league_id"),
+            pl.col("season").cast(pl.Utf8),
+            pl.col("round").cast(pl.Int64),
+            pl.col("original_roster_id").cast(pl.Int64),
+        )
+        .unique()
+    )
+
+
 def build_pick_universe(
     observed: pl.DataFrame,
     current_meta: pl.DataFrame,
     years_ahead: int = 3,
+    grid: pl.DataFrame | None = None,
 ) -> pl.DataFrame:
     """Enumerate every pick that should exist, keyed by ``_PICK_KEY``.
 
@@ -210,122 +381,92 @@ def build_pick_universe(
     ``cutoff_season`` (latest already-drafted season) and ``rookie_rounds``. When
     ``rookie_rounds``/``cutoff_season`` are unknown (e.g. no drafts data) the grid
     is skipped and the function falls back to the observed ``(season, round)`` set
-    crossed with rosters, preserving older behavior.
+    crossed with rosters, preserving older behavior. Observed picks beyond the grid
+    (e.g. traded further out than the window) are always added. ``grid`` is a
+    precomputed :func:`build_pick_grid` of ``current_meta``.
     """
-    parts: list[pl.DataFrame] = []
+    if grid is None:
+        grid = build_pick_grid(current_meta, years_ahead)
+    return pl.concat([_grid_rows(grid), _observed_universe(observed, current_meta)],
+                     how="vertical").unique()
 
-    # deterministic grid: full rolling window of future picks
-    grid_src = current_meta.filter(
-        pl.col("cutoff_season").is_not_null() & pl.col("rookie_rounds").is_not_null()
-    )
-    if grid_src.height:
-        grid = (
-            grid_src
-            .with_columns(
-                pl.int_ranges(pl.col("cutoff_season") + 1,
-                              pl.col("cutoff_season") + 1 + years_ahead).alias("_season")
-            )
-            .explode("_season")
-            .with_columns(pl.int_ranges(1, pl.col("rookie_rounds") + 1).alias("round"))
-            .explode("round")
-            .with_columns(pl.int_ranges(1, pl.col("total_rosters") + 1).alias("original_roster_id"))
-            .explode("original_roster_id")
-            .select(
-                pl.col("league_id"),
-                pl.col("_season").cast(pl.Utf8).alias("season"),
-                pl.col("round").cast(pl.Int64),
-                pl.col("original_roster_id").cast(pl.Int64),
-            )
-        )
-        parts.append(grid)
-
-    # observed-based fallback / supplement: any (season, round) actually seen,
-    # crossed with rosters (covers leagues without drafts data, or picks traded
-    # beyond the assumed window).
-    if observed is not None and observed.height:
-        obs = (
-            observed
-            .join(current_meta.select("league_id", "total_rosters"), on="league_id", how="inner")
-            .with_columns(pl.int_ranges(1, pl.col("total_rosters") + 1).alias("original_roster_id"))
-            .explode("original_roster_id")
-            .select(
-                pl.col("league_id"),
-                pl.col("season").cast(pl.Utf8),
-                pl.col("round").cast(pl.Int64),
-                pl.col("original_roster_id").cast(pl.Int64),
-            )
-        )
-        parts.append(obs)
 
-    if not parts:
-        return pl.DataFrame(schema={
-            "league_id": pl.Utf8, "season": pl.Utf8,
-            "round": pl.Int64, "original_roster_id": pl.Int64,
-        })
+_pick_memo: OrderedDict = OrderedDict()
+_pick_memo_stats = {"hits": 0, "misses": 0}
+_fingerprints: dict[int, tuple] = {}
 
-    universe = pl.concat(parts, how="vertical").unique()
 
-    # drop spent seasons (draft already happened): keep season > cutoff_season
-    universe = (
-        universe
-        .join(current_meta.select("league_id", "cutoff_season"), on="league_id", how="left")
-        .with_columns(pl.col("season").cast(pl.Int64).alias("_s"))
-        .filter(pl.col("cutoff_season").is_null() | (pl.col("_s") > pl.col("cutoff_season")))
-        .select(_PICK_KEY)
-    )
-    return universe
+def _fingerprint(df: pl.DataFrame | None) -> str:
+    """``frame_fingerprint`` of one frame, remembered for as long as the frame object lives
+    (the per-day loops hand the same leagues frame over on every call)."""
+    if df is None:
+        return frame_fingerprint(None)
+    hit = _fingerprints.get(id(df))
+    if hit is not None and hit[0]() is df:
+        return hit[1]
+    fp = frame_fingerprint(df)
+    _fingerprints[id(df)] = (weakref.ref(df, lambda _, k=id(df): _fingerprints.pop(k, None)), fp)
+    return fp
 
 
-def resolve_pick_ownership(
-    traded_picks_df: pl.DataFrame,
-    txn_draft_picks_df: pl.DataFrame,
-    overrides_df: pl.DataFrame,
-    leagues_df: pl.DataFrame,
-    drafts_df: pl.DataFrame | None = None,
-    years_ahead: int = 3,
-) -> pl.DataFrame:
-    """Resolve the current owner roster for every pick in the universe.
+def _memoized(kind: tuple, frames: tuple, build):
+    """``build()`` cached under ``kind`` + the content fingerprints of ``frames`` (LRU)."""
+    key = (*kind, *(_fingerprint(df) for df in frames))
+    if key in _pick_memo:
+        _pick_memo.move_to_end(key)
+        _pick_memo_stats["hits"] += 1
+        return _pick_memo[key]
+    _pick_memo_stats["misses"] += 1
+    value = _pick_memo[key] = build()
+    while len(_pick_memo) > int(os.environ.get("PICK_MEMO_SIZE") or PICK_MEMO_SIZE):
+        _pick_memo.popitem(last=False)
+    return value
 
-    Every source's ``league_id`` is first translated to its lineage's *current*
-    league (see :func:`build_lineage_map`), so a pick referenced under any
-    season's league_id collapses onto the league we actually track. The universe
-    of picks that should exist is then enumerated deterministically by
-    :func:`build_pick_universe` (every league x the next ``years_ahead`` undrafted
-    seasons x ``1..rookie_rounds`` x ``1..total_rosters``), so untraded picks are
-    still accounted for. Ownership is overlaid in precedence order (highest wins):
-    commissioner override -> transaction event log -> Sleeper traded state ->
-    original owner.
 
-    The "draft has not happened" cutoff prefers per-season draft *status* from
-    ``drafts_df`` (a draft completes months before its league does); without it,
-    it falls back to the lineage's latest completed *league* season. ``rounds`` is
-    read per-league from ``drafts_df`` (a league setting, not assumed).
+def pick_memo_stats() -> dict:
+    """Hit/miss counters and size of the resolver memo."""
+    return {**_pick_memo_stats, "entries": len(_pick_memo)}
 
-    Returns one row per pick with columns ``_PICK_KEY + [owner_roster_id]`` where
-    ``league_id`` is the current league of the lineage.
-    """
-    lineage_map = build_lineage_map(leagues_df)
-    l2c = lineage_map.select("league_id", "current_league_id")
 
-    def _relabel(df):
-        """Translate a source's league_id to its lineage's current league_id."""
-        if df is None or df.height == 0:
-            return df
-        return (
-            df.with_columns(pl.col("league_id").cast(pl.Utf8))
-            .join(l2c, on="league_id", how="left")
-            .filter(pl.col("current_league_id").is_not_null())
-            .with_columns(pl.col("current_league_id").alias("league_id"))
-            .drop("current_league_id")
-        )
+def clear_pick_memo() -> None:
+    _pick_memo.clear()
+    _pick_memo_stats.update(hits=0, misses=0)
+
+
+def _memoized_lineage_map(leagues_df: pl.DataFrame) -> pl.DataFrame:
+    return _memoized(("lineage_map",), (leagues_df,), lambda: build_lineage_map(leagues_df))
 
-    traded_c = _relabel(traded_picks_df)
-    txn_c = _relabel(txn_draft_picks_df)
-    ovr_c = _relabel(overrides_df)
 
-    # current-league metadata keyed by the current league_id, with the season
-    # cutoff for "draft already happened" (draft status preferred, league status
-    # as fallback).
+def _resolver_state(leagues_df: pl.DataFrame, drafts_df, years_ahead: int):
+    """``(lineage_map, current_meta, grid)`` for one leagues/drafts state, memoized: the
+    lineage map on the leagues alone, the rest on leagues + drafts + ``years_ahead``."""
+    lineage_map = _memoized_lineage_map(leagues_df)
+
+    def build():
+        meta = _current_meta(lineage_map, drafts_df)
+        return meta, build_pick_grid(meta, years_ahead)
+
+    meta, grid = _memoized(("current_meta", years_ahead), (leagues_df, drafts_df), build)
+    return lineage_map, meta, grid
+
+
+def _relabel_current(df, l2c: pl.DataFrame):
+    """Translate a pick source's league_id to its lineage's current league_id."""
+    if df is None or df.height == 0:
+        return df
+    return (
+        df.with_columns(pl.col("league_id").cast(pl.Utf8))
+        .join(l2c, on="league_id", how="left")
+        .filter(pl.col("current_league_id").is_not_null())
+        .with_columns(pl.col("current_league_id").alias("league_id"))
+        .drop("current_league_id")
+    )
+
+
+def _current_meta(lineage_map: pl.DataFrame, drafts_df) -> pl.DataFrame:
+    """Current-league metadata keyed by the current league_id: ``total_rosters``, the
+    "draft already happened" ``cutoff_season`` (draft status preferred, league status as
+    fallback) and ``rookie_rounds``."""
     current_meta = lineage_map.select(
         pl.col("current_league_id").alias("league_id"),
         pl.col("current_total_rosters").alias("total_rosters"),
@@ -347,33 +488,81 @@ def resolve_pick_ownership(
         current_meta = current_meta.join(rounds_map, on="league_id", how="left")
     else:
         current_meta = current_meta.with_columns(pl.lit(None, dtype=pl.Int64).alias("rookie_rounds"))
+    return current_meta
 
-    # --- observed (current_league, season, round) across every pick source ---
-    def _lsr(df, season="season", rnd="round"):
-        if df is None or df.height == 0:
-            return pl.DataFrame(schema={"league_id": pl.Utf8, "season": pl.Utf8, "round": pl.Int64})
-        return df.select(
-            pl.col("league_id").cast(pl.Utf8),
-            pl.col(season).cast(pl.Utf8).alias("season"),
-            pl.col(rnd).cast(pl.Int64).alias("round"),
+
+def _lsr(df, season="season", rnd="round", keep: tuple[str, ...] = ()):
+    """Observed ``(league_id, season, round)`` of a pick source (plus ``keep`` columns)."""
+    if df is None or df.height == 0:
+        return pl.DataFrame(schema={**{k: pl.Utf8 for k in keep},
+                                    "league_id": pl.Utf8, "season": pl.Utf8, "round": pl.Int64})
+    return df.select(
+        *keep,
+        pl.col("league_id").cast(pl.Utf8),
+        pl.col(season).cast(pl.Utf8).alias("season"),
+        pl.col(rnd).cast(pl.Int64).alias("round"),
+    )
+
+
+def _override_owners(ovr_c, key_schema: dict) -> pl.DataFrame:
+    """One commissioner-override owner per pick key (latest ``created`` wins)."""
+    if ovr_c is not None and ovr_c.height:
+        ovr = _norm_pick_keys(ovr_c, "roster_id")
+        ovr = ovr.sort("created") if "created" in ovr.columns else ovr
+        return (
+            ovr.unique(subset=_PICK_KEY, keep="last")
+            .select(_PICK_KEY + [pl.col("to_team_id").cast(pl.Int64).alias("override_owner")])
         )
+    return pl.DataFrame(schema={**key_schema, "override_owner": pl.Int64})
+
+
+def resolve_pick_ownership(
+    traded_picks_df: pl.DataFrame,
+    txn_draft_picks_df: pl.DataFrame,
+    overrides_df: pl.DataFrame,
+    leagues_df: pl.DataFrame,
+    drafts_df: pl.DataFrame | None = None,
+    years_ahead: int = 3,
+) -> pl.DataFrame:
+    """Resolve the current owner roster for every pick in the universe.
 
+    Every source's ``league_id`` is first translated to its lineage's *current*
+    league (see :func:`build_lineage_map`), so a pick referenced under any
+    season's league_id collapses onto the league we actually track. The universe
+    of picks that should exist is the deterministic grid of :func:`build_pick_grid`
+    (every league x the next ``years_ahead`` undrafted seasons x ``1..rookie_rounds``
+    x ``1..total_rosters``), so untraded picks are still accounted for. It is resolved
+    as one dense owner array and exploded to rows only for the output. Ownership is
+    overlaid in precedence order (highest wins): commissioner override -> transaction
+    event log -> Sleeper traded state -> original owner.
+
+    The "draft has not happened" cutoff prefers per-season draft *status* from
+    ``drafts_df`` (a draft completes months before its league does); without it,
+    it falls back to the lineage's latest completed *league* season. ``rounds`` is
+    read per-league from ``drafts_df`` (a league setting, not assumed). The lineage
+    map, cutoffs, rounds and grid are memoized on the content of ``leagues_df`` and
+    ``drafts_df`` (:func:`_resolver_state`), so repeated calls over the same state
+    only redo the overlay.
+
+    Returns one row per pick with columns ``_PICK_KEY + [owner_roster_id]`` where
+    ``league_id`` is the current league of the lineage.
+    """
+    lineage_map, current_meta, grid = _resolver_state(leagues_df, drafts_df, years_ahead)
+    l2c = lineage_map.select("league_id", "current_league_id")
+
+    traded_c = _relabel_current(traded_picks_df, l2c)
+    txn_c = _relabel_current(txn_draft_picks_df, l2c)
+    ovr_c = _relabel_current(overrides_df, l2c)
+
+    # --- observed (current_league, season, round) across every pick source ---
     observed = pl.concat(
         [_lsr(traded_c), _lsr(txn_c), _lsr(ovr_c)],
         how="vertical",
     ).unique()
 
-    # --- universe: every pick that should exist (deterministic grid of the
-    #     rolling future-pick window), so untraded picks are still accounted ---
-    universe = build_pick_universe(observed, current_meta, years_ahead=years_ahead)
-
-    if universe.height == 0:
-        return pl.DataFrame(schema={
-            "league_id": pl.Utf8, "season": pl.Utf8, "round": pl.Int64,
-            "original_roster_id": pl.Int64, "owner_roster_id": pl.Int64,
-        })
-
     # --- overlay sources (relabeled), each deduped to one owner per pick key ---
+    key_schema = {"league_id": pl.Utf8, "season": pl.Utf8, "round": pl.Int64,
+                  "original_roster_id": pl.Int64}
     traded = (
         _norm_pick_keys(traded_c, "original_roster_id")
         .sort("timestamp") if (traded_c is not None and traded_c.height) else None
@@ -384,7 +573,7 @@ def resolve_pick_ownership(
             .select(_PICK_KEY + [pl.col("owner_roster_id").cast(pl.Int64).alias("traded_owner")])
         )
     else:
-        traded = pl.DataFrame(schema={**{k: universe.schema[k] for k in _PICK_KEY}, "traded_owner": pl.Int64})
+        traded = pl.DataFrame(schema={**key_schema, "traded_owner": pl.Int64})
 
     if txn_c is not None and txn_c.height:
         sort_col = "load_date" if "load_date" in txn_c.columns else None
@@ -395,35 +584,153 @@ def resolve_pick_ownership(
             .select(_PICK_KEY + [pl.col("owner_id").cast(pl.Int64).alias("txn_owner")])
         )
     else:
-        txn = pl.DataFrame(schema={**{k: universe.schema[k] for k in _PICK_KEY}, "txn_owner": pl.Int64})
+        txn = pl.DataFrame(schema={**key_schema, "txn_owner": pl.Int64})
+
+    ovr = _override_owners(ovr_c, key_schema)
+
+    # one owner per pick key from the highest-precedence source that has one:
+    # override > txn event > traded state (> original, applied below)
+    overlay = (
+        pl.concat([
+            src.select(_PICK_KEY + [pl.col(col).alias("owner"), pl.lit(prec).alias("_prec")])
+            for prec, (src, col) in enumerate(((traded, "traded_owner"), (txn, "txn_owner"),
+                                               (ovr, "override_owner")))
+        ], how="vertical")
+        .filter(pl.col("owner").is_not_null())
+        .sort("_prec", maintain_order=True)
+        .unique(subset=_PICK_KEY, keep="last")
+    )
 
-    if ovr_c is not None and ovr_c.height:
-        ovr = _norm_pick_keys(ovr_c, "roster_id")
-        ovr = ovr.sort("created") if "created" in ovr.columns else ovr
-        ovr = (
-            ovr.unique(subset=_PICK_KEY, keep="last")
-            .select(_PICK_KEY + [pl.col("to_team_id").cast(pl.Int64).alias("override_owner")])
+    # --- the deterministic grid (every pick that should exist in the rolling window, so
+    #     untraded picks are still accounted) resolved in place: one owner array over
+    #     the grid, starting at the original roster ---
+    sizes = grid["size"].to_numpy()
+    owner = (np.arange(int(sizes.sum()), dtype=np.int64)
+             - np.repeat(grid["offset"].to_numpy(), sizes)) % np.repeat(grid["rosters"].to_numpy(), sizes) + 1
+    indexed = _grid_index(overlay, grid)
+    hit = indexed.filter(pl.col("_idx").is_not_null())
+    owner[hit["_idx"].to_numpy()] = hit["owner"].to_numpy()
+    on_grid = _grid_rows(grid, owner)
+
+    # --- observed picks outside the grid (leagues without drafts data, or picks traded
+    #     beyond the window) ---
+    off_grid = (
+        _grid_index(_observed_universe(observed, current_meta), grid)
+        .filter(pl.col("_idx").is_null())
+        .join(indexed.filter(pl.col("_idx").is_null()).select(_PICK_KEY + ["owner"]),
+              on=_PICK_KEY, how="left")
+        .select(_PICK_KEY + [pl.coalesce("owner", "original_roster_id").cast(pl.Int64)
+                             .alias("owner_roster_id")])
+    )
+    return pl.concat([on_grid, off_grid], how="vertical")
+
+
+def _draft_cutoff_groups(days: list[str], drafts_df) -> dict[str, list[str]]:
+    """Group snapshot days that see the same set of run drafts (``_drafts_completed_by``)
+    -> ``{representative day: days}``. Groups change only at a draft's run date, so a
+    season of daily snapshots collapses to a handful of groups."""
+    import bisect
+    if drafts_df is None or drafts_df.height == 0 or "start_time" not in drafts_df.columns:
+        return {days[0]: list(days)} if days else {}
+    run = sorted(
+        drafts_df.select(pl.from_epoch((pl.col("start_time").cast(pl.Int64, strict=False) // 1000),
+                                       time_unit="s").dt.date().cast(pl.Utf8).alias("_cd"))
+        ["_cd"].drop_nulls().unique().to_list()
+    )
+    groups: dict[int, list[str]] = {}
+    for d in sorted(days):
+        groups.setdefault(bisect.bisect_right(run, d), []).append(d)
+    return {ds[0]: ds for ds in groups.values()}
+
+
+def resolve_pick_ownership_by_day(
+    traded_by_day: pl.DataFrame,
+    overrides_df: pl.DataFrame,
+    leagues_df: pl.DataFrame,
+    drafts_df: pl.DataFrame | None = None,
+    days: list[str] | None = None,
+    years_ahead: int = 3,
+    date_col: str = "snapshot_date",
+) -> pl.DataFrame:
+    """:func:`resolve_pick_ownership` for many snapshot days in one pass.
+
+    ``traded_by_day`` is every day's traded_picks state with a ``date_col`` column. The
+    result equals calling ``resolve_pick_ownership(traded_d, <empty txn log>, overrides_df,
+    leagues_df, _drafts_completed_by(drafts_df, d))`` for each day ``d`` in ``days``
+    (default: the days present in ``traded_by_day``) and stacking the results with
+    ``date_col``. The lineage map is built once. Cutoffs, rookie rounds and the
+    deterministic universe grid are built once per distinct draft cutoff
+    (:func:`_draft_cutoff_groups`), and memoized across calls, so the chunked readers
+    reuse them. The days are then resolved with one set of joins.
+    """
+    key_schema = {"league_id": pl.Utf8, "season": pl.Utf8, "round": pl.Int64,
+                  "original_roster_id": pl.Int64}
+    out_schema = {date_col: pl.Utf8, **key_schema, "owner_roster_id": pl.Int64}
+    if traded_by_day is not None and traded_by_day.height:
+        traded_by_day = traded_by_day.with_columns(pl.col(date_col).cast(pl.Utf8))
+    if days is None:
+        days = [] if traded_by_day is None or traded_by_day.height == 0 else \
+            traded_by_day[date_col].unique().sort().to_list()
+    if not days:
+        return pl.DataFrame(schema=out_schema)
+
+    lineage_map = _memoized_lineage_map(leagues_df)
+    l2c = lineage_map.select("league_id", "current_league_id")
+    traded_c = _relabel_current(traded_by_day, l2c)
+    ovr_c = _relabel_current(overrides_df, l2c)
+    ovr_observed = _lsr(ovr_c).unique()
+
+    # per cutoff group: metadata + the day-independent universe (grid + override-observed)
+    group_rows, metas, statics = [], [], []
+    for gid, (rep_day, group_days) in enumerate(_draft_cutoff_groups(days, drafts_df).items()):
+        _, meta, grid = _resolver_state(leagues_df, _drafts_completed_by(drafts_df, rep_day), years_ahead)
+        group_rows.append(pl.DataFrame({date_col: group_days, "_gid": [gid] * len(group_days)}))
+        metas.append(meta.select("league_id", "total_rosters", "cutoff_season").with_columns(
+            pl.lit(gid).alias("_gid")))
+        statics.append(build_pick_universe(ovr_observed, meta, grid=grid)
+                       .with_columns(pl.lit(gid).alias("_gid")))
+    day_gid = pl.concat(group_rows, how="vertical")
+    meta_all = pl.concat(metas, how="vertical")
+
+    static_days = day_gid.join(pl.concat(statics, how="vertical"), on="_gid", how="inner")
+    # day-specific universe: each day's traded (season, round) x rosters, cutoff-filtered
+    traded_days = (
+        _lsr(traded_c, keep=(date_col,)).unique()
+        .join(day_gid, on=date_col, how="inner")
+        .join(meta_all, on=["_gid", "league_id"], how="inner")
+        .with_columns(pl.int_ranges(1, pl.col("total_rosters") + 1).alias("original_roster_id"))
+        .explode("original_roster_id")
+        .filter(pl.col("cutoff_season").is_null()
+                | (pl.col("season").cast(pl.Int64) > pl.col("cutoff_season")))
+        .select(date_col, "league_id", "season", "round", pl.col("original_roster_id").cast(pl.Int64))
+    )
+    universe = pl.concat([static_days.select(date_col, *_PICK_KEY), traded_days],
+                         how="vertical_relaxed").unique()
+    if universe.height == 0:
+        return pl.DataFrame(schema=out_schema)
+
+    if traded_c is not None and traded_c.height:
+        traded = (
+            _norm_pick_keys(traded_c, "original_roster_id")
+            .sort("timestamp", maintain_order=True)
+            .unique(subset=[date_col] + _PICK_KEY, keep="last")
+            .select([date_col] + _PICK_KEY + [pl.col("owner_roster_id").cast(pl.Int64).alias("traded_owner")])
         )
     else:
-        ovr = pl.DataFrame(schema={**{k: universe.schema[k] for k in _PICK_KEY}, "override_owner": pl.Int64})
+        traded = pl.DataFrame(schema={date_col: pl.Utf8, **key_schema, "traded_owner": pl.Int64})
+    ovr = _override_owners(ovr_c, key_schema)
 
-    resolved = (
+    return (
         universe
-        .join(traded, on=_PICK_KEY, how="left")
-        .join(txn, on=_PICK_KEY, how="left")
+        .join(traded, on=[date_col] + _PICK_KEY, how="left")
         .join(ovr, on=_PICK_KEY, how="left")
-        # precedence (highest first): override > txn event > traded state > original
+        # same precedence as resolve_pick_ownership (there is no txn log per snapshot day)
         .with_columns(
-            pl.coalesce([
-                pl.col("override_owner"),
-                pl.col("txn_owner"),
-                pl.col("traded_owner"),
-                pl.col("original_roster_id"),
-            ]).cast(pl.Int64).alias("owner_roster_id")
+            pl.coalesce([pl.col("override_owner"), pl.col("traded_owner"),
+                         pl.col("original_roster_id")]).cast(pl.Int64).alias("owner_roster_id")
         )
-        .select(_PICK_KEY + ["owner_roster_id"])
+        .select([date_col] + _PICK_KEY + ["owner_roster_id"])
     )
-    return resolved
 
 
 def build_pick_membership(
@@ -527,35 +834,186 @@ def reconcile(
     return fact_df, quarantine_df
 
 
-def _read_prefix_concat(bucket_name: str, prefix: str) -> pl.DataFrame:
-    """Read and vertically concat every parquet under a bronze prefix (used for
-    sources partitioned by something other than load_date, e.g. league_id)."""
-    from google.cloud import storage
+# Columns of the interval-ledger quarantine (validate_ledger). Pick-count rows name a
+# season/round class ("season:round") in asset_id and the offending stretch in valid_from/to.
+_INTERVAL_QUARANTINE_COLS = [
+    "quarantine_reason", "lineage_id", "asset_type", "asset_id", "franchise_id",
+    "valid_from", "valid_to", "other_franchise_id", "detail",
+]
+
+
+def validate_ledger(ledger: pl.DataFrame | pl.LazyFrame, leagues_df: pl.DataFrame,
+                    lifecycle: pl.DataFrame | None = None) -> pl.DataFrame:
+    """Interval-level invariants of the SCD2 ledger; return the violations (empty if clean).
+
+    ``reconcile`` checks one day's fact; this checks the whole history without expanding it
+    to days. Each check is a sort plus a sweep over interval ends:
+
+    * ``zero_length`` — ``valid_to <= valid_from``.
+    * ``overlap`` — within a lineage an asset is held twice at once: an interval starts
+      before the running max ``valid_to`` of the asset's earlier intervals.
+      ``other_franchise_id`` is the holder of that earlier interval.
+    * ``pick_gap`` — nobody holds a pick between two of its intervals (players leave
+      rosters legitimately, so only picks are checked). The row spans the gap.
+    * ``pick_after_consume`` — a pick interval runs past its ``consume_date`` (needs the
+      ``synthesize_pick_lifecycle`` frame).
+    * ``pick_count`` — a +1/-1 sweep over the interval ends of each lineage/season/round
+      gives the live pick count per stretch; any nonzero count other than the lineage's
+      ``total_rosters`` in the pick's season is flagged for that stretch.
+    """
+    iv = (
+        ledger.lazy().select(_LEDGER_COLS)
+        .with_columns(
+            _lineage_of(pl.col("franchise_id")).alias("lineage_id"),
+            pl.col("valid_from").str.to_date().alias("_from"),
+            pl.col("valid_to").str.to_date().alias("_to"),
+        )
+        .with_columns(pl.col("_to").fill_null(date.max).alias("_end"))
+        .collect()
+    )
+    parts: list[pl.DataFrame] = []
+
+    def _flag(df: pl.DataFrame, reason: str) -> pl.DataFrame:
+        return df.with_columns(pl.lit(reason).alias("quarantine_reason"))
+
+    parts.append(_flag(iv.filter(pl.col("_end") <= pl.col("_from")), "zero_length"))
+
+    g = ["lineage_id", "asset_type", "asset_id"]
+    parts.append(_flag(overlaps(iv, g, "_from", "_to", carry="franchise_id",
+                                carry_as="other_franchise_id"), "overlap"))
+    picks = iv.filter(pl.col("asset_type") == "pick")
+    parts.append(_flag(
+        gaps(picks, g, "_from", "_to").with_columns(pl.col("_from").cast(pl.Utf8).alias("valid_from"),
+                                                    pl.col("_to").cast(pl.Utf8).alias("valid_to")),
+        "pick_gap",
+    ))
+
+    if lifecycle is not None and lifecycle.height:
+        consumed = lifecycle.filter(pl.col("consume_date").is_not_null()).select(
+            _lineage_of(pl.col("franchise_id")).alias("lineage_id"),
+            pl.col("pick_id").alias("asset_id"),
+            pl.col("consume_date"),
+        )
+        parts.append(_flag(
+            picks.join(consumed, on=["lineage_id", "asset_id"], how="inner")
+            .filter(pl.col("_end") > pl.col("consume_date").str.to_date())
+            .with_columns(pl.format("consumed {}", pl.col("consume_date")).alias("detail")),
+            "pick_after_consume",
+        ))
+
+    # a lineage can resize between seasons: a pick class counts against the league size of
+    # its own season (the latest known season for future picks, the first for older ones)
+    N = (
+        leagues_df.group_by(pl.col("league_lineage_id").cast(pl.Utf8).alias("lineage_id"),
+                            pl.col("season").cast(pl.Int64).alias("_season"))
+        .agg(pl.col("total_rosters").cast(pl.Int64).max().alias("N"))
+        .sort("_season")
+    )
+    first_N = N.group_by("lineage_id").agg(pl.col("N").first().alias("_first_N"))
+    cls = ["lineage_id", "pick_class"]
+    deltas = picks.with_columns(
+        pl.col("asset_id").str.replace(r":[^:]*$", "").alias("pick_class")
+    ).select(*cls, pl.concat_list(pl.col("_from"), pl.col("_to")).alias("_at"),
+             pl.concat_list(pl.lit(1), pl.lit(-1)).alias("_d"))
+    counts = (
+        deltas.explode("_at", "_d").drop_nulls("_at")
+        .group_by(*cls, "_at").agg(pl.col("_d").sum())
+        .sort(*cls, "_at")
+        .with_columns(pl.col("_d").cum_sum().over(cls).alias("n"),
+                      pl.col("_at").shift(-1).over(cls).alias("_next"))
+        .with_columns(pl.col("pick_class").str.extract(r"^(\d+)").cast(pl.Int64).alias("_season"))
+        .sort("_season")
+        .join_asof(N, on="_season", by="lineage_id", strategy="backward", check_sortedness=False)
+        .join(first_N, on="lineage_id", how="left")
+        .with_columns(pl.col("N").fill_null(pl.col("_first_N")))
+        .filter((pl.col("n") != 0) & (pl.col("n") != pl.col("N")))
+    )
+    parts.append(_flag(
+        counts.select(
+            "lineage_id", pl.lit("pick").alias("asset_type"), pl.col("pick_class").alias("asset_id"),
+            pl.col("_at").cast(pl.Utf8).alias("valid_from"), pl.col("_next").cast(pl.Utf8).alias("valid_to"),
+            pl.format("{} live picks, expected {}", pl.col("n"), pl.col("N")).alias("detail"),
+        ),
+        "pick_count",
+    ))
+
+    schema = {c: pl.Utf8 for c in _INTERVAL_QUARANTINE_COLS}
+    return pl.concat(
+        [pl.DataFrame(schema=schema)]
+        + [p.select(pl.col(c).cast(pl.Utf8) if c in p.columns else pl.lit(None, pl.Utf8).alias(c)
+                    for c in _INTERVAL_QUARANTINE_COLS) for p in parts],
+        how="vertical",
+    )
 
-    client = storage.Client()
-    blobs = [
-        b.name for b in client.bucket(bucket_name).list_blobs(prefix=prefix)
-        if b.name.endswith(".parquet")
-    ]
-    if not blobs:
-        return pl.DataFrame()
-    frames = [pl.read_parquet(f"gs://{bucket_name}/{name}") for name in blobs]
-    return pl.concat(frames, how="diagonal_relaxed")
+
+def _read_prefix_concat(bucket_name: str, prefix: str, columns: list[str] | None = None) -> pl.DataFrame:
+    """Read and vertically concat every parquet under a bronze prefix (used for
+    sources partitioned by something other than load_date, e.g. league_id). The
+    object list comes from the entity's bronze manifest and the objects are fetched
+    concurrently; ``columns`` projects each file before the concat."""
+    blobs = partition_objects(get_bucket(bucket_name), prefix)
+    return read_objects(bucket_name, blobs, columns=columns, hive_columns=False)
 
 
 def _latest_file(bucket_name: str, prefix: str) -> str | None:
-    """Return the gs:// path of the lexically-latest parquet directly under a
-    prefix (handles load_date=<date>.parquet style files)."""
-    from google.cloud import storage
-
-    client = storage.Client()
-    names = [
-        b.name for b in client.bucket(bucket_name).list_blobs(prefix=prefix)
-        if b.name.endswith(".parquet")
-    ]
-    if not names:
-        return None
-    return f"gs://{bucket_name}/{max(names)}"
+    """Return the path (gs:// or local lake) of the latest load_date parquet under a prefix (handles
+    load_date=<date>.parquet style files), via the manifest's latest pointer."""
+    name = latest_object(get_bucket(bucket_name), prefix)
+    return lake_uri(bucket_name, name) if name else None
+
+
+class BronzeSources:
+    """Per-run registry of the bronze inputs to the ledger build.
+
+    Several steps read the same prefixes (transactions, drafts, draft_picks, the
+    commission overrides). The registry reads each prefix the first time any step asks for
+    it and hands that same frame to every later caller, so a full rebuild fetches and
+    decodes each bronze object once. Frames are shared, so callers must not mutate them in
+    place (polars expressions never do)."""
+
+    def __init__(self, bucket_name: str):
+        self.bucket_name = bucket_name
+        self._frames: dict[tuple[str, str], pl.DataFrame | None] = {}
+        self.reads = 0                      # prefixes actually fetched (for the run log)
+
+    def prefix(self, prefix: str) -> pl.DataFrame:
+        """Every parquet under ``prefix``, concatenated (see ``_read_prefix_concat``)."""
+        key = ("prefix", prefix)
+        if key not in self._frames:
+            self._frames[key] = _read_prefix_concat(self.bucket_name, prefix)
+            self.reads += 1
+        return self._frames[key]
+
+    def latest(self, prefix: str) -> pl.DataFrame | None:
+        """The latest load_date object under ``prefix``; None when there is none."""
+        key = ("latest", prefix)
+        if key not in self._frames:
+            path = _latest_file(self.bucket_name, prefix)
+            self._frames[key] = pl.read_parquet(path) if path else None
+            self.reads += 1
+        return self._frames[key]
+
+    def subset(self, league_ids) -> "BronzeSources":
+        """A registry holding only the rows of ``league_ids`` from every frame read so far, to
+        hand to a lineage worker. Frames without a league_id are narrowed through the
+        draft_id / transaction_id of the kept rows. A prefix not read yet is read in full by
+        whoever asks for it first."""
+        ids = pl.Series(list(league_ids), dtype=pl.Utf8).implode()
+        out = BronzeSources(self.bucket_name)
+        keep = {}
+        for key, df in self._frames.items():
+            if df is not None and "league_id" in df.columns:
+                out._frames[key] = df = df.filter(pl.col("league_id").cast(pl.Utf8).is_in(ids))
+                for col in ("draft_id", "transaction_id"):
+                    if col in df.columns:
+                        keep.setdefault(col, []).append(df.select(col))
+        keep = {col: pl.concat(frames, how="vertical_relaxed").unique() for col, frames in keep.items()}
+        for key, df in self._frames.items():
+            if key in out._frames:
+                continue
+            col = next((c for c in keep if df is not None and c in df.columns), None)
+            out._frames[key] = df.join(keep[col], on=col, how="semi") if col else df
+        return out
 
 
 def _snapshot_date_from_path(path: str) -> str:
@@ -564,7 +1022,108 @@ def _snapshot_date_from_path(path: str) -> str:
     return datetime.now().strftime("%Y-%m-%d")
 
 
-# SCD2 ledger: gaps-and-islands over daily presence
+# SCD2 ledger: presence as run-length stints
+#
+# A stint is ``key_cols + [first_date, last_date]``: the asset is present on every day of the
+# snapshot calendar from first_date through last_date. The calendar is the sorted list of
+# snapshot days. Contiguity is judged on it, so a gap in snapshot collection doesn't split a
+# stint. The readers build stints a chunk of days at a time, so the ledger build never holds
+# one row per asset per day: memory follows the number of holding changes. The first chunk
+# has _STINT_CHUNK_DAYS days; later ones are sized from the decoded bytes per day to a quarter
+# of the memory cap (see _day_chunks).
+_STINT_CHUNK_DAYS = 32
+_MAX_CHUNK_DAYS = 366
+
+
+def _stint_schema(schema, key_cols: list[str]) -> dict:
+    return {**{k: schema.get(k, pl.Utf8) for k in key_cols}, "first_date": pl.Utf8, "last_date": pl.Utf8}
+
+
+def _calendar(days) -> pl.DataFrame:
+    """Snapshot calendar -> (day, didx, next_day)."""
+    return (
+        pl.DataFrame({"day": sorted(set(days))}, schema={"day": pl.Utf8})
+        .with_row_index("didx")
+        .with_columns(pl.col("day").shift(-1).alias("next_day"))
+    )
+
+
+def presence_to_stints(present: pl.DataFrame, key_cols: list[str],
+                       date_col: str = "snapshot_date", days=None) -> pl.DataFrame:
+    """Collapse per-day presence (``key_cols`` + ``date_col``) into stints over the snapshot
+    calendar ``days`` (default: the days ``present`` covers), via gaps-and-islands."""
+    if present.height == 0:
+        return pl.DataFrame(schema=_stint_schema(present.schema, key_cols))
+    p = present.select(key_cols + [pl.col(date_col).cast(pl.Utf8).alias("day")]).unique()
+    cal = _calendar(p["day"].unique().to_list() if days is None else days).select("day", "didx")
+    return (
+        p.join(cal, on="day", how="inner")
+        .sort(key_cols + ["didx"])
+        # consecutive didx within a key share an island id (didx - running count)
+        .with_columns((pl.col("didx") - pl.col("didx").cum_count().over(key_cols)).alias("_isl"))
+        .group_by(key_cols + ["_isl"])
+        .agg(pl.col("day").min().alias("first_date"), pl.col("day").max().alias("last_date"))
+        .select(key_cols + ["first_date", "last_date"])
+    )
+
+
+def append_stints(stints: pl.DataFrame, new: pl.DataFrame, key_cols: list[str],
+                  edge: str | None = None, start: str | None = None) -> pl.DataFrame:
+    """Append stints over later days. ``edge`` is the last calendar day of ``stints`` and
+    ``start`` the next one, the first of ``new`` (by default the latest and earliest days the
+    frames reach). A stint reaching ``edge`` joins the new stint of the same key that starts
+    on ``start``."""
+    if stints.height == 0:
+        return new
+    if new.height == 0:
+        return stints
+    edge = edge or stints["last_date"].max()
+    start = start or new["first_date"].min()
+    open_ = stints.filter(pl.col("last_date") == edge)
+    cont = new.filter(pl.col("first_date") == start)
+    merged = open_.join(cont.select(key_cols + [pl.col("last_date").alias("_to")]), on=key_cols, how="inner")
+    return pl.concat([
+        stints.filter(pl.col("last_date") != edge),
+        open_.join(cont, on=key_cols, how="anti"),
+        merged.select(key_cols + ["first_date", pl.col("_to").alias("last_date")]),
+        cont.join(open_, on=key_cols, how="anti"),
+        new.filter(pl.col("first_date") != start),
+    ], how="vertical_relaxed")
+
+
+def coalesce_stints(stints: pl.DataFrame, key_cols: list[str], days) -> pl.DataFrame:
+    """Merge a key's overlapping or calendar-adjacent stints. Every endpoint must be a day
+    of ``days``."""
+    if stints.height == 0:
+        return stints
+    # a stint is the interval [idx(first), idx(last) + 1) of calendar indexes
+    cal = sorted(set(days))
+    s = index_on(stints, cal, {"first_date": "_f", "last_date": "_l"})
+    return (
+        coalesce(s.with_columns((pl.col("_l") + 1).alias("_e")), key_cols, "_f", "_e")
+        .select(key_cols + [point_at(cal, "_f").alias("first_date"),
+                            point_at(cal, pl.col("_e") - 1).alias("last_date")])
+    )
+
+
+def stints_to_intervals(stints: pl.DataFrame, key_cols: list[str], days) -> pl.DataFrame:
+    """Stints over the snapshot calendar ``days`` -> ``key_cols + [valid_from, valid_to,
+    is_current]``. A stint ends at the next calendar day after its last; one reaching the
+    latest day is current with ``valid_to = None``."""
+    schema_out = {**{k: stints.schema.get(k, pl.Utf8) for k in key_cols},
+                  "valid_from": pl.Utf8, "valid_to": pl.Utf8, "is_current": pl.Boolean}
+    if stints.height == 0:
+        return pl.DataFrame(schema=schema_out)
+    cal = _calendar(days)
+    latest = cal["day"].max()
+    return (
+        stints.join(cal.select(pl.col("day").alias("last_date"), pl.col("next_day").alias("valid_to")),
+                    on="last_date", how="left")
+        .select(key_cols + [pl.col("first_date").alias("valid_from"), "valid_to",
+                            (pl.col("last_date") == latest).alias("is_current")])
+    )
+
+
 def build_snapshot_intervals(present: pl.DataFrame, key_cols: list[str],
                              date_col: str = "snapshot_date") -> pl.DataFrame:
     """Collapse per-day presence rows into SCD2 intervals.
@@ -577,35 +1136,8 @@ def build_snapshot_intervals(present: pl.DataFrame, key_cols: list[str],
     ``valid_to = None``. "Contiguous" means consecutive *snapshot* dates (so gaps in
     snapshot collection don't split a stint), via gaps-and-islands.
     """
-    schema_out = {**{k: present.schema.get(k, pl.Utf8) for k in key_cols},
-                  "valid_from": pl.Utf8, "valid_to": pl.Utf8, "is_current": pl.Boolean}
-    if present.height == 0:
-        return pl.DataFrame(schema=schema_out)
-
-    dates = present.select(pl.col(date_col).cast(pl.Utf8)).unique().sort(date_col).with_row_index("didx")
-    max_didx = dates["didx"].max()
-
-    p = (
-        present.with_columns(pl.col(date_col).cast(pl.Utf8))
-        .join(dates, on=date_col, how="left")
-        .sort(key_cols + ["didx"])
-        # consecutive didx within a key share an island id (didx - running count)
-        .with_columns((pl.col("didx") - pl.col("didx").cum_count().over(key_cols)).alias("_isl"))
-    )
-    iv = p.group_by(key_cols + ["_isl"]).agg(
-        pl.col(date_col).min().alias("valid_from"),
-        pl.col("didx").max().alias("_last"),
-    )
-    next_date = dates.select(pl.col("didx").alias("_nd"), pl.col(date_col).alias("_to"))
-    iv = (
-        iv.with_columns((pl.col("_last") + 1).alias("_nd"))
-        .join(next_date, on="_nd", how="left")
-        .with_columns(
-            pl.col("_to").alias("valid_to"),
-            (pl.col("_last") == max_didx).alias("is_current"),
-        )
-    )
-    return iv.select(key_cols + ["valid_from", "valid_to", "is_current"])
+    days = present[date_col].cast(pl.Utf8).unique().to_list() if present.height else []
+    return stints_to_intervals(presence_to_stints(present, key_cols, date_col), key_cols, days)
 
 
 def build_event_intervals(events: pl.DataFrame, key_cols: list[str],
@@ -655,6 +1187,12 @@ def build_event_intervals(events: pl.DataFrame, key_cols: list[str],
 
 def combine_eras(present: pl.DataFrame, events: pl.DataFrame, boundary: str,
                  key_cols: list[str]) -> pl.DataFrame:
+    """``combine_era_intervals`` over per-day snapshot presence."""
+    return combine_era_intervals(build_snapshot_intervals(present, key_cols), events, boundary, key_cols)
+
+
+def combine_era_intervals(snap: pl.DataFrame, events: pl.DataFrame, boundary: str,
+                          key_cols: list[str]) -> pl.DataFrame:
     """Merge the snapshot era (>= boundary, authoritative) with the reconstructed
     era (< boundary, from events) into one SCD2 interval set.
 
@@ -663,19 +1201,10 @@ def combine_eras(present: pl.DataFrame, events: pl.DataFrame, boundary: str,
     intervals are left un-stitched (a continuously-held asset shows a boundary split
     at ``boundary``) — correct for as-of queries; stitching is a later refinement.
     """
-    snap = build_snapshot_intervals(present, key_cols).select(
-        key_cols + ["valid_from", "valid_to", "is_current"]
-    )
-    recon = build_event_intervals(events, key_cols)
+    snap = snap.select(key_cols + ["valid_from", "valid_to", "is_current"])
     recon = (
-        recon
-        .filter(pl.col("valid_from") < boundary)
-        .with_columns(
-            pl.when(pl.col("valid_to").is_null() | (pl.col("valid_to") > boundary))
-              .then(pl.lit(boundary)).otherwise(pl.col("valid_to")).alias("valid_to"),
-            pl.lit(False).alias("is_current"),
-        )
-        .filter(pl.col("valid_from") < pl.col("valid_to"))
+        clip(build_event_intervals(events, key_cols), hi=boundary)
+        .with_columns(pl.lit(False).alias("is_current"))
         .select(key_cols + ["valid_from", "valid_to", "is_current"])
     )
     return pl.concat([recon, snap], how="vertical")
@@ -751,36 +1280,124 @@ def _lineage_franchise(df: pl.DataFrame, lineage_map: pl.DataFrame) -> pl.DataFr
     )
 
 
-def _read_player_presence(bucket_name: str, lineage_map: pl.DataFrame) -> pl.DataFrame:
-    """All daily roster_players snapshots -> (franchise_id, player_id, snapshot_date)."""
-    from google.cloud import storage
-    client = storage.Client()
-    names = sorted(
-        bl.name for bl in client.bucket(bucket_name).list_blobs(
-            prefix="bronze/sleeper/rosters/roster_players/daily/")
-        if bl.name.endswith(".parquet")
-    )
-    frames = []
+def _memory_budget() -> int:
+    """The ledger build's memory cap in bytes (``LEDGER_MEMORY_MB``)."""
+    return int(os.environ.get("LEDGER_MEMORY_MB", LEDGER_MEMORY_MB)) * 1024 ** 2
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident memory so far of this process or its largest finished worker, in MiB
+    (ru_maxrss is KiB on Linux)."""
+    return max(resource.getrusage(who).ru_maxrss
+               for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)) / 1024
+
+
+def _day_chunks(names: list[str], decoded: list[int] | None = None):
+    """Snapshot objects in day order, in chunks -> (days, names). The first chunk has
+    ``_STINT_CHUNK_DAYS`` days. When the caller appends each chunk's decoded size to
+    ``decoded``, the next chunk takes as many days as fit in a quarter of the memory budget."""
+    by_day: dict[str, list[str]] = {}
     for n in names:
-        d = n.split("load_date=")[1].split("/")[0]
-        df = pl.read_parquet(f"gs://{bucket_name}/{n}").select(
+        by_day.setdefault(_snapshot_date_from_path(n), []).append(n)
+    days = sorted(by_day)
+    i, step = 0, _STINT_CHUNK_DAYS
+    while i < len(days):
+        batch = days[i:i + step]
+        yield batch, [n for d in batch for n in by_day[d]]
+        i += step
+        if decoded:
+            per_day = max(1, decoded[-1] // len(batch))
+            step = max(1, min(_MAX_CHUNK_DAYS, _memory_budget() // 4 // per_day))
+
+
+def _in_leagues(lineage_map: pl.DataFrame) -> pl.Expr:
+    """Row filter for the leagues of ``lineage_map``, pushed into each snapshot read."""
+    return pl.col("league_id").cast(pl.Utf8).is_in(lineage_map["league_id"].cast(pl.Utf8).implode())
+
+
+_PLAYER_SNAPSHOT_COLS = ["league_id", "roster_id", "player_id", "load_date"]
+
+
+def _snapshot_chunks(bucket_name: str, prefix: str, lineage_map: pl.DataFrame,
+                     since: str | None = None, columns: list[str] | None = None,
+                     decoded: list[int] | None = None, spool: dict | None = None):
+    """Daily snapshot objects under ``prefix`` (all, or the days after ``since``) a chunk of
+    days at a time -> (days, rows of ``lineage_map``'s leagues); see ``_day_chunks`` for
+    ``decoded``. With ``spool`` (``_spool_snapshots``) the chunks come from the local files
+    the parent process already cut for this lineage partition, not from the lake."""
+    if spool is not None:
+        for days, path in spool[prefix]:
+            yield days, pl.read_parquet(path)
+        return
+    names = [n for n in partition_objects(get_bucket(bucket_name), prefix)
+             if since is None or _snapshot_date_from_path(n) > since]
+    for days, chunk in _day_chunks(names, decoded):
+        yield days, read_objects(bucket_name, chunk, columns=columns, predicate=_in_leagues(lineage_map))
+
+
+def _spool_snapshots(bucket_name: str, lineage_maps: list[pl.DataFrame], spool_dir: str) -> list[dict]:
+    """Read every daily snapshot object once, a chunk of days at a time, and cut each chunk
+    into one local file per lineage partition -> per partition ``{prefix: [(days, path)]}``
+    for ``_snapshot_chunks``. Workers then read their own leagues' rows, not every object."""
+    everyone = pl.concat(lineage_maps, how="vertical")
+    spools: list[dict] = [{} for _ in lineage_maps]
+    for prefix, columns in ((_PLAYER_DAYS_PREFIX, _PLAYER_SNAPSHOT_COLS), (_PICK_DAYS_PREFIX, None)):
+        kind = prefix.strip("/").split("/")[-2]
+        decoded: list[int] = []
+        for spool in spools:
+            spool[prefix] = []
+        for i, (days, rows) in enumerate(_snapshot_chunks(bucket_name, prefix, everyone, columns=columns,
+                                                          decoded=decoded)):
+            decoded.append(rows.estimated_size())
+            for j, (spool, lin_map) in enumerate(zip(spools, lineage_maps)):
+                path = Path(spool_dir) / f"spool-{j:04d}" / f"{kind}-{i:05d}.parquet"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                rows.filter(_in_leagues(lin_map)).write_parquet(path)
+                spool[prefix].append((days, str(path)))
+    return spools
+
+
+def _read_player_stints(bucket_name: str, lineage_map: pl.DataFrame,
+                        since: str | None = None,
+                        spool: dict | None = None) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Daily roster_players snapshots (all of them, or only days after ``since``), streamed
+    a chunk of days at a time -> (stints (franchise_id, player_id, first_date, last_date),
+    franchise days (franchise_id, snapshot_date)). The franchise days carry each lineage's
+    snapshot calendar for the rollover repair and the state sidecar. Stints are built on the
+    calendar of snapshot objects, so only the leagues in ``lineage_map`` need to be read.
+    ``spool`` reads the chunks a parent process spooled (``_spool_snapshots``)."""
+    key = ["franchise_id", "player_id"]
+    stints = pl.DataFrame(schema=_stint_schema({}, key))
+    franchise_days = [pl.DataFrame(schema={"franchise_id": pl.Utf8, "snapshot_date": pl.Utf8})]
+    decoded: list[int] = []
+    edge = None
+    for chunk_days, present in _snapshot_chunks(bucket_name, _PLAYER_DAYS_PREFIX, lineage_map, since,
+                                                _PLAYER_SNAPSHOT_COLS, decoded, spool):
+        present = present.select(
             pl.col("league_id").cast(pl.Utf8), pl.col("roster_id").cast(pl.Int64),
-            pl.col("player_id").cast(pl.Utf8),
-        ).with_columns(pl.lit(d).alias("snapshot_date"))
-        frames.append(df)
-    present = pl.concat(frames, how="vertical")
-    return _lineage_franchise(present, lineage_map).select("franchise_id", "player_id", "snapshot_date")
+            pl.col("player_id").cast(pl.Utf8), pl.col("load_date").cast(pl.Utf8).alias("snapshot_date"),
+        )
+        present = _lineage_franchise(present, lineage_map).select("franchise_id", "player_id", "snapshot_date")
+        decoded.append(present.estimated_size())
+        franchise_days.append(present.select("franchise_id", "snapshot_date").unique())
+        stints = append_stints(stints, presence_to_stints(present, key, days=chunk_days), key,
+                               edge=edge, start=chunk_days[0])
+        edge = chunk_days[-1]
+    return stints, pl.concat(franchise_days, how="vertical")
 
 
-def _read_player_events(bucket_name: str, lineage_map: pl.DataFrame) -> pl.DataFrame:
+def _read_player_events(bucket_name: str, lineage_map: pl.DataFrame,
+                        sources: BronzeSources | None = None) -> pl.DataFrame:
     """Deduped add/drop event stream (drafts + transactions, full_load UNION daily) ->
     (franchise_id, player_id, ts, date, action)."""
+    src = sources or BronzeSources(bucket_name)
+
     def both(sub, cols):
+        frames = [src.prefix(f"bronze/sleeper/transactions/{sub}/{feed}/")
+                  for feed in ("full_load", "daily")]
         return pl.concat([
-            _read_prefix_concat(bucket_name, f"bronze/sleeper/transactions/{sub}/full_load/").select(cols)
-            if _read_prefix_concat(bucket_name, f"bronze/sleeper/transactions/{sub}/full_load/").height else pl.DataFrame(schema={c: pl.Utf8 for c in cols}),
-            _read_prefix_concat(bucket_name, f"bronze/sleeper/transactions/{sub}/daily/").select(cols)
-            if _read_prefix_concat(bucket_name, f"bronze/sleeper/transactions/{sub}/daily/").height else pl.DataFrame(schema={c: pl.Utf8 for c in cols}),
+            f.select(cols) if f.height else pl.DataFrame(schema={c: pl.Utf8 for c in cols})
+            for f in frames
         ], how="diagonal_relaxed")
 
     tx = both("transactions", ["transaction_id", "created", "status"]).unique("transaction_id").filter(pl.col("status") == "complete")
@@ -793,9 +1410,9 @@ def _read_player_events(bucket_name: str, lineage_map: pl.DataFrame) -> pl.DataF
         )
     )
     # draft adds
-    drafts = _read_prefix_concat(bucket_name, "bronze/sleeper/drafts/drafts/").unique("draft_id").select("draft_id", "league_id", "start_time")
+    drafts = src.prefix("bronze/sleeper/drafts/drafts/").unique("draft_id").select("draft_id", "league_id", "start_time")
     dpk = (
-        _read_prefix_concat(bucket_name, "bronze/sleeper/drafts/draft_picks/").unique(["draft_id", "pick_no"])
+        src.prefix("bronze/sleeper/drafts/draft_picks/").unique(["draft_id", "pick_no"])
         .select("draft_id", "player_id", "roster_id")
         .join(drafts, on="draft_id", how="inner")
         .with_columns(
@@ -832,68 +1449,71 @@ def _drafts_completed_by(drafts_df, day: str):
     )
 
 
-def _read_pick_presence(bucket_name: str, lineage_map: pl.DataFrame, leagues_df: pl.DataFrame,
-                        overrides_df: pl.DataFrame, drafts_df) -> pl.DataFrame:
-    """Per-day pick ownership over the daily traded_picks snapshots ->
-    (franchise_id, pick_id, snapshot_date).
+def _read_pick_stints(bucket_name: str, lineage_map: pl.DataFrame, leagues_df: pl.DataFrame,
+                      overrides_df: pl.DataFrame, drafts_df, since: str | None = None,
+                      spool: dict | None = None) -> tuple[pl.DataFrame, list[str]]:
+    """Per-day pick ownership over the daily traded_picks snapshots -> (stints
+    (franchise_id, pick_id, first_date, last_date), snapshot days).
 
     Each day's traded_picks IS Sleeper's net pick state for that day, so we resolve
     ownership as-of that day with an EMPTY txn event log (no future-trade leakage);
     the resolver still applies the deterministic future-pick universe + draft cutoff.
-    The pick accrues to the OWNER's franchise (lineage + owner_roster_id)."""
-    from google.cloud import storage
-    client = storage.Client()
-    names = sorted(
-        bl.name for bl in client.bucket(bucket_name).list_blobs(
-            prefix="bronze/sleeper/rosters/traded_picks/daily/")
-        if bl.name.endswith(".parquet")
-    )
-    empty_txn = pl.DataFrame()
-    frames = []
-    for n in names:
-        d = n.split("load_date=")[1].split("/")[0]
-        traded = pl.read_parquet(f"gs://{bucket_name}/{n}")
-        # date-aware cutoff: only count drafts that had actually run by day `d`, so a
-        # now-complete FUTURE draft can't retroactively roll earlier days' picks forward
-        # a year (e.g. the 2026 class vanishing months before the 2026 draft).
-        resolved = resolve_pick_ownership(traded, empty_txn, overrides_df, leagues_df,
-                                          _drafts_completed_by(drafts_df, d))
+    The cutoff is date-aware: only drafts that had actually run by that day count, so a
+    now-complete FUTURE draft can't retroactively roll earlier days' picks forward a year
+    (e.g. the 2026 class vanishing months before the 2026 draft). Days are read and
+    resolved a chunk at a time by ``resolve_pick_ownership_by_day`` and folded into stints
+    over the calendar of snapshot objects (the returned days).
+    The pick accrues to the OWNER's franchise (lineage + owner_roster_id). With ``since``
+    only the days after it are resolved; ``spool`` reads spooled chunks as for player stints."""
+    key = ["franchise_id", "pick_id"]
+    stints, days = pl.DataFrame(schema=_stint_schema({}, key)), []
+    decoded: list[int] = []
+    edge = None
+    for chunk_days, traded in _snapshot_chunks(bucket_name, _PICK_DAYS_PREFIX, lineage_map, since,
+                                               decoded=decoded, spool=spool):
+        days += chunk_days
+        traded = traded.with_columns(pl.col("load_date").cast(pl.Utf8).alias("snapshot_date"))
+        resolved = resolve_pick_ownership_by_day(traded, overrides_df, leagues_df, drafts_df,
+                                                 days=chunk_days)
+        decoded.append(traded.estimated_size() + resolved.estimated_size())
+        prev_edge, edge = edge, chunk_days[-1]
         if resolved.height == 0:
             continue
-        df = (
+        present = (
             resolved.with_columns(pl.col("league_id").cast(pl.Utf8))
             .join(lineage_map, on="league_id", how="inner")
-            .with_columns(
+            .select(
                 pl.concat_str([pl.col("league_lineage_id"), pl.col("owner_roster_id").cast(pl.Utf8)],
                               separator="_").alias("franchise_id"),
                 pl.concat_str([pl.col("season").cast(pl.Utf8), pl.col("round").cast(pl.Utf8),
                                pl.col("original_roster_id").cast(pl.Utf8)], separator=":").alias("pick_id"),
-                pl.lit(d).alias("snapshot_date"),
+                pl.col("snapshot_date").cast(pl.Utf8),
             )
-            .select("franchise_id", "pick_id", "snapshot_date")
         )
-        frames.append(df)
-    return pl.concat(frames, how="vertical") if frames else pl.DataFrame(
-        schema={"franchise_id": pl.Utf8, "pick_id": pl.Utf8, "snapshot_date": pl.Utf8})
+        stints = append_stints(stints, presence_to_stints(present, key, days=chunk_days), key,
+                               edge=prev_edge, start=chunk_days[0])
+    return stints, days
 
 
-def _read_pick_trade_events(bucket_name: str, lineage_map: pl.DataFrame) -> pl.DataFrame:
+def _read_pick_trade_events(bucket_name: str, lineage_map: pl.DataFrame,
+                            sources: BronzeSources | None = None) -> pl.DataFrame:
     """Unify pick ownership-change events with the CORRECT new/prev owner per source.
 
     DATA QUIRK: `transactions/draft_picks/full_load` (GraphQL dump) has from/to SWAPPED
     — its `from_team_id` is the NEW owner. The `daily` feed (`owner_id`) and
     `commission_overrides` (`to_team_id`) are correct. Returns one row per ownership
     change: ``pick_id, prev_franchise, new_franchise, ts, date`` (lineage-keyed)."""
+    src = sources or BronzeSources(bucket_name)
     txns = pl.concat([
-        _read_prefix_concat(bucket_name, "bronze/sleeper/transactions/transactions/full_load/")
-            .select("transaction_id", "created", "status"),
-        _read_prefix_concat(bucket_name, "bronze/sleeper/transactions/transactions/daily/")
-            .select("transaction_id", "created", "status"),
+        f.select("transaction_id", "created", "status")
+        for f in (src.prefix("bronze/sleeper/transactions/transactions/full_load/"),
+                  src.prefix("bronze/sleeper/transactions/transactions/daily/"))
+        if f.height
     ], how="vertical_relaxed").unique("transaction_id").filter(pl.col("status") == "complete")
 
     # full_load: corrected schema uses owner_id (new); legacy data (before the
     # ingestion fix) used from_team_id as the new owner (labels were swapped).
-    fl = _read_prefix_concat(bucket_name, "bronze/sleeper/transactions/draft_picks/full_load/")
+    fl = src.prefix("bronze/sleeper/transactions/draft_picks/full_load/")
     if fl.height:
         if "owner_id" in fl.columns:                       # corrected schema
             new_col, prev_col = "owner_id", "previous_owner_id"
@@ -905,7 +1525,7 @@ def _read_pick_trade_events(bucket_name: str, lineage_map: pl.DataFrame) -> pl.D
             pl.col(prev_col).cast(pl.Int64).alias("prev_owner"),
         )
     # daily: NEW owner = owner_id, prev = previous_owner_id
-    dl = _read_prefix_concat(bucket_name, "bronze/sleeper/transactions/draft_picks/daily/")
+    dl = src.prefix("bronze/sleeper/transactions/draft_picks/daily/")
     dl = dl.select(
         "transaction_id", "league_id", "season", pl.col("round").cast(pl.Int64),
         pl.col("roster_id").cast(pl.Int64), pl.col("owner_id").cast(pl.Int64).alias("new_owner"),
@@ -920,9 +1540,9 @@ def _read_pick_trade_events(bucket_name: str, lineage_map: pl.DataFrame) -> pl.D
     ) if txn_picks.height else pl.DataFrame()
 
     # commission_overrides: NEW owner = to_team_id, prev = from_team_id
-    ov_path = _latest_file(bucket_name, "bronze/sleeper/transactions/commission_overrides/")
-    if ov_path:
-        ov = pl.read_parquet(ov_path).select(
+    ov = src.latest("bronze/sleeper/transactions/commission_overrides/")
+    if ov is not None:
+        ov = ov.select(
             "league_id", "season", pl.col("round").cast(pl.Int64), pl.col("roster_id").cast(pl.Int64),
             pl.col("to_team_id").cast(pl.Int64).alias("new_owner"),
             pl.col("from_team_id").cast(pl.Int64).alias("prev_owner"),
@@ -1011,8 +1631,199 @@ def synthesize_pick_lifecycle(drafts_df: pl.DataFrame, leagues_df: pl.DataFrame,
     return out.select("franchise_id", "pick_id", "mint_ts", "mint_date", "consume_date")
 
 
-def reconstruct_rollover_presence(present: pl.DataFrame, leagues_df: pl.DataFrame,
-                                  bucket_name: str) -> pl.DataFrame:
+def _pick_lifecycle(drafts_df: pl.DataFrame, leagues_df: pl.DataFrame,
+                    lineage_map: pl.DataFrame) -> pl.DataFrame:
+    """``synthesize_pick_lifecycle`` with each lineage's rounds from its latest complete draft."""
+    rounds_df = (
+        drafts_df.unique("draft_id").with_columns(pl.col("league_id").cast(pl.Utf8))
+        .join(lineage_map, on="league_id", how="inner")
+        .filter(pl.col("status") == "complete").with_columns(pl.col("season").cast(pl.Int64))
+        .sort("season").group_by("league_lineage_id").agg(pl.col("rounds").last().alias("rounds"))
+    )
+    return synthesize_pick_lifecycle(drafts_df, leagues_df, lineage_map, rounds_df, years_out=3)
+
+
+def _windows_frame(windows: list) -> pl.DataFrame:
+    return pl.DataFrame({"_lin": [w[0][:-1] for w in windows], "_R": [w[1] for w in windows],
+                         "_S": [w[2] for w in windows]},
+                        schema={"_lin": pl.Utf8, "_R": pl.Utf8, "_S": pl.Utf8})
+
+
+def _window_days(windows: list) -> set[str]:
+    out = set()
+    for _, R, S in windows:
+        d, end = date.fromisoformat(R), date.fromisoformat(S)
+        while d < end:
+            out.add(d.isoformat())
+            d += timedelta(days=1)
+    return out
+
+
+def _interval_stints(intervals: pl.DataFrame, key_cols: list[str]) -> pl.DataFrame:
+    """Closed daily ``[valid_from, valid_to)`` intervals -> stints over every calendar day."""
+    return intervals.select(key_cols + [
+        "valid_from", pl.col("valid_to").str.to_date().dt.offset_by("-1d").cast(pl.Utf8),
+    ]).rename({"valid_from": "first_date", "valid_to": "last_date"})
+
+
+def _cut_windows(stints: pl.DataFrame, windows: list, days) -> pl.DataFrame:
+    """Cut each rollover window ``[R, S_new)`` out of its lineage's stints (the stale
+    frozen-old-league days). ``days`` is the snapshot calendar the stints are built on."""
+    # in calendar-index space a window is [first day >= R, first day >= S_new)
+    cal = sorted(set(days))
+    w = index_on(_windows_frame(windows), cal, {"_R": "_r", "_S": "_s"}).select("_lin", "_r", "_s")
+    s = (
+        index_on(stints, cal, {"first_date": "_f", "last_date": "_l"})
+        .with_columns((pl.col("_l") + 1).alias("_e"), _lineage_of(pl.col("franchise_id")).alias("_lin"))
+        .join(w, on="_lin", how="left")
+    )
+    return (
+        subtract(s, pl.col("_r"), pl.col("_s"), "_f", "_e")
+        .with_columns(point_at(cal, "_f").alias("first_date"),
+                      point_at(cal, pl.col("_e") - 1).alias("last_date"))
+        .select(stints.columns)
+    )
+
+
+def _apply_rollover(stints: pl.DataFrame, days, held: pl.DataFrame, windows: list,
+                    key_cols: list[str]) -> tuple[pl.DataFrame, list[str]]:
+    """Replace the window days of ``stints`` with the ``held`` intervals -> (stints,
+    calendar). Every window day joins the calendar. A stint of another lineage that already
+    spans such a day is not split, since a day without snapshots isn't an absence."""
+    calendar = sorted(set(days) | _window_days(windows))
+    merged = pl.concat([_cut_windows(stints, windows, days), _interval_stints(held, key_cols)],
+                       how="vertical_relaxed")
+    return coalesce_stints(merged, key_cols, calendar), calendar
+
+
+def rollover_holdings(stints: pl.DataFrame, franchise_days: pl.DataFrame, leagues_df: pl.DataFrame,
+                      drafts_all: pl.DataFrame, dpicks_all: pl.DataFrame, tx_players: pl.DataFrame,
+                      txns: pl.DataFrame) -> tuple[pl.DataFrame, list]:
+    """Rollover windows and the new league's replayed holdings inside them.
+
+    Per lineage the window is its largest snapshot gap (at least ``ROLLOVER_GAP_DAYS``):
+    ``last_old`` is the old league's last snapshot and ``S_new`` the new league's first. ``R``
+    is the current league's first event, or ``last_old + 1`` when it has none. The replay is
+    vectorized: the carry roster (the lineage's stints covering its last snapshot before
+    ``R``) is seeded on ``R``.
+    Daily transactions and draft adds then follow, sorted by ms timestamp with drops before
+    adds on ties. The last event of a day sets a (franchise, player)'s day-end state, and
+    state changes become intervals directly.
+
+    Returns ``(holdings, windows)``: holdings are ``franchise_id, player_id, valid_from,
+    valid_to`` intervals inside ``[R, S_new)``; windows are ``(lineage_id + "_", R, S_new)``.
+    ``stints`` / ``franchise_days`` come from ``_read_player_stints``. ``tx_players`` /
+    ``txns`` are the daily transaction_players / transactions feeds (all leagues)."""
+    empty = pl.DataFrame(schema={"franchise_id": pl.Utf8, "player_id": pl.Utf8,
+                                 "valid_from": pl.Utf8, "valid_to": pl.Utf8})
+    if franchise_days.height == 0:
+        return empty, []
+    current = (
+        leagues_df.with_columns(pl.col("season").cast(pl.Int64, strict=False).alias("_s"))
+        .sort("_s").group_by("league_lineage_id")
+        .agg(pl.col("league_id").last().cast(pl.Utf8).alias("cur_league"))
+        .select(pl.col("league_lineage_id").cast(pl.Utf8).alias("lin"), "cur_league")
+    )
+    day = pl.col("snapshot_date")
+
+    # 1. each lineage's largest snapshot gap (earliest on ties) -> (last_old, S_new)
+    gaps = (
+        franchise_days.select(_lineage_of(pl.col("franchise_id")).alias("lin"), day.cast(pl.Utf8))
+        .unique().sort("lin", "snapshot_date")
+        .with_columns(day.shift(1).over("lin").alias("last_old"))
+        .drop_nulls("last_old")
+        .with_columns((day.str.to_date() - pl.col("last_old").str.to_date()).dt.total_days().alias("gap"))
+        .filter(pl.col("gap") == pl.col("gap").max().over("lin"))
+        .group_by("lin")
+        .agg(pl.col("last_old").min(), day.min().alias("S_new"), pl.col("gap").first())
+        .filter(pl.col("gap") >= ROLLOVER_GAP_DAYS)
+        .join(current, on="lin", how="inner")
+    )
+    if gaps.height == 0:
+        return empty, []
+
+    # 2. the current league's events (transactions add/drop + draft adds), ms-ordered
+    ev_schema = {"league_id": pl.Utf8, "ts": pl.Int64, "roster_id": pl.Int64,
+                 "player_id": pl.Utf8, "action": pl.Utf8}
+    parts = [pl.DataFrame(schema=ev_schema)]
+    if tx_players.height and txns.height:
+        complete = txns.filter(pl.col("status") == "complete").select(
+            "transaction_id", pl.col("created").cast(pl.Int64).alias("ts")).unique("transaction_id")
+        parts.append(tx_players.join(complete, on="transaction_id", how="inner").select(
+            pl.col("league_id").cast(pl.Utf8), "ts", pl.col("roster_id").cast(pl.Int64),
+            pl.col("player_id").cast(pl.Utf8), "action"))
+    if drafts_all.height and dpicks_all.height:
+        ts_cols = [c for c in ("start_time", "last_picked") if c in drafts_all.columns]
+        dr = drafts_all.select(pl.col("league_id").cast(pl.Utf8), "draft_id",
+                               pl.coalesce(ts_cols).cast(pl.Int64).alias("ts")
+                               ).unique("draft_id", keep="first", maintain_order=True)
+        parts.append(dpicks_all.join(dr, on="draft_id", how="inner").select(
+            "league_id", "ts", pl.col("roster_id").cast(pl.Int64), pl.col("player_id").cast(pl.Utf8),
+            pl.lit("add").alias("action")))
+    ev = (
+        pl.concat(parts, how="vertical_relaxed")
+        .join(gaps.select("lin", pl.col("cur_league").alias("league_id")), on="league_id", how="inner")
+        .drop_nulls("ts")
+        .with_columns(
+            pl.from_epoch(pl.col("ts"), time_unit="ms").dt.date().cast(pl.Utf8).alias("d"),
+            pl.when(pl.col("action") == "add").then(1).otherwise(0).alias("_tb"),
+        )
+    )
+
+    # 3. R per lineage; keep windows that open before S_new and have a carry roster
+    first_move = ev.group_by("lin").agg(pl.col("d").min().alias("_first"))
+    win = (
+        gaps.join(first_move, on="lin", how="left")
+        .with_columns(pl.coalesce(
+            "_first", pl.col("last_old").str.to_date().dt.offset_by("1d").cast(pl.Utf8)).alias("R"))
+        .filter(pl.col("R") < pl.col("S_new"))
+    )
+    carry_day = (
+        franchise_days.select(_lineage_of(pl.col("franchise_id")).alias("lin"), day.cast(pl.Utf8))
+        .join(win.select("lin", "R"), on="lin", how="inner")
+        .filter(day < pl.col("R"))
+        .group_by("lin").agg(day.max().alias("_carry"), pl.col("R").first())
+    )
+    carry = (
+        stints.with_columns(_lineage_of(pl.col("franchise_id")).alias("lin"))
+        .join(carry_day, on="lin", how="inner")
+        .filter((pl.col("first_date") <= pl.col("_carry")) & (pl.col("last_date") >= pl.col("_carry")))
+    )
+    win = win.join(carry.select("lin").unique(), on="lin", how="semi").sort("lin")
+    if win.height == 0:
+        return empty, []
+
+    # 4. replay: carry seeded on R (before any event that day), then events in [R, S_new)
+    seq = pl.concat([
+        carry.select("lin", "franchise_id", pl.col("player_id").cast(pl.Utf8), pl.col("R").alias("d"),
+                     pl.lit(None, dtype=pl.Int64).alias("ts"), pl.lit(-1).alias("_tb"),
+                     pl.lit(True).alias("held")),
+        ev.join(win.select("lin", "R", "S_new"), on="lin", how="inner")
+        .filter((pl.col("d") >= pl.col("R")) & (pl.col("d") < pl.col("S_new")))
+        .select("lin", pl.concat_str([pl.col("lin"), pl.col("roster_id").cast(pl.Utf8)], separator="_")
+                .alias("franchise_id"), "player_id", "d", "ts", "_tb",
+                (pl.col("action") == "add").alias("held")),
+    ], how="vertical_relaxed")
+    key = ["franchise_id", "player_id"]
+    holdings = (
+        seq.sort(key + ["d", "ts", "_tb"], nulls_last=False)
+        .group_by(key + ["d"], maintain_order=True).agg(pl.col("lin").last(), pl.col("held").last())
+        .sort(key + ["d"])
+        .filter(pl.col("held") != pl.col("held").shift(1).over(key).fill_null(False))
+        .with_columns(pl.col("d").shift(-1).over(key).alias("_next"))
+        .filter(pl.col("held"))
+        .join(win.select("lin", "S_new"), on="lin", how="inner")
+        .select(*key, pl.col("d").alias("valid_from"),
+                pl.coalesce("_next", "S_new").alias("valid_to"))
+    )
+    windows = [(f"{lin}_", R, S) for lin, R, S in win.select("lin", "R", "S_new").iter_rows()]
+    return holdings, windows
+
+
+def reconstruct_rollover_presence(stints: pl.DataFrame, franchise_days: pl.DataFrame,
+                                  leagues_df: pl.DataFrame, bucket_name: str,
+                                  sources: BronzeSources | None = None, days=None,
+                                  ) -> tuple[pl.DataFrame, list[str], list]:
     """Repair the season-rollover gap in PLAYER presence.
 
     When a lineage rolls to a new season, Sleeper keeps serving the OLD (completed) league, so
@@ -1026,229 +1837,638 @@ def reconstruct_rollover_presence(present: pl.DataFrame, leagues_df: pl.DataFram
     ORDERED BY the millisecond timestamp (drop-before-add on ties) so same-day add/drop
     round-trips net correctly. The real S_new snapshot then takes over (anchor to truth).
     Validated to reproduce the new league's first snapshot bar a couple of same-day round-trip
-    fringe players. Returns corrected presence (franchise_id, player_id, snapshot_date)."""
-    import datetime as _dt
-    from collections import defaultdict
-    from google.cloud import storage
-    client = storage.Client()
-
-    def _read(prefix):
-        names = [b.name for b in client.bucket(bucket_name).list_blobs(prefix=prefix)
-                 if b.name.endswith(".parquet")]
-        return (pl.concat([pl.read_parquet(f"gs://{bucket_name}/{n}") for n in names],
-                          how="diagonal_relaxed") if names else pl.DataFrame())
-
-    drafts_all = _read("bronze/sleeper/drafts/drafts/")
-    dpicks_all = _read("bronze/sleeper/drafts/draft_picks/")
-    current = (
-        leagues_df.with_columns(pl.col("season").cast(pl.Int64, strict=False).alias("_s"))
-        .sort("_s").group_by("league_lineage_id")
-        .agg(pl.col("league_id").last().cast(pl.Utf8).alias("cur_league"))
+    fringe players. The replay itself is interval-native (``rollover_holdings``).
+    ``days`` is the snapshot calendar of ``stints`` (default: the days ``franchise_days`` covers).
+    Returns (corrected stints, snapshot calendar, windows)."""
+    src = sources or BronzeSources(bucket_name)
+    if days is None:
+        days = franchise_days["snapshot_date"].unique().sort().to_list()
+    holdings, windows = rollover_holdings(
+        stints, franchise_days, leagues_df,
+        src.prefix("bronze/sleeper/drafts/drafts/"),
+        src.prefix("bronze/sleeper/drafts/draft_picks/"),
+        src.prefix("bronze/sleeper/transactions/transaction_players/daily/"),
+        src.prefix("bronze/sleeper/transactions/transactions/daily/"),
     )
-
-    synth: list[tuple] = []
-    windows: list[tuple] = []
-    for row in current.iter_rows(named=True):
-        lin, L, pref = row["league_lineage_id"], row["cur_league"], row["league_lineage_id"] + "_"
-        dates = sorted(present.filter(pl.col("franchise_id").str.starts_with(pref))["snapshot_date"].unique().to_list())
-        if len(dates) < 2:
-            continue
-        gaps = [(_dt.date.fromisoformat(dates[i + 1]) - _dt.date.fromisoformat(dates[i])).days
-                for i in range(len(dates) - 1)]
-        gi = max(range(len(gaps)), key=lambda i: gaps[i])
-        if gaps[gi] < 3:               # no rollover gap -> nothing to reconstruct
-            continue
-        last_old, S_new = dates[gi], dates[gi + 1]   # old league's last snapshot; new league's first
-
-        # current-league events (transactions add/drop) with millisecond ts -- MAY be empty
-        # (e.g. a pre-draft new league with no offseason moves yet). Even then we must carry the
-        # frozen roster forward across the gap, or this lineage alone is absent on the synthetic
-        # days the OTHER lineages' reconstruction adds to the global date grid -> a spurious hole.
-        tp = _read(f"bronze/sleeper/transactions/transaction_players/daily/league_id={L}/")
-        tx = _read(f"bronze/sleeper/transactions/transactions/daily/league_id={L}/")
-        if tp.is_empty() or tx.is_empty():
-            ev = pl.DataFrame(schema={"ts": pl.Int64, "roster_id": pl.Int64,
-                                      "player_id": pl.Utf8, "action": pl.Utf8})
-        else:
-            txc = tx.filter(pl.col("status") == "complete").select(
-                "transaction_id", pl.col("created").cast(pl.Int64).alias("ts"))
-            ev = tp.join(txc, on="transaction_id", how="inner").select(
-                "ts", pl.col("roster_id").cast(pl.Int64), pl.col("player_id").cast(pl.Utf8), "action")
-        # draft adds with the draft's ts so they interleave with same-day transactions
-        dr = (drafts_all.filter(pl.col("league_id") == L)
-              .select("draft_id", pl.coalesce([pl.col("start_time"), pl.col("last_picked")]).cast(pl.Int64).alias("ts"))
-              .unique("draft_id"))
-        if not dr.is_empty() and not dpicks_all.is_empty():
-            dadd = dpicks_all.join(dr, on="draft_id", how="inner").select(
-                "ts", pl.col("roster_id").cast(pl.Int64), pl.col("player_id").cast(pl.Utf8),
-                pl.lit("add").alias("action"))
-            ev = pl.concat([ev, dadd], how="vertical_relaxed")
-        one = _dt.timedelta(days=1)
-        if ev.is_empty():
-            R = (_dt.date.fromisoformat(last_old) + one).isoformat()   # no events -> just bridge the gap
-        else:
-            ev = (ev.drop_nulls("ts")
-                  .with_columns(pl.from_epoch(pl.col("ts"), time_unit="ms").dt.date().cast(pl.Utf8).alias("d"),
-                                pl.when(pl.col("action") == "add").then(1).otherwise(0).alias("_tb"))
-                  .sort(["ts", "_tb"]))        # ts asc; drop(0) before add(1) on identical ts
-            R = ev["d"].min()
-        if R >= S_new:
-            continue
-        pre = present.filter(pl.col("franchise_id").str.starts_with(pref) & (pl.col("snapshot_date") < R))
-        if pre.is_empty():
-            continue
-        carry_date = pre["snapshot_date"].max()       # frozen roster just before the first move
-        roster: dict = defaultdict(set)
-        for x in pre.filter(pl.col("snapshot_date") == carry_date).iter_rows(named=True):
-            roster[x["franchise_id"]].add(x["player_id"])
-
-        by_day: dict = defaultdict(list)
-        for e in ev.iter_rows(named=True):             # already ts-ordered
-            by_day[e["d"]].append(e)
-        d, end, one = _dt.date.fromisoformat(R), _dt.date.fromisoformat(S_new), _dt.timedelta(days=1)
-        while d < end:
-            ds = d.isoformat()
-            for e in by_day.get(ds, []):
-                fid = f"{lin}_{e['roster_id']}"
-                if e["action"] == "add":
-                    roster[fid].add(e["player_id"])
-                else:
-                    roster[fid].discard(e["player_id"])
-            for fid, s in roster.items():
-                for pid in s:
-                    synth.append((fid, pid, ds))
-            d += one
-        windows.append((pref, R, S_new))
-
-    if not synth:
-        return present, []
-    synth_df = pl.DataFrame({"franchise_id": [s[0] for s in synth],
-                             "player_id": [s[1] for s in synth],
-                             "snapshot_date": [s[2] for s in synth]})
-    out = present
-    for pref, R, S_new in windows:      # drop the stale frozen-old-league window
-        out = out.filter(~(pl.col("franchise_id").str.starts_with(pref)
-                           & (pl.col("snapshot_date") >= R) & (pl.col("snapshot_date") < S_new)))
-    corrected = pl.concat([out, synth_df], how="vertical_relaxed").unique(["franchise_id", "player_id", "snapshot_date"])
-    return corrected, windows
-
-
-def reconstruct_rollover_pick_presence(pick_present: pl.DataFrame, recon_intervals: pl.DataFrame,
-                                       windows: list) -> pl.DataFrame:
-    """Apply the same rollover repair to PICK presence. The reconstructed pick intervals
-    (`reconstruct_pick_intervals`, keyed on mint/consume/trades) already CONSUME each season's
-    picks at that season's draft. We project them onto daily presence across each rollover
+    if holdings.height == 0:
+        return stints, days, []
+    stints, days = _apply_rollover(stints, days, holdings, windows, ["franchise_id", "player_id"])
+    return stints, days, windows
+
+
+def rollover_pick_holdings(recon_intervals: pl.DataFrame, windows: list) -> pl.DataFrame:
+    """Reconstructed pick intervals clipped to each rollover window ``[R, S_new)`` ->
+    (franchise_id, pick_id, valid_from, valid_to)."""
+    windowed = (recon_intervals.with_columns(_lineage_of(pl.col("franchise_id")).alias("_lin"))
+                .join(_windows_frame(windows), on="_lin", how="inner"))
+    return clip(windowed, pl.col("_R"), pl.col("_S")).select("franchise_id", "pick_id", "valid_from", "valid_to")
+
+
+def reconstruct_rollover_pick_presence(pick_stints: pl.DataFrame, pick_days: list[str],
+                                       recon_intervals: pl.DataFrame,
+                                       windows: list) -> tuple[pl.DataFrame, list[str]]:
+    """Apply the same rollover repair to PICK stints -> (stints, snapshot calendar). The
+    reconstructed pick intervals (`reconstruct_pick_intervals`, keyed on mint/consume/trades)
+    already CONSUME each season's picks at that season's draft. We clip them to each rollover
     window [R, S_new) and replace the stale frozen-old-league pick snapshots there -- so the new
     season's picks turn into rookies (drop) at the draft instead of lingering until the first
     new-league snapshot (which would double-count vs the reconstructed rookies)."""
-    import datetime as _dt
     if not windows or recon_intervals is None or recon_intervals.is_empty():
-        return pick_present
-    synth: list[tuple] = []
-    for pref, R, S_new in windows:
-        rows = recon_intervals.filter(
-            pl.col("franchise_id").str.starts_with(pref) & pl.col("valid_from").is_not_null()
-        ).select("franchise_id", "pick_id", "valid_from", "valid_to").to_dicts()
-        if not rows:
+        return pick_stints, pick_days
+    held = rollover_pick_holdings(recon_intervals, windows)
+    if held.height == 0:
+        return pick_stints, pick_days
+    return _apply_rollover(pick_stints, pick_days, held, windows, ["franchise_id", "pick_id"])
+
+
+# Incremental maintenance
+class FullRebuildRequired(Exception):
+    """The previous ledger can't be carried forward; the message says why."""
+
+
+def extend_snapshot_intervals(intervals: pl.DataFrame, present_new: pl.DataFrame,
+                              key_cols: list[str], hwm: str,
+                              date_col: str = "snapshot_date") -> pl.DataFrame:
+    """``extend_stint_intervals`` over per-day presence after ``hwm``."""
+    if present_new.height == 0:
+        return intervals
+    return extend_stint_intervals(intervals, presence_to_stints(present_new, key_cols, date_col),
+                                  key_cols, hwm, present_new[date_col].cast(pl.Utf8).unique().to_list())
+
+
+def extend_stint_intervals(intervals: pl.DataFrame, stints_new: pl.DataFrame,
+                           key_cols: list[str], hwm: str, days_new) -> pl.DataFrame:
+    """Advance snapshot intervals built through snapshot day ``hwm`` with the stints of the
+    later snapshot days ``days_new``.
+
+    Gives the same result as ``build_snapshot_intervals`` over the whole history, as long as
+    every day in ``days_new`` is after ``hwm``. Closed intervals are final. Each open
+    (``is_current``) stint either continues into the first new day or closes on it. Open
+    stints are re-seeded as one-day stints on ``hwm``; a result interval starting at ``hwm``
+    then gets its original ``valid_from`` back."""
+    if not len(days_new):
+        return intervals
+    cols = key_cols + ["valid_from", "valid_to", "is_current"]
+    open_ = intervals.filter(pl.col("is_current"))
+    seed = open_.select(key_cols + [pl.lit(hwm).alias("first_date"), pl.lit(hwm).alias("last_date")])
+    new = stints_to_intervals(
+        append_stints(seed, stints_new.select(key_cols + ["first_date", "last_date"]), key_cols),
+        key_cols, [hwm, *days_new],
+    )
+    starts = open_.select(key_cols + [pl.lit(hwm).alias("valid_from"), pl.col("valid_from").alias("_from")])
+    new = (
+        new.join(starts, on=key_cols + ["valid_from"], how="left")
+        .with_columns(pl.coalesce("_from", "valid_from").alias("valid_from"))
+        .select(cols)
+    )
+    return pl.concat([intervals.filter(~pl.col("is_current")).select(cols), new], how="vertical_relaxed")
+
+
+def frame_fingerprint(*frames: pl.DataFrame | None) -> str:
+    """Row-order-insensitive content hash of ``frames`` (compared run over run to detect
+    changes to closed history). Columns are compared by name, so column order doesn't matter.
+    The hash comes from polars, so a polars upgrade can change it once: that costs a single
+    full rebuild."""
+    h = hashlib.sha1()
+    for df in frames:
+        if df is None or df.is_empty():
+            h.update(b"-|")
             continue
-        d, end, one = _dt.date.fromisoformat(R), _dt.date.fromisoformat(S_new), _dt.timedelta(days=1)
-        while d < end:
-            ds = d.isoformat()
-            for r in rows:
-                if r["valid_from"] <= ds and (r["valid_to"] is None or r["valid_to"] > ds):
-                    synth.append((r["franchise_id"], r["pick_id"], ds))
-            d += one
-    if not synth:
-        return pick_present
-    sdf = pl.DataFrame({"franchise_id": [s[0] for s in synth], "pick_id": [s[1] for s in synth],
-                        "snapshot_date": [s[2] for s in synth]})
-    out = pick_present
-    for pref, R, S_new in windows:
-        out = out.filter(~(pl.col("franchise_id").str.starts_with(pref)
-                           & (pl.col("snapshot_date") >= R) & (pl.col("snapshot_date") < S_new)))
-    return pl.concat([out, sdf], how="vertical_relaxed").unique(["franchise_id", "pick_id", "snapshot_date"])
+        df = df.select(pl.col(c).cast(pl.Utf8) for c in sorted(df.columns)).unique()
+        h.update(",".join(df.columns).encode())
+        h.update(df.hash_rows(seed=0, seed_1=1, seed_2=2, seed_3=3).sort().to_numpy().tobytes())
+        h.update(b"|")
+    return h.hexdigest()
 
 
-def main():
-    bucket_name = os.environ.get("GCS_BUCKET_NAME")
+def _lineage_of(franchise: pl.Expr) -> pl.Expr:
+    return franchise.str.replace(r"_[^_]*$", "")
 
-    leagues_df = pl.read_parquet(f"gs://{bucket_name}/silver/fantasy/dim_leagues_meta/data.parquet")
-    lineage_map = leagues_df.select(
-        pl.col("league_id").cast(pl.Utf8), pl.col("league_lineage_id").cast(pl.Utf8)
-    ).unique()
 
+def lineage_snapshot_days(present: pl.DataFrame, last: bool = True) -> dict[str, str]:
+    """Latest (or earliest) snapshot day per league lineage -> ``{lineage_id: date}``."""
+    if present.height == 0:
+        return {}
+    day = pl.col("snapshot_date").cast(pl.Utf8)
+    return dict(present.group_by(_lineage_of(pl.col("franchise_id")).alias("lin"))
+                .agg(day.max() if last else day.min()).iter_rows())
+
+
+def rollover_lineages(present_new: pl.DataFrame, lineage_last: dict[str, str]) -> list[str]:
+    """Lineages whose first new snapshot follows a rollover-sized gap after their last
+    ledgered one. The rollover repair rewrites the days before that snapshot, so these need
+    a full rebuild."""
+    out = []
+    for lin, first in lineage_snapshot_days(present_new, last=False).items():
+        prev = lineage_last.get(lin)
+        if prev and (date.fromisoformat(first) - date.fromisoformat(prev)).days >= ROLLOVER_GAP_DAYS:
+            out.append(lin)
+    return sorted(out)
+
+
+def _closed_history_fingerprint(overrides_df: pl.DataFrame, drafts_df, cutoff: str) -> str:
+    """Fingerprint of the small inputs that shaped ledger days before ``cutoff``: the
+    commission overrides and the drafts that had started by then (their status drives the
+    per-day pick cutoff). The event feeds are checked by ``_check_event_feeds`` instead."""
+    drafts = None
+    if drafts_df is not None and drafts_df.height:
+        cols = [c for c in ("draft_id", "league_id", "season", "status", "rounds", "start_time")
+                if c in drafts_df.columns]
+        drafts = _drafts_completed_by(drafts_df.select(cols), cutoff)
+    return frame_fingerprint(overrides_df, drafts)
+
+
+def _event_generations(bucket_name: str) -> tuple[dict[str, int], dict[str, dict[str, int]]]:
+    """Generations of the event feeds' objects, from their bronze manifests (nothing is
+    opened) -> (``{object: generation}`` for the whole-history dumps and any daily object
+    not partitioned by league, ``{league_id: {object: generation}}`` for the rest)."""
+    bucket = get_bucket(bucket_name)
+    objects, leagues = {}, {}
+    for prefix in _EVENT_DUMP_PREFIXES + _EVENT_DAILY_PREFIXES:
+        root = entity_root(prefix)
+        for rel, entry in load_manifest(bucket, root)["partitions"].items():
+            name = f"{root}/{rel}"
+            league = hive_values(name).get("league_id") if prefix in _EVENT_DAILY_PREFIXES else None
+            (objects if league is None else leagues.setdefault(league, {}))[name] = entry.get("generation")
+    return objects, leagues
+
+
+def _partition_digest(partitions: dict[str, int] | None) -> str | None:
+    if not partitions:
+        return None
+    return hashlib.sha1(json.dumps(partitions, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _read_daily_events(bucket_name: str, names: list[str]) -> tuple[pl.DataFrame, ...]:
+    """The daily transaction tables' rows from ``names`` -> (transactions,
+    transaction_players, draft_picks), for ``_event_rows``."""
+    return tuple(read_objects(bucket_name, [n for n in names if n.startswith(prefix)], hive_columns=False)
+                 for prefix in _EVENT_DAILY_PREFIXES)
+
+
+def _event_rows(tx: pl.DataFrame, tp: pl.DataFrame, dp: pl.DataFrame) -> pl.DataFrame:
+    """One row per complete transaction and per player or pick it moved -> ``league_id``,
+    ``ts`` (the transaction's ``created``) and ``h``, a hash of the row."""
+    schema = {"league_id": pl.Utf8, "ts": pl.Int64, "h": pl.UInt64}
+    if not tx.height:
+        return pl.DataFrame(schema=schema)
+    done = tx.filter(pl.col("status") == "complete").select(
+        pl.col("transaction_id").cast(pl.Utf8), pl.col("league_id").cast(pl.Utf8),
+        pl.col("created").cast(pl.Int64).alias("ts"),
+    ).unique("transaction_id")
+    moves = [(done, ["ts"])]
+    for df, cols in ((tp, ["player_id", "roster_id", "action"]),
+                     (dp, ["season", "round", "roster_id", "owner_id", "previous_owner_id"])):
+        if df.height:
+            cols = [c for c in cols if c in df.columns]
+            moves.append((df.select(pl.col(c).cast(pl.Utf8) for c in ["transaction_id", *cols]).unique()
+                          .join(done, on="transaction_id", how="inner"), cols))
+    return pl.concat([
+        m.select("league_id", "ts", pl.concat_str(
+            [pl.lit(str(i)), pl.col("transaction_id"),
+             *(pl.col(c).cast(pl.Utf8).fill_null("") for c in cols)], separator="\x1f",
+        ).hash(0, 1, 2, 3).alias("h"))
+        for i, (m, cols) in enumerate(moves)
+    ], how="vertical")
+
+
+def _league_event_stamps(rows: pl.DataFrame) -> dict[str, list]:
+    """``{league_id: [fingerprint, max ts]}`` of ``_event_rows`` output."""
+    return {lid: [_hash_digest(g["h"]), int(g["ts"].max())]
+            for (lid,), g in rows.partition_by("league_id", as_dict=True).items()}
+
+
+def _hash_digest(hashes: pl.Series) -> str:
+    return hashlib.sha1(np.unique(hashes.to_numpy()).tobytes()).hexdigest()[:16]
+
+
+def _event_state(objects: dict, leagues: dict, stamps: dict) -> dict:
+    """The event-feed part of the ledger state: object generations and, per league, its
+    event stamp and a digest of its daily partitions' generations (``[fingerprint, max ts,
+    digest]``)."""
+    return {
+        "event_objects": objects,
+        "event_leagues": {lid: [*stamps.get(lid, [None, None]), _partition_digest(leagues.get(lid))]
+                          for lid in sorted(set(stamps) | set(leagues))},
+    }
+
+
+def _check_event_feeds(bucket_name: str, state: dict, cutoff: str) -> dict:
+    """Compare the event feeds with the previous run's stamps -> this run's event state
+    (``_event_state``). Raises ``FullRebuildRequired`` when events may have arrived late.
+
+    The manifests say which objects moved, so unchanged ones are never opened. A moved,
+    added or removed whole-history dump means history was reloaded. Of the daily tables only
+    the partitions of leagues whose digest moved are read (every daily object not
+    partitioned by league, when one of those moved). A league's rows up to its stamp's max
+    ``ts`` must still hash to the stamp, and any newer row must be dated on or after
+    ``cutoff``: an event dated inside closed history is late."""
+    objects, leagues = _event_generations(bucket_name)
+    old_objects, old_leagues = state.get("event_objects"), state.get("event_leagues")
+    if old_objects is None or old_leagues is None:
+        raise FullRebuildRequired("no event-feed stamps")
+    loose = {n: g for n, g in objects.items() if n.startswith(_EVENT_DAILY_PREFIXES)}
+    old_loose = {n: g for n, g in old_objects.items() if n.startswith(_EVENT_DAILY_PREFIXES)}
+    if {n: g for n, g in objects.items() if n not in loose} != {n: g for n, g in old_objects.items()
+                                                                if n not in old_loose}:
+        raise FullRebuildRequired("a whole-history event dump was reloaded")
+    if (set(old_loose) - set(loose)
+            or {lid for lid, st in old_leagues.items() if st[2] is not None} - set(leagues)):
+        raise FullRebuildRequired("daily event partitions were removed")
+
+    check = {lid for lid, parts in leagues.items()
+             if (old_leagues.get(lid) or [None] * 3)[2] != _partition_digest(parts)}
+    loose_raw = None
+    if loose != old_loose:
+        loose_raw = _read_daily_events(bucket_name, sorted(loose))
+        if loose_raw[0].height:
+            check |= set(loose_raw[0]["league_id"].cast(pl.Utf8).unique().to_list())
+    if not check:
+        return _event_state(objects, leagues, {lid: st[:2] for lid, st in old_leagues.items()})
+    names = sorted(n for lid in check for n in leagues.get(lid, {}))
+    print(f"  {len(check):,} league(s) with moved daily events: reading {len(names):,} partitions")
+    raw = _read_daily_events(bucket_name, names)
+    if loose_raw is not None:
+        raw = tuple(pl.concat([f for f in pair if f.height], how="diagonal_relaxed")
+                    if any(f.height for f in pair) else pl.DataFrame() for pair in zip(loose_raw, raw))
+    rows = _event_rows(*raw).filter(pl.col("league_id").is_in(pl.Series(sorted(check), dtype=pl.Utf8).implode()))
+    by_league = rows.partition_by("league_id", as_dict=True)
+    day = pl.from_epoch(pl.col("ts"), time_unit="ms").dt.date().cast(pl.Utf8)
+    late = []
+    for lid in sorted(check):
+        fp, max_ts = (old_leagues.get(lid) or [None, None])[:2]
+        mine = by_league.get((lid,), rows.clear())
+        known = mine.filter(pl.col("ts") <= max_ts) if max_ts is not None else mine.clear()
+        new = mine.filter(pl.col("ts") > max_ts) if max_ts is not None else mine
+        if (fp is not None and _hash_digest(known["h"]) != fp) or new.select((day < cutoff).any()).item():
+            late.append(lid)
+    if late:
+        raise FullRebuildRequired(f"late events in {len(late):,} league(s), e.g. {late[0]}")
+    stamps = _league_event_stamps(rows)
+    carried = {lid: st[:2] for lid, st in old_leagues.items() if lid not in check}
+    return _event_state(objects, leagues, {**carried, **stamps})
+
+
+def _snapshot_days(bucket_name: str, prefix: str) -> list[str]:
+    return sorted({_snapshot_date_from_path(n) for n in partition_objects(get_bucket(bucket_name), prefix)
+                   if "load_date=" in n})
+
+
+def _read_json(uri: str) -> dict | None:
+    if uri.startswith("gs://"):
+        bucket_name, name = uri[len("gs://"):].split("/", 1)
+        blob = get_bucket(bucket_name).get_blob(name)
+        return json.loads(blob.download_as_text()) if blob is not None else None
+    path = Path(uri)
+    return json.loads(path.read_text()) if path.is_file() else None
+
+
+def _write_json(uri: str, obj: dict) -> None:
+    payload = json.dumps(obj, sort_keys=True, indent=1)
+    if uri.startswith("gs://"):
+        bucket_name, name = uri[len("gs://"):].split("/", 1)
+        get_bucket(bucket_name).blob(name).upload_from_string(payload, content_type="application/json")
+    else:
+        Path(uri).parent.mkdir(parents=True, exist_ok=True)
+        Path(uri).write_text(payload)
+
+
+def _full_ledger(bucket_name, leagues_df, lineage_map, sources, events, trades,
+                 overrides_df, drafts_df, player_days: list[str], pick_days: list[str],
+                 spool: dict | None = None) -> tuple[pl.LazyFrame, dict]:
+    """Full-history rebuild -> (ledger plan, state facts for the next incremental run).
+    ``player_days`` / ``pick_days`` are the snapshot calendars (every snapshot object's day);
+    ``spool`` is this partition's share of the snapshots when a parent read them."""
+    key = ["franchise_id", "player_id"]
     print("Reading daily roster snapshots...")
-    present = _read_player_presence(bucket_name, lineage_map)
-    print(f"  {present.height:,} player-days (raw)")
+    stints, franchise_days = _read_player_stints(bucket_name, lineage_map, spool=spool)
+    print(f"  {stints.height:,} player stints over {franchise_days['snapshot_date'].n_unique():,} snapshot days")
     print("Reconstructing season-rollover gaps from events (offseason draft + trades)...")
-    present, rollover_windows = reconstruct_rollover_presence(present, leagues_df, bucket_name)
-    boundary = present["snapshot_date"].min()
-    print(f"  {present.height:,} player-days after rollover repair; snapshot era starts {boundary}")
-
-    print("Reading event stream (drafts + transactions, full_load + daily)...")
-    events = _read_player_events(bucket_name, lineage_map)
-    print(f"  {events.height:,} add/drop events; {events['date'].min()} -> {events['date'].max()}")
+    stints, days, rollover_windows = reconstruct_rollover_presence(
+        stints, franchise_days, leagues_df, bucket_name, sources, days=player_days)
+    boundary = days[0] if days else None
+    print(f"  {stints.height:,} player stints after rollover repair; snapshot era starts {boundary}")
 
     print("Building SCD2 player ledger (snapshot era + reconstructed era)...")
-    player_ledger = combine_eras(present, events, boundary, ["franchise_id", "player_id"]).with_columns(
+    player_ledger = combine_era_intervals(
+        stints_to_intervals(stints, key, days), events, boundary, key,
+    ).with_columns(
         pl.lit("player").alias("asset_type"),
         pl.col("player_id").alias("asset_id"),
-    ).select("franchise_id", "asset_type", "asset_id", "valid_from", "valid_to", "is_current")
+    ).select(_LEDGER_COLS)
 
     # --- picks (asset_type='pick'): full history. Snapshot era from the traded_picks
     #     snapshots; reconstructed era from synthesized minting + corrected trade events. ---
-    overrides_path = _latest_file(bucket_name, "bronze/sleeper/transactions/commission_overrides/")
-    overrides_df = pl.read_parquet(overrides_path) if overrides_path else pl.DataFrame()
-    try:
-        drafts_df = pl.read_parquet(get_latest_bronze_path(bucket_name, "drafts/drafts", source="sleeper"))
-    except ValueError:
-        drafts_df = None
-
     print("Resolving per-day pick ownership over traded_picks snapshots...")
-    pick_present = _read_pick_presence(bucket_name, lineage_map, leagues_df, overrides_df, drafts_df)
+    pick_stints, _ = _read_pick_stints(bucket_name, lineage_map, leagues_df, overrides_df, drafts_df,
+                                       spool=spool)
 
     print("Reconstructing pre-snapshot pick ownership (mint/consume + trades)...")
-    rounds_df = (
-        drafts_df.unique("draft_id").with_columns(pl.col("league_id").cast(pl.Utf8))
-        .join(lineage_map, on="league_id", how="inner")
-        .filter(pl.col("status") == "complete").with_columns(pl.col("season").cast(pl.Int64))
-        .sort("season").group_by("league_lineage_id").agg(pl.col("rounds").last().alias("rounds"))
-    )
-    lifecycle = synthesize_pick_lifecycle(drafts_df, leagues_df, lineage_map, rounds_df, years_out=3)
-    trades = _read_pick_trade_events(bucket_name, lineage_map)
+    lifecycle = _pick_lifecycle(drafts_df, leagues_df, lineage_map)
     recon_pick_full = reconstruct_pick_intervals(lifecycle, trades)
     # rollover repair: in the offseason window, replace stale frozen-old-league pick snapshots
     # with the reconstructed holdings so the new season's picks consume at the draft.
-    pick_present = reconstruct_rollover_pick_presence(pick_present, recon_pick_full, rollover_windows)
-    snap_pick = build_snapshot_intervals(pick_present, ["franchise_id", "pick_id"])
+    pick_stints, pick_days = reconstruct_rollover_pick_presence(
+        pick_stints, pick_days, recon_pick_full, rollover_windows)
+    snap_pick = stints_to_intervals(pick_stints, ["franchise_id", "pick_id"], pick_days)
     # truncate reconstruction at the snapshot boundary (snapshots own >= boundary)
     recon_pick = (
-        recon_pick_full.filter(pl.col("valid_from") < boundary)
-        .with_columns(
-            pl.when(pl.col("valid_to").is_null() | (pl.col("valid_to") > boundary))
-              .then(pl.lit(boundary)).otherwise(pl.col("valid_to")).alias("valid_to"),
-            pl.lit(False).alias("is_current"),
-        )
-        .filter(pl.col("valid_from") < pl.col("valid_to"))
+        clip(recon_pick_full, hi=boundary)
+        .with_columns(pl.lit(False).alias("is_current"))
         .select("franchise_id", "pick_id", "valid_from", "valid_to", "is_current")
     )
 
     pick_ledger = pl.concat([recon_pick, snap_pick], how="vertical").with_columns(
         pl.lit("pick").alias("asset_type"),
         pl.col("pick_id").alias("asset_id"),
-    ).select("franchise_id", "asset_type", "asset_id", "valid_from", "valid_to", "is_current")
+    ).select(_LEDGER_COLS)
     print(f"  player intervals: {player_ledger.height:,} | pick intervals: {pick_ledger.height:,}")
 
-    ledger = pl.concat([player_ledger, pick_ledger], how="vertical").with_columns(
-        pl.lit("sleeper").alias("source_system"),
-        pl.lit(datetime.now()).alias("loaded_at"),
-    )
+    facts = {
+        "boundary": boundary,
+        "player_hwm": days[-1] if days else None,
+        "pick_hwm": pick_days[-1] if pick_days else None,
+        "lineage_last": lineage_snapshot_days(franchise_days),
+    }
+    return pl.concat([player_ledger.lazy(), pick_ledger.lazy()], how="vertical"), facts
+
+
+def lineage_partitions(lineage_ids, n: int) -> list[list[str]]:
+    """Lineages spread over ``n`` parts by a stable hash of the id; empty parts dropped."""
+    parts: list[list[str]] = [[] for _ in range(max(1, n))]
+    for lin in sorted(set(lineage_ids)):
+        parts[zlib.crc32(lin.encode()) % len(parts)].append(lin)
+    return [p for p in parts if p]
+
+
+def _lineage_inputs(lineages: list[str], leagues_df, lineage_map, sources, events, trades,
+                    overrides_df, drafts_df) -> dict:
+    """The full-rebuild inputs narrowed to ``lineages``. Franchises, picks, rollover windows
+    and drafts never cross lineages, so each partition builds on its own rows only."""
+    lin_map = lineage_map.filter(pl.col("league_lineage_id").is_in(pl.Series(lineages).implode()))
+    league_ids = lin_map["league_id"]
+    in_leagues = pl.col("league_id").cast(pl.Utf8).is_in(league_ids.implode())
+    in_lineages = pl.Series(lineages).implode()
+
+    def by_league(df):
+        return df.filter(in_leagues) if df is not None and "league_id" in df.columns else df
+
+    return {
+        "leagues_df": by_league(leagues_df),
+        "lineage_map": lin_map,
+        "sources": sources.subset(league_ids),
+        "events": events.filter(_lineage_of(pl.col("franchise_id")).is_in(in_lineages)),
+        "trades": trades.filter(_lineage_of(pl.coalesce("new_franchise", "prev_franchise"))
+                                .is_in(in_lineages)) if trades.height else trades,
+        "overrides_df": by_league(overrides_df),
+        "drafts_df": by_league(drafts_df),
+    }
+
+
+def _build_part(task: dict) -> dict:
+    """Worker: the full ledger of one lineage partition, sunk to ``task["path"]`` -> its
+    state facts. The worker gets its share of the memory cap."""
+    os.environ["LEDGER_MEMORY_MB"] = str(task["memory_mb"])
+    ledger, facts = _full_ledger(**task["inputs"])
+    sink_parquet(ledger, task["path"])
+    return facts
+
+
+def _full_ledger_parts(inputs: dict, parts_dir: str, workers: int) -> tuple[pl.LazyFrame, dict]:
+    """``_full_ledger`` split by lineage over a pool of ``workers`` processes.
+
+    Each partition's inputs are narrowed before they are handed over. The daily snapshots are
+    read once here and spooled under ``parts_dir`` per partition (``_spool_snapshots``), so
+    the pool does the snapshot I/O of one build, not one per worker. Its ledger is written
+    as a part under ``parts_dir``, and the result is a scan over the union of the parts.
+    Workers are spawned (forking a process that already runs polars' thread pool can
+    deadlock) with this pipeline directory on their import path. One worker builds in-process
+    without parts."""
+    parts = lineage_partitions(inputs["lineage_map"]["league_lineage_id"].to_list(), workers)
+    if workers <= 1 or len(parts) <= 1:
+        return _full_ledger(**inputs)
+    scope = {k: inputs[k] for k in ("leagues_df", "lineage_map", "sources", "events", "trades",
+                                    "overrides_df", "drafts_df")}
+    share = max(1, _memory_budget() // 1024 ** 2 // min(workers, len(parts)))
+    narrowed = [_lineage_inputs(lins, **scope) for lins in parts]
+    print(f"Spooling daily snapshots for {len(parts)} lineage partitions...")
+    spools = _spool_snapshots(inputs["bucket_name"], [n["lineage_map"] for n in narrowed], parts_dir)
+    tasks = [{"inputs": {**inputs, **n, "spool": spool},
+              "path": str(Path(parts_dir) / f"part-{i:04d}.parquet"), "memory_mb": share}
+             for i, (n, spool) in enumerate(zip(narrowed, spools))]
+    print(f"Building {len(parts)} lineage partitions on {min(workers, len(parts))} worker processes...")
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=site.addsitedir,
+                             initargs=(str(Path(__file__).resolve().parent),)) as pool:
+        results = list(pool.map(_build_part, tasks))
+    for i in range(len(tasks)):
+        shutil.rmtree(Path(parts_dir) / f"spool-{i:04d}", ignore_errors=True)
+    facts = {
+        "boundary": min((f["boundary"] for f in results if f["boundary"]), default=None),
+        "player_hwm": max((f["player_hwm"] for f in results if f["player_hwm"]), default=None),
+        "pick_hwm": max((f["pick_hwm"] for f in results if f["pick_hwm"]), default=None),
+        "lineage_last": {k: v for f in results for k, v in f["lineage_last"].items()},
+    }
+    return pl.scan_parquet([t["path"] for t in tasks]), facts
+
+
+def _incremental_ledger(prev: pl.LazyFrame, state: dict, bucket_name, leagues_df, lineage_map,
+                        overrides_df, drafts_df, history_fp: str,
+                        player_days: list[str], pick_days: list[str],
+                        ) -> tuple[pl.LazyFrame, dict, pl.DataFrame]:
+    """Apply the snapshot days after the previous run's high-water marks to its ledger
+    -> (ledger plan, state facts, change feed). Raises ``FullRebuildRequired`` when closed
+    history changed.
+
+    ``prev`` is a lazy scan of the previous ledger. Only its open intervals are collected;
+    the closed ones stream from the old output into the new one untouched. Since only the
+    open intervals change, the run's change feed is their diff against what they became
+    (closed, extended or joined by new openings), not a diff of the whole ledger."""
+    if state.get("version") != LEDGER_STATE_VERSION:
+        raise FullRebuildRequired("ledger state version changed")
+    p_hwm, k_hwm = state.get("player_hwm"), state.get("pick_hwm")
+    if not p_hwm or not k_hwm:
+        raise FullRebuildRequired("no high-water mark")
+    if (sum(d <= p_hwm for d in player_days) != state.get("player_days")
+            or sum(d <= k_hwm for d in pick_days) != state.get("pick_days")):
+        raise FullRebuildRequired("snapshot days were backfilled at or before the high-water mark")
+    if history_fp != state.get("history_fingerprint"):
+        raise FullRebuildRequired("overrides / drafts changed closed history")
+    print("Checking the event feeds for late arrivals...")
+    event_state = _check_event_feeds(bucket_name, state, min(p_hwm, k_hwm))
+
+    print(f"Reading roster snapshots after {p_hwm}...")
+    stints_new, franchise_days = _read_player_stints(bucket_name, lineage_map, since=p_hwm)
+    rolled = rollover_lineages(franchise_days, state.get("lineage_last", {}))
+    if rolled:
+        raise FullRebuildRequired(f"season rollover in lineage(s) {', '.join(rolled)}")
+    days_new = [d for d in player_days if d > p_hwm]
+    print(f"  {len(days_new):,} new snapshot days, {stints_new.height:,} player stints")
+    print(f"Resolving pick ownership for traded_picks days after {k_hwm}...")
+    pick_new, _ = _read_pick_stints(bucket_name, lineage_map, leagues_df, overrides_df,
+                                    drafts_df, since=k_hwm)
+    pick_days_new = [d for d in pick_days if d > k_hwm]
+
+    def _extend(asset_type: str, id_col: str, new: pl.DataFrame, new_days: list[str],
+                hwm: str) -> tuple[pl.DataFrame, pl.DataFrame]:
+        open_ = prev.filter((pl.col("asset_type") == asset_type) & pl.col("is_current")).select(
+            _LEDGER_COLS).collect()
+        extended = extend_stint_intervals(
+            open_.select("franchise_id", pl.col("asset_id").alias(id_col), "valid_from", "valid_to",
+                         "is_current"),
+            new, ["franchise_id", id_col], hwm, new_days,
+        ).with_columns(
+            pl.lit(asset_type).alias("asset_type"), pl.col(id_col).alias("asset_id"),
+        ).select(_LEDGER_COLS)
+        return extended, ledger_changes(open_, extended).collect()
+
+    players, player_changes = _extend("player", "player_id", stints_new, days_new, p_hwm)
+    picks, pick_changes = _extend("pick", "pick_id", pick_new, pick_days_new, k_hwm)
+    ledger = pl.concat([
+        prev.filter(~pl.col("is_current")).select(_LEDGER_COLS),
+        players.lazy(),
+        picks.lazy(),
+    ], how="vertical")
+    lineage_last = {**state.get("lineage_last", {}), **lineage_snapshot_days(franchise_days)}
+    facts = {
+        "boundary": state.get("boundary"),
+        "player_hwm": days_new[-1] if days_new else p_hwm,
+        "pick_hwm": pick_days_new[-1] if pick_days_new else k_hwm,
+        "lineage_last": lineage_last,
+        **event_state,
+    }
+    return ledger, facts, pl.concat([player_changes, pick_changes], how="vertical")
+
 
-    fact_path = os.environ.get(
-        "LEDGER_OUTPUT_PATH", f"gs://{bucket_name}/silver/fantasy/fact_roster_membership")
-    print(f"Writing {ledger.height:,} SCD2 intervals (full history) to {fact_path}...")
-    # Full-history rebuild each run (idempotent) — NOT the old latest-only overwrite.
-    ledger.write_parquet(fact_path, partition_by=["asset_type"], use_pyarrow=True)
+def main():
+    bucket_name = os.environ.get("GCS_BUCKET_NAME")
+
+    leagues_df = pl.read_parquet(lake_uri(bucket_name, "silver/fantasy/dim_leagues_meta/data.parquet"))
+    lineage_map = leagues_df.select(
+        pl.col("league_id").cast(pl.Utf8), pl.col("league_lineage_id").cast(pl.Utf8)
+    ).unique()
+    sources = BronzeSources(bucket_name)
+    fact_uri = os.environ.get("LEDGER_OUTPUT_PATH", f"gs://{bucket_name}/silver/fantasy/fact_roster_membership")
+    state_uri = fact_uri + LEDGER_STATE_SUFFIX
+    changes_uri = os.environ.get("LEDGER_CHANGES_PATH") or fact_uri + LEDGER_CHANGES_SUFFIX
+    version_uri = fact_uri + LEDGER_VERSION_SUFFIX
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+    overrides_df = sources.latest("bronze/sleeper/transactions/commission_overrides/")
+    if overrides_df is None:
+        overrides_df = pl.DataFrame()
+    drafts_df = sources.latest("bronze/sleeper/drafts/drafts/")
+    player_days = _snapshot_days(bucket_name, _PLAYER_DAYS_PREFIX)
+    pick_days = _snapshot_days(bucket_name, _PICK_DAYS_PREFIX)
+
+    ledger, changes, mode = None, None, "full"
+    state = cutoff = history_fp = None
+    if os.environ.get("LEDGER_FULL_REBUILD", "").lower() not in ("1", "true", "yes"):
+        state = _read_json(state_uri)
+    if state is not None:
+        try:
+            try:
+                prev = scan_dataset(fact_uri)
+                prev.collect_schema()
+            except Exception as e:        # state without a readable ledger: start over
+                raise FullRebuildRequired(f"previous ledger unreadable ({e})")
+            cutoff = min(state.get("player_hwm") or "", state.get("pick_hwm") or "")
+            history_fp = _closed_history_fingerprint(overrides_df, drafts_df, cutoff)
+            ledger, facts, changes = _incremental_ledger(prev, state, bucket_name, leagues_df,
+                                                         lineage_map, overrides_df, drafts_df,
+                                                         history_fp, player_days, pick_days)
+            mode = "incremental"
+        except FullRebuildRequired as e:
+            print(f"Full rebuild: {e}.")
+    with tempfile.TemporaryDirectory(prefix="ledger_parts_") as parts_dir:
+        if ledger is None:
+            # generations first: a bronze write during the read shows up as moved next run
+            event_objects, event_leagues = _event_generations(bucket_name)
+            print("Reading event stream (drafts + transactions, full_load + daily)...")
+            events = _read_player_events(bucket_name, lineage_map, sources)
+            print(f"  {events.height:,} add/drop events; {events['date'].min()} -> {events['date'].max()}")
+            trades = _read_pick_trade_events(bucket_name, lineage_map, sources)
+            workers = int(os.environ.get("LEDGER_WORKERS") or os.cpu_count() or 1)
+            ledger, facts = _full_ledger_parts(dict(
+                bucket_name=bucket_name, leagues_df=leagues_df, lineage_map=lineage_map,
+                sources=sources, events=events, trades=trades, overrides_df=overrides_df,
+                drafts_df=drafts_df, player_days=player_days, pick_days=pick_days,
+            ), parts_dir, workers)
+            facts.update(_event_state(event_objects, event_leagues, _league_event_stamps(
+                _event_rows(*(sources.prefix(p) for p in _EVENT_DAILY_PREFIXES)))))
+        print(f"  bronze prefixes read: {sources.reads} (each once)")
+
+        ledger = ledger.with_columns(
+            pl.lit("sleeper").alias("source_system"),
+            pl.lit(datetime.now()).alias("loaded_at"),
+        )
+        if os.environ.get("LEDGER_EXPLAIN", "").lower() in ("1", "true", "yes"):
+            print("Ledger plan (streaming engine):")
+            print(ledger.explain(engine="streaming"))
+        if changes is None:
+            # a full rebuild may rewrite any interval: keep the version being replaced, the
+            # change feed is the diff against it
+            prev_copy = str(Path(parts_dir) / "previous.parquet")
+            try:
+                sink_parquet(scan_dataset(fact_uri).select(_LEDGER_COLS), prev_copy)
+            except Exception:             # no previous ledger: everything is an open
+                prev_copy = None
+        print(f"Streaming SCD2 intervals ({mode}) to {resolve(fact_uri)}...")
+        sink_parquet(ledger, fact_uri)
+
+        pointer = _read_json(version_uri) or {}
+        version = pointer.get("version", 0) + 1
+        run_changes = f"{changes_uri.rstrip('/')}/run_id={run_id}/data.parquet"
+        print(f"Writing the change feed (version {version}) to {resolve(run_changes)}...")
+        if changes is None:
+            changes = ledger_changes(prev_copy and pl.scan_parquet(prev_copy), scan_dataset(fact_uri))
+        sink_parquet(changes.lazy().with_columns(pl.lit(version, pl.Int64).alias("version")),
+                     run_changes)
+    change_counts = dict(scan_dataset(run_changes).group_by("change_type").len().collect().rows())
+    print("  " + ", ".join(f"{k} {change_counts.get(k, 0):,}" for k in ("open", "close", "retract")))
+    rows = scan_dataset(fact_uri).select(pl.len()).collect().item()
+    peak, cap = _peak_rss_mb(), _memory_budget() / 1024 ** 2
+    print(f"  {rows:,} intervals written; peak RSS {peak:,.0f} MiB of a {cap:,.0f} MiB cap")
+    if peak > cap:
+        print(f"  ! peak memory exceeded LEDGER_MEMORY_MB={cap:.0f}")
+
+    print("Validating interval invariants over the written ledger...")
+    violations = validate_ledger(scan_dataset(fact_uri), leagues_df,
+                                 _pick_lifecycle(drafts_df, leagues_df, lineage_map))
+    quarantine_uri = os.environ.get("LEDGER_QUARANTINE_PATH") or lake_uri(bucket_name, LEDGER_QUARANTINE)
+    write_parquet(violations, quarantine_uri)
+    if violations.height:
+        counts = violations.group_by("quarantine_reason").len().sort("quarantine_reason").rows()
+        print(f"  ! {violations.height:,} violations quarantined to {resolve(quarantine_uri)}: "
+              + ", ".join(f"{r} {n:,}" for r, n in counts))
+    else:
+        print("  no interval violations")
+
+    next_cutoff = min(facts["player_hwm"] or "", facts["pick_hwm"] or "")
+    if mode == "full" or next_cutoff != cutoff:
+        history_fp = _closed_history_fingerprint(overrides_df, drafts_df, next_cutoff)
+    _write_json(state_uri, {
+        "version": LEDGER_STATE_VERSION,
+        "mode": mode,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        **facts,
+        "player_days": sum(d <= (facts["player_hwm"] or "") for d in player_days),
+        "pick_days": sum(d <= (facts["pick_hwm"] or "") for d in pick_days),
+        "history_fingerprint": history_fp,
+    })
+    # last: a reader that sees this version finds its ledger and change feed already written
+    _write_json(version_uri, {
+        "version": version,
+        "run_id": run_id,
+        "previous_run_id": pointer.get("run_id"),
+        "mode": mode,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "ledger": fact_uri,
+        "changes": run_changes,
+        "rows": rows,
+        "change_counts": change_counts,
+    })
     print("Done.")
 
 
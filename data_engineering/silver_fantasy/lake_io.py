@@ -0,0 +1,781 @@
+"""lake_io.py — the one bronze writer every ingestion job goes through.
+
+Each Cloud Run image is built from its own pipeline directory, so there is no shared package to
+import from: this file is vendored byte-for-byte into every pipeline root and
+``tests/test_lake_io.py`` fails if the copies drift. Edit one, then copy it to the others.
+
+``write_bronze(df, "gs://<bucket>/bronze/...")``:
+  * writes the parquet LOCALLY first — zstd, bounded row groups, column statistics — sorted by
+    the entity's sort key (``SORT_KEYS``) so row-group min/max stats can prune downstream filters;
+  * uploads through the storage client with a hard timeout + retry (polars' direct gs:// write
+    can hang forever on a large upload, see ``league_history_crawler._flush``);
+  * commits atomically: the bytes land on a staging name no reader matches
+    (``<name>.inprogress-<id>``) and are promoted by a server-side copy only once the upload
+    finished, so a killed run leaves at worst an orphan staging object — never a truncated
+    ``.parquet`` and never a clobbered previous version;
+  * records the committed object in the entity's ``_manifest.json`` (rows, bytes, schema hash,
+    generation) with a generation-matched read-modify-write, so concurrent writers can't lose
+    each other's entries.
+
+Readers use the manifest instead of listing the prefix: ``latest_object`` and
+``partition_objects`` cost one small GET, however many daily partitions have piled up.
+The first write for an entity with no manifest seeds it from one listing, so files written
+before manifests existed are not lost. A reader that finds no manifest rebuilds it the same
+way and saves it.
+
+``read_objects`` is the matching bulk reader. It downloads objects on a bounded thread pool
+and decodes each one as it arrives. polars releases the GIL while decoding, so this scales
+with bandwidth, not per-object latency. It restores hive ``key=value`` columns, can project
+and filter each file before the concat, and returns one frame.
+
+Reads can go through a local disk cache. Set ``LAKE_CACHE_DIR`` to enable it; it is off by
+default because Cloud Run's disk is memory-backed. Entries are keyed by object name and GCS
+generation, so a rewritten object is never served stale. Repeat reads of an unchanged
+partition cost one metadata GET. Size is capped at ``LAKE_CACHE_MAX_BYTES``, evicting least
+recently used first; the directory is walked once per process and then only when a running
+byte total crosses the cap. ``cache_stats()`` reports hits and misses for sizing the cap.
+
+Storage backend: ``LAKE_STORAGE`` unset (or ``gcs``) means Google Cloud Storage. A directory
+path (or ``file://`` URI) means a local lake at ``<dir>/<bucket>/<object name>``. That
+backend has the same surface: list, read, write, atomic commit via ``os.replace``, and
+generations with compare-and-swap for manifests. Pipelines can then run and be profiled
+offline, for example against a production snapshot copied to local NVMe. Code keeps
+building ``gs://`` URIs. ``get_bucket`` picks the backend, ``resolve``/``lake_uri`` map a URI
+to what polars should open, and ``write_parquet`` creates the parent directories that a
+local write needs.
+
+``scan_dataset`` is the lazy counterpart for silver outputs, which may be a single parquet
+object or a hive-partitioned directory. Filters and selections on the returned LazyFrame
+are pushed into the reader: partition directories that can't match are skipped, row
+groups are pruned by min/max stats, and only the selected columns are decoded.
+``write_dataset`` writes that layout: it replaces the dataset with hive ``key=value``
+directories, and each file is sorted by the fact's key and carries row-group stats.
+``sink_parquet`` streams a LazyFrame plan into one object with the same atomic commit, so
+a large output never has to be collected in memory.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import polars as pl
+
+# parquet layout knobs: zstd 6 is ~the knee of ratio vs. write cost for these mostly-string
+# frames; 128k-row groups keep per-group stats selective without bloating the footer.
+ZSTD_LEVEL = 6
+ROW_GROUP_SIZE = 128_000
+
+UPLOAD_TIMEOUT = 300           # seconds, per attempt
+UPLOAD_ATTEMPTS = 3
+MANIFEST_NAME = "_manifest.json"
+MANIFEST_ATTEMPTS = 5
+STAGING_SUFFIX = ".inprogress-"
+READ_WORKERS = 16              # concurrent object downloads per read_objects call
+CACHE_DIR_ENV = "LAKE_CACHE_DIR"
+CACHE_MAX_BYTES_ENV = "LAKE_CACHE_MAX_BYTES"
+CACHE_MAX_BYTES = 2 * 1024 ** 3
+STORAGE_ENV = "LAKE_STORAGE"
+
+# Per-entity sort keys, matched on the longest entity-root prefix below ``bronze/``. Only the
+# columns actually present are used, so one key list can cover sibling entities.
+SORT_KEYS: dict[str, list[str]] = {
+    "sleeper/rosters/roster_players": ["league_id", "roster_id", "player_id"],
+    "sleeper/rosters/traded_picks": ["league_id", "season", "round", "original_roster_id"],
+    "sleeper/rosters": ["league_id", "roster_id", "user_id"],
+    "sleeper/transactions/commission_overrides": ["league_id", "created"],
+    "sleeper/transactions": ["created", "transaction_id", "player_id", "season", "round"],
+    "sleeper/drafts/draft_picks": ["draft_id", "pick_no"],
+    "sleeper/drafts": ["league_id", "season", "draft_id"],
+    "sleeper/league": ["league_id"],
+    "sleeper_crawl": ["league_id", "season"],
+    "ktc/dynasty/full_load": ["ranking_date"],
+    "ktc/dynasty/local_load": ["ktc_id", "date"],
+    "ktc": ["position", "playerName", "player_name"],
+    "fantasycalc": ["position", "name"],
+    "nflverse": ["season", "week", "game_id", "player_id", "gsis_id"],
+}
+
+
+def split_gs_uri(uri: str) -> tuple[str, str]:
+    """``gs://bucket/a/b.parquet`` -> ``("bucket", "a/b.parquet")``."""
+    if not uri.startswith("gs://"):
+        raise ValueError(f"not a gs:// uri: {uri}")
+    bucket, _, name = uri[len("gs://"):].partition("/")
+    if not bucket or not name:
+        raise ValueError(f"gs:// uri needs a bucket and an object name: {uri}")
+    return bucket, name
+
+
+def entity_root(object_name: str) -> str:
+    """The prefix an entity's partitions hang off: everything before the first hive
+    ``key=value`` segment (``bronze/sleeper/rosters/roster_players/daily``)."""
+    parts = object_name.split("/")
+    for i, seg in enumerate(parts):
+        if "=" in seg:
+            return "/".join(parts[:i])
+    return "/".join(parts[:-1])
+
+
+def sort_keys_for(object_name: str, columns: list[str]) -> list[str]:
+    """Registered sort key for the entity that ``object_name`` belongs to, restricted to
+    ``columns``."""
+    rel = entity_root(object_name).removeprefix("bronze/")
+    best = max((k for k in SORT_KEYS if rel == k or rel.startswith(k + "/")), key=len, default=None)
+    if best is None:
+        return []
+    return [c for c in SORT_KEYS[best] if c in columns]
+
+
+def schema_hash(schema) -> str:
+    """Stable short fingerprint of a frame schema (column names + dtypes, in order)."""
+    spec = json.dumps([[name, str(dtype)] for name, dtype in schema.items()])
+    return hashlib.sha1(spec.encode()).hexdigest()[:16]
+
+
+def write_parquet_local(df: pl.DataFrame, path, sort_by: list[str] | None = None,
+                        compression_level: int = ZSTD_LEVEL,
+                        row_group_size: int = ROW_GROUP_SIZE) -> None:
+    """Write ``df`` to a local parquet file with the bronze layout (sorted, zstd, stats)."""
+    if sort_by:
+        df = df.sort(sort_by, nulls_last=True, maintain_order=True)
+    df.write_parquet(
+        path,
+        compression="zstd",
+        compression_level=compression_level,
+        statistics=True,
+        row_group_size=row_group_size,
+    )
+
+
+def local_root() -> Path | None:
+    """Root directory of the local lake, or None when the backend is GCS."""
+    value = os.environ.get(STORAGE_ENV, "").strip()
+    if not value or value.lower() == "gcs":
+        return None
+    return Path(value.removeprefix("file://")).expanduser()
+
+
+def resolve(uri: str) -> str:
+    """What polars should open for ``uri``: unchanged on GCS, the mirrored local path on the
+    local backend (``gs://bucket/a/b`` -> ``<root>/bucket/a/b``)."""
+    root = local_root()
+    if root is None or not uri.startswith("gs://"):
+        return uri
+    return str(root / uri[len("gs://"):])
+
+
+def lake_uri(bucket_name: str, name: str = "") -> str:
+    """``gs://<bucket>/<name>`` resolved for the active backend (no trailing slash for the
+    bucket root, so ``f"{lake_uri(b)}/silver/..."`` works)."""
+    return resolve(f"gs://{bucket_name}/{name}" if name else f"gs://{bucket_name}")
+
+
+def write_parquet(df: pl.DataFrame, uri: str, **kwargs) -> None:
+    """``df.write_parquet`` against the active backend, creating local parent directories."""
+    path = resolve(uri)
+    if local_root() is not None:
+        # polars ignores partition_by under use_pyarrow and writes one file at ``path``
+        partitioned = ((kwargs.get("partition_by") and not kwargs.get("use_pyarrow"))
+                       or (kwargs.get("pyarrow_options") or {}).get("partition_cols"))
+        target = Path(path) if partitioned else Path(path).parent
+        target.mkdir(parents=True, exist_ok=True)
+    df.write_parquet(path, **kwargs)
+
+
+def _is_object(uri: str) -> bool:
+    """True when ``uri`` names one parquet object (vs. a dataset directory / prefix)."""
+    if "*" in uri or uri.endswith(".parquet"):
+        return True
+    if local_root() is not None or not uri.startswith("gs://"):
+        return Path(resolve(uri)).is_file()
+    bucket_name, name = split_gs_uri(uri)
+    return get_bucket(bucket_name).get_blob(name) is not None
+
+
+def scan_dataset(uri: str, **kwargs) -> pl.LazyFrame:
+    """Lazy, hive-aware scan of a parquet object or a partitioned dataset directory on the
+    active backend. Push filters/column selections onto the result rather than collecting
+    first: partitions, row groups and columns the query doesn't need are never read."""
+    path = resolve(uri)
+    if not _is_object(uri):
+        path = f"{path.rstrip('/')}/**/*.parquet"
+        kwargs.setdefault("hive_partitioning", True)
+    return pl.scan_parquet(path, **kwargs)
+
+
+def write_dataset(df: pl.DataFrame, uri: str, partition_by: list[str], sort_by: list[str],
+                  compression_level: int = ZSTD_LEVEL,
+                  row_group_size: int = ROW_GROUP_SIZE) -> None:
+    """Replace the dataset at ``uri`` with hive partitions on ``partition_by``.
+
+    Rows are sorted by ``sort_by`` before the write, so each file is clustered on it and the
+    min/max stats of its row groups prune key and date-range filters. The partitions are
+    written locally and uploaded under a staging prefix beside ``uri``; only once every
+    upload succeeded are they copied into place, and only then are the old objects the new
+    dataset didn't overwrite deleted, so partitions that disappeared don't linger and a
+    failed write leaves the old dataset whole. A legacy single object at ``uri`` is removed
+    just before the copy (on a local lake it holds the directory's path)."""
+    from google.api_core.exceptions import NotFound
+    from google.cloud.storage.retry import DEFAULT_RETRY
+
+    bucket_name, name = split_gs_uri(uri)
+    bucket = get_bucket(bucket_name)
+    old = {b.name for b in bucket.list_blobs(prefix=name) if b.name == name or b.name.startswith(name + "/")}
+    staging = f"{name}{STAGING_SUFFIX}{uuid.uuid4().hex[:12]}"
+    staged = []
+    with tempfile.TemporaryDirectory(prefix="lake_io_") as tmp:
+        df.sort(sort_by, nulls_last=True, maintain_order=True).write_parquet(
+            tmp,
+            partition_by=partition_by,
+            compression="zstd",
+            compression_level=compression_level,
+            statistics=True,
+            row_group_size=row_group_size,
+        )
+        try:
+            for path in sorted(Path(tmp).rglob("*.parquet")):
+                rel = path.relative_to(tmp).as_posix()
+                blob = bucket.blob(f"{staging}/{rel}")
+                _upload_with_retry(blob, path, f"{name}/{rel}")
+                staged.append((blob, f"{name}/{rel}"))
+            if name in old:
+                bucket.blob(name).delete()
+            for blob, final in staged:
+                bucket.copy_blob(blob, bucket, final, timeout=UPLOAD_TIMEOUT, retry=DEFAULT_RETRY)
+        finally:
+            for blob, _ in staged:
+                try:
+                    blob.delete()
+                except NotFound:
+                    pass
+            if isinstance(bucket, LocalBucket):        # a local lake keeps the empty directories
+                shutil.rmtree(bucket.root / staging, ignore_errors=True)
+    for stale in sorted(old - {name} - {final for _, final in staged}):
+        bucket.blob(stale).delete()
+
+
+def sink_parquet(lf: pl.LazyFrame, uri: str, engine: str = "streaming",
+                 compression_level: int = ZSTD_LEVEL,
+                 row_group_size: int = ROW_GROUP_SIZE) -> None:
+    """Stream ``lf`` into one parquet object at ``uri`` without collecting it.
+
+    The plan runs on ``engine`` into a local file (zstd, bounded row groups, stats). That
+    file is then committed atomically: a staged upload on GCS, a rename into place for a
+    plain local path. ``lf`` may therefore scan the object it replaces."""
+    with tempfile.TemporaryDirectory(prefix="lake_io_") as tmp:
+        local_path = Path(tmp) / "data.parquet"
+        lf.sink_parquet(local_path, compression="zstd", compression_level=compression_level,
+                        statistics=True, row_group_size=row_group_size, engine=engine)
+        if uri.startswith("gs://"):
+            bucket_name, object_name = split_gs_uri(uri)
+            _upload_staged(get_bucket(bucket_name), local_path, object_name)
+            return
+        target = Path(uri)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staged = target.with_name(f"{target.name}{STAGING_SUFFIX}{uuid.uuid4().hex[:12]}")
+        try:
+            shutil.copyfile(local_path, staged)
+            os.replace(staged, target)
+        finally:
+            staged.unlink(missing_ok=True)
+
+
+class _LocalBlob:
+    """A file under the local lake with the slice of ``storage.Blob`` lake_io relies on. The
+    generation is derived from (inode, mtime_ns, size): every commit is an ``os.replace`` of a
+    fresh file, so a rewrite always changes it."""
+
+    def __init__(self, bucket: "LocalBucket", name: str):
+        self.bucket, self.name = bucket, name
+        self.path = bucket.root / name
+
+    def _stat(self):
+        try:
+            return self.path.stat()
+        except FileNotFoundError:
+            return None
+
+    @property
+    def generation(self):
+        st = self._stat()
+        if st is None:
+            return None
+        spec = f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}".encode()
+        return int(hashlib.sha1(spec).hexdigest()[:15], 16) or 1
+
+    @property
+    def size(self):
+        st = self._stat()
+        return st.st_size if st else None
+
+    @property
+    def time_created(self):
+        st = self._stat()
+        return datetime.fromtimestamp(st.st_mtime, timezone.utc) if st else None
+
+    updated = time_created
+
+    def exists(self, *args, **kwargs) -> bool:
+        return self.path.is_file()
+
+    def reload(self, *args, **kwargs) -> None:
+        if not self.exists():
+            from google.api_core.exceptions import NotFound
+            raise NotFound(str(self.path))
+
+    def _commit(self, write, if_generation_match=None) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}{STAGING_SUFFIX}{uuid.uuid4().hex[:12]}")
+        try:
+            write(tmp)
+            with self.bucket._lock(self.name):
+                if if_generation_match is not None and (self.generation or 0) != if_generation_match:
+                    from google.api_core.exceptions import PreconditionFailed
+                    raise PreconditionFailed(f"{self.path}: generation mismatch")
+                os.replace(tmp, self.path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def upload_from_filename(self, filename, *args, if_generation_match=None, **kwargs) -> None:
+        self._commit(lambda tmp: shutil.copyfile(filename, tmp), if_generation_match)
+
+    def upload_from_string(self, data, *args, if_generation_match=None, **kwargs) -> None:
+        payload = data.encode() if isinstance(data, str) else bytes(data)
+        self._commit(lambda tmp: tmp.write_bytes(payload), if_generation_match)
+
+    def download_as_bytes(self, *args, if_generation_match=None, **kwargs) -> bytes:
+        self.reload()
+        return self.path.read_bytes()
+
+    def download_as_text(self, *args, **kwargs) -> str:
+        return self.download_as_bytes().decode()
+
+    def delete(self, *args, **kwargs) -> None:
+        self.reload()
+        self.path.unlink()
+
+
+class LocalBucket:
+    """A directory standing in for a GCS bucket (``<LAKE_STORAGE>/<bucket name>``)."""
+
+    _locks: dict[str, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, root: Path, name: str):
+        self.name = name
+        self.root = Path(root) / name
+
+    @contextmanager
+    def _lock(self, object_name: str):
+        """Serialise compare-and-swap on one object: a thread lock inside this process plus
+        an exclusive lock file across processes."""
+        key = str(self.root / object_name)
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            lock_path = f"{key}.lock"
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                    break
+                except FileExistsError:
+                    if time.monotonic() > deadline:
+                        os.unlink(lock_path)            # holder died; lock is stale
+                    time.sleep(0.01)
+            try:
+                yield
+            finally:
+                os.close(fd)
+                os.unlink(lock_path)
+
+    def blob(self, name: str) -> _LocalBlob:
+        return _LocalBlob(self, name)
+
+    def get_blob(self, name: str, *args, **kwargs):
+        b = self.blob(name)
+        return b if b.exists() else None
+
+    def list_blobs(self, prefix: str = "", *args, **kwargs):
+        # walk from the deepest directory the prefix names, not the whole bucket
+        start = self.root / prefix.rsplit("/", 1)[0] if "/" in prefix else self.root
+        if not start.is_dir():
+            return []
+        names = []
+        for p in start.rglob("*"):
+            if not p.is_file() or p.name.endswith(".lock"):
+                continue
+            name = p.relative_to(self.root).as_posix()
+            if name.startswith(prefix) and STAGING_SUFFIX not in name:
+                names.append(name)
+        return [self.blob(n) for n in sorted(names)]
+
+    def copy_blob(self, blob, destination_bucket, new_name=None, *args, **kwargs):
+        blob.reload()
+        dest = destination_bucket.blob(new_name or blob.name)
+        dest.upload_from_filename(blob.path)
+        return dest
+
+
+def get_bucket(bucket_name: str):
+    """Bucket handle for the active backend (``LAKE_STORAGE``)."""
+    root = local_root()
+    if root is not None:
+        return LocalBucket(root, bucket_name)
+    from google.cloud import storage
+
+    return storage.Client().bucket(bucket_name)
+
+
+def _upload_with_retry(blob, local_path, object_name: str) -> None:
+    """Upload ``local_path`` to ``blob``, retrying with backoff (``object_name`` is for the log)."""
+    from google.cloud.storage.retry import DEFAULT_RETRY
+
+    delay = 2.0
+    for attempt in range(1, UPLOAD_ATTEMPTS + 1):
+        try:
+            blob.upload_from_filename(str(local_path), timeout=UPLOAD_TIMEOUT, retry=DEFAULT_RETRY)
+            return
+        except Exception as e:
+            if attempt == UPLOAD_ATTEMPTS:
+                raise
+            print(f"  ! upload {object_name} attempt {attempt} failed ({e}); "
+                  f"retrying in {delay:.0f}s", flush=True)
+            time.sleep(delay)
+            delay *= 2
+
+
+def _upload_staged(bucket, local_path, object_name: str):
+    """Upload to a staging name, then promote to ``object_name`` server-side."""
+    from google.api_core.exceptions import NotFound
+    from google.cloud.storage.retry import DEFAULT_RETRY
+
+    staging = bucket.blob(f"{object_name}{STAGING_SUFFIX}{uuid.uuid4().hex[:12]}")
+    try:
+        _upload_with_retry(staging, local_path, object_name)
+        return bucket.copy_blob(staging, bucket, object_name, timeout=UPLOAD_TIMEOUT,
+                                retry=DEFAULT_RETRY)
+    finally:
+        try:
+            staging.delete()
+        except NotFound:
+            pass
+
+
+def _latest_partition(partitions) -> str | None:
+    """The newest ``load_date=`` partition (ISO dates sort lexically), or None for entities
+    partitioned by something else (e.g. ``league_id=``)."""
+    dated = [rel for rel in partitions if "load_date=" in rel]
+    return max(dated) if dated else None
+
+
+def _listed_manifest(bucket, root: str) -> dict:
+    """Manifest rebuilt from a listing of ``root`` (the fallback path). Row counts and schema
+    hashes are unknown without opening every file, so they are left null."""
+    partitions = {}
+    for b in bucket.list_blobs(prefix=f"{root}/"):
+        if not b.name.endswith(".parquet") or entity_root(b.name) != root:
+            continue
+        created = getattr(b, "time_created", None)
+        partitions[b.name[len(root) + 1:]] = {
+            "rows": None,
+            "bytes": int(getattr(b, "size", None) or 0),
+            "schema_hash": None,
+            "generation": int(getattr(b, "generation", None) or 0),
+            "written_at": created.isoformat() if created else None,
+        }
+    return {"entity": root, "partitions": partitions, "latest": _latest_partition(partitions),
+            "updated_at": datetime.now(timezone.utc).isoformat()}
+
+
+def record_manifest_entry(bucket, object_name: str, entry: dict) -> dict:
+    """Add/replace ``object_name``'s entry in its entity's ``_manifest.json``.
+
+    Read-modify-write guarded by ``if_generation_match`` (0 = must not exist yet), retried on
+    a lost race so two jobs writing the same entity both land. A missing manifest is seeded
+    from a listing first, so partitions written before the manifest existed stay visible."""
+    from google.api_core.exceptions import PreconditionFailed
+
+    root = entity_root(object_name)
+    manifest_name = f"{root}/{MANIFEST_NAME}"
+    rel = object_name[len(root) + 1:] if root else object_name
+    for _ in range(MANIFEST_ATTEMPTS):
+        current = bucket.get_blob(manifest_name)
+        if current is None:
+            manifest, generation = _listed_manifest(bucket, root), 0
+        else:
+            manifest, generation = json.loads(current.download_as_text()), current.generation
+        manifest["partitions"][rel] = entry
+        manifest["latest"] = _latest_partition(manifest["partitions"])
+        manifest["updated_at"] = entry["written_at"]
+        try:
+            bucket.blob(manifest_name).upload_from_string(
+                json.dumps(manifest, sort_keys=True), content_type="application/json",
+                if_generation_match=generation)
+            return manifest
+        except PreconditionFailed:
+            continue
+    raise RuntimeError(f"could not update {manifest_name}: too many concurrent writers")
+
+
+def read_manifest(bucket, root: str) -> dict | None:
+    """The entity's ``_manifest.json``, or None if it has never been written."""
+    blob = bucket.get_blob(f"{root}/{MANIFEST_NAME}")
+    return json.loads(blob.download_as_text()) if blob is not None else None
+
+
+def load_manifest(bucket, root: str) -> dict:
+    """The entity's manifest, rebuilt from a listing (and saved) if it is missing."""
+    from google.api_core.exceptions import PreconditionFailed
+
+    manifest = read_manifest(bucket, root)
+    if manifest is not None:
+        return manifest
+    manifest = _listed_manifest(bucket, root)
+    if manifest["partitions"]:
+        try:
+            bucket.blob(f"{root}/{MANIFEST_NAME}").upload_from_string(
+                json.dumps(manifest, sort_keys=True), content_type="application/json",
+                if_generation_match=0)
+        except PreconditionFailed:
+            pass                      # a writer created it meanwhile; ours is only a cache
+    return manifest
+
+
+def _manifest_objects(bucket, prefix: str) -> tuple[list[str], dict]:
+    if "=" not in prefix.rsplit("/", 1)[-1] and not prefix.endswith("/"):
+        prefix += "/"                        # a bare entity path, not a partial partition key
+    root = entity_root(prefix)
+    manifest = load_manifest(bucket, root)
+    names = [f"{root}/{rel}" for rel in manifest["partitions"]]
+    if not names:
+        # a prefix above several entity roots has no manifest of its own: plain listing
+        names = [b.name for b in bucket.list_blobs(prefix=prefix) if b.name.endswith(".parquet")]
+    return sorted(n for n in names if n.startswith(prefix)), manifest
+
+
+def partition_objects(bucket, prefix: str) -> list[str]:
+    """Sorted object names of every committed parquet under ``prefix``, which may be an
+    entity root (``.../daily/``) or reach into its partitions (``.../load_date=``)."""
+    return _manifest_objects(bucket, prefix)[0]
+
+
+def latest_object(bucket, prefix: str) -> str | None:
+    """Object name of the newest ``load_date=`` partition under ``prefix`` (the manifest's
+    ``latest`` pointer), or None if there is none."""
+    names, manifest = _manifest_objects(bucket, prefix)
+    latest = manifest.get("latest")
+    if latest is not None and f"{manifest['entity']}/{latest}" in names:
+        return f"{manifest['entity']}/{latest}"
+    dated = [n for n in names if "load_date=" in n]
+    return max(dated) if dated else None
+
+
+def hive_values(object_name: str) -> dict[str, str]:
+    """``key=value`` path segments of an object name (``load_date=2025-01-01.parquet`` style
+    file names included) -> ``{key: value}``."""
+    out = {}
+    for seg in object_name.split("/"):
+        if "=" in seg:
+            k, v = seg.split("=", 1)
+            out[k] = v.removesuffix(".parquet")
+    return out
+
+
+_cache_lock = threading.Lock()
+_CACHE_STATS = {"hits": 0, "misses": 0, "bytes_from_cache": 0, "bytes_downloaded": 0,
+                "evictions": 0}
+# running byte total per cache directory: set by a walk (evict_cache), then moved by misses
+_cache_bytes: dict[Path, int] = {}
+
+
+def cache_stats() -> dict:
+    """Read-cache counters since process start (or ``reset_cache_stats``), plus hit rate."""
+    with _cache_lock:
+        stats = dict(_CACHE_STATS)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
+
+
+def reset_cache_stats() -> None:
+    with _cache_lock:
+        for k in _CACHE_STATS:
+            _CACHE_STATS[k] = 0
+
+
+def _count(**deltas) -> None:
+    with _cache_lock:
+        for k, v in deltas.items():
+            _CACHE_STATS[k] += v
+
+
+def _cache_dir() -> Path | None:
+    root = os.environ.get(CACHE_DIR_ENV)
+    return Path(root) if root else None
+
+
+def fetch_object(bucket, name: str) -> bytes:
+    """Bytes of ``name``, through the local read cache when ``LAKE_CACHE_DIR`` is set.
+
+    A cache entry is ``<dir>/<bucket>/<name>@<generation>``: a hit costs one metadata GET to
+    learn the live generation; a miss downloads that exact generation and drops any older
+    ones. Hits refresh the entry's mtime, which is what LRU eviction orders by."""
+    root = _cache_dir()
+    if root is None or isinstance(bucket, LocalBucket):
+        return bucket.blob(name).download_as_bytes(timeout=UPLOAD_TIMEOUT)
+    blob = bucket.get_blob(name)
+    if blob is None:
+        raise FileNotFoundError(f"gs://{bucket.name}/{name}")
+    path = root / bucket.name / f"{name}@{blob.generation}"
+    try:
+        data = path.read_bytes()
+        os.utime(path)
+        _count(hits=1, bytes_from_cache=len(data))
+        return data
+    except FileNotFoundError:
+        pass
+    data = blob.download_as_bytes(timeout=UPLOAD_TIMEOUT, if_generation_match=blob.generation)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    freed = 0
+    for stale in path.parent.glob(f"{Path(name).name}@*"):
+        try:
+            freed += stale.stat().st_size
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+    tmp = path.with_name(f"{path.name}{STAGING_SUFFIX}{uuid.uuid4().hex[:12]}")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    _count(misses=1, bytes_downloaded=len(data))
+    with _cache_lock:
+        if root in _cache_bytes:
+            _cache_bytes[root] += len(data) - freed
+    return data
+
+
+def _cache_max_bytes() -> int:
+    return int(os.environ.get(CACHE_MAX_BYTES_ENV, CACHE_MAX_BYTES))
+
+
+def evict_cache(max_bytes: int | None = None) -> int:
+    """Trim the read cache to ``max_bytes`` (default ``LAKE_CACHE_MAX_BYTES``), least recently
+    used first. Returns the number of entries removed. Walks the whole cache directory and
+    resets the running total that ``_evict_if_over`` checks."""
+    root = _cache_dir()
+    if root is None or not root.exists():
+        return 0
+    if max_bytes is None:
+        max_bytes = _cache_max_bytes()
+    entries = []
+    for p in root.rglob("*@*"):
+        if p.is_file() and STAGING_SUFFIX not in p.name:
+            st = p.stat()
+            entries.append((st.st_mtime, st.st_size, p))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, p in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        p.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    with _cache_lock:
+        _cache_bytes[root] = total
+    _count(evictions=removed)
+    return removed
+
+
+def _evict_if_over() -> None:
+    """``evict_cache`` only when the running total is unknown (first read of the process) or
+    over the cap, so a read doesn't pay a walk of the whole cache. Other processes sharing
+    the directory are seen at the next walk."""
+    root = _cache_dir()
+    if root is None:
+        return
+    with _cache_lock:
+        total = _cache_bytes.get(root)
+    if total is None or total > _cache_max_bytes():
+        evict_cache()
+
+
+def read_objects(bucket_name: str, names: list[str], columns: list[str] | None = None,
+                 predicate: pl.Expr | None = None, hive_columns: bool = True,
+                 how: str = "diagonal_relaxed", max_workers: int = READ_WORKERS) -> pl.DataFrame:
+    """Read parquet objects concurrently and concat them in ``names`` order.
+
+    Each object gets its hive partition columns (only where the file lacks them, when
+    ``hive_columns``), then ``predicate`` and ``columns``, before the concat. A column in
+    ``columns`` is never decoded from a file that doesn't need it; requested columns no file
+    has are simply absent from the result."""
+    if not names:
+        return pl.DataFrame()
+    bucket = get_bucket(bucket_name)
+    needed = None
+    if columns is not None:
+        extra = predicate.meta.root_names() if predicate is not None else []
+        needed = list(dict.fromkeys([*columns, *extra]))
+
+    def _one(name: str) -> pl.DataFrame:
+        buf = io.BytesIO(fetch_object(bucket, name))
+        file_cols = None
+        if needed is not None:
+            schema = pl.read_parquet_schema(buf)
+            file_cols = [c for c in needed if c in schema]
+            buf.seek(0)
+        df = pl.read_parquet(buf, columns=file_cols)
+        if hive_columns:
+            df = df.with_columns(pl.lit(v).alias(k) for k, v in hive_values(name).items()
+                                 if k not in df.columns and (needed is None or k in needed))
+        if predicate is not None:
+            df = df.filter(predicate)
+        if columns is not None:
+            df = df.select(c for c in columns if c in df.columns)
+        return df
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as pool:
+        frames = list(pool.map(_one, names))
+    _evict_if_over()
+    return pl.concat(frames, how=how)
+
+
+def commit_file(local_path, uri: str, rows: int, schema) -> dict:
+    """Atomically publish an already-written local parquet at ``uri`` and record it in the
+    entity manifest. Returns the manifest entry (plus ``path``)."""
+    bucket_name, object_name = split_gs_uri(uri)
+    bucket = get_bucket(bucket_name)
+    blob = _upload_staged(bucket, local_path, object_name)
+    entry = {
+        "rows": int(rows),
+        "bytes": int(blob.size or 0),
+        "schema_hash": schema_hash(schema),
+        "generation": int(blob.generation or 0),
+        "written_at": datetime.now(timezone.utc).isoformat(),
+    }
+    record_manifest_entry(bucket, object_name, entry)
+    return {**entry, "path": uri}
+
+
+def write_bronze(df: pl.DataFrame, uri: str, sort_by: list[str] | None = None,
+                 compression_level: int = ZSTD_LEVEL,
+                 row_group_size: int = ROW_GROUP_SIZE) -> dict:
+    """Write ``df`` to ``uri`` (gs://) via local file -> staged upload -> atomic promote ->
+    manifest entry. ``sort_by`` overrides the entity's registered ``SORT_KEYS``."""
+    _, object_name = split_gs_uri(uri)
+    keys = sort_by if sort_by is not None else sort_keys_for(object_name, df.columns)
+    with tempfile.TemporaryDirectory(prefix="lake_io_") as tmp:
+        local_path = Path(tmp) / "data.parquet"
+        write_parquet_local(df, local_path, sort_by=keys, compression_level=compression_level,
+                            row_group_size=row_group_size)
+        return commit_file(local_path, uri, rows=df.height, schema=df.schema)
@@ -1,26 +1,21 @@
-from google.cloud import storage
 import polars as pl
 
+from lake_io import get_bucket, lake_uri, latest_object
+
 def get_latest_bronze_path(bucket_name: str, entity_path: str, source: str = 'sleeper') -> str:
-    """Get the most recent load_date partition for a bronze entity."""
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
-    prefix = f"bronze/{source}/{entity_path}"
-    
-    blobs = list(bucket.list_blobs(prefix=prefix))
-    
-    # Extract load_dates from paths
-    load_dates = []
-    for blob in blobs:
-        if "load_date=" in blob.name and blob.name.endswith(".parquet"):
-            load_date = blob.name.split("load_date=")[1].split("/")[0]
-            load_dates.append(load_date)
-    
-    if not load_dates:
+    """Get the most recent load_date partition for a bronze entity.
+
+    Resolved from the entity's bronze manifest (one small read) rather than by listing
+    every partition; the manifest is rebuilt from a listing if it doesn't exist yet."""
+    bucket = get_bucket(bucket_name)
+    prefix = f"bronze/{source}/{entity_path}/"
+
+    latest = latest_object(bucket, prefix)
+    if latest is None:
         raise ValueError(f"No data found for {entity_path}")
-    
-    latest_date = max(load_dates)
-    return f"gs://{bucket_name}/bronze/{source}/{entity_path}/load_date={latest_date}/data.parquet"
+
+    latest_date = latest.split("load_date=")[1].split("/")[0]
+    return lake_uri(bucket_name, f"bronze/{source}/{entity_path}/load_date={latest_date}/data.parquet")
 
 
 
@@ -3,9 +3,10 @@ import os
 import polars as pl
 
 import requests
-from google.cloud import storage
 from dotenv import load_dotenv
 
+from lake_io import get_bucket, lake_uri, latest_object
+
 load_dotenv()
 
 def fetch(url) -> dict[str, Any]:
@@ -53,23 +54,16 @@ def sleeper_login(email: str, password: str) -> str:
     return f"Bearer {token}"
     
 def get_latest_blob_path(bucket_name: str, base_prefix: str) -> str | None:
-    storage_client = storage.Client()
+    """Newest ``load_date=`` parquet under ``base_prefix``, from the entity's bronze manifest
+    (rebuilt from a listing on first use) instead of listing every blob."""
+    bucket = get_bucket(bucket_name)
 
     if not (base_prefix.endswith("/") or base_prefix.endswith("=")):
         base_prefix += "/"
 
-    blobs = storage_client.list_blobs(bucket_name, prefix=base_prefix)
-    most_recent_blob = None
-    
-    for blob in blobs:
-        if blob.name.endswith('/'): 
-            continue 
-            
-        if most_recent_blob is None or blob.time_created > most_recent_blob.time_created:
-            most_recent_blob = blob
-
-    if most_recent_blob:
-        full_path = f"gs://{bucket_name}/{most_recent_blob.name}"
+    latest = latest_object(bucket, base_prefix)
+    if latest:
+        full_path = lake_uri(bucket_name, latest)
         return full_path
     else:
         return None
@@ -83,7 +77,7 @@ def get_bronze_leagues() -> pl.DataFrame:
 
 def get_fantasy_leagues() -> pl.DataFrame:
     bucket_name = os.environ.get('GCS_BUCKET_NAME')
-    storage_path = f"gs://{bucket_name}/silver/fantasy/dim_leagues_meta/data.parquet"
+    storage_path = lake_uri(bucket_name, "silver/fantasy/dim_leagues_meta/data.parquet")
 
     try:
         df = pl.read_parquet(storage_path)
@@ -9,6 +9,7 @@ import polars as pl
 env_path = sys.path.insert(0, str(Path(__file__).parent.parent))
 from _utils import get_fantasy_leagues
 from api.league import get_league, get_rosters, get_user_leagues_for_year, get_sport_state
+from lake_io import write_bronze
 
 def flatten_league_to_parquets(league: dict):
     leagues_records = []
@@ -89,7 +90,7 @@ def save_df_to_gcs(df: pl.DataFrame, bucket_name: str, base_date: str, entity: s
     file_path = f"gs://{bucket_name}/bronze/sleeper/league/{entity}/incremental/load_date={base_date}/data.parquet"
     
     try:
-        df.write_parquet(file_path)
+        write_bronze(df, file_path)
         print(f"✅ Saved {entity} to {file_path}") 
     except Exception as e:
         print(f"Failed to save to GCS: {e}")
@@ -3,9 +3,13 @@ import sys
 import time
 import requests
 from datetime import datetime, timezone
+from pathlib import Path
 import polars as pl
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from lake_io import write_bronze
+
 load_dotenv()
 
 def fetch_all_players(sport: str = "nfl") -> dict:
@@ -35,7 +39,7 @@ def save_df_to_gcs(df: pl.DataFrame, bucket_name: str, base_date: str, entity: s
         clean_bucket = bucket_name.replace('gs://', '')
         full_path = f"gs://{clean_bucket}/bronze/sleeper/league/{entity}/incremental/load_date={base_date}/data.parquet"
         
-        df.write_parquet(full_path)
+        write_bronze(df, full_path)
         print(f"✅ Saved {entity} to {full_path}")
         
     except Exception as e:
@@ -10,6 +10,7 @@ import polars as pl
 env_path = sys.path.insert(0, str(Path(__file__).parent.parent))
 from _utils import get_fantasy_leagues
 from api.league import get_rosters, get_traded_picks
+from lake_io import write_bronze
 
 
 def flatten_rosters(rosters_data: list[dict]) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
@@ -207,7 +208,7 @@ def save_df_to_gcs(
     file_path = f"gs://{bucket_name}/bronze/sleeper/rosters/{entity}/daily/{partition}/data.parquet"
 
     try:
-        df.write_parquet(file_path)
+        write_bronze(df, file_path)
         print(f"✅ Saved {entity} to {file_path}")
     except Exception as e:
         print(f"❌ Failed to save {entity} to GCS: {e}")
@@ -10,6 +10,7 @@ import polars as pl
 
 from api.league import get_transactions
 from _utils import get_fantasy_leagues 
+from lake_io import resolve, write_bronze
 
 def flatten_transactions(all_transactions: list[dict], league_id: str) -> tuple[pl.DataFrame, pl.DataFrame | None, pl.DataFrame | None]:    
     transaction_records = []
@@ -194,7 +195,7 @@ def save_transactions_to_bronze_deduplicated(
         
         # Try to merge with existing data
         try:
-            existing_df = pl.read_parquet(file_path)
+            existing_df = pl.read_parquet(resolve(file_path))
             combined_df = pl.concat([existing_df, new_df], how="diagonal")
             
             # Deduplicate based on table type
@@ -217,11 +218,8 @@ def save_transactions_to_bronze_deduplicated(
             combined_df = new_df
             print(f"ℹ️  {table_name}: First load with {len(combined_df)} records")
         
-        # Sort for easier reading
-        if 'created' in combined_df.columns:
-            combined_df = combined_df.sort('created')
-        
-        combined_df.write_parquet(file_path)
+        # sorted by `created` (then ids) via the bronze writer's sort keys
+        write_bronze(combined_df, file_path)
         print(f"✅ Saved {table_name} for league {league_id}")
 
 
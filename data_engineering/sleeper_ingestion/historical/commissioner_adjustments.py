@@ -1,8 +1,13 @@
 import polars as pl
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from lake_io import write_bronze
+
 load_dotenv()
 
 commissioner_pick_transactions = [
@@ -73,7 +78,7 @@ def save_picks_to_gcs(commissioner_picks: list[dict], bucket_name: str, base_dat
     file_path = f"gs://{bucket_name}/bronze/sleeper/transactions/commission_overrides/load_date={base_date}.parquet"
     
     try:
-        df.write_parquet(file_path)
+        write_bronze(df, file_path)
         print(f"✅ Saved {len(df)} commissioner pick transactions to {file_path}")
     except Exception as e:
         print(f"Failed to save commissioner picks to GCS: {e}")
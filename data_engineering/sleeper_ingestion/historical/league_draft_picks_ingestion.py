@@ -13,6 +13,7 @@ from dotenv import load_dotenv
 env_path = sys.path.insert(0, str(Path(__file__).parent.parent))
 from api.draft import get_player_draft_picks, get_traded_draft_picks
 from _utils import get_latest_blob_path
+from lake_io import write_bronze
 
 load_dotenv()
 
@@ -170,7 +171,7 @@ def save_df_to_gcs(
         return ""
 
     file_path = f"gs://{bucket_name}/bronze/sleeper/drafts/{entity}/load_date={base_date}/data.parquet"
-    df.write_parquet(file_path)
+    write_bronze(df, file_path)
     print(f"✅ Saved {entity} -> {file_path}")
     return file_path
 
@@ -10,6 +10,7 @@ from dotenv import load_dotenv
 env_path = sys.path.insert(0, str(Path(__file__).parent.parent))
 from api.draft import get_drafts_in_league
 from _utils import get_fantasy_leagues
+from lake_io import write_bronze
 
 def flatten_drafts(drafts_list: list[dict]) -> tuple[pl.DataFrame, pl.DataFrame]:
     drafts_rows = []
@@ -82,7 +83,7 @@ def save_df_to_gcs_drafts(
     file_path = f"gs://{bucket_name}/bronze/sleeper/drafts/{entity}/load_date={base_date}/data.parquet"
 
     try:
-        df.write_parquet(file_path)
+        write_bronze(df, file_path)
         print(f"✅ Saved {entity} to {file_path}")
     except Exception as e:
         print(f"❌ Failed to save {entity} to GCS: {e}")
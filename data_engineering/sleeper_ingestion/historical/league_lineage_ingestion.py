@@ -11,6 +11,7 @@ from dotenv import load_dotenv
 env_path = sys.path.insert(0, str(Path(__file__).parent.parent))
 from api.league import get_user_leagues_for_year, get_league
 from _utils import get_sport_state
+from lake_io import write_bronze
 
 load_dotenv(dotenv_path=env_path)
     
@@ -176,7 +177,7 @@ def save_df_to_gcs(df: pl.DataFrame, bucket_name: str, base_date: str, entity: s
     file_path = f"gs://{bucket_name}/bronze/sleeper/league/{entity}/full_load/load_date={base_date}/data.parquet" 
 
     try:
-        df.write_parquet(file_path)
+        write_bronze(df, file_path)
         print(f"✅ Saved {entity} to {file_path}") 
     except Exception as e:
         print(f"Failed to save to GCS: {e}")
@@ -12,6 +12,7 @@ from dotenv import load_dotenv
 
 env_path = sys.path.insert(0, str(Path(__file__).parent.parent))
 from _utils import get_bronze_leagues
+from lake_io import write_bronze
 
 load_dotenv(dotenv_path=env_path)
 
@@ -183,7 +184,7 @@ def save_df_to_gcs(df: pl.DataFrame, bucket_name: str, base_date: str, entity: s
     file_path = f"gs://{bucket_name}/bronze/sleeper/transactions/{entity}/full_load/load_date={base_date}/data.parquet" 
 
     try:
-        df.write_parquet(file_path)
+        write_bronze(df, file_path)
         
     except Exception as e:
         print(f"Failed to save to GCS: {e}")
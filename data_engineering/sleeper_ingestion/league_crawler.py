@@ -17,7 +17,7 @@ from pathlib import Path
 
 import polars as pl
 import requests
-from google.cloud import storage
+from lake_io import lake_uri, write_bronze
 
 BASE = "https://api.sleeper.app/v1"
 BUCKET = os.environ.get("GCS_BUCKET_NAME", "nfl-data-bronze")
@@ -74,7 +74,7 @@ def _get(url: str, tries: int = 5):
 
 def _seed_users() -> list[str]:
     """Franchise owners already in our silver dataset."""
-    fr = pl.read_parquet(f"gs://{BUCKET}/silver/fantasy/dim_franchises_meta/data.parquet")
+    fr = pl.read_parquet(lake_uri(BUCKET, "silver/fantasy/dim_franchises_meta/data.parquet"))
     return (fr.filter(pl.col("owner_id").is_not_null())["owner_id"]
             .cast(pl.Utf8).unique().drop_nulls().to_list())
 
@@ -122,9 +122,9 @@ def _write(leagues: list[dict], rosters: list[dict], users: list[str], tag: str)
     us_df.write_parquet(LOCAL_DIR / "users.parquet")
     if tag == "final" and not NO_GCS:
         root = f"gs://{BUCKET}/bronze/sleeper_crawl"
-        lg_df.write_parquet(f"{root}/leagues/load_date={LOAD_DATE}/data.parquet")
-        ro_df.write_parquet(f"{root}/rosters/load_date={LOAD_DATE}/data.parquet")
-        us_df.write_parquet(f"{root}/users/load_date={LOAD_DATE}/data.parquet")
+        write_bronze(lg_df, f"{root}/leagues/load_date={LOAD_DATE}/data.parquet")
+        write_bronze(ro_df, f"{root}/rosters/load_date={LOAD_DATE}/data.parquet")
+        write_bronze(us_df, f"{root}/users/load_date={LOAD_DATE}/data.parquet")
         print(f"  wrote GCS: {root}/{{leagues,rosters,users}}/load_date={LOAD_DATE}/data.parquet", flush=True)
 
 
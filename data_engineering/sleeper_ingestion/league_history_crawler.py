@@ -44,7 +44,9 @@ from pathlib import Path
 
 import polars as pl
 import requests
-from google.cloud import storage
+
+from lake_io import (commit_file, get_bucket, lake_uri, latest_object, sort_keys_for,
+                     write_parquet_local)
 
 BASE_APP = "https://api.sleeper.app/v1"      # leagues, matchups, transactions, drafts, brackets
 BUCKET = os.environ.get("GCS_BUCKET_NAME", "nfl-data-bronze")
@@ -150,10 +152,8 @@ def _seed_leagues() -> list[dict]:
     if local.exists():
         df = pl.read_parquet(local)
     else:
-        from google.cloud import storage as _st
-        c = _st.Client()
-        names = sorted(b.name for b in c.list_blobs(BUCKET, prefix="bronze/sleeper_crawl/leagues/"))
-        df = pl.read_parquet(f"gs://{BUCKET}/{names[-1]}")
+        latest = latest_object(get_bucket(BUCKET), "bronze/sleeper_crawl/leagues/")
+        df = pl.read_parquet(lake_uri(BUCKET, latest))
     rows = df.to_dicts()
     rows.sort(key=lambda r: str(r.get("league_id")))      # stable order for offset sharding
     return rows
@@ -310,23 +310,16 @@ def _harvest_season(lg: dict, sink: dict[str, list], lineage_id: str):
 
 # --------------------------------------------------------------------------- output
 _part = 0
-_gcs_bucket = None
-
-
-def _bucket():
-    global _gcs_bucket
-    if _gcs_bucket is None:
-        _gcs_bucket = storage.Client().bucket(BUCKET)
-    return _gcs_bucket
 
 
 def _flush(sink: dict[str, list], totals: dict[str, int]):
     """Persist each entity's accumulated rows as a part file, then clear that buffer. The parquet
-    is written LOCALLY first (fast, reliable), then uploaded to GCS via the storage client with a
-    timeout + built-in retry — NOT polars' direct gs:// path, which can hang forever on a large
-    upload with no timeout. A per-entity try/except means a transient write failure is logged and
-    the rows are KEPT (retried on the next flush) rather than lost or hanging the whole run. The
-    local files double as a crash-safe mirror. Parts read back as one dataset per entity."""
+    is written LOCALLY first (fast, reliable), then committed to GCS by ``lake_io.commit_file``
+    (staged upload with timeout + retry, atomic promote, manifest entry) — NOT polars' direct
+    gs:// path, which can hang forever on a large upload with no timeout. A per-entity try/except
+    means a transient write failure is logged and the rows are KEPT (retried on the next flush)
+    rather than lost or hanging the whole run. The local files double as a crash-safe mirror.
+    Parts read back as one dataset per entity."""
     global _part
     LOCAL_DIR.mkdir(parents=True, exist_ok=True)
     wrote = []
@@ -341,11 +334,11 @@ def _flush(sink: dict[str, list], totals: dict[str, int]):
             # infer_schema_length=None scans ALL rows, so a column that's None in the first rows
             # then has a value later (custom_points, is_keeper, ...) types correctly instead of
             # failing to append. strict=False coerces the odd mixed scalar rather than erroring.
-            pl.DataFrame(rows, infer_schema_length=None, strict=False).write_parquet(local_path)
+            df = pl.DataFrame(rows, infer_schema_length=None, strict=False)
+            name = f"bronze/sleeper_crawl/history/{ent}/load_date={LOAD_DATE}/part={part}.parquet"
+            write_parquet_local(df, local_path, sort_by=sort_keys_for(name, df.columns))
             if not NO_GCS:
-                blob = _bucket().blob(
-                    f"bronze/sleeper_crawl/history/{ent}/load_date={LOAD_DATE}/part={part}.parquet")
-                blob.upload_from_filename(str(local_path), timeout=300)   # retries + hard timeout
+                commit_file(local_path, f"gs://{BUCKET}/{name}", rows=n, schema=df.schema)
             totals[ent] += n
             sink[ent].clear()               # only on success -> no data loss on a failed write
             wrote.append(f"{ent}={n}")
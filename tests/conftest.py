@@ -1,31 +1,205 @@
 """Shared fixtures for the ETL test suite."""
 from __future__ import annotations
 
+import io
+import itertools
+from datetime import datetime, timezone
+from pathlib import Path
+
 import polars as pl
 import pytest
+from google.cloud import storage
+
+
+class _FakeBlob:
+    """Just enough of ``google.cloud.storage.Blob`` for the ETL code paths."""
+
+    def __init__(self, gcs: "_FakeGCS", bucket_name: str, name: str):
+        self._gcs, self.bucket_name, self.name = gcs, bucket_name, name
+
+    @property
+    def _key(self) -> str:
+        return f"gs://{self.bucket_name}/{self.name}"
+
+    @property
+    def generation(self):
+        return self._gcs.generation(self._key)
+
+    @property
+    def size(self):
+        return self._gcs.sizes.get(self._key)
+
+    @property
+    def time_created(self):
+        return self._gcs.created.get(self._key)
+
+    updated = time_created
+
+    def exists(self, *args, **kwargs) -> bool:
+        return self._gcs.exists(self._key)
+
+    def reload(self, *args, **kwargs) -> None:
+        if not self.exists():
+            from google.api_core.exceptions import NotFound
+            raise NotFound(self._key)
+
+    def _check_precondition(self, if_generation_match) -> None:
+        if if_generation_match is None:
+            return
+        if (self.generation or 0) != if_generation_match:
+            from google.api_core.exceptions import PreconditionFailed
+            raise PreconditionFailed(f"{self._key}: generation mismatch")
+
+    def upload_from_filename(self, filename, *args, if_generation_match=None, **kwargs) -> None:
+        self._check_precondition(if_generation_match)
+        local = str(filename)
+        if local in self._gcs.store:                 # written through the patched write_parquet
+            self._gcs.put(self._key, self._gcs.store.pop(local))
+        else:
+            self._gcs.put(self._key, Path(local).read_bytes())
+
+    def upload_from_string(self, data, *args, if_generation_match=None, **kwargs) -> None:
+        self._check_precondition(if_generation_match)
+        self._gcs.put(self._key, data.encode() if isinstance(data, str) else bytes(data))
+
+    def download_as_bytes(self, *args, **kwargs) -> bytes:
+        self.reload()
+        return self._gcs.read_bytes(self._key)
+
+    def download_as_text(self, *args, **kwargs) -> str:
+        return self.download_as_bytes().decode()
+
+    def delete(self, *args, **kwargs) -> None:
+        self.reload()
+        self._gcs.delete(self._key)
+
+
+class _FakeBucket:
+    def __init__(self, gcs: "_FakeGCS", name: str):
+        self._gcs, self.name = gcs, name
+
+    def blob(self, name: str) -> _FakeBlob:
+        return _FakeBlob(self._gcs, self.name, name)
+
+    def get_blob(self, name: str, *args, **kwargs):
+        b = self.blob(name)
+        return b if b.exists() else None
+
+    def list_blobs(self, prefix: str = "", *args, **kwargs):
+        return self._gcs.list(self.name, prefix or "")
+
+    def copy_blob(self, blob, destination_bucket, new_name=None, *args, **kwargs):
+        blob.reload()
+        dest = destination_bucket.blob(new_name or blob.name)
+        self._gcs.put(dest._key, self._gcs.objects(blob._key))
+        return dest
+
+
+class _FakeClient:
+    def __init__(self, gcs: "_FakeGCS"):
+        self._gcs = gcs
+
+    def bucket(self, name: str) -> _FakeBucket:
+        return _FakeBucket(self._gcs, name)
+
+    def list_blobs(self, bucket_or_name, prefix: str = "", *args, **kwargs):
+        name = bucket_or_name if isinstance(bucket_or_name, str) else bucket_or_name.name
+        return self._gcs.list(name, prefix or "")
+
+
+class _FakeGCS:
+    """Object store behind the fake client. Parquet objects live in ``store`` as frames
+    (keyed by ``gs://`` path, what tests seed/assert on); anything else (manifests, JSON)
+    lives in ``raw`` as bytes."""
+
+    def __init__(self, store: dict):
+        self.store = store
+        self.raw: dict[str, bytes] = {}
+        self.generations: dict[str, int] = {}
+        self.sizes: dict[str, int] = {}
+        self.created: dict[str, datetime] = {}
+        self._gen = itertools.count(2)          # 1 is what directly-seeded keys report
+
+    def exists(self, key: str) -> bool:
+        return key in self.store or key in self.raw
+
+    def generation(self, key: str):
+        # objects seeded straight into the dict by a test have no recorded write -> gen 1
+        return self.generations.get(key, 1) if self.exists(key) else None
+
+    def objects(self, key):
+        return self.store[key] if key in self.store else self.raw[key]
+
+    def put(self, key: str, value) -> None:
+        if isinstance(value, pl.DataFrame):
+            self.raw.pop(key, None)
+            self.store[key] = value
+            self.sizes[key] = int(value.estimated_size())
+        else:
+            self.store.pop(key, None)
+            self.raw[key] = value
+            self.sizes[key] = len(value)
+        self.generations[key] = next(self._gen)
+        self.created[key] = datetime.now(timezone.utc)
+
+    def delete(self, key: str) -> None:
+        self.store.pop(key, None)
+        self.raw.pop(key, None)
+        for meta in (self.generations, self.sizes, self.created):
+            meta.pop(key, None)
+
+    def read_bytes(self, key: str) -> bytes:
+        if key in self.raw:
+            return self.raw[key]
+        buf = io.BytesIO()
+        _REAL_WRITE_PARQUET(self.store[key], buf)
+        return buf.getvalue()
+
+    def list(self, bucket: str, prefix: str):
+        root = f"gs://{bucket}/"
+        keys = sorted(k for k in {*self.store, *self.raw} if k.startswith(root + prefix))
+        return [_FakeBlob(self, bucket, k[len(root):]) for k in keys]
+
+
+_REAL_WRITE_PARQUET = pl.DataFrame.write_parquet
+_REAL_READ_PARQUET = pl.read_parquet
 
 
 @pytest.fixture
 def fake_gcs(monkeypatch):
     """In-memory stand-in for parquet I/O against gs:// paths.
 
-    Patches ``polars.read_parquet`` and ``polars.DataFrame.write_parquet`` so any
-    ETL code that round-trips through GCS instead reads/writes an in-process dict
-    keyed by path string. Returns the dict so tests can seed inputs and assert on
-    outputs.
+    Patches ``polars.read_parquet`` / ``polars.DataFrame.write_parquet`` and
+    ``google.cloud.storage.Client`` so any ETL code that round-trips through GCS — directly
+    via polars or through ``lake_io``'s staged upload — instead reads/writes an in-process
+    dict keyed by path string. Returns the dict so tests can seed inputs and assert on
+    outputs; the backing fake store (manifests, generations) is ``fake_gcs.gcs``.
 
     Notes:
         * Partitioning kwargs (partition_by/use_pyarrow) are accepted and ignored;
           the whole frame is stored under the given path.
         * Reading a missing path raises FileNotFoundError, matching the
           "first load" branch that several scripts rely on.
+        * In-memory sources (bytes / file objects) pass through to the real reader.
     """
-    store: dict[str, pl.DataFrame] = {}
+
+    class _Store(dict):
+        gcs: _FakeGCS
+
+    store = _Store()
+    gcs = _FakeGCS(store)
+    store.gcs = gcs
 
     def fake_write(self, path, *args, **kwargs):
-        store[str(path)] = self.clone()
+        key = str(path)
+        if key.startswith("gs://"):
+            gcs.put(key, self.clone())
+        else:
+            store[key] = self.clone()
 
     def fake_read(path, *args, **kwargs):
+        if not isinstance(path, (str, Path)):
+            return _REAL_READ_PARQUET(path, *args, **kwargs)
         key = str(path)
         if key in store:
             return store[key].clone()
@@ -33,4 +207,19 @@ def fake_gcs(monkeypatch):
 
     monkeypatch.setattr(pl.DataFrame, "write_parquet", fake_write, raising=True)
     monkeypatch.setattr(pl, "read_parquet", fake_read, raising=True)
+    monkeypatch.setattr(storage, "Client", lambda *a, **k: _FakeClient(gcs), raising=True)
     return store
+
+
+@pytest.fixture
+def local_lake(tmp_path, monkeypatch):
+    """Point ``lake_io`` at the local-directory backend (``LAKE_STORAGE``) under tmp_path.
+
+    Unlike ``fake_gcs`` this is real file I/O: parquet bytes, hive partition directories,
+    manifests and generations all land on disk. Returns the lake root; bucket ``b`` lives at
+    ``<root>/b``.
+    """
+    root = tmp_path / "lake"
+    monkeypatch.setenv("LAKE_STORAGE", str(root))
+    monkeypatch.delenv("LAKE_CACHE_DIR", raising=False)
+    return root
@@ -0,0 +1,223 @@
+"""analysis/fantasy_lib.py
+
+``team_bags`` against a per-franchise scan of a synthetic ledger: what each franchise holds
+on the date, each player at its last value on or before it and each pick at its round's.
+The cached ownership index must follow the production ledger across runs, and the session
+loader cache must hit, reload and evict as documented.
+"""
+import importlib.util
+import os
+import random
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import polars as pl
+import pytest
+
+from tests.de_loader import REPO_ROOT
+
+START = date(2025, 1, 1)
+DAYS = [(START + timedelta(days=i)).isoformat() for i in range(40)]
+PICKS = ["2026:1:1", "2026:2:2", "2027:1:3"]
+
+
+def _load_fantasy_lib():
+    """Import the notebook library by path, leaving the process environment as it was
+    (the module points ``LAKE_CACHE_DIR`` at ``analysis/_cache`` on import)."""
+    env = os.environ.copy()
+    try:
+        spec = importlib.util.spec_from_file_location("fantasy_lib", REPO_ROOT / "analysis" / "fantasy_lib.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        os.environ.clear()
+        os.environ.update(env)
+
+
+F = _load_fantasy_lib()
+
+
+def _ledger(seed: int) -> pl.DataFrame:
+    """Disjoint stints per asset over three franchises of lineage L."""
+    rng = random.Random(seed)
+    rows = []
+    for atype, aid in [("player", f"p{i}") for i in range(8)] + [("pick", a) for a in PICKS]:
+        t = rng.randint(0, 5)
+        while t < 36:
+            end = t + rng.randint(2, 10)
+            open_ = end >= 36
+            rows.append((f"L_{rng.randint(1, 3)}", atype, aid, DAYS[t], None if open_ else DAYS[end], open_))
+            t = end + rng.randint(0, 3)
+    return pl.DataFrame(rows, schema=["franchise_id", "asset_type", "asset_id", "valid_from",
+                                      "valid_to", "is_current"], orient="row")
+
+
+def _values(seed: int) -> tuple[pl.DataFrame, pl.DataFrame]:
+    rng = random.Random(seed + 1000)
+    pv = pl.DataFrame([(date.fromisoformat(DAYS[d]), f"p{i}", rng.choice([0, rng.randint(1, 9000)]))
+                       for d in range(0, 40, 3) for i in range(7)],
+                      schema={"valuation_date": pl.Date, "player_id": pl.Utf8, "ktc_value": pl.Int64},
+                      orient="row")
+    pk = pl.DataFrame([("2026", r, date.fromisoformat(DAYS[d]), rng.randint(100, 3000))
+                       for d in range(10, 40, 5) for r in (1, 2)],
+                      schema={"season": pl.Utf8, "round": pl.Int64, "valuation_date": pl.Date,
+                              "value": pl.Int64}, orient="row")
+    return pv, pk
+
+
+def _slow(ledger, on, pv, pk) -> dict:
+    """franchise_id -> its positive held values, descending, by a per-asset scan."""
+    out: dict = {}
+    day = date.fromisoformat(on)
+    held = ledger.filter((pl.col("valid_from") <= on) & (pl.col("valid_to").is_null() | (pl.col("valid_to") > on)))
+    for r in held.iter_rows(named=True):
+        if r["asset_type"] == "player":
+            s = pv.filter(pl.col("player_id") == r["asset_id"]).rename({"ktc_value": "value"})
+        else:
+            season, rnd, _ = r["asset_id"].split(":")
+            s = pk.filter((pl.col("season") == season) & (pl.col("round") == int(rnd)))
+        known = s.filter(pl.col("valuation_date") <= day).sort("valuation_date")["value"]
+        values = out.setdefault(r["franchise_id"], [])
+        if known.len() and known[-1] > 0:
+            values.append(float(known[-1]))
+    return {fid: sorted(v, reverse=True) for fid, v in out.items()}
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_team_bags_match_per_asset_scan(seed, monkeypatch):
+    ledger, (pv, pk) = _ledger(seed), _values(seed)
+    fr = pl.DataFrame({"franchise_id": ["L_1", "L_2", "L_3"], "current_team_name": ["One", "Two", "Three"]})
+    monkeypatch.setattr(F, "load_dims", lambda: (fr, None))
+    for on in DAYS[4:40:7]:
+        bags = F.team_bags(as_of=on, ledger=ledger, player_values=pv, pick_values=pk)
+        assert {fid: b["values"] for fid, b in bags.items()} == _slow(ledger, on, pv, pk)
+        for fid, b in bags.items():
+            assert b["name"] == dict(fr.iter_rows())[fid]
+            assert b["n"] == len(b["values"]) and b["naive_sum"] == sum(b["values"])
+    assert F.team_bags(ledger=ledger, player_values=pv, pick_values=pk)    # as_of: the last value date
+
+
+def test_cached_ownership_index_follows_the_ledger(local_lake, tmp_path, monkeypatch):
+    monkeypatch.setattr(F, "CACHE", tmp_path / "cache")
+    root = f"gs://{F.BUCKET}/silver/fantasy/fact_roster_membership"
+    lake_io = F._silver_module("lake_io")
+    bucket = lake_io.get_bucket(F.BUCKET)
+    OwnershipIndex = F._silver_module("_ownership_index").OwnershipIndex
+    built, build = [], OwnershipIndex.build
+    monkeypatch.setattr(OwnershipIndex, "build", lambda led: built.append(1) or build(led))
+
+    def ledger_run(frame: pl.DataFrame, version: int) -> None:
+        lake_io.write_parquet(frame, root + "/data.parquet")
+        lake_io.write_parquet(frame.head(1), f"{root}_changes/run_id={version}/data.parquet")
+        bucket.blob(F._LEDGER_POINTER).upload_from_string(f'{{"version": {version}}}')
+
+    ledger = _ledger(0)
+    ledger_run(ledger, 1)
+    assert F.load_ownership_index().rosters_on(DAYS[20]).height == ledger.filter(
+        (pl.col("valid_from") <= DAYS[20]) & (pl.col("valid_to").is_null() | (pl.col("valid_to") > DAYS[20]))).height
+    assert len(F.load_ownership_index()) == ledger.height and len(built) == 1    # from the cache
+    # only the pointer stamps the index: other objects beside the ledger don't move it
+    bucket.blob("silver/fantasy/fact_roster_membership.state.json").upload_from_string("{}")
+    assert len(F.load_ownership_index()) == ledger.height and len(built) == 1
+    ledger_run(ledger.head(3), 2)
+    assert len(F.load_ownership_index()) == 3 and len(built) == 2
+
+
+@pytest.fixture
+def loaders(monkeypatch):
+    """Two memoized loaders over a fake source whose generation the test moves, on a fake
+    clock; ``calls`` records every real load."""
+    clock, gens, calls = [0.0], {"src/": 1}, []
+    monkeypatch.setattr(F, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setattr(F, "_source_generations", lambda prefix: ((prefix, gens[prefix]),))
+    F.clear_loader_cache()
+
+    @F._memoized("src/")
+    def frame(rows: int) -> pl.DataFrame:
+        calls.append(("frame", rows))
+        return pl.DataFrame({"x": range(rows)}, schema={"x": pl.Int64})
+
+    @F._memoized("src/")
+    def other() -> pl.DataFrame:
+        calls.append(("other",))
+        return pl.DataFrame({"x": [1]})
+
+    yield SimpleNamespace(frame=frame, other=other, clock=clock, gens=gens, calls=calls)
+    F.clear_loader_cache()
+
+
+def _size(rows: int) -> int:
+    return pl.DataFrame({"x": range(rows)}, schema={"x": pl.Int64}).estimated_size()
+
+
+def test_loader_cache_repeat_call_hits(loaders):
+    first = loaders.frame(10)
+    assert loaders.frame(10) is first and loaders.frame(rows=10) is first
+    assert loaders.calls == [("frame", 10)]
+    stats = F.loader_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"], stats["bytes"]) == (2, 1, 1, _size(10))
+
+
+def test_loader_cache_reloads_a_new_generation_after_the_recheck(loaders, monkeypatch):
+    monkeypatch.setattr(F, "LOADER_CACHE_RECHECK", 60)
+    loaders.frame(10)
+    loaders.gens["src/"] = 2
+    loaders.clock[0] = 59
+    loaders.frame(10)                                     # within the recheck: not looked at
+    assert len(loaders.calls) == 1
+    loaders.clock[0] = 61
+    loaders.frame(10)
+    assert len(loaders.calls) == 2 and F.loader_cache_stats()["stale"] == 1
+    loaders.clock[0] = 200
+    loaders.frame(10)                                     # rechecked, generation unchanged
+    assert len(loaders.calls) == 2
+
+
+def test_loader_cache_reloads_after_the_ttl(loaders, monkeypatch):
+    monkeypatch.setattr(F, "LOADER_CACHE_TTL", 100)
+    monkeypatch.setattr(F, "LOADER_CACHE_RECHECK", 1000)
+    loaders.frame(10)
+    loaders.clock[0] = 99
+    loaders.frame(10)
+    loaders.clock[0] = 101
+    loaders.frame(10)
+    assert loaders.calls == [("frame", 10)] * 2 and F.loader_cache_stats()["stale"] == 1
+
+
+def test_loader_cache_evicts_least_recently_used_past_the_budget(loaders, monkeypatch):
+    monkeypatch.setattr(F, "LOADER_CACHE_MAX_BYTES", _size(250))
+    loaders.frame(100)
+    loaders.frame(120)
+    loaders.frame(100)                                    # now the most recent
+    loaders.frame(50)                                     # 270 rows held: drop the LRU (120)
+    stats = F.loader_cache_stats()
+    assert (stats["entries"], stats["bytes"], stats["evicted"]) == (2, _size(100) + _size(50), 1)
+    loaders.frame(100)
+    loaders.frame(50)
+    assert loaders.calls == [("frame", 100), ("frame", 120), ("frame", 50)]
+    loaders.frame(120)
+    assert loaders.calls[-1] == ("frame", 120)
+
+
+def test_loader_cache_returns_but_does_not_keep_an_oversized_result(loaders, monkeypatch):
+    monkeypatch.setattr(F, "LOADER_CACHE_MAX_BYTES", _size(10))
+    loaders.frame(5)
+    assert loaders.frame(20).height == 20
+    assert loaders.frame(20).height == 20
+    assert loaders.calls == [("frame", 5), ("frame", 20), ("frame", 20)]
+    stats = F.loader_cache_stats()
+    assert (stats["entries"], stats["bytes"], stats["evicted"]) == (1, _size(5), 0)
+
+
+def test_clear_loader_cache_by_loader(loaders):
+    loaders.frame(10)
+    loaders.other()
+    F.clear_loader_cache("frame")
+    stats = F.loader_cache_stats()
+    assert (stats["entries"], stats["bytes"], stats["misses"]) == (1, loaders.other().estimated_size(), 2)
+    loaders.frame(10)
+    assert loaders.calls == [("frame", 10), ("other",), ("frame", 10)]
+    F.clear_loader_cache()
+    assert F.loader_cache_stats() == {"entries": 0, "bytes": 0, "hits": 0, "misses": 0,
+                                      "stale": 0, "evicted": 0}
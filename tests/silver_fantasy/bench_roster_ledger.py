@@ -0,0 +1,254 @@
+"""Scale benchmark for the ``fact_roster_membership`` ledger stages.
+
+    python -m tests.silver_fantasy.bench_roster_ledger run [--lake] [scale ...]
+    python -m tests.silver_fantasy.bench_roster_ledger compare [run_a run_b]
+
+``run`` generates each scale point with ``ledger_synth.generate`` and times every ledger
+stage on it. It also records the stage's peak RSS (sampled from ``/proc/self/statm``; polars
+allocates outside the Python heap) and how far that sits above the RSS when the stage
+started. With ``--lake`` the frames are also written to a temporary local lake and the
+full rebuild (``_full_ledger``, readers included) is timed end to end.
+
+Results are appended to ``bench_results/roster_ledger.jsonl`` (``BENCH_RESULTS`` overrides
+the path), one line per stage, tagged with a run id and the git commit, so runs of different
+versions can be compared with ``compare``. That defaults to the two latest runs.
+Scale points are ``SCALES``; ``medium`` is 100 lineages x 3 seasons of daily snapshots.
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import polars as pl
+
+from tests.de_loader import load_de_module
+from tests.silver_fantasy.ledger_synth import generate, write_lake
+
+SCALES = {
+    "tiny": dict(lineages=2, seasons=2),
+    "small": dict(lineages=10, seasons=3),
+    "medium": dict(lineages=100, seasons=3),
+    "crawl": dict(lineages=1000, seasons=3),
+}
+RESULTS = Path(os.environ.get("BENCH_RESULTS")
+               or Path(__file__).with_name("bench_results") / "roster_ledger.jsonl")
+_PAGE_MB = os.sysconf("SC_PAGE_SIZE") / 1024 ** 2 if hasattr(os, "sysconf") else 0.0
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_MB
+    except OSError:                       # no procfs: the process high-water mark instead
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+@contextmanager
+def _measure(out: dict, interval: float = 0.005):
+    """Wall time and sampled peak RSS of the block into ``out``."""
+    start_rss = peak = _rss_mb()
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.wait(interval):
+            peak = max(peak, _rss_mb())
+
+    t = threading.Thread(target=sample, daemon=True)
+    t.start()
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        out["seconds"] = round(time.perf_counter() - t0, 4)
+        done.set()
+        t.join()
+        peak = max(peak, _rss_mb())
+        out["peak_rss_mb"] = round(peak, 1)
+        out["rss_delta_mb"] = round(peak - start_rss, 1)
+
+
+def _git_sha() -> str:
+    try:
+        sha = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             check=True, cwd=Path(__file__).parent).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               capture_output=True, text=True, cwd=Path(__file__).parent).stdout
+        return sha + ("-dirty" if dirty.strip() else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _sources(mod, frames: dict[str, pl.DataFrame]):
+    """A BronzeSources whose prefixes are served from the generated frames."""
+    first = frames["snapshot_days"]["snapshot_date"].min()
+    day = pl.from_epoch(pl.col("created"), time_unit="ms").dt.date().cast(pl.Utf8)
+    src = mod.BronzeSources("b")
+    feeds = {"full_load": day < first, "daily": day >= first}
+    for feed, keep in feeds.items():
+        ids = frames["transactions"].filter(keep).select("transaction_id")
+        for sub, name in (("transactions", "transactions"), ("transaction_players", "transaction_players"),
+                          ("draft_picks", "txn_draft_picks")):
+            src._frames[("prefix", f"bronze/sleeper/transactions/{sub}/{feed}/")] = \
+                frames[name].join(ids, on="transaction_id", how="semi")
+    src._frames[("prefix", "bronze/sleeper/drafts/drafts/")] = frames["drafts"]
+    src._frames[("prefix", "bronze/sleeper/drafts/draft_picks/")] = frames["draft_picks"]
+    src._frames[("latest", "bronze/sleeper/transactions/commission_overrides/")] = None
+    return src
+
+
+def run_stages(frames: dict[str, pl.DataFrame], lake: bool = False):
+    """Time every ledger stage over one generated scale point -> ``(stage, record)`` pairs,
+    yielded as each stage finishes. Stage inputs are built outside the timed blocks."""
+    mod = load_de_module("silver_fantasy/fact_roster_membership.py", "silver_fantasy",
+                         "fact_roster_membership")
+    leagues, drafts = frames["leagues"], frames["drafts"]
+    lineage_map = leagues.select("league_id", "league_lineage_id").unique()
+    days = frames["snapshot_days"]["snapshot_date"].to_list()
+    boundary, key = days[0], ["franchise_id", "player_id"]
+    src = _sources(mod, frames)
+    present = mod._lineage_franchise(
+        frames["roster_players"].rename({"load_date": "snapshot_date"}), lineage_map
+    ).select("franchise_id", "player_id", "snapshot_date")
+    traded = frames["traded_picks"].rename({"load_date": "snapshot_date"})
+    step = mod._STINT_CHUNK_DAYS
+    chunks = [days[i:i + step] for i in range(0, len(days), step)]
+    out: dict = {}
+
+    def stage(name, rows):
+        rec = {"stage": name, **out, "rows": rows}
+        out.clear()
+        return name, rec
+
+    with _measure(out):
+        events = mod._read_player_events("b", lineage_map, src)
+    yield stage("player_events", events.height)
+
+    with _measure(out):
+        stints, edge = pl.DataFrame(schema=mod._stint_schema({}, key)), None
+        for chunk in chunks:
+            part = present.filter(pl.col("snapshot_date").is_between(pl.lit(chunk[0]), pl.lit(chunk[-1])))
+            stints = mod.append_stints(stints, mod.presence_to_stints(part, key, days=chunk), key,
+                                       edge=edge, start=chunk[0])
+            edge = chunk[-1]
+    yield stage("presence_to_stints", stints.height)
+
+    with _measure(out):
+        snap = mod.build_snapshot_intervals(present, key)
+    yield stage("build_snapshot_intervals", snap.height)
+
+    with _measure(out):
+        ev_iv = mod.build_event_intervals(events, key)
+    yield stage("build_event_intervals", ev_iv.height)
+
+    with _measure(out):
+        combined = mod.combine_eras(present, events, boundary, key)
+    yield stage("combine_eras", combined.height)
+    del snap, ev_iv, combined
+
+    with _measure(out):
+        latest = traded.filter(pl.col("snapshot_date") == days[-1])
+        resolved = mod.resolve_pick_ownership(latest, frames["txn_draft_picks"], pl.DataFrame(),
+                                              leagues, drafts)
+    yield stage("resolve_pick_ownership", resolved.height)
+
+    with _measure(out):
+        n = 0
+        for chunk in chunks:
+            part = traded.filter(pl.col("snapshot_date").is_between(pl.lit(chunk[0]), pl.lit(chunk[-1])))
+            n += mod.resolve_pick_ownership_by_day(part, pl.DataFrame(), leagues, drafts,
+                                                   days=chunk).height
+    yield stage("resolve_pick_ownership_by_day", n)
+
+    franchise_days = present.select("franchise_id", "snapshot_date").unique()
+    with _measure(out):
+        repaired, _, windows = mod.reconstruct_rollover_presence(
+            stints, franchise_days, leagues, "b", src, days=days)
+    yield stage("rollover_repair", repaired.height)
+
+    with _measure(out):
+        trades = mod._read_pick_trade_events("b", lineage_map, src)
+        rounds_df = (drafts.filter(pl.col("status") == "complete")
+                     .join(lineage_map, on="league_id").sort("season")
+                     .group_by("league_lineage_id").agg(pl.col("rounds").last()))
+        lifecycle = mod.synthesize_pick_lifecycle(drafts, leagues, lineage_map, rounds_df)
+        recon = mod.reconstruct_pick_intervals(lifecycle, trades)
+    yield stage("reconstruct_pick_intervals", recon.height)
+
+    if lake:
+        with tempfile.TemporaryDirectory(prefix="bench_lake_") as root:
+            os.environ["LAKE_STORAGE"] = root
+            try:
+                write_lake(frames, mod.sink_parquet)
+                with _measure(out):
+                    ledger, _ = mod._full_ledger(
+                        "b", leagues, lineage_map, mod.BronzeSources("b"), events, trades,
+                        pl.DataFrame(), drafts, days, days)
+                    rows = ledger.collect(engine="streaming").height
+                yield stage("full_ledger", rows)
+            finally:
+                os.environ.pop("LAKE_STORAGE", None)
+
+
+def run(scales: list[str], lake: bool = False, results: Path = RESULTS) -> list[dict]:
+    """Benchmark ``scales`` and append one JSON line per stage to ``results``."""
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    env = {"run_id": run_id, "git_sha": _git_sha(), "python": platform.python_version(),
+           "polars": pl.__version__, "cpus": os.cpu_count()}
+    results.parent.mkdir(parents=True, exist_ok=True)
+    records = []
+    for scale in scales:
+        params = SCALES[scale]
+        gen: dict = {}
+        with _measure(gen):
+            frames = generate(**params)
+        print(f"[{scale}] generated {frames['roster_players'].height:,} roster-day rows, "
+              f"{frames['transactions'].height:,} transactions in {gen['seconds']:.1f}s")
+        for name, rec in run_stages(frames, lake=lake):
+            rec = {**env, "scale": scale, **params, **rec}
+            records.append(rec)
+            with results.open("a") as f:
+                f.write(json.dumps(rec) + "\n")
+            print(f"  {name:<32} {rec['seconds']:>9.3f}s  peak {rec['peak_rss_mb']:>8.0f} MiB "
+                  f"(+{rec['rss_delta_mb']:.0f})  rows {rec['rows']:,}")
+        del frames
+    return records
+
+
+def compare(run_a: str | None = None, run_b: str | None = None, results: Path = RESULTS) -> pl.DataFrame:
+    """Per (scale, stage) seconds and peak RSS of two runs side by side (default: the two
+    latest), with the b/a time ratio."""
+    df = pl.read_ndjson(results)
+    runs = df.select("run_id").unique(maintain_order=True)["run_id"].to_list()
+    if run_a is None and run_b is None:
+        run_a, run_b = (runs[-2:] if len(runs) > 1 else runs * 2)
+    cols = ["scale", "stage", "seconds", "peak_rss_mb"]
+    a = df.filter(pl.col("run_id") == run_a).select(cols)
+    b = df.filter(pl.col("run_id") == run_b).select(cols)
+    out = (a.join(b, on=["scale", "stage"], how="full", coalesce=True, suffix="_b")
+           .with_columns((pl.col("seconds_b") / pl.col("seconds")).round(2).alias("ratio")))
+    print(f"a = {run_a}, b = {run_b}")
+    with pl.Config(tbl_rows=-1, tbl_hide_dataframe_shape=True):
+        print(out)
+    return out
+
+
+if __name__ == "__main__":
+    cmd, *args = sys.argv[1:] or ["run"]
+    if cmd == "run":
+        lake = "--lake" in args
+        run([a for a in args if a != "--lake"] or ["tiny", "small"], lake=lake)
+    elif cmd == "compare":
+        compare(*args[:2])
+    else:
+        sys.exit(__doc__)
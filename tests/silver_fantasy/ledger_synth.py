@@ -0,0 +1,286 @@
+"""Synthetic bronze inputs for ``fact_roster_membership`` at any scale.
+
+``generate`` simulates dynasty lineages day by day and returns the frames the ledger
+reads, in their bronze shapes:
+
+* one league per lineage and season. The startup draft fills every roster; each later season
+  opens with a rookie draft that consumes that season's picks and mints the picks three
+  seasons out;
+* free-agent add/drops and trades (players and future picks) as transactions, with the
+  ``transaction_players`` and ``draft_picks`` rows they imply;
+* daily ``roster_players`` and ``traded_picks`` snapshots over each season's snapshot span,
+  with a ``ROLLOVER_GAP`` between seasons. That gap is the offseason window the rollover
+  repair replays.
+
+Everything comes from one ``random.Random(seed)``, so a scale point is reproducible. The
+simulation's own holding intervals come back as ``truth`` so tests can check the ledger
+stages against them. ``write_lake`` lays the frames out under a local ``LAKE_STORAGE``
+bucket at the prefixes the job reads.
+"""
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, timedelta, timezone
+
+import polars as pl
+
+ROLLOVER_GAP = 14               # days between a season's last snapshot and the next's first
+
+
+def _ms(d: date, seconds: int = 43_200) -> int:
+    return int(datetime(d.year, d.month, d.day, tzinfo=timezone.utc).timestamp() * 1000) + seconds * 1000
+
+
+def _daterange(a: date, b: date) -> list[date]:
+    return [a + timedelta(days=i) for i in range((b - a).days)]
+
+
+def generate(lineages: int = 4, seasons: int = 2, rosters: int = 12, roster_size: int = 25,
+             rookie_rounds: int = 4, tx_per_day: float = 0.6, pick_trade_share: float = 0.3,
+             start_year: int = 2023, seed: int = 0) -> dict[str, pl.DataFrame]:
+    """Simulate ``lineages`` leagues over ``seasons`` seasons -> bronze-shaped frames.
+
+    Keys: ``leagues`` (dim_leagues_meta), ``drafts``, ``draft_picks``, ``transactions``,
+    ``transaction_players``, ``txn_draft_picks``, ``roster_players`` (daily, with
+    ``load_date``), ``traded_picks`` (daily), ``truth`` (the simulated player holdings:
+    ``franchise_id, player_id, valid_from, valid_to``) and ``snapshot_days``."""
+    rng = random.Random(seed)
+    pool = [str(p) for p in range(1, max(4 * rosters * roster_size, 2000) + 1)]
+    years = list(range(start_year, start_year + seasons))
+    draft_day = {y: date(y, 5, 1) for y in years}
+    startup = date(start_year, 4, 1)
+    first_snap = date(start_year, 5, 15)
+    span = {y: (max(first_snap, date(y, 5, 1) + timedelta(days=ROLLOVER_GAP)),
+                date(y + 1, 5, 1) if y < years[-1] else date(y + 1, 3, 1)) for y in years}
+
+    leagues, drafts, draft_picks = [], [], []
+    txns, tx_players, txn_picks = [], [], []
+    truth, pick_iv = [], []
+    tx_seq = iter(range(10**9))
+
+    def league_of(lin: str, d: date) -> str:
+        y = max([y for y in years if draft_day[y] <= d] or [start_year])
+        return f"{lin}{y}"
+
+    for li in range(lineages):
+        lin = str(1_000_000 + li)
+        for y in years:
+            leagues.append((f"{lin}{y}", lin, str(y), "complete" if y < years[-1] else "in_season",
+                            rosters))
+        held: dict[str, tuple[int, date]] = {}               # player -> (roster, since)
+        owner: dict[tuple, tuple[int, date]] = {}            # (season, round, orig) -> (owner, since)
+        free, free_at = list(pool), {p: i for i, p in enumerate(pool)}   # O(1) add/remove
+
+        def free_add(player: str) -> None:
+            if player not in free_at:
+                free_at[player] = len(free)
+                free.append(player)
+
+        def free_remove(player: str) -> None:
+            i = free_at.pop(player, None)
+            if i is not None:
+                last = free.pop()
+                if last != player:
+                    free[i], free_at[last] = last, i
+
+        def move(player: str, roster: int | None, d: date) -> None:
+            if player in held:
+                r, since = held.pop(player)
+                if since < d:
+                    truth.append((f"{lin}_{r}", player, since, d))
+                free_add(player)
+            if roster is not None:
+                held[player] = (roster, d)
+                free_remove(player)
+
+        def move_pick(key: tuple, new: int | None, d: date) -> None:
+            if key in owner:
+                o, since = owner.pop(key)
+                if since < d:
+                    pick_iv.append((lin, *key, o, since, d))
+            if new is not None:
+                owner[key] = (new, d)
+
+        def record(d: date, league: str, kind: str, players=(), picks=()) -> None:
+            tid = str(next(tx_seq))
+            txns.append((tid, league, kind, "complete", _ms(d, rng.randrange(86_400))))
+            for player, roster, action in players:
+                tx_players.append((tid, league, player, roster, action))
+            for (season, rnd, orig), new, prev in picks:
+                txn_picks.append((tid, league, str(season), rnd, orig, new, prev))
+
+        # startup draft: snake order, fills every roster
+        did = f"d{lin}{start_year}"
+        drafts.append((did, f"{lin}{start_year}", str(start_year), "complete", roster_size,
+                       _ms(startup), _ms(startup, 80_000), "snake"))
+        picks_left = rng.sample(pool, rosters * roster_size)
+        for rnd in range(roster_size):
+            order = range(1, rosters + 1) if rnd % 2 == 0 else range(rosters, 0, -1)
+            for slot, roster in enumerate(order):
+                player = picks_left[rnd * rosters + slot]
+                draft_picks.append((did, rnd * rosters + slot + 1, rnd + 1, player, roster, slot + 1))
+                move(player, roster, startup)
+        for season in range(start_year + 1, start_year + 4):
+            for rnd in range(1, rookie_rounds + 1):
+                for orig in range(1, rosters + 1):
+                    owner[(season, rnd, orig)] = (orig, startup)
+
+        for d in _daterange(startup, span[years[-1]][1]):
+            league = league_of(lin, d)
+            if d in draft_day.values() and d != date(start_year, 5, 1):
+                y = d.year
+                did = f"d{lin}{y}"
+                drafts.append((did, league, str(y), "complete", rookie_rounds, _ms(d), _ms(d, 50_000),
+                               "linear"))
+                rookies = [f"{y}{k:03d}" for k in range(rookie_rounds * rosters)]
+                for rnd in range(1, rookie_rounds + 1):
+                    for orig in range(1, rosters + 1):
+                        o, _ = owner[(y, rnd, orig)]
+                        rookie = rookies[(rnd - 1) * rosters + orig - 1]
+                        draft_picks.append((did, (rnd - 1) * rosters + orig, rnd, rookie, o, orig))
+                        move_pick((y, rnd, orig), None, d)
+                        move(rookie, o, d)
+                        cut = rng.choice([p for p, (r, _) in held.items() if r == o and p != rookie])
+                        move(cut, None, d)
+                        record(d, league, "free_agent", players=[(cut, o, "drop")])
+                for rnd in range(1, rookie_rounds + 1):
+                    for orig in range(1, rosters + 1):
+                        owner[(y + 3, rnd, orig)] = (orig, d)
+            for _ in range(int(tx_per_day) + (rng.random() < tx_per_day % 1)):
+                a, b = rng.sample(range(1, rosters + 1), 2)
+                mine = [p for p, (r, _) in held.items() if r == a]
+                if rng.random() < pick_trade_share:
+                    # a player of a's for a player of b's plus one of b's picks (sizes hold)
+                    picks = [k for k, (o, _) in owner.items() if o == b]
+                    if not picks:
+                        continue
+                    p1 = rng.choice(mine)
+                    p2 = rng.choice([p for p, (r, _) in held.items() if r == b])
+                    key = rng.choice(picks)
+                    move(p1, b, d)
+                    move(p2, a, d)
+                    move_pick(key, a, d)
+                    record(d, league, "trade", players=[(p1, a, "drop"), (p1, b, "add"),
+                                                        (p2, b, "drop"), (p2, a, "add")],
+                           picks=[(key, a, b)])
+                elif rng.random() < 0.5:
+                    theirs = [p for p, (r, _) in held.items() if r == b]
+                    p1, p2 = rng.choice(mine), rng.choice(theirs)
+                    move(p1, b, d)
+                    move(p2, a, d)
+                    record(d, league, "trade", players=[(p1, a, "drop"), (p1, b, "add"),
+                                                        (p2, b, "drop"), (p2, a, "add")])
+                else:
+                    out, inn = rng.choice(mine), rng.choice(free)
+                    move(out, None, d)
+                    move(inn, a, d)
+                    record(d, league, "free_agent", players=[(out, a, "drop"), (inn, a, "add")])
+        for player in list(held):
+            r, since = held.pop(player)
+            truth.append((f"{lin}_{r}", player, since, None))
+        for key, (o, since) in owner.items():
+            pick_iv.append((lin, *key, o, since, None))
+
+    snap_days = sorted(d for y in years for d in _daterange(*span[y]))
+    season_of = pl.DataFrame({"load_date": snap_days,
+                              "_y": [max(y for y in years if d >= span[y][0]) for d in snap_days]})
+    cal = season_of.with_columns(pl.col("load_date").cast(pl.Int32).alias("_d"))
+
+    truth_df = pl.DataFrame(truth, schema={"franchise_id": pl.Utf8, "player_id": pl.Utf8,
+                                           "valid_from": pl.Date, "valid_to": pl.Date}, orient="row")
+    roster_players = (
+        truth_df.with_columns(pl.int_ranges(pl.col("valid_from").cast(pl.Int32),
+                                            pl.col("valid_to").cast(pl.Int32)
+                                            .fill_null(snap_days[-1].toordinal() - 719_162),
+                                            dtype=pl.Int32).alias("_d"))
+        .explode("_d").join(cal, on="_d", how="inner")
+        .with_columns(pl.col("franchise_id").str.split("_").alias("_f"))
+        .select((pl.col("_f").list.get(0) + pl.col("_y").cast(pl.Utf8)).alias("league_id"),
+                pl.col("_f").list.get(1).cast(pl.Int64).alias("roster_id"), "player_id",
+                pl.col("load_date").cast(pl.Utf8))
+    )
+    picks_df = pl.DataFrame(pick_iv, schema={"lin": pl.Utf8, "season": pl.Int64, "round": pl.Int64,
+                                             "original_roster_id": pl.Int64,
+                                             "owner_roster_id": pl.Int64, "valid_from": pl.Date,
+                                             "valid_to": pl.Date}, orient="row")
+    traded_picks = (
+        picks_df.filter(pl.col("owner_roster_id") != pl.col("original_roster_id"))
+        .with_columns(pl.int_ranges(pl.col("valid_from").cast(pl.Int32),
+                                    pl.col("valid_to").cast(pl.Int32)
+                                    .fill_null(snap_days[-1].toordinal() - 719_162),
+                                    dtype=pl.Int32).alias("_d"))
+        .explode("_d").join(cal, on="_d", how="inner")
+        .select((pl.col("lin") + pl.col("_y").cast(pl.Utf8)).alias("league_id"),
+                pl.col("season").cast(pl.Utf8), "round", "original_roster_id", "owner_roster_id",
+                pl.col("original_roster_id").alias("previous_owner_roster_id"),
+                pl.col("valid_from").cast(pl.Datetime("us")).alias("timestamp"),
+                pl.col("load_date").cast(pl.Utf8))
+    )
+    return {
+        "leagues": pl.DataFrame(leagues, schema=["league_id", "league_lineage_id", "season", "status",
+                                                 "total_rosters"], orient="row"),
+        "drafts": pl.DataFrame(drafts, schema=["draft_id", "league_id", "season", "status", "rounds",
+                                               "start_time", "last_picked", "type"], orient="row"),
+        "draft_picks": pl.DataFrame(draft_picks, schema=["draft_id", "pick_no", "round", "player_id",
+                                                         "roster_id", "draft_slot"], orient="row"),
+        "transactions": pl.DataFrame(txns, schema=["transaction_id", "league_id", "type", "status",
+                                                   "created"], orient="row"),
+        "transaction_players": pl.DataFrame(tx_players, schema=["transaction_id", "league_id",
+                                                                "player_id", "roster_id", "action"],
+                                            orient="row"),
+        "txn_draft_picks": pl.DataFrame(txn_picks, schema={
+            "transaction_id": pl.Utf8, "league_id": pl.Utf8, "season": pl.Utf8, "round": pl.Int64,
+            "roster_id": pl.Int64, "owner_id": pl.Int64, "previous_owner_id": pl.Int64}, orient="row"),
+        "roster_players": roster_players,
+        "traded_picks": traded_picks,
+        "truth": truth_df.with_columns(pl.col("valid_from", "valid_to").cast(pl.Utf8)),
+        "snapshot_days": pl.DataFrame({"snapshot_date": [d.isoformat() for d in snap_days]}),
+    }
+
+
+def write_lake(frames: dict[str, pl.DataFrame], sink_parquet, bucket: str = "b",
+               by_league: bool = False, until: str | None = None) -> None:
+    """Lay ``frames`` out at the bronze/silver prefixes the ledger job reads, through the
+    job's own ``sink_parquet`` (so ``LAKE_STORAGE`` decides where they land). Daily
+    snapshots become one ``load_date=`` object per day (up to ``until``, when given; see
+    ``write_snapshots`` for the rest); event feeds land as ``daily`` except the pre-snapshot
+    history, which goes to ``full_load``. ``by_league`` partitions the daily feeds by
+    ``league_id=`` as the daily ingestion does."""
+    root = f"gs://{bucket}/"
+    first = frames["snapshot_days"]["snapshot_date"].min()
+    created_day = pl.from_epoch(pl.col("created"), time_unit="ms").dt.date().cast(pl.Utf8)
+
+    def put(frame: pl.DataFrame, name: str) -> None:
+        sink_parquet(frame.lazy(), root + name)
+
+    put(frames["leagues"], "silver/fantasy/dim_leagues_meta/data.parquet")
+    last = frames["snapshot_days"]["snapshot_date"].max()
+    put(frames["drafts"], f"bronze/sleeper/drafts/drafts/load_date={last}/data.parquet")
+    put(frames["draft_picks"], "bronze/sleeper/drafts/draft_picks/data.parquet")
+    tx = frames["transactions"].with_columns(created_day.alias("_day"))
+    for feed, keep in (("full_load", pl.col("_day") < first), ("daily", pl.col("_day") >= first)):
+        part = tx.filter(keep)
+        for (league,), rows in (part.partition_by("league_id", as_dict=True).items()
+                                if feed == "daily" and by_league else [((None,), part)]):
+            at = f"{feed}/league_id={league}" if league else feed
+            ids = rows.select("transaction_id")
+            put(rows.drop("_day"), f"bronze/sleeper/transactions/transactions/{at}/data.parquet")
+            put(frames["transaction_players"].join(ids, on="transaction_id", how="semi"),
+                f"bronze/sleeper/transactions/transaction_players/{at}/data.parquet")
+            put(frames["txn_draft_picks"].join(ids, on="transaction_id", how="semi"),
+                f"bronze/sleeper/transactions/draft_picks/{at}/data.parquet")
+    write_snapshots(frames, sink_parquet, bucket=bucket, until=until)
+
+
+def write_snapshots(frames: dict[str, pl.DataFrame], sink_parquet, bucket: str = "b",
+                    after: str | None = None, until: str | None = None) -> None:
+    """Write the daily ``roster_players`` / ``traded_picks`` snapshot objects of the days in
+    ``(after, until]`` (open ends when None) and nothing else, as later ingestion days do."""
+    for name in ("roster_players", "traded_picks"):
+        frame = frames[name]
+        if after is not None:
+            frame = frame.filter(pl.col("load_date") > after)
+        if until is not None:
+            frame = frame.filter(pl.col("load_date") <= until)
+        for (day,), part in frame.partition_by("load_date", as_dict=True, maintain_order=False).items():
+            sink_parquet(part.lazy(), f"gs://{bucket}/bronze/sleeper/rosters/{name}/daily/load_date={day}/data.parquet")
@@ -97,6 +97,17 @@ class TestParseFCPicks:
         assert out.height == 1
         assert out.to_dicts()[0]["season"] == 2027 and out.to_dicts()[0]["round"] == 2
 
+    def test_split_into_round_and_slot_rows_in_input_order(self):
+        rounds, slots = mod.split_fc_picks(_fc([
+            ("PICK", "2026 Pick 1.09", 2741),
+            ("PICK", " 2027 2nd ", 1619),
+            ("PICK", "2026 Pick X", 1),         # malformed -> dropped
+            ("PICK", "2026 1st", 3235),
+            ("PICK", "2026 Pick 3.12", 402),
+        ]))
+        assert rounds.select("season", "round", "value").rows() == [(2027, 2, 1619), (2026, 1, 3235)]
+        assert slots.select("season", "round", "slot", "value").rows() == [(2026, 1, 9, 2741), (2026, 3, 12, 402)]
+
 
 # --- historical archive: "Tier Season Round", SF Standard only --------------
 def _local(rows):
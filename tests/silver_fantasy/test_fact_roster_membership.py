@@ -7,6 +7,8 @@ step must conserve assets (no double ownership, every league/season/round
 resolves to exactly total_rosters picks, every moved pick lands on a real
 franchise) and quarantine anything that doesn't instead of dropping it.
 """
+import shutil
+import sys
 from datetime import datetime
 
 import polars as pl
@@ -326,6 +328,80 @@ class TestResolveWithDrafts:
         assert row["owner_roster_id"] == 4
 
 
+def _join_resolve(traded, overrides, leagues, drafts):
+    # the row-per-pick resolution the dense grid replaced: universe rows + left joins
+    lm = mod.build_lineage_map(leagues)
+    l2c = lm.select("league_id", "current_league_id")
+    tr, ov = mod._relabel_current(traded, l2c), mod._relabel_current(overrides, l2c)
+    meta = mod._current_meta(lm, drafts)
+    uni = build_pick_universe(pl.concat([mod._lsr(tr), mod._lsr(ov)]).unique(), meta)
+    tr = mod._norm_pick_keys(tr, "original_roster_id").unique(mod._PICK_KEY, keep="last").select(
+        mod._PICK_KEY + [pl.col("owner_roster_id").alias("t")])
+    ov = mod._override_owners(ov, {k: uni.schema[k] for k in mod._PICK_KEY})
+    return (uni.join(tr, on=mod._PICK_KEY, how="left").join(ov, on=mod._PICK_KEY, how="left")
+            .select(mod._PICK_KEY + [pl.coalesce("override_owner", "t", "original_roster_id")
+                                     .alias("owner_roster_id")]))
+
+
+class TestDensePickGrid:
+    LEAGUES = pl.DataFrame({"league_id": ["A", "B", "C"], "league_lineage_id": ["A", "B", "C"],
+                            "season": ["2025"] * 3, "status": ["complete"] * 3,
+                            "total_rosters": [4, 6, 3]})
+
+    def test_grid_index_is_the_flat_row_order(self):
+        meta = mod._current_meta(mod.build_lineage_map(self.LEAGUES),
+                                 _drafts([("A", "2025", 2), ("B", "2025", 3)]))
+        grid = mod.build_pick_grid(meta, years_ahead=3)
+        assert grid["league_id"].to_list() == ["A", "B"]           # C has no drafts: no block
+        rows = mod._grid_rows(grid)
+        assert rows.height == 3 * 2 * 4 + 3 * 3 * 6 == grid["size"].sum()
+        assert mod._grid_index(rows, grid)["_idx"].to_list() == list(range(rows.height))
+        outside = pl.DataFrame({"league_id": ["A", "A", "B", "C"], "season": ["2029", "2026", "2026", "2026"],
+                                "round": [1, 3, 1, 1], "original_roster_id": [1, 1, 7, 1]})
+        assert mod._grid_index(outside, grid)["_idx"].null_count() == 4
+
+    def test_matches_row_resolution_on_random_overlays(self):
+        import random
+        drafts = _drafts([("A", "2025", 2), ("B", "2025", 3)])
+        for seed in range(15):
+            rng = random.Random(seed)
+
+            def rows(n):   # some land outside the grid: season 2029+, round 3+ in A, roster 5+
+                return [(str(rng.randint(2025, 2030)), rng.randint(1, 4), rng.randint(1, 6),
+                         rng.randint(1, 6)) for _ in range(n)]
+            traded = pl.concat([_traded(rows(8), league=lg) for lg in "ABC"])
+            overrides = pl.concat([_overrides(rows(3), league=lg) for lg in "ABC"])
+            got = resolve_pick_ownership(traded, _EMPTY, overrides, self.LEAGUES, drafts)
+            want = _join_resolve(traded, overrides, self.LEAGUES, drafts)
+            assert got.sort(mod._PICK_KEY).equals(want.sort(mod._PICK_KEY)), seed
+
+
+class TestResolverMemo:
+    def test_equal_inputs_hit_and_changed_drafts_miss(self):
+        mod.clear_pick_memo()
+        leagues = _lineage_leagues()
+        drafts = _drafts([("CUR", "2025", 3)])
+        first = resolve_pick_ownership(_EMPTY, _EMPTY, _EMPTY, leagues, drafts)
+        assert mod.pick_memo_stats() == {"hits": 0, "misses": 2, "entries": 2}
+        # equal content in new frame objects (row order differs) is the same state
+        again = resolve_pick_ownership(_EMPTY, _EMPTY, _EMPTY, leagues.reverse(), drafts.clone())
+        assert again.equals(first) and mod.pick_memo_stats()["hits"] == 2
+        resolve_pick_ownership(_EMPTY, _EMPTY, _EMPTY, leagues, _drafts([("CUR", "2025", 2)]))
+        assert mod.pick_memo_stats() == {"hits": 3, "misses": 3, "entries": 3}
+
+    def test_lru_is_bounded(self, monkeypatch):
+        mod.clear_pick_memo()
+        monkeypatch.setenv("PICK_MEMO_SIZE", "3")
+        leagues = _lineage_leagues()
+        for rounds in range(1, 6):
+            resolve_pick_ownership(_EMPTY, _EMPTY, _EMPTY, leagues, _drafts([("CUR", "2025", rounds)]))
+        assert mod.pick_memo_stats()["entries"] == 3
+        resolve_pick_ownership(_EMPTY, _EMPTY, _EMPTY, leagues, _drafts([("CUR", "2025", 5)]))
+        resolve_pick_ownership(_EMPTY, _EMPTY, _EMPTY, leagues, _drafts([("CUR", "2025", 1)]))
+        # the lineage map stays hot; rounds=1 was evicted and is rebuilt
+        assert mod.pick_memo_stats()["misses"] == 1 + 5 + 1
+
+
 # --- pick membership / franchise mapping -----------------------------------
 class TestBuildPickMembership:
     def test_asset_id_and_franchise(self):
@@ -419,3 +495,231 @@ class TestReconcile:
         assert "unmapped_player" in quarantine["quarantine_reason"].to_list()
         # franchise is known, so the row stays in the fact (not dropped silently)
         assert fact.filter(pl.col("asset_id") == "999").height == 1
+
+
+# --- bronze source registry ------------------------------------------------
+class TestBronzeSources:
+    _TXN = pl.DataFrame({"transaction_id": ["t1"], "created": [1735732800000], "status": ["complete"]})
+    _TP = pl.DataFrame({"transaction_id": ["t1"], "league_id": ["L1"], "player_id": ["100"],
+                        "roster_id": [1], "action": ["add"]})
+    _DPK = pl.DataFrame({"transaction_id": ["t1"], "league_id": ["L1"], "season": ["2026"],
+                         "round": [1], "roster_id": [2], "owner_id": [1], "previous_owner_id": [2]})
+    _DRAFTS = pl.DataFrame({"draft_id": ["d1"], "league_id": ["L1"], "start_time": [1735732800000]})
+    _PICKS = pl.DataFrame({"draft_id": ["d1"], "pick_no": [1], "player_id": ["200"], "roster_id": [2]})
+
+    def _source(self, monkeypatch):
+        by_prefix = {
+            "transactions/transactions/": self._TXN,
+            "transactions/transaction_players/": self._TP,
+            "transactions/draft_picks/": self._DPK,
+            "drafts/drafts/": self._DRAFTS,
+            "drafts/draft_picks/": self._PICKS,
+        }
+        calls = []
+
+        def fake_read(bucket_name, prefix, columns=None):
+            calls.append(prefix)
+            for part, frame in by_prefix.items():
+                if f"bronze/sleeper/{part}" in prefix:
+                    return frame
+            return pl.DataFrame()
+
+        monkeypatch.setattr(mod, "_read_prefix_concat", fake_read)
+        monkeypatch.setattr(mod, "_latest_file", lambda bucket_name, prefix: None)
+        return calls
+
+    def test_same_frame_is_handed_to_every_caller(self, monkeypatch):
+        calls = self._source(monkeypatch)
+        src = mod.BronzeSources("b")
+        first = src.prefix("bronze/sleeper/drafts/drafts/")
+        assert src.prefix("bronze/sleeper/drafts/drafts/") is first
+        assert src.latest("bronze/sleeper/transactions/commission_overrides/") is None
+        assert src.latest("bronze/sleeper/transactions/commission_overrides/") is None
+        assert calls == ["bronze/sleeper/drafts/drafts/"] and src.reads == 2
+
+    def test_ledger_readers_share_one_read_per_prefix(self, monkeypatch):
+        calls = self._source(monkeypatch)
+        lineage = pl.DataFrame({"league_id": ["L1"], "league_lineage_id": ["L1"]})
+        src = mod.BronzeSources("b")
+        events = mod._read_player_events("b", lineage, src)
+        trades = mod._read_pick_trade_events("b", lineage, src)
+        assert sorted(events["player_id"].to_list()) == ["100", "200"]
+        assert trades["new_franchise"].to_list() == ["L1_1"]
+        assert len(calls) == len(set(calls))
+        assert "bronze/sleeper/transactions/transactions/full_load/" in calls
+
+
+# --- batched multi-day resolution -------------------------------------------
+class TestResolveByDay:
+    @staticmethod
+    def _ms(iso):
+        return int((datetime.fromisoformat(iso) - datetime(1970, 1, 1)).total_seconds() * 1000)
+
+    def _inputs(self):
+        leagues = pl.DataFrame({
+            "league_id": ["OLD", "CUR", "B"], "league_lineage_id": ["ROOT", "ROOT", "B"],
+            "season": ["2025", "2026", "2026"], "status": ["complete", "in_season", "in_season"],
+            "total_rosters": [4, 4, 6],
+        })
+        drafts = pl.DataFrame({
+            "league_id": ["OLD", "CUR", "B"], "season": ["2025", "2026", "2026"],
+            "status": ["complete"] * 3, "rounds": [3, 2, 4],
+            "start_time": [self._ms("2025-05-12"), self._ms("2026-05-08"), self._ms("2026-05-20")],
+        })
+        days = ["2026-05-01", "2026-05-09", "2026-05-10", "2026-05-21", "2026-06-01"]
+        traded = pl.concat([
+            _traded([("2027", 1, 2, 3), ("2026", 2, 1, 4)], league="OLD").with_columns(
+                pl.lit(d).alias("snapshot_date"),
+                pl.lit(datetime(2026, 1, 1 + i)).alias("timestamp"))
+            for i, d in enumerate(days[:3])
+        ] + [
+            _traded([("2027", 1, 2, 1), ("2028", 1, 5, 6)], league="B").with_columns(
+                pl.lit(d).alias("snapshot_date"), pl.lit(datetime(2026, 2, 1)).alias("timestamp"))
+            for d in days[2:]
+        ], how="vertical_relaxed")
+        overrides = _overrides([("2028", 2, 3, 1)], league="OLD")
+        return traded, overrides, leagues, drafts, days
+
+    def test_matches_per_day_resolution(self):
+        traded, overrides, leagues, drafts, days = self._inputs()
+        batched = mod.resolve_pick_ownership_by_day(traded, overrides, leagues, drafts, days=days)
+        expected = pl.concat([
+            resolve_pick_ownership(traded.filter(pl.col("snapshot_date") == d).drop("snapshot_date"),
+                                   _EMPTY, overrides, leagues, mod._drafts_completed_by(drafts, d))
+            .with_columns(pl.lit(d).alias("snapshot_date"))
+            for d in days
+        ], how="vertical_relaxed").select(batched.columns)
+        key = ["snapshot_date", "league_id", "season", "round", "original_roster_id"]
+        assert batched.height == expected.height
+        assert batched.sort(key).equals(expected.sort(key))
+
+    def test_days_split_at_draft_run_dates(self):
+        _, _, _, drafts, days = self._inputs()
+        groups = mod._draft_cutoff_groups(days, drafts)
+        assert list(groups.values()) == [["2026-05-01"], ["2026-05-09", "2026-05-10"],
+                                         ["2026-05-21", "2026-06-01"]]
+
+
+# --- streamed stint readers ---------------------------------------------------
+class TestStintReaders:
+    DAYS = ["2025-03-01", "2025-03-02", "2025-03-04", "2025-03-05", "2025-03-06"]
+
+    def test_chunked_read_matches_daily_presence(self, local_lake, monkeypatch):
+        rows = [(d, r, p) for i, d in enumerate(self.DAYS) for r in (1, 2) for p in ("10", "11", "12")
+                if (i + r + int(p)) % 3]
+        for d in self.DAYS:
+            day = [r for r in rows if r[0] == d]
+            mod.sink_parquet(
+                pl.LazyFrame({"league_id": ["L1"] * len(day), "roster_id": [r[1] for r in day],
+                              "player_id": [r[2] for r in day]}),
+                f"gs://b/{mod._PLAYER_DAYS_PREFIX}load_date={d}/data.parquet")
+        monkeypatch.setattr(mod, "_STINT_CHUNK_DAYS", 2)
+        lineage = pl.DataFrame({"league_id": ["L1"], "league_lineage_id": ["L1"]})
+        key = ["franchise_id", "player_id"]
+
+        stints, franchise_days = mod._read_player_stints("b", lineage)
+        present = pl.DataFrame({"snapshot_date": [r[0] for r in rows],
+                                "franchise_id": [f"L1_{r[1]}" for r in rows],
+                                "player_id": [r[2] for r in rows]})
+        got = mod.stints_to_intervals(stints, key, franchise_days["snapshot_date"].unique().to_list())
+        expected = mod.build_snapshot_intervals(present, key)
+        assert got.sort(key + ["valid_from"]).equals(expected.sort(key + ["valid_from"]))
+        assert stints.height < present.height
+
+        later, days = mod._read_player_stints("b", lineage, since="2025-03-04")
+        assert sorted(days["snapshot_date"].unique()) == self.DAYS[3:]
+
+    def test_chunks_are_sized_to_the_memory_cap(self, monkeypatch):
+        monkeypatch.setenv("LEDGER_MEMORY_MB", "1")
+        monkeypatch.setattr(mod, "_STINT_CHUNK_DAYS", 4)
+        names = [f"{mod._PLAYER_DAYS_PREFIX}load_date=2025-03-{d:02d}/data.parquet" for d in range(1, 21)]
+        decoded, sizes = [], []
+        for days, chunk in mod._day_chunks(names, decoded):
+            assert len(chunk) == len(days)
+            sizes.append(len(days))
+            decoded.append(len(days) * 100 * 1024)        # 100 KiB per day -> 2 days per 256 KiB
+        assert sizes == [4] + [2] * 8
+
+
+# --- lineage-partitioned full rebuild ------------------------------------------
+class TestLineagePartitions:
+    DAYS = ["2025-03-01", "2025-03-02", "2025-03-03", "2025-03-05", "2025-03-06"]
+    LINEAGES = ["A", "B", "C"]
+
+    def _inputs(self, tmp_path):
+        import random
+        rng = random.Random(7)
+        for d in self.DAYS:
+            rows = [(f"{lin}1", r, f"{lin}{p}") for lin in self.LINEAGES for r in (1, 2)
+                    for p in range(4) if rng.random() < 0.6]
+            mod.sink_parquet(
+                pl.LazyFrame({"league_id": [x[0] for x in rows], "roster_id": [x[1] for x in rows],
+                              "player_id": [x[2] for x in rows]}),
+                f"gs://b/{mod._PLAYER_DAYS_PREFIX}load_date={d}/data.parquet")
+        leagues = pl.DataFrame({"league_id": [f"{lin}1" for lin in self.LINEAGES],
+                                "league_lineage_id": self.LINEAGES, "season": ["2025"] * 3,
+                                "total_rosters": [2] * 3, "status": ["in_season"] * 3})
+        drafts = pl.DataFrame({"draft_id": [f"d{lin}" for lin in self.LINEAGES],
+                               "league_id": [f"{lin}1" for lin in self.LINEAGES],
+                               "season": ["2025"] * 3, "status": ["complete"] * 3, "rounds": [2] * 3,
+                               "start_time": [1736000000000] * 3, "last_picked": [1736000000000] * 3})
+        events = pl.DataFrame([(f"{lin}_{r}", f"{lin}{p}", 1735000000000 + i, "2024-12-24", "add")
+                               for i, (lin, r, p) in enumerate((rng.choice(self.LINEAGES), rng.randint(1, 2),
+                                                                rng.randint(0, 3)) for _ in range(12))],
+                              schema=["franchise_id", "player_id", "ts", "date", "action"], orient="row")
+        trades = pl.DataFrame(schema={"pick_id": pl.Utf8, "prev_franchise": pl.Utf8,
+                                      "new_franchise": pl.Utf8, "ts": pl.Int64, "date": pl.Utf8})
+        return dict(bucket_name="b", leagues_df=leagues,
+                    lineage_map=leagues.select("league_id", "league_lineage_id"),
+                    sources=mod.BronzeSources("b"), events=events, trades=trades,
+                    overrides_df=pl.DataFrame(), drafts_df=drafts,
+                    player_days=self.DAYS, pick_days=[])
+
+    def test_partitions_are_stable_and_cover_every_lineage(self):
+        parts = mod.lineage_partitions(["c", "a", "b", "a"], 2)
+        assert sorted(x for p in parts for x in p) == ["a", "b", "c"]
+        assert parts == mod.lineage_partitions(["b", "c", "a"], 2)
+
+    def test_worker_pool_matches_single_process(self, local_lake, tmp_path, monkeypatch):
+        # later test modules evict this one from sys.modules; pickling _build_part needs it back
+        monkeypatch.setitem(sys.modules, mod.__name__, mod)
+        inputs = self._inputs(tmp_path)
+        one, facts_one = mod._full_ledger_parts(inputs, str(tmp_path), 1)
+        many, facts_many = mod._full_ledger_parts(inputs, str(tmp_path), 3)
+        key = ["asset_type", "franchise_id", "asset_id", "valid_from"]
+        one, many = one.collect().sort(key), many.collect().sort(key)
+        assert one.height and one.equals(many)
+        assert facts_one == facts_many
+        assert len(list(tmp_path.glob("part-*.parquet"))) == len(mod.lineage_partitions(self.LINEAGES, 3))
+
+    def test_workers_read_spooled_snapshots_not_the_lake(self, local_lake, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, mod.__name__, mod)
+        inputs = self._inputs(tmp_path)
+        one, _ = mod._full_ledger_parts(inputs, str(tmp_path), 1)
+        spool, fetched = mod._spool_snapshots, []
+        read = mod.read_objects
+
+        def counted(bucket_name, names, **kwargs):
+            fetched.extend(names)
+            return read(bucket_name, names, **kwargs)
+
+        def spool_then_drop_snapshots(*args):
+            spools = spool(*args)
+            shutil.rmtree(local_lake / "b" / mod._PLAYER_DAYS_PREFIX)     # workers must not need them
+            return spools
+
+        monkeypatch.setattr(mod, "read_objects", counted)
+        monkeypatch.setattr(mod, "_spool_snapshots", spool_then_drop_snapshots)
+        many, _ = mod._full_ledger_parts(inputs, str(tmp_path / "parts"), 3)
+        key = ["asset_type", "franchise_id", "asset_id", "valid_from"]
+        assert one.collect().sort(key).equals(many.collect().sort(key))
+        assert len(fetched) == len(set(fetched)) == len(self.DAYS)
+        assert not list((tmp_path / "parts").glob("spool-*"))
+
+    def test_sources_subset_narrows_through_join_keys(self):
+        src = mod.BronzeSources("b")
+        src._frames[("prefix", "drafts")] = pl.DataFrame({"draft_id": ["d1", "d2"], "league_id": ["A1", "B1"]})
+        src._frames[("prefix", "picks")] = pl.DataFrame({"draft_id": ["d1", "d2", "d2"], "player_id": ["1", "2", "3"]})
+        sub = src.subset(["B1"])
+        assert sub.prefix("picks")["player_id"].to_list() == ["2", "3"]
+        assert sub.prefix("drafts")["league_id"].to_list() == ["B1"] and sub.reads == 0
@@ -0,0 +1,148 @@
+"""silver_fantasy/_intervals.py
+
+Property checks: every operation is compared with the same operation on the day sets the
+intervals stand for, over random interval sets with open ends, touching and overlapping
+intervals.
+"""
+import random
+from datetime import date, timedelta
+
+import polars as pl
+import pytest
+
+from tests.de_loader import load_de_module
+
+mod = load_de_module("silver_fantasy/_intervals.py", "silver_fantasy", "intervals")
+
+START = date(2025, 1, 1)
+H = 30
+DAYS = [(START + timedelta(days=i)).isoformat() for i in range(H)]
+SEEDS = range(12)
+
+
+def _intervals(seed: int, keys: int = 3, n: int = 12) -> pl.DataFrame:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        a = rng.randrange(H - 1)
+        b = None if rng.random() < 0.2 else min(H - 1, a + rng.randint(1, 8))
+        rows.append((i, f"k{rng.randrange(keys)}", DAYS[a], None if b is None else DAYS[b]))
+    return pl.DataFrame(rows, schema=["row", "key", "valid_from", "valid_to"], orient="row")
+
+
+def _days(valid_from, valid_to) -> set[str]:
+    """The grid days ``[valid_from, valid_to)`` holds (open runs to the end of the grid)."""
+    return {d for d in DAYS if d >= valid_from and (valid_to is None or d < valid_to)}
+
+
+def _sweep_order(r: dict) -> tuple:
+    return r["valid_from"], r["valid_to"] or "~", r["row"]
+
+
+def _by(df: pl.DataFrame, col: str) -> dict:
+    out: dict = {}
+    for r in df.iter_rows(named=True):
+        out.setdefault(r[col], set()).update(_days(r["valid_from"], r["valid_to"]))
+    return out
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+class TestIntervalProperties:
+    def test_clip_is_intersection(self, seed):
+        df = _intervals(seed)
+        lo, hi = sorted(random.Random(seed).sample(DAYS, 2))
+        got = mod.clip(df, lo, hi)
+        assert _by(got, "row") == {k: v & _days(lo, hi) for k, v in _by(df, "row").items() if v & _days(lo, hi)}
+        # per-row bounds; a null bound leaves that side alone
+        per_row = df.with_columns(pl.lit(lo).alias("lo"), pl.lit(None, pl.Utf8).alias("hi"))
+        assert _by(mod.clip(per_row, pl.col("lo"), pl.col("hi")), "row") == _by(mod.clip(df, lo), "row")
+        assert mod.clip(df, lo)["valid_to"].null_count() == df["valid_to"].null_count()
+
+    def test_subtract_is_difference(self, seed):
+        df = _intervals(seed)
+        lo, hi = sorted(random.Random(seed).sample(DAYS, 2))
+        windowed = df.with_columns(
+            pl.when(pl.col("key") != "k0").then(pl.lit(lo)).alias("lo"),
+            pl.when(pl.col("key") != "k0").then(pl.lit(hi)).alias("hi"),
+        )
+        got = mod.subtract(windowed, pl.col("lo"), pl.col("hi"))
+        assert (got["valid_to"].is_null() | (got["valid_from"] < got["valid_to"])).all()
+        want = {r["row"]: _days(r["valid_from"], r["valid_to"]) - (set() if r["key"] == "k0" else _days(lo, hi))
+                for r in df.iter_rows(named=True)}
+        assert _by(got, "row") == {k: v for k, v in want.items() if v}
+
+    def test_coalesce_is_union_of_disjoint_islands(self, seed):
+        df = _intervals(seed)
+        got = mod.coalesce(df, ["key"]).sort("key", "valid_from")
+        assert _by(got, "key") == _by(df, "key")
+        for _, g in got.group_by("key"):
+            ends, starts = g["valid_to"].to_list()[:-1], g["valid_from"].to_list()[1:]
+            assert all(e is not None and s > e for e, s in zip(ends, starts))   # not even touching
+        assert _by(mod.union([df.head(5), df.tail(7)], ["key"]), "key") == _by(df, "key")
+
+    def test_coalesce_on_integer_indexes(self, seed):
+        df = _intervals(seed).with_columns(
+            pl.col("valid_from").str.to_date().cast(pl.Int32).alias("f"),
+            pl.col("valid_to").str.to_date().cast(pl.Int32).alias("e"),
+        )
+        got = mod.coalesce(df, ["key"], "f", "e").with_columns(
+            pl.col("f").cast(pl.Date).cast(pl.Utf8).alias("valid_from"),
+            pl.col("e").cast(pl.Date).cast(pl.Utf8).alias("valid_to"))
+        assert _by(got, "key") == _by(df, "key")
+
+    def test_points_in_matches_cross_filter(self, seed):
+        df = _intervals(seed)
+        grid = sorted(random.Random(seed).sample(DAYS, 10))
+        want = (df.join(pl.DataFrame({"date": grid}), how="cross")
+                .filter(mod.covering(pl.col("date"))).select("row", "date").sort("row", "date"))
+        assert mod.points_in(df, grid).select("row", "date").sort("row", "date").equals(want)
+        assert mod.points_in(df.lazy(), grid).collect().height == want.height
+
+    def test_points_in_chunks_stream_the_same_rows(self, seed):
+        df = _intervals(seed)
+        grid = sorted(random.Random(seed).sample(DAYS, 10))
+        chunks = list(mod.points_in_chunks(df, grid, 3))
+        assert len(chunks) == 4
+        for i, c in zip(range(0, 10, 3), chunks):
+            assert set(c["date"]) <= set(grid[i:i + 3])
+        got = pl.concat(chunks).select("row", "date").sort("row", "date")
+        assert got.equals(mod.points_in(df, grid).select("row", "date").sort("row", "date"))
+        assert [c.height for c in mod.points_in_chunks(df, [], 3)] == [0]
+
+    def test_probes_match_day_sets(self, seed):
+        df = _intervals(seed)
+        lo, hi = sorted(random.Random(seed).sample(DAYS, 2))
+        held = _by(df, "row")
+        assert set(df.filter(mod.covering(lo))["row"]) == {k for k, v in held.items() if lo in v}
+        assert set(df.filter(mod.overlapping(lo, hi))["row"]) == {k for k, v in held.items() if v & _days(lo, hi)}
+        assert set(df.filter(mod.overlapping(lo))["row"]) == {k for k, v in held.items() if v & _days(lo, None)}
+
+    def test_overlaps_and_gaps_match_day_sets(self, seed):
+        df = _intervals(seed)
+        flagged = mod.overlaps(df, ["key"], carry="row", carry_as="other_row")
+        rows = df.sort("key", "valid_from").iter_rows(named=True)
+        for r in flagged.iter_rows(named=True):
+            other = df.row(by_predicate=pl.col("row") == r["other_row"], named=True)
+            assert other["key"] == r["key"] and other["valid_from"] <= r["valid_from"]
+            assert r["valid_from"] in _days(other["valid_from"], other["valid_to"])
+        # flagged iff its first day is held by an interval swept before it: (start, end, row)
+        earlier = {r["row"]: any(o["row"] != r["row"] and o["key"] == r["key"]
+                                 and _sweep_order(o) < _sweep_order(r)
+                                 and r["valid_from"] in _days(o["valid_from"], o["valid_to"])
+                                 for o in df.iter_rows(named=True)) for r in rows}
+        assert set(flagged["row"]) == {k for k, v in earlier.items() if v}
+
+        covered, uncovered = _by(df, "key"), _by(mod.gaps(df, ["key"]), "key")
+        for key, days in covered.items():
+            span = {d for d in DAYS if min(days) <= d <= max(days)}
+            assert uncovered.get(key, set()) == span - days
+
+
+class TestCalendarIndex:
+    def test_index_round_trip_and_ceiling(self):
+        cal = DAYS[::3]
+        df = pl.DataFrame({"d": [DAYS[0], DAYS[3], DAYS[4], DAYS[29]]})
+        got = mod.index_on(df, cal, {"d": "i"})
+        assert got["i"].to_list() == [0, 1, 2, 10]      # a non-calendar day maps to the next one
+        back = got.head(2).select(mod.point_at(cal, "i").alias("d"))
+        assert back["d"].to_list() == df["d"].head(2).to_list()
@@ -0,0 +1,110 @@
+"""silver_fantasy/_ledger_changes.py
+
+The change feed between two ledger versions: extending an open interval is no change,
+closing one is a ``close``, rewritten history is ``retract`` + ``open``, and replaying the
+feed onto the old version gives the new one. The job writes one feed per run and bumps the
+version pointer after it.
+"""
+import json
+import random
+import sys
+
+import polars as pl
+
+from tests.de_loader import load_de_module
+from tests.silver_fantasy.ledger_synth import generate, write_lake, write_snapshots
+
+mod = load_de_module("silver_fantasy/_ledger_changes.py", "silver_fantasy", "ledger_changes")
+job = load_de_module("silver_fantasy/fact_roster_membership.py", "silver_fantasy",
+                     "fact_roster_membership")
+
+KEY = ["franchise_id", "asset_type", "asset_id", "valid_from", "valid_to"]
+
+
+def _ledger(rows):
+    # rows: (franchise_id, asset_id, valid_from, valid_to) — players only
+    return pl.DataFrame([(f, "player", a, vf, vt, vt is None) for f, a, vf, vt in rows],
+                        schema=mod.LEDGER_COLS, orient="row")
+
+
+def _changes(prev, new):
+    out = mod.ledger_changes(prev, new).collect()
+    return {(r["change_type"], r["franchise_id"], r["asset_id"], r["valid_from"], r["valid_to"])
+            for r in out.iter_rows(named=True)}
+
+
+def _random_ledger(rng):
+    rows = []
+    for asset in "abcdef":
+        t = rng.randint(1, 4)
+        while t < 20:
+            end = t + rng.randint(1, 6)
+            rows.append((f"L_{rng.randint(1, 3)}", asset, f"2025-01-{t:02d}",
+                         None if end >= 20 else f"2025-01-{end:02d}"))
+            t = end + rng.randint(0, 3)
+    return _ledger(rows)
+
+
+class TestLedgerChanges:
+    def test_first_version_is_all_opens(self):
+        new = _ledger([("L_1", "a", "2025-01-01", None), ("L_2", "b", "2025-01-01", "2025-01-03")])
+        assert {c[0] for c in _changes(None, new)} == {"open"} and len(_changes(None, new)) == 2
+
+    def test_incremental_run_only_reports_what_started_or_ended(self):
+        prev = _ledger([("L_1", "a", "2025-01-01", None), ("L_1", "b", "2025-01-01", None),
+                        ("L_2", "c", "2024-12-01", "2024-12-20")])
+        new = _ledger([("L_1", "a", "2025-01-01", None),                 # still held: no change
+                       ("L_1", "b", "2025-01-01", "2025-01-09"),         # dropped
+                       ("L_2", "b", "2025-01-09", None),                 # picked up
+                       ("L_2", "c", "2024-12-01", "2024-12-20")])
+        assert _changes(prev, new) == {("close", "L_1", "b", "2025-01-01", "2025-01-09"),
+                                       ("open", "L_2", "b", "2025-01-09", None)}
+
+    def test_rewritten_history_is_retracted(self):
+        prev = _ledger([("L_1", "a", "2024-12-01", "2024-12-20"), ("L_2", "a", "2024-12-20", None)])
+        new = _ledger([("L_1", "a", "2024-12-01", "2024-12-15"), ("L_3", "a", "2024-12-15", None)])
+        assert _changes(prev, new) == {("retract", "L_1", "a", "2024-12-01", "2024-12-20"),
+                                       ("retract", "L_2", "a", "2024-12-20", None),
+                                       ("open", "L_1", "a", "2024-12-01", "2024-12-15"),
+                                       ("open", "L_3", "a", "2024-12-15", None)}
+
+    def test_replaying_consecutive_feeds_reproduces_each_version(self):
+        rng = random.Random(4)
+        versions = [_random_ledger(rng) for _ in range(6)]
+        ledger = versions[0]
+        for prev, new in zip(versions, versions[1:]):
+            ledger = mod.apply_ledger_changes(ledger, mod.ledger_changes(prev, new)).collect()
+            assert ledger.sort(KEY, nulls_last=True).equals(new.sort(KEY, nulls_last=True))
+        assert mod.ledger_changes(ledger, ledger).collect().height == 0
+
+
+class TestJobChangeFeed:
+    def test_runs_write_versioned_feeds_that_replay(self, local_lake, monkeypatch):
+        monkeypatch.setitem(sys.modules, job.__name__, job)
+        for k, v in {"GCS_BUCKET_NAME": "b", "LEDGER_WORKERS": "1"}.items():
+            monkeypatch.setenv(k, v)
+        f = generate(lineages=1, seasons=1, rosters=4, roster_size=6, rookie_rounds=2, tx_per_day=2, seed=2)
+        days = f["snapshot_days"]["snapshot_date"].to_list()
+        fact = local_lake / "b/silver/fantasy/fact_roster_membership"
+        versions = []
+        for write in (lambda: write_lake(f, job.sink_parquet, until=days[-10]),
+                      lambda: write_snapshots(f, job.sink_parquet, after=days[-10])):
+            write()
+            for manifest in local_lake.rglob("_manifest.json"):   # re-list the new days
+                manifest.unlink()
+            job.main()
+            versions.append(pl.read_parquet(fact).select(mod.LEDGER_COLS))
+
+        pointer = json.loads((local_lake / "b/silver/fantasy/fact_roster_membership.version.json").read_text())
+        feed = pl.scan_parquet(f"{fact}_changes/**/*.parquet", hive_partitioning=True).collect()
+        assert pointer["version"] == 2 and feed["version"].unique().sort().to_list() == [1, 2]
+        assert pointer["mode"] == "incremental"         # its feed comes from the open intervals
+        assert pointer["run_id"] in feed["run_id"].to_list()
+        assert (feed.filter(pl.col("version") == 1)["change_type"] == "open").all()
+        second = feed.filter(pl.col("version") == 2)
+        assert 0 < second.height < versions[1].height
+        full_diff = mod.ledger_changes(versions[0], versions[1]).collect()
+        cols = ["change_type", *mod.LEDGER_COLS]
+        assert second.select(cols).sort(cols, nulls_last=True).equals(full_diff.sort(cols, nulls_last=True))
+        replayed = mod.apply_ledger_changes(versions[0], second).collect()
+        assert replayed.sort(KEY, nulls_last=True).equals(versions[1].sort(KEY, nulls_last=True))
@@ -0,0 +1,44 @@
+"""silver_fantasy/_ledger_keys.py
+
+The compact ledger must decode back to the stored ledger exactly, and its keys must index
+the dims they came with.
+"""
+import polars as pl
+
+from tests.de_loader import load_de_module
+
+mod = load_de_module("silver_fantasy/_ledger_keys.py", "silver_fantasy", "ledger_keys")
+
+LEDGER = pl.DataFrame(
+    [("L1_1", "player", "4046", "2024-01-01", "2024-03-01", False),
+     ("L1_2", "player", "4046", "2024-03-01", None, True),
+     ("L1_2", "player", "KC", "2024-02-10", None, True),
+     ("L2_10", "player", "4046", "2023-06-01", None, True),
+     ("L1_1", "pick", "2026:1:2", "2024-01-01", None, True),
+     ("L2_10", "pick", "2025:3:10", "2023-06-01", "2025-04-30", False)],
+    schema=mod.LEDGER_COLS, orient="row",
+)
+
+
+class TestLedgerKeys:
+    def test_round_trip(self):
+        compact, franchises, players = mod.encode_ledger(LEDGER)
+        assert compact.schema == pl.Schema(mod.COMPACT_SCHEMA)
+        assert mod.decode_ledger(compact, franchises, players).collect().equals(LEDGER)
+
+    def test_keys_index_sorted_dims_and_picks_are_parsed(self):
+        compact, franchises, players = mod.encode_ledger(LEDGER.lazy())
+        assert franchises["franchise_id"].to_list() == ["L1_1", "L1_2", "L2_10"]
+        assert franchises.row(2) == (2, "L2_10", "L2", 10)
+        assert players["player_id"].to_list() == ["4046", "KC"]
+        assert compact["franchise_key"].to_list() == [0, 1, 1, 2, 0, 2]
+        assert compact["player_key"].to_list() == [0, 0, 1, 0, None, None]
+        picks = compact.filter(pl.col("asset_type") == "pick")
+        assert picks.select("pick_season", "pick_round", "pick_roster").rows() == [(2026, 1, 2), (2025, 3, 10)]
+        assert compact.filter(pl.col("asset_type") == "player")["pick_season"].null_count() == 4
+
+    def test_encode_unknown_id_is_null(self):
+        ids = pl.DataFrame({"player_id": ["KC", "0001", "4046", None]})
+        _, _, players = mod.encode_ledger(LEDGER)
+        got = ids.select(mod.encode("player_id", players["player_id"]).alias("k"))["k"].to_list()
+        assert got == [1, None, 0, None]
@@ -0,0 +1,75 @@
+"""tests/silver_fantasy/ledger_synth.py + bench_roster_ledger.py
+
+The synthetic generator must produce inputs the ledger stages treat as real: rosters keep
+their size day to day, the season gaps are found as rollover windows, and pick resolution
+recovers the simulated owners. The benchmark runs every stage at a toy scale.
+"""
+import polars as pl
+
+from tests.de_loader import load_de_module
+from tests.silver_fantasy.bench_roster_ledger import compare, run
+from tests.silver_fantasy.ledger_synth import generate
+
+mod = load_de_module("silver_fantasy/fact_roster_membership.py", "silver_fantasy",
+                     "fact_roster_membership")
+
+PARAMS = dict(lineages=2, seasons=2, rosters=4, roster_size=8, rookie_rounds=2, tx_per_day=1.5)
+
+
+def _frames():
+    return generate(**PARAMS, seed=11)
+
+
+class TestLedgerSynth:
+    def test_same_seed_same_frames(self):
+        a, b = _frames(), generate(**PARAMS, seed=11)
+        assert all(a[k].equals(b[k]) for k in a)
+        assert not a["transactions"].equals(generate(**PARAMS, seed=12)["transactions"])
+
+    def test_every_snapshot_is_a_full_roster_set(self):
+        f = _frames()
+        per_day = f["roster_players"].group_by("league_id", "load_date").agg(
+            pl.len().alias("n"), pl.col("player_id").n_unique().alias("u"))
+        assert (per_day["n"] == 4 * 8).all() and (per_day["u"] == per_day["n"]).all()
+        assert per_day["load_date"].n_unique() == f["snapshot_days"].height
+
+    def test_season_gaps_are_rollover_windows(self):
+        f = _frames()
+        leagues = f["leagues"]
+        lineage_map = leagues.select("league_id", "league_lineage_id")
+        present = mod._lineage_franchise(f["roster_players"].rename({"load_date": "snapshot_date"}),
+                                         lineage_map)
+        key = ["franchise_id", "player_id"]
+        stints = mod.presence_to_stints(present.select(*key, "snapshot_date"), key)
+        txns = f["transactions"]
+        _, windows = mod.rollover_holdings(
+            stints, present.select("franchise_id", "snapshot_date").unique(), leagues,
+            f["drafts"], f["draft_picks"], f["transaction_players"], txns)
+        assert sorted(w[1] for w in windows) == ["2024-05-01", "2024-05-01"]
+
+    def test_pick_resolution_recovers_simulated_owners(self):
+        f = _frames()
+        last = f["snapshot_days"]["snapshot_date"].max()
+        resolved = mod.resolve_pick_ownership(
+            f["traded_picks"].filter(pl.col("load_date") == last), f["txn_draft_picks"],
+            pl.DataFrame(), f["leagues"], f["drafts"])
+        # 2 lineages x 3 future seasons x 2 rounds x 4 rosters
+        assert resolved.height == 2 * 3 * 2 * 4
+        traded = resolved.filter(pl.col("owner_roster_id") != pl.col("original_roster_id"))
+        assert traded.height > 0
+        snap = (f["traded_picks"].filter(pl.col("load_date") == last)
+                .select("league_id", "season", "round", "original_roster_id", "owner_roster_id"))
+        assert traded.sort(snap.columns).equals(snap.sort(snap.columns))
+
+
+class TestBench:
+    def test_every_stage_is_timed_and_recorded(self, tmp_path, monkeypatch):
+        import tests.silver_fantasy.bench_roster_ledger as bench
+        monkeypatch.setitem(bench.SCALES, "toy", PARAMS)
+        results = tmp_path / "bench.jsonl"
+        records = run(["toy"], results=results)
+        stages = [r["stage"] for r in records]
+        assert stages[0] == "player_events" and "rollover_repair" in stages
+        assert all(r["seconds"] >= 0 and r["peak_rss_mb"] > 0 for r in records)
+        run(["toy"], results=results)
+        assert compare(results=results)["ratio"].null_count() == 0
@@ -0,0 +1,132 @@
+"""silver_fantasy/_ownership_index.py
+
+Binary-searched as-of ownership lookups over the SCD2 ledger. Every query is checked
+against the interval filter it replaces (``valid_from <= D < valid_to``).
+"""
+import json
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from tests.de_loader import load_de_module
+
+mod = load_de_module("silver_fantasy/_ownership_index.py", "silver_fantasy", "ownership_index")
+OwnershipIndex = mod.OwnershipIndex
+
+START = date(2025, 1, 1)
+DAYS = [(START + timedelta(days=i)).isoformat() for i in range(40)]
+
+
+def _ledger(seed=3):
+    """Disjoint intervals per (asset, lineage); players are shared across lineages."""
+    rng = random.Random(seed)
+    rows = []
+    assets = [("player", str(p)) for p in range(8)] + [("pick", f"2026:{r}:A_{r}") for r in (1, 2)]
+    for lin in ("A", "B", "AB"):
+        for atype, aid in assets:
+            t = rng.randint(0, 5)
+            while t < 38:
+                end = t + rng.randint(1, 9)
+                open_ = end >= 38
+                if rng.random() < 0.8:
+                    rows.append((f"{lin}_{rng.randint(1, 3)}", atype, aid, DAYS[t],
+                                 None if open_ else DAYS[min(end, 39)], open_))
+                t = end + rng.randint(0, 3)
+    return pl.DataFrame(rows, schema=["franchise_id", "asset_type", "asset_id", "valid_from",
+                                      "valid_to", "is_current"], orient="row")
+
+
+def _held(ledger, day):
+    return ledger.filter((pl.col("valid_from") <= day)
+                         & (pl.col("valid_to").is_null() | (pl.col("valid_to") > day)))
+
+
+@pytest.fixture(scope="module")
+def ledger():
+    return _ledger()
+
+
+@pytest.fixture(scope="module")
+def index(ledger):
+    return OwnershipIndex.build(ledger)
+
+
+class TestOwnershipIndex:
+    def test_holder_matches_interval_filter(self, ledger, index):
+        for day in DAYS[::3]:
+            held = _held(ledger, day).with_columns(
+                pl.col("franchise_id").str.replace(r"_[^_]*$", "").alias("lin"))
+            want = {(r["asset_type"], r["asset_id"], r["lin"]): r["franchise_id"]
+                    for r in held.iter_rows(named=True)}
+            for atype, aid in ledger.select("asset_type", "asset_id").unique().iter_rows():
+                for lin in ("A", "B", "AB", "Z"):
+                    assert index.holder(atype, aid, day, lin) == want.get((atype, aid, lin))
+                assert sorted(index.holders(atype, aid, day)) == sorted(
+                    v for (t, a, _), v in want.items() if (t, a) == (atype, aid))
+
+    def test_roster_and_rosters_on_match_interval_filter(self, ledger, index):
+        for day in DAYS[::4]:
+            held = _held(ledger, day)
+            for fid in ("A_1", "AB_2", "B_3", "C_1"):
+                want = held.filter(pl.col("franchise_id") == fid)
+                assert sorted(index.roster(fid, date.fromisoformat(day))) == sorted(
+                    want.select("asset_type", "asset_id").iter_rows())
+            key = ["franchise_id", "asset_type", "asset_id"]
+            assert index.rosters_on(day).sort(key).equals(held.select(key).sort(key))
+            # "A" must not pick up the "AB" lineage's franchises
+            assert index.rosters_on(day, "A").sort(key).equals(
+                held.filter(pl.col("franchise_id").str.starts_with("A_")).select(key).sort(key))
+
+    def test_bulk_lookup_matches_scalar(self, ledger, index):
+        rng = random.Random(5)
+        q = pl.DataFrame([(t, a, rng.choice(["A", "B", "AB", "Z"]), rng.choice(DAYS))
+                          for t, a in ledger.select("asset_type", "asset_id").rows() * 3],
+                         schema=["asset_type", "asset_id", "lineage_id", "date"], orient="row")
+        got = index.holders_at(q)
+        assert got["franchise_id"].to_list() == [
+            index.holder(t, a, d, lin) for t, a, lin, d in q.rows()]
+        assert got["franchise_id"].null_count() < got.height
+
+    def test_history_is_the_assets_intervals(self, ledger, index):
+        hist = index.history("player", "3")
+        want = (ledger.filter((pl.col("asset_type") == "player") & (pl.col("asset_id") == "3"))
+                .select("franchise_id", pl.col("valid_from").str.to_date(),
+                        pl.col("valid_to").str.to_date()).sort("valid_from", "franchise_id"))
+        assert hist.select(want.columns).equals(want)
+        assert index.history("player", "3", "B")["franchise_id"].str.starts_with("B_").all()
+        assert index.history("player", "nope").height == 0
+
+    def test_saved_index_is_memory_mapped(self, ledger, index, tmp_path):
+        index.save(tmp_path / "idx")
+        loaded = OwnershipIndex.load(tmp_path / "idx")
+        assert isinstance(loaded.a_key, np.memmap) and len(loaded) == ledger.height
+        q = ledger.select("asset_type", "asset_id",
+                          pl.col("franchise_id").str.replace(r"_[^_]*$", "").alias("lineage_id"),
+                          pl.col("valid_from").alias("date"))
+        assert loaded.holders_at(q)["franchise_id"].equals(index.holders_at(q)["franchise_id"])
+        meta = tmp_path / "idx" / "meta.json"
+        meta.write_text(json.dumps({"version": 0}))
+        with pytest.raises(ValueError, match="rebuild"):
+            OwnershipIndex.load(tmp_path / "idx")
+
+    def test_resave_keeps_mapped_index_and_records_source(self, ledger, index, tmp_path):
+        index.save(tmp_path / "idx", source=[["ledger.parquet", 1]])
+        mapped = OwnershipIndex.load(tmp_path / "idx")
+        before = mapped.rosters_on(DAYS[10])
+        OwnershipIndex.build(ledger.head(5)).save(tmp_path / "idx", source=[["ledger.parquet", 2]])
+        assert mapped.rosters_on(DAYS[10]).equals(before)          # old mapping still readable
+        assert len(OwnershipIndex.load(tmp_path / "idx")) == 5
+        assert OwnershipIndex.saved_source(tmp_path / "idx") == [["ledger.parquet", 2]]
+        assert OwnershipIndex.saved_source(tmp_path / "none") is None
+        assert not list((tmp_path / "idx").glob("*.tmp"))
+
+    def test_empty_ledger(self, ledger):
+        idx = OwnershipIndex.build(ledger.clear())
+        assert idx.holder("player", "1", DAYS[0], "A") is None and idx.roster("A_1", DAYS[0]) == []
+        assert idx.rosters_on(DAYS[0]).height == 0
+        q = pl.DataFrame({"asset_type": ["player"], "asset_id": ["1"], "lineage_id": ["A"],
+                          "date": [DAYS[0]]})
+        assert idx.holders_at(q)["franchise_id"].to_list() == [None]
@@ -1,11 +1,21 @@
 """silver_fantasy/fact_roster_membership.py — SCD2 ledger builders.
 
 Covers build_snapshot_intervals: collapsing per-day presence into [valid_from,
-valid_to) holding stints via gaps-and-islands (handles gaps + is_current).
+valid_to) holding stints via gaps-and-islands (handles gaps + is_current), the
+run-length stints the readers stream into, the rollover replay, and the incremental
+maintenance that extends a ledger past its high-water mark (reading only the event
+partitions that moved, and rebuilding on a late one), and the interval-level validator
+(checked against a day-by-day count).
 """
+import json
+import random
+import sys
+from datetime import date, datetime, timedelta, timezone
+
 import polars as pl
 
 from tests.de_loader import load_de_module
+from tests.silver_fantasy.ledger_synth import generate, write_lake, write_snapshots
 
 mod = load_de_module(
     "silver_fantasy/fact_roster_membership.py", "silver_fantasy", "fact_roster_membership"
@@ -228,3 +238,319 @@ class TestReconstructPickIntervals:
         end = {r["franchise_id"]: r["valid_to"] for r in out.to_dicts()}
         assert end["1061_1"] == "2024-05-02"
         assert end["1131_1"] == "2024-06-28"
+
+
+class TestIncrementalLedger:
+    DAYS = [f"2025-01-{d:02d}" for d in range(1, 13)]
+
+    def _random_presence(self, seed):
+        rng = random.Random(seed)
+        rows = [(d, r, p) for d in self.DAYS for r in (1, 2) for p in ("a", "b", "c", "d")
+                if rng.random() < 0.6]
+        return _present(rows).with_columns(pl.col("roster_id").cast(pl.Int64))
+
+    def _sorted(self, df):
+        return df.sort(KEY + ["valid_from"]).to_dicts()
+
+    def test_extension_matches_full_rebuild(self):
+        for seed in range(20):
+            present = self._random_presence(seed)
+            full = build_snapshot_intervals(present, KEY)
+            for hwm in self.DAYS[2:-1]:
+                old = build_snapshot_intervals(present.filter(pl.col("snapshot_date") <= hwm), KEY)
+                new = present.filter(pl.col("snapshot_date") > hwm)
+                inc = mod.extend_snapshot_intervals(old, new, KEY, hwm)
+                assert self._sorted(inc) == self._sorted(full), (seed, hwm)
+
+    def test_no_new_days_is_a_noop(self):
+        old = build_snapshot_intervals(self._random_presence(1), KEY)
+        assert mod.extend_snapshot_intervals(old, old.clear().select(KEY).with_columns(
+            pl.lit("x").alias("snapshot_date")), KEY, "2025-01-12") is old
+
+    def test_fingerprint_ignores_row_and_column_order(self):
+        df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        fp = mod.frame_fingerprint(df, None)
+        assert fp == mod.frame_fingerprint(df.reverse().select("b", "a"), None)
+        assert fp != mod.frame_fingerprint(df.head(2), None)
+        assert fp != mod.frame_fingerprint(None, df)
+
+    def test_rollover_gap_after_high_water_mark_is_detected(self):
+        new = pl.DataFrame({"franchise_id": ["100_1", "200_3"],
+                            "player_id": ["p", "q"],
+                            "snapshot_date": ["2025-05-10", "2025-05-02"]})
+        last = {"100": "2025-05-01", "200": "2025-05-01"}
+        assert mod.rollover_lineages(new, last) == ["100"]
+        assert mod.lineage_snapshot_days(new) == {"100": "2025-05-10", "200": "2025-05-02"}
+
+
+class TestLateEvents:
+    LEDGER_COLS = ["franchise_id", "asset_type", "asset_id", "valid_from", "valid_to", "is_current"]
+
+    @staticmethod
+    def _noon_ms(day: str) -> int:
+        return int(datetime.fromisoformat(day).replace(hour=12, tzinfo=timezone.utc).timestamp() * 1000)
+
+    def _run(self, lake):
+        for manifest in lake.rglob("_manifest.json"):       # re-list what the test rewrote
+            manifest.unlink()
+        mod.main()
+        pointer = json.loads((lake / "b/silver/fantasy/fact_roster_membership.version.json").read_text())
+        ledger = pl.read_parquet(lake / "b/silver/fantasy/fact_roster_membership").select(self.LEDGER_COLS)
+        return pointer["mode"], ledger.sort(self.LEDGER_COLS, nulls_last=True)
+
+    def _add_move(self, lake, league: str, txn: str, day: str, player: str) -> None:
+        """Rewrite the league's daily partitions with one more complete add, as the daily
+        ingestion's merge does."""
+        for table, row in (("transactions", {"transaction_id": txn, "league_id": league, "type": "free_agent",
+                                             "status": "complete", "created": self._noon_ms(day)}),
+                           ("transaction_players", {"transaction_id": txn, "league_id": league,
+                                                    "player_id": player, "roster_id": 1, "action": "add"})):
+            uri = f"gs://b/bronze/sleeper/transactions/{table}/daily/league_id={league}/data.parquet"
+            old = pl.read_parquet(mod.resolve(uri))
+            mod.sink_parquet(pl.concat([old, pl.DataFrame([row], schema=old.schema)]).lazy(), uri)
+
+    def test_only_moved_partitions_are_read_and_a_late_move_rebuilds(self, local_lake, monkeypatch):
+        monkeypatch.setitem(sys.modules, mod.__name__, mod)
+        for k, v in {"GCS_BUCKET_NAME": "b", "LEDGER_WORKERS": "1"}.items():
+            monkeypatch.setenv(k, v)
+        read, real = [], mod._read_daily_events
+        monkeypatch.setattr(mod, "_read_daily_events", lambda b, names: read.append(names) or real(b, names))
+        f = generate(lineages=2, seasons=1, rosters=4, roster_size=6, rookie_rounds=2, tx_per_day=2, seed=3)
+        days = f["snapshot_days"]["snapshot_date"].to_list()
+        league = f["leagues"]["league_id"][0]
+        write_lake(f, mod.sink_parquet, by_league=True, until=days[-10])
+        assert self._run(local_lake)[0] == "full"
+
+        write_snapshots(f, mod.sink_parquet, after=days[-10])
+        assert self._run(local_lake)[0] == "incremental" and read == []
+
+        # a move after everything known, dated past the high-water mark: only its league is read
+        after = (date.fromisoformat(days[-1]) + timedelta(days=1)).isoformat()
+        self._add_move(local_lake, league, "new-1", after, "p-new")
+        assert self._run(local_lake)[0] == "incremental"
+        assert len(read) == 1 and len(read[0]) == 3 and all(f"league_id={league}/" in n for n in read[0])
+
+        # a move dated inside closed history arrives late
+        self._add_move(local_lake, league, "late-1", days[5], "p-late")
+        mode, ledger = self._run(local_lake)
+        monkeypatch.setenv("LEDGER_FULL_REBUILD", "1")
+        assert mode == "full" and ledger.equals(self._run(local_lake)[1])
+
+
+class TestStints:
+    DAYS = [f"2025-01-{d:02d}" for d in range(1, 13)]
+    KEY = ["franchise_id", "player_id"]
+
+    def _presence(self, seed, lineages=("L",)):
+        rng = random.Random(seed)
+        rows = [(d, f"{lin}_{r}", p) for d in self.DAYS for lin in lineages for r in (1, 2)
+                for p in "abc" if rng.random() < 0.6]
+        return pl.DataFrame({"snapshot_date": [r[0] for r in rows], "franchise_id": [r[1] for r in rows],
+                             "player_id": [r[2] for r in rows]})
+
+    def _sorted(self, df):
+        return df.sort(self.KEY + ["valid_from"]).to_dicts()
+
+    def test_chunked_append_matches_one_pass(self):
+        for seed in range(20):
+            present = self._presence(seed)
+            cuts = sorted(random.Random(seed).sample(range(1, len(self.DAYS)), 3))
+            stints = mod.presence_to_stints(present.clear(), self.KEY)
+            for lo, hi in zip([0, *cuts], [*cuts, len(self.DAYS)]):
+                chunk = present.filter(pl.col("snapshot_date").is_in(self.DAYS[lo:hi]))
+                stints = mod.append_stints(stints, mod.presence_to_stints(chunk, self.KEY), self.KEY)
+            days = present["snapshot_date"].unique().to_list()
+            assert self._sorted(mod.stints_to_intervals(stints, self.KEY, days)) == \
+                self._sorted(build_snapshot_intervals(present, self.KEY)), seed
+
+    def test_coalesce_merges_overlapping_and_adjacent(self):
+        stints = pl.DataFrame({"franchise_id": ["L_1"] * 4, "player_id": ["a"] * 4,
+                               "first_date": ["2025-01-01", "2025-01-03", "2025-01-04", "2025-01-09"],
+                               "last_date": ["2025-01-03", "2025-01-03", "2025-01-06", "2025-01-10"]})
+        out = mod.coalesce_stints(stints, self.KEY, self.DAYS).sort("first_date")
+        assert out.select("first_date", "last_date").rows() == [
+            ("2025-01-01", "2025-01-06"), ("2025-01-09", "2025-01-10")]
+
+    def test_rollover_matches_daily_replacement(self):
+        R, S = "2025-01-04", "2025-01-09"
+        for seed in range(20):
+            rng = random.Random(seed)
+            present = self._presence(seed, lineages=("L", "M"))
+            held = pl.DataFrame([(f"L_{rng.randint(1, 2)}", rng.choice("abcd"), vf, vt)
+                                 for vf, vt in (sorted(rng.sample(self.DAYS[3:9], 2)) for _ in range(4))],
+                                schema=self.KEY + ["valid_from", "valid_to"], orient="row")
+            stints, days = mod._apply_rollover(
+                mod.presence_to_stints(present, self.KEY), present["snapshot_date"].unique().to_list(),
+                held, [("L_", R, S)], self.KEY)
+            daily = pl.concat([
+                present.filter(~(pl.col("franchise_id").str.starts_with("L_")
+                                 & (pl.col("snapshot_date") >= R) & (pl.col("snapshot_date") < S))),
+                pl.DataFrame([(str(d), f, p) for f, p, vf, vt in held.iter_rows() for d in _days_between(vf, vt)],
+                             schema=["snapshot_date", "franchise_id", "player_id"], orient="row"),
+            ]).unique()
+            assert self._sorted(mod.stints_to_intervals(stints, self.KEY, days)) == \
+                self._sorted(build_snapshot_intervals(daily, self.KEY)), seed
+
+
+def _days_between(start, end):
+    from datetime import date, timedelta
+    d, end = date.fromisoformat(start), date.fromisoformat(end)
+    while d < end:
+        yield d
+        d += timedelta(days=1)
+
+
+def _day_loop_rollover(present, last_old, s_new, events):
+    """Reference replay: walk [R, S_new) day by day applying (ts, drop-before-add) events."""
+    from datetime import date, timedelta
+    R = min([e[0] for e in events], default=None) or str(date.fromisoformat(last_old) + timedelta(days=1))
+    prior = [r for r in present if r[0] < R]
+    if R >= s_new or not prior:
+        return set()
+    carry_day = max(r[0] for r in prior)
+    roster = {(f, p) for d, f, p in prior if d == carry_day}
+    out, d = set(), date.fromisoformat(R)
+    while str(d) < s_new:
+        for _, _, rid, pid, action in sorted((e for e in events if e[0] == str(d)),
+                                             key=lambda e: (e[1], e[4] == "add")):
+            (roster.add if action == "add" else roster.discard)((f"L_{rid}", pid))
+        out |= {(str(d), f, p) for f, p in roster}
+        d += timedelta(days=1)
+    return out
+
+
+class TestRolloverHoldings:
+    LEAGUES = pl.DataFrame({"league_lineage_id": ["L", "L"], "league_id": ["L", "N"],
+                            "season": ["2024", "2025"]})
+    NO_DRAFTS = pl.DataFrame(schema={"league_id": pl.Utf8, "draft_id": pl.Utf8, "start_time": pl.Int64})
+    NO_PICKS = pl.DataFrame(schema={"draft_id": pl.Utf8, "roster_id": pl.Int64, "player_id": pl.Utf8})
+
+    @staticmethod
+    def _ms(day, minute):
+        from datetime import datetime, timezone
+        return int(datetime.fromisoformat(day).replace(tzinfo=timezone.utc).timestamp() * 1000) + minute * 60_000
+
+    def _run(self, present, events):
+        # events: (day, minute, roster_id, player_id, action) on the new league
+        tp = pl.DataFrame({"league_id": ["N"] * len(events), "transaction_id": [str(i) for i in range(len(events))],
+                           "roster_id": [e[2] for e in events], "player_id": [e[3] for e in events],
+                           "action": [e[4] for e in events]},
+                          schema={"league_id": pl.Utf8, "transaction_id": pl.Utf8, "roster_id": pl.Int64,
+                                  "player_id": pl.Utf8, "action": pl.Utf8})
+        tx = pl.DataFrame({"transaction_id": tp["transaction_id"], "status": ["complete"] * len(events),
+                           "created": [self._ms(e[0], e[1]) for e in events]},
+                          schema={"transaction_id": pl.Utf8, "status": pl.Utf8, "created": pl.Int64})
+        pres = pl.DataFrame({"snapshot_date": [r[0] for r in present], "franchise_id": [r[1] for r in present],
+                             "player_id": [r[2] for r in present]})
+        stints = mod.presence_to_stints(pres, ["franchise_id", "player_id"])
+        fdays = pres.select("franchise_id", "snapshot_date").unique()
+        holdings, windows = mod.rollover_holdings(stints, fdays, self.LEAGUES, self.NO_DRAFTS,
+                                                  self.NO_PICKS, tp, tx)
+        return {(str(d), f, p) for f, p, vf, vt in holdings.iter_rows()
+                for d in _days_between(vf, vt)}, windows
+
+    def test_same_day_round_trip_nets_out(self):
+        present = [("2025-01-05", "L_1", "a"), ("2025-01-05", "L_1", "b"),
+                   ("2025-01-20", "L_1", "a")]
+        events = [("2025-01-08", 10, 1, "c", "add"), ("2025-01-08", 20, 1, "c", "drop"),
+                  ("2025-01-10", 5, 1, "b", "drop"), ("2025-01-10", 5, 2, "b", "add")]
+        got, windows = self._run(present, events)
+        assert windows == [("L_", "2025-01-08", "2025-01-20")]
+        assert got == _day_loop_rollover(present, "2025-01-05", "2025-01-20", events)
+        assert ("2025-01-08", "L_1", "c") not in got
+        assert ("2025-01-10", "L_2", "b") in got and ("2025-01-10", "L_1", "b") not in got
+
+    def test_matches_day_loop_on_random_offseasons(self):
+        for seed in range(25):
+            rng = random.Random(seed)
+            present = [(f"2025-01-{d:02d}", f"L_{r}", p) for d in (1, 2, 3) for r in (1, 2)
+                       for p in "abcd" if rng.random() < 0.5]
+            present += [("2025-01-25", "L_1", "a")]
+            events = [(f"2025-01-{rng.randint(4, 26):02d}", rng.randint(0, 3), rng.randint(1, 2),
+                       rng.choice("abcdef"), rng.choice(["add", "drop"])) for _ in range(rng.randint(0, 12))]
+            got, _ = self._run(present, events)
+            last_old = max(r[0] for r in present if r[0] < "2025-01-25")
+            assert got == _day_loop_rollover(present, last_old, "2025-01-25", events), seed
+
+
+def _ledger(rows):
+    # rows: (franchise_id, asset_type, asset_id, valid_from, valid_to)
+    return pl.DataFrame([(*r, r[4] is None) for r in rows], orient="row",
+                        schema=mod._LEDGER_COLS)
+
+
+class TestValidateLedger:
+    LEAGUES = pl.DataFrame({"league_lineage_id": ["L"], "season": ["2025"], "total_rosters": [2]})
+
+    def _reasons(self, rows, lifecycle=None):
+        out = mod.validate_ledger(_ledger(rows), self.LEAGUES, lifecycle)
+        return {(r["quarantine_reason"], r["asset_id"], r["valid_from"], r["valid_to"])
+                for r in out.to_dicts()}, out
+
+    def test_clean_ledger_has_no_violations(self):
+        rows = [("L_1", "player", "a", "2025-01-01", "2025-01-05"),
+                ("L_1", "player", "a", "2025-01-05", None),        # boundary split, same holder
+                ("L_2", "player", "b", "2025-01-01", "2025-01-03"),
+                ("L_1", "player", "b", "2025-01-09", None),        # players may sit in free agency
+                ("M_1", "player", "a", "2025-01-02", None),        # another lineage's copy
+                ("L_1", "pick", "2026:1:1", "2025-01-01", "2025-02-01"),
+                ("L_2", "pick", "2026:1:1", "2025-02-01", "2025-05-01"),
+                ("L_2", "pick", "2026:1:2", "2025-01-01", "2025-05-01")]
+        lc = _lifecycle([("L_1", "2026:1:1", 0, "2025-01-01", "2025-05-01"),
+                         ("L_2", "2026:1:2", 0, "2025-01-01", "2025-05-01")])
+        got, out = self._reasons(rows, lc)
+        assert got == set() and out.columns == mod._INTERVAL_QUARANTINE_COLS
+
+    def test_overlap_and_zero_length(self):
+        got, out = self._reasons([("L_1", "player", "a", "2025-01-01", "2025-01-10"),
+                                  ("L_2", "player", "a", "2025-01-04", "2025-01-06"),
+                                  ("L_3", "player", "a", "2025-01-08", None),
+                                  ("L_1", "player", "c", "2025-01-03", "2025-01-03")])
+        assert got == {("overlap", "a", "2025-01-04", "2025-01-06"),
+                       ("overlap", "a", "2025-01-08", None),
+                       ("zero_length", "c", "2025-01-03", "2025-01-03")}
+        # both overlaps are against L_1's long interval, not the interval just before
+        assert set(out.filter(pl.col("quarantine_reason") == "overlap")["other_franchise_id"]) == {"L_1"}
+
+    def test_pick_gap_and_pick_after_consume(self):
+        rows = [("L_1", "pick", "2026:1:1", "2025-01-01", "2025-02-01"),
+                ("L_2", "pick", "2026:1:1", "2025-02-10", None),
+                ("L_2", "pick", "2026:1:2", "2025-01-01", None)]
+        lc = _lifecycle([("L_1", "2026:1:1", 0, "2025-01-01", "2025-05-01"),
+                         ("L_2", "2026:1:2", 0, "2025-01-01", "2025-05-01")])
+        got, _ = self._reasons(rows, lc)
+        assert got == {("pick_gap", "2026:1:1", "2025-02-01", "2025-02-10"),
+                       ("pick_count", "2026:1", "2025-02-01", "2025-02-10"),
+                       ("pick_after_consume", "2026:1:1", "2025-02-10", None),
+                       ("pick_after_consume", "2026:1:2", "2025-01-01", None)}
+
+    def test_pick_count_follows_a_resized_league(self):
+        # 10 teams through 2025, 12 from 2026: each pick class is held to its own season's size
+        leagues = pl.DataFrame({"league_lineage_id": ["L", "L", "L"], "season": ["2024", "2025", "2026"],
+                                "total_rosters": [10, 10, 12]})
+        rows = [(f"L_{r}", "pick", f"{season}:1:{r}", "2025-01-01", "2025-06-01")
+                for season, teams in (("2025", 10), ("2026", 12), ("2027", 12)) for r in range(1, teams + 1)]
+        assert mod.validate_ledger(_ledger(rows), leagues).height == 0
+        short = [r for r in rows if r[2] != "2026:1:12"]
+        got = mod.validate_ledger(_ledger(short), leagues)
+        assert got.select("asset_id", "detail").rows() == [("2026:1", "11 live picks, expected 12")]
+
+    def test_pick_count_matches_daily_expansion(self):
+        for seed in range(10):
+            rng = random.Random(seed)
+            rows = []
+            for roster in (1, 2, 3):
+                t = rng.randint(0, 3)
+                while t < 25:
+                    end = t + rng.randint(1, 8)
+                    rows.append((f"L_{rng.randint(1, 2)}", "pick", f"2026:1:{roster}",
+                                 f"2025-01-{t + 1:02d}", f"2025-01-{min(end, 28) + 1:02d}"))
+                    t = end + rng.randint(-2, 2)
+            out = mod.validate_ledger(_ledger(rows), self.LEAGUES)
+            flagged = {d for r in out.filter(pl.col("quarantine_reason") == "pick_count").iter_rows(named=True)
+                       for d in _days_between(r["valid_from"], r["valid_to"])}
+            live = {}
+            for _, _, _, vf, vt in rows:
+                for d in _days_between(vf, vt):
+                    live[d] = live.get(d, 0) + 1
+            assert flagged == {d for d, n in live.items() if n != 2}, seed
@@ -1,6 +1,4 @@
 """silver_fantasy/utils.py: get_latest_bronze_path + merge_full_and_incremental."""
-import types
-
 import polars as pl
 import pytest
 
@@ -11,57 +9,47 @@ get_latest_bronze_path = mod.get_latest_bronze_path
 merge_full_and_incremental = mod.merge_full_and_incremental
 
 
-class _Blob:
-    def __init__(self, name):
-        self.name = name
-
-
-def _fake_storage(blob_names):
-    """Build a fake google.cloud.storage.Client returning the given blob names."""
-    class _Bucket:
-        def list_blobs(self, prefix=None):
-            return [_Blob(n) for n in blob_names]
-
-    class _Client:
-        def bucket(self, name):
-            return _Bucket()
-
-    stub = types.SimpleNamespace(Client=_Client)
-    return stub
+def _seed(fake_gcs, bucket, blob_names):
+    """Put the given object names into the fake bucket (parquet as frames, the rest as bytes)."""
+    for n in blob_names:
+        key = f"gs://{bucket}/{n}"
+        if n.endswith(".parquet"):
+            fake_gcs[key] = pl.DataFrame({"x": [1]})
+        else:
+            fake_gcs.gcs.put(key, b"")
 
 
 class TestGetLatestBronzePath:
-    def test_picks_most_recent_load_date(self, monkeypatch):
+    def test_picks_most_recent_load_date(self, fake_gcs):
         names = [
             "bronze/sleeper/league/leagues/full_load/load_date=2024-01-01/data.parquet",
             "bronze/sleeper/league/leagues/full_load/load_date=2024-03-15/data.parquet",
             "bronze/sleeper/league/leagues/full_load/load_date=2024-02-10/data.parquet",
         ]
-        monkeypatch.setattr(mod, "storage", _fake_storage(names))
+        _seed(fake_gcs, "nfl-data-bronze", names)
         path = get_latest_bronze_path("nfl-data-bronze", "league/leagues/full_load")
         assert path == (
             "gs://nfl-data-bronze/bronze/sleeper/league/leagues/full_load/"
             "load_date=2024-03-15/data.parquet"
         )
 
-    def test_ignores_non_parquet_and_non_partitioned_blobs(self, monkeypatch):
+    def test_ignores_non_parquet_and_non_partitioned_blobs(self, fake_gcs):
         names = [
             "bronze/sleeper/league/leagues/full_load/load_date=2024-01-01/data.parquet",
             "bronze/sleeper/league/leagues/full_load/_SUCCESS",
             "bronze/sleeper/league/leagues/full_load/load_date=2024-05-01/data.json",
         ]
-        monkeypatch.setattr(mod, "storage", _fake_storage(names))
+        _seed(fake_gcs, "b", names)
         path = get_latest_bronze_path("b", "league/leagues/full_load")
         assert "load_date=2024-01-01" in path
 
-    def test_raises_when_no_data(self, monkeypatch):
-        monkeypatch.setattr(mod, "storage", _fake_storage([]))
+    def test_raises_when_no_data(self, fake_gcs):
         with pytest.raises(ValueError):
             get_latest_bronze_path("b", "league/leagues/full_load")
 
-    def test_source_segment_is_used(self, monkeypatch):
+    def test_source_segment_is_used(self, fake_gcs):
         names = ["bronze/nflverse/players/load_date=2024-01-01/data.parquet"]
-        monkeypatch.setattr(mod, "storage", _fake_storage(names))
+        _seed(fake_gcs, "b", names)
         path = get_latest_bronze_path("b", "players", source="nflverse")
         assert "/bronze/nflverse/players/" in path
 
@@ -93,3 +81,13 @@ class TestMergeFullAndIncremental:
         row = out.to_dicts()[0]
         assert row["val"] == 99
         assert row["league_lineage_id"] == "ROOT"
+
+
+def test_latest_bronze_path_on_local_lake(local_lake):
+    lake_io = load_de_module("silver_fantasy/lake_io.py", "silver_fantasy", "lake_io")
+    for d in ("2024-01-01", "2024-02-01"):
+        lake_io.write_bronze(pl.DataFrame({"league_id": [d]}),
+                             f"gs://b/bronze/sleeper/league/leagues/full_load/load_date={d}/data.parquet")
+    path = get_latest_bronze_path("b", "league/leagues/full_load")
+    assert path.startswith(str(local_lake))
+    assert pl.read_parquet(path)["league_id"].to_list() == ["2024-02-01"]
@@ -0,0 +1,143 @@
+"""silver_fantasy/_value_cube.py
+
+The cube's rows must be the valuation done the slow way (filter the ledger per date, take
+each asset's last value on or before it), and an incrementally updated cube must equal one
+built from scratch on the same ledger, grid and values.
+"""
+import random
+from datetime import date, timedelta
+
+import polars as pl
+import pytest
+
+from tests.de_loader import load_de_module
+
+mod = load_de_module("silver_fantasy/_value_cube.py", "silver_fantasy", "value_cube")
+changes_mod = load_de_module("silver_fantasy/_ledger_changes.py", "silver_fantasy", "ledger_changes")
+ValueCube = mod.ValueCube
+
+START = date(2025, 1, 1)
+DAYS = [(START + timedelta(days=i)).isoformat() for i in range(60)]
+PICKS = ["2026:1:1", "2026:2:2", "2027:1:3"]
+
+
+def _ledger(seed: int) -> pl.DataFrame:
+    """Disjoint stints per asset over two franchises."""
+    rng = random.Random(seed)
+    rows = []
+    for atype, aid in [("player", f"p{i}") for i in range(6)] + [("pick", a) for a in PICKS]:
+        t = rng.randint(0, 5)
+        while t < 55:
+            end = t + rng.randint(3, 15)
+            open_ = end >= 55
+            rows.append((f"L_{rng.randint(1, 2)}", atype, aid, DAYS[t], None if open_ else DAYS[end], open_))
+            t = end + rng.randint(0, 4)
+    return pl.DataFrame(rows, schema=changes_mod.LEDGER_COLS, orient="row")
+
+
+def _values(seed: int, through: int) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Player values every 4th day and 2026 pick values from day 20, up to day ``through``;
+    the 2027 class is never priced."""
+    rng = random.Random(seed)
+    pv = pl.DataFrame([(date.fromisoformat(DAYS[d]), f"p{i}", rng.choice([0, rng.randint(1, 9000)]))
+                       for d in range(0, through + 1, 4) for i in range(5)],
+                      schema={"valuation_date": pl.Date, "player_id": pl.Utf8, "value": pl.Int64}, orient="row")
+    rng = random.Random(seed + 1000)
+    pk = pl.DataFrame([("2026", r, date.fromisoformat(DAYS[d]), rng.randint(100, 3000))
+                       for d in range(20, through + 1, 7) for r in (1, 2)],
+                      schema={"season": pl.Utf8, "round": pl.Int64, "valuation_date": pl.Date,
+                              "value": pl.Int64}, orient="row")
+    return pv, pk
+
+
+def _slow(ledger, dates, pv, pk) -> set:
+    """(date, franchise, asset, value) by a per-date scan."""
+    out = set()
+    for d in dates:
+        on = date.fromisoformat(d)
+        held = ledger.filter((pl.col("valid_from") <= d) & (pl.col("valid_to").is_null() | (pl.col("valid_to") > d)))
+        for r in held.iter_rows(named=True):
+            if r["asset_type"] == "player":
+                s = pv.filter((pl.col("player_id") == r["asset_id"]) & (pl.col("value") > 0))
+            else:
+                season, rnd, _ = r["asset_id"].split(":")
+                s = pk.filter((pl.col("season") == season) & (pl.col("round") == int(rnd)))
+            known = s.filter(pl.col("valuation_date") <= on).sort("valuation_date")
+            first = s.sort("valuation_date")["value"].head(1).to_list()
+            if known.height:
+                value = known["value"][-1]
+            else:
+                value = first[0] if first and r["asset_type"] == "pick" else None
+            out.add((on, r["franchise_id"], r["asset_id"], value))
+    return out
+
+
+def _rows(cube) -> set:
+    return {(r["date"], r["franchise_id"], r["asset_id"], r["value"])
+            for r in cube.rows.with_columns(pl.col("franchise_id", "asset_id").cast(pl.Utf8)).iter_rows(named=True)}
+
+
+def _same(a, b) -> bool:
+    return _rows(a) == _rows(b) and a.team_values().equals(b.team_values())
+
+
+@pytest.mark.parametrize("seed", range(4))
+class TestValueCube:
+    def test_rows_match_per_date_scan(self, seed):
+        ledger, (pv, pk) = _ledger(seed), _values(seed, 59)
+        grid = DAYS[::3]
+        cube = ValueCube.build(ledger, grid, pv, pk, chunk_days=4)
+        assert _rows(cube) == _slow(ledger, grid, pv, pk)
+        assert cube.dates == grid
+
+    def test_team_sums(self, seed):
+        ledger, (pv, pk) = _ledger(seed), _values(seed, 59)
+        cube = ValueCube.build(ledger, DAYS[::5], pv, pk)
+        tv = cube.team_values()
+        rows = cube.rows.with_columns(pl.col("franchise_id").cast(pl.Utf8))
+        for r in tv.sample(5, seed=seed).iter_rows(named=True):
+            mine = rows.filter((pl.col("franchise_id") == r["franchise_id"]) & (pl.col("date") == r["date"]))
+            players = mine.filter(pl.col("asset_type") == "player")["value"]
+            assert r["player_value"] == players.fill_null(0).sum()
+            assert r["n_player"] == (players > 0).sum()
+            assert r["total_value"] == r["player_value"] + r["pick_value"]
+        got = cube.team_values(DAYS[20:30:5])["date"].unique().sort().to_list()
+        assert got == [START + timedelta(days=20), START + timedelta(days=25)]
+
+    def test_update_equals_rebuild(self, seed, monkeypatch):
+        old, new = _ledger(seed), _ledger(seed + 100)
+        pv0, pk0 = _values(seed, 40)
+        pv1, pk1 = _values(seed, 59)            # same history through day 40, newer dates after
+        cube = ValueCube.build(old, DAYS[:45:3], pv0, pk0, ledger_version=1)
+        grid = DAYS[6::3]                       # drops the first dates, adds later ones
+        changes = changes_mod.ledger_changes(old, new).collect()
+        valued = []
+        value_rows = mod._value_rows
+        monkeypatch.setattr(mod, "_value_rows", lambda led, g, *a: valued.append(g.len()) or value_rows(led, g, *a))
+        got = cube.update(new, grid, pv1, pk1, changes=changes, ledger_version=2, chunk_days=4)
+        # moved assets over the kept dates (through day 40), then the new and provisional ones
+        assert valued == [len(DAYS[6:41:3]), len(grid) - len(DAYS[6:41:3])]
+        want = ValueCube.build(new, grid, pv1, pk1, ledger_version=2)
+        assert _same(got, want)
+        assert got.meta == want.meta
+
+    def test_restated_values_or_missing_feed_rebuild(self, seed):
+        ledger, (pv, pk) = _ledger(seed), _values(seed, 59)
+        cube = ValueCube.build(ledger, DAYS[::4], pv, pk, ledger_version=1)
+        restated = pv.with_columns(pl.when(pl.col("valuation_date") == START).then(pl.col("value") + 1)
+                                   .otherwise("value").alias("value"))
+        assert _same(cube.update(ledger, DAYS[::4], restated, pk, ledger_version=1),
+                     ValueCube.build(ledger, DAYS[::4], restated, pk))
+        other = _ledger(seed + 1)
+        assert _same(cube.update(other, DAYS[::4], pv, pk, ledger_version=2),
+                     ValueCube.build(other, DAYS[::4], pv, pk))
+
+    def test_is_current_and_save_load(self, seed, tmp_path):
+        ledger, (pv, pk) = _ledger(seed), _values(seed, 59)
+        cube = ValueCube.build(ledger, DAYS[::4], pv, pk, ledger_version=3, lens="ktc_SF_Standard")
+        assert cube.is_current(DAYS[::4], pv, pk, 3)
+        assert not cube.is_current(DAYS[::4], pv, pk, 4)
+        assert not cube.is_current(DAYS[::2], pv, pk, 3)
+        back = ValueCube.load(cube.save(tmp_path / "cube"))
+        assert _same(back, cube) and back.meta == cube.meta
+        assert back.on(DAYS[20:21]).height == cube.on(DAYS[20:21]).height > 0
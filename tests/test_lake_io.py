@@ -0,0 +1,380 @@
+"""data_engineering/*/lake_io.py — the shared bronze writer.
+
+The module is vendored into every pipeline root (each is its own Docker build context), so
+the first test guards the copies against drift; the rest exercise one copy.
+"""
+import json
+import os
+
+import polars as pl
+import pytest
+
+from tests.de_loader import DE, load_de_module
+
+mod = load_de_module("sleeper_ingestion/lake_io.py", "sleeper_ingestion", "lake_io")
+
+URI = "gs://b/bronze/sleeper/rosters/roster_players/daily/load_date=2025-01-01/data.parquet"
+
+
+def test_vendored_copies_are_identical():
+    copies = sorted(DE.glob("*/lake_io.py"))
+    assert len(copies) >= 4
+    reference = copies[0].read_bytes()
+    drifted = [str(p.relative_to(DE)) for p in copies if p.read_bytes() != reference]
+    assert drifted == []
+
+
+class TestPaths:
+    def test_entity_root_stops_at_first_hive_segment(self):
+        assert mod.entity_root(URI.removeprefix("gs://b/")) == \
+            "bronze/sleeper/rosters/roster_players/daily"
+
+    def test_entity_root_without_partitions_is_parent_dir(self):
+        assert mod.entity_root("bronze/x/y/data.parquet") == "bronze/x/y"
+
+    def test_sort_keys_longest_prefix_restricted_to_columns(self):
+        name = URI.removeprefix("gs://b/")
+        assert mod.sort_keys_for(name, ["player_id", "league_id"]) == ["league_id", "player_id"]
+        assert mod.sort_keys_for("bronze/sleeper/rosters/daily/load_date=x/data.parquet",
+                                 ["roster_id", "league_id"]) == ["league_id", "roster_id"]
+
+    def test_unregistered_entity_is_unsorted(self):
+        assert mod.sort_keys_for("bronze/other/load_date=x/data.parquet", ["a"]) == []
+
+    def test_split_rejects_non_gs(self):
+        with pytest.raises(ValueError):
+            mod.split_gs_uri("/tmp/data.parquet")
+
+
+class TestWriteBronze:
+    def _df(self):
+        return pl.DataFrame({"league_id": ["2", "1", "1"], "roster_id": [1, 2, 1],
+                             "player_id": ["p", "q", "r"]})
+
+    def test_commits_sorted_object_without_staging_leftovers(self, fake_gcs):
+        mod.write_bronze(self._df(), URI)
+        assert set(fake_gcs) == {URI}
+        out = fake_gcs[URI]
+        assert out["league_id"].to_list() == ["1", "1", "2"]
+        assert out["roster_id"].to_list() == [1, 2, 1]
+        assert not any(mod.STAGING_SUFFIX in k for k in fake_gcs.gcs.raw)
+
+    def test_records_manifest_entry(self, fake_gcs):
+        df = self._df()
+        entry = mod.write_bronze(df, URI)
+        manifest_key = "gs://b/bronze/sleeper/rosters/roster_players/daily/_manifest.json"
+        manifest = json.loads(fake_gcs.gcs.raw[manifest_key])
+        rec = manifest["partitions"]["load_date=2025-01-01/data.parquet"]
+        assert rec["rows"] == 3
+        assert rec["schema_hash"] == mod.schema_hash(df.schema) == entry["schema_hash"]
+        assert rec["generation"] == fake_gcs.gcs.generation(URI)
+
+    def test_manifest_accumulates_partitions(self, fake_gcs):
+        mod.write_bronze(self._df(), URI)
+        mod.write_bronze(self._df(), URI.replace("2025-01-01", "2025-01-02"))
+        manifest_key = "gs://b/bronze/sleeper/rosters/roster_players/daily/_manifest.json"
+        assert len(json.loads(fake_gcs.gcs.raw[manifest_key])["partitions"]) == 2
+
+    def test_explicit_sort_by_overrides_registry(self, fake_gcs):
+        mod.write_bronze(self._df(), URI, sort_by=["player_id"])
+        assert fake_gcs[URI]["player_id"].to_list() == ["p", "q", "r"]
+
+
+ROOT = "bronze/sleeper/drafts/drafts"
+
+
+def _seed(fake_gcs, *dates, root=ROOT):
+    for d in dates:
+        fake_gcs[f"gs://b/{root}/load_date={d}/data.parquet"] = pl.DataFrame({"draft_id": [d]})
+
+
+def _manifest(fake_gcs, root=ROOT):
+    return json.loads(fake_gcs.gcs.raw[f"gs://b/{root}/{mod.MANIFEST_NAME}"])
+
+
+class TestManifestIndex:
+    def test_write_sets_latest_pointer(self, fake_gcs):
+        _seed(fake_gcs, "2025-01-03")
+        mod.write_bronze(pl.DataFrame({"draft_id": ["x"]}),
+                         f"gs://b/{ROOT}/load_date=2025-01-01/data.parquet")
+        assert _manifest(fake_gcs)["latest"] == "load_date=2025-01-03/data.parquet"
+
+    def test_first_write_seeds_manifest_with_existing_partitions(self, fake_gcs):
+        _seed(fake_gcs, "2025-01-01", "2025-01-02")
+        mod.write_bronze(pl.DataFrame({"draft_id": ["x"]}),
+                         f"gs://b/{ROOT}/load_date=2025-01-05/data.parquet")
+        assert sorted(_manifest(fake_gcs)["partitions"]) == [
+            f"load_date=2025-01-0{d}/data.parquet" for d in (1, 2, 5)]
+
+    def test_missing_manifest_is_rebuilt_from_listing_and_saved(self, fake_gcs):
+        _seed(fake_gcs, "2025-01-01", "2025-02-01")
+        bucket = mod.get_bucket("b")
+        assert mod.latest_object(bucket, f"{ROOT}/") == f"{ROOT}/load_date=2025-02-01/data.parquet"
+        assert _manifest(fake_gcs)["latest"] == "load_date=2025-02-01/data.parquet"
+
+    def test_reads_do_not_list_once_manifest_exists(self, fake_gcs, monkeypatch):
+        _seed(fake_gcs, "2025-01-01")
+        bucket = mod.get_bucket("b")
+        mod.partition_objects(bucket, f"{ROOT}/")                     # builds the manifest
+        _seed(fake_gcs, "2025-03-01")                                 # bypasses the writer
+
+        def no_listing(*a, **k):
+            raise AssertionError("listed the prefix")
+        monkeypatch.setattr(type(bucket), "list_blobs", no_listing)
+        assert mod.partition_objects(bucket, f"{ROOT}/") == [f"{ROOT}/load_date=2025-01-01/data.parquet"]
+
+    def test_partition_prefix_filters_within_entity(self, fake_gcs):
+        _seed(fake_gcs, "2024-12-31", "2025-01-01")
+        names = mod.partition_objects(mod.get_bucket("b"), f"{ROOT}/load_date=2025")
+        assert names == [f"{ROOT}/load_date=2025-01-01/data.parquet"]
+
+    def test_nested_entities_are_kept_apart(self, fake_gcs):
+        _seed(fake_gcs, "2025-01-01", root="bronze/ktc/dynasty/full_load")
+        fake_gcs["gs://b/bronze/ktc/dynasty/full_load/errors/load_date=2025-02-01/e.parquet"] = \
+            pl.DataFrame({"e": [1]})
+        assert mod.latest_object(mod.get_bucket("b"), "bronze/ktc/dynasty/full_load/") == \
+            "bronze/ktc/dynasty/full_load/load_date=2025-01-01/data.parquet"
+
+    def test_file_level_partitions(self, fake_gcs):
+        root = "bronze/sleeper/transactions/commission_overrides"
+        for d in ("2025-01-01", "2025-06-01"):
+            fake_gcs[f"gs://b/{root}/load_date={d}.parquet"] = pl.DataFrame({"x": [1]})
+        assert mod.latest_object(mod.get_bucket("b"), f"{root}/") == f"{root}/load_date=2025-06-01.parquet"
+
+    def test_empty_prefix(self, fake_gcs):
+        bucket = mod.get_bucket("b")
+        assert mod.latest_object(bucket, f"{ROOT}/") is None
+        assert mod.partition_objects(bucket, f"{ROOT}/") == []
+        assert f"gs://b/{ROOT}/{mod.MANIFEST_NAME}" not in fake_gcs.gcs.raw
+
+
+class TestReadObjects:
+    def _seed(self, fake_gcs):
+        root = "bronze/fantasycalc/values/daily"
+        names = []
+        for i, d in enumerate(("2025-01-01", "2025-01-02", "2025-01-03")):
+            name = f"{root}/load_date={d}/data.parquet"
+            fake_gcs[f"gs://b/{name}"] = pl.DataFrame(
+                {"name": [f"p{i}", "2026 1st"], "position": ["WR", "PICK"], "value": [i, 10 + i]})
+            names.append(name)
+        return names
+
+    def test_concats_in_name_order_with_hive_columns(self, fake_gcs):
+        names = self._seed(fake_gcs)
+        out = mod.read_objects("b", list(reversed(names)), max_workers=3)
+        assert out.height == 6
+        assert out["load_date"].to_list()[::2] == ["2025-01-03", "2025-01-02", "2025-01-01"]
+
+    def test_projection_and_predicate(self, fake_gcs):
+        names = self._seed(fake_gcs)
+        out = mod.read_objects("b", names, columns=["value", "load_date"],
+                               predicate=pl.col("position") == "PICK")
+        assert out.columns == ["value", "load_date"]
+        assert out["value"].to_list() == [10, 11, 12]
+
+    def test_file_columns_win_over_hive_and_hive_can_be_disabled(self, fake_gcs):
+        name = "bronze/x/load_date=2025-01-01/data.parquet"
+        fake_gcs[f"gs://b/{name}"] = pl.DataFrame({"load_date": ["own"]})
+        assert mod.read_objects("b", [name])["load_date"].to_list() == ["own"]
+        fake_gcs[f"gs://b/{name}"] = pl.DataFrame({"a": [1]})
+        assert mod.read_objects("b", [name], hive_columns=False).columns == ["a"]
+
+    def test_file_level_hive_value_drops_extension(self):
+        assert mod.hive_values("x/league_id=1/load_date=2025-01-01.parquet") == {
+            "league_id": "1", "load_date": "2025-01-01"}
+
+    def test_no_objects(self, fake_gcs):
+        assert mod.read_objects("b", []).is_empty()
+
+
+class TestReadCache:
+    NAME = "bronze/fantasycalc/values/daily/load_date=2025-01-01/data.parquet"
+
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch, fake_gcs):
+        monkeypatch.setenv(mod.CACHE_DIR_ENV, str(tmp_path))
+        mod.reset_cache_stats()
+        fake_gcs[f"gs://b/{self.NAME}"] = pl.DataFrame({"v": [1]})
+        return tmp_path
+
+    def test_second_read_is_a_hit(self, cache, fake_gcs):
+        assert mod.read_objects("b", [self.NAME])["v"].to_list() == [1]
+        assert mod.read_objects("b", [self.NAME])["v"].to_list() == [1]
+        stats = mod.cache_stats()
+        assert (stats["misses"], stats["hits"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_new_generation_is_refetched_and_old_entry_dropped(self, cache, fake_gcs):
+        mod.read_objects("b", [self.NAME])
+        fake_gcs.gcs.put(f"gs://b/{self.NAME}", pl.DataFrame({"v": [2]}))
+        assert mod.read_objects("b", [self.NAME])["v"].to_list() == [2]
+        assert mod.cache_stats()["misses"] == 2
+        assert len(list(cache.rglob("data.parquet@*"))) == 1
+
+    def test_lru_eviction_keeps_recently_read(self, cache, fake_gcs):
+        other = self.NAME.replace("01-01", "01-02")
+        fake_gcs[f"gs://b/{other}"] = pl.DataFrame({"v": [3]})
+        mod.read_objects("b", [self.NAME, other])
+        entries = sorted(cache.rglob("*@*"))
+        keep = entries[0]
+        os.utime(entries[1], (1, 1))                       # 01-02 entry is least recently used
+        assert mod.evict_cache(max_bytes=keep.stat().st_size) == 1
+        assert list(cache.rglob("*@*")) == [keep]
+        assert mod.cache_stats()["evictions"] == 1
+
+    def test_cache_walked_once_then_only_past_the_cap(self, cache, fake_gcs, monkeypatch):
+        other = self.NAME.replace("01-01", "01-02")
+        fake_gcs[f"gs://b/{other}"] = pl.DataFrame({"v": [3]})
+        monkeypatch.setattr(mod, "_cache_bytes", {})
+        walks, evict = [], mod.evict_cache
+        monkeypatch.setattr(mod, "evict_cache", lambda *a, **k: walks.append(1) or evict(*a, **k))
+        for names in ([self.NAME], [self.NAME], [other]):
+            mod.read_objects("b", names)
+        assert len(walks) == 1                       # later reads keep a running total
+        assert mod._cache_bytes[cache] == sum(p.stat().st_size for p in cache.rglob("*@*"))
+        fake_gcs.gcs.put(f"gs://b/{other}", pl.DataFrame({"v": [4, 5]}))   # replaces its entry
+        mod.read_objects("b", [other])
+        assert mod._cache_bytes[cache] == sum(p.stat().st_size for p in cache.rglob("*@*"))
+        monkeypatch.setenv(mod.CACHE_MAX_BYTES_ENV, "1")
+        fake_gcs.gcs.put(f"gs://b/{self.NAME}", pl.DataFrame({"v": [6]}))
+        mod.read_objects("b", [self.NAME])
+        assert len(walks) == 2 and not list(cache.rglob("*@*"))
+
+    def test_disabled_without_env(self, fake_gcs, monkeypatch):
+        monkeypatch.delenv(mod.CACHE_DIR_ENV, raising=False)
+        mod.reset_cache_stats()
+        fake_gcs[f"gs://b/{self.NAME}"] = pl.DataFrame({"v": [1]})
+        mod.read_objects("b", [self.NAME])
+        assert mod.cache_stats()["misses"] == 0
+
+
+class TestLocalBackend:
+    def test_gcs_is_the_default(self, monkeypatch):
+        monkeypatch.delenv(mod.STORAGE_ENV, raising=False)
+        assert mod.local_root() is None
+        assert mod.lake_uri("b", "silver/x") == "gs://b/silver/x"
+        assert mod.lake_uri("b") == "gs://b"
+
+    def test_uris_map_into_the_root(self, local_lake):
+        assert mod.resolve("gs://b/silver/x/data.parquet") == str(local_lake / "b/silver/x/data.parquet")
+        assert mod.resolve("/already/local") == "/already/local"
+
+    def test_write_bronze_commits_file_and_manifest(self, local_lake):
+        mod.write_bronze(pl.DataFrame({"draft_id": ["2", "1"]}),
+                         f"gs://b/{ROOT}/load_date=2025-01-01/data.parquet")
+        path = local_lake / "b" / ROOT / "load_date=2025-01-01" / "data.parquet"
+        assert pl.read_parquet(path)["draft_id"].to_list() == ["1", "2"]       # sort key applied
+        manifest = json.loads((local_lake / "b" / ROOT / mod.MANIFEST_NAME).read_text())
+        assert manifest["latest"] == "load_date=2025-01-01/data.parquet"
+        leftovers = [p.name for p in (local_lake / "b").rglob("*")
+                     if mod.STAGING_SUFFIX in p.name or p.name.endswith(".lock")]
+        assert leftovers == []
+
+    def test_readers_round_trip(self, local_lake):
+        for d in ("2025-01-01", "2025-01-02"):
+            mod.write_bronze(pl.DataFrame({"draft_id": [d]}), f"gs://b/{ROOT}/load_date={d}/data.parquet")
+        bucket = mod.get_bucket("b")
+        assert mod.latest_object(bucket, f"{ROOT}/") == f"{ROOT}/load_date=2025-01-02/data.parquet"
+        out = mod.read_objects("b", mod.partition_objects(bucket, f"{ROOT}/"))
+        assert out["draft_id"].to_list() == ["2025-01-01", "2025-01-02"]
+
+    def test_generation_changes_on_rewrite_and_guards_cas(self, local_lake):
+        from google.api_core.exceptions import PreconditionFailed
+
+        blob = mod.get_bucket("b").blob("x/_manifest.json")
+        blob.upload_from_string("{}", if_generation_match=0)
+        first = blob.generation
+        blob.upload_from_string('{"a": 1}', if_generation_match=first)
+        assert blob.generation != first
+        with pytest.raises(PreconditionFailed):
+            blob.upload_from_string("{}", if_generation_match=first)
+        assert blob.download_as_text() == '{"a": 1}'
+
+    def test_write_parquet_creates_directories(self, local_lake):
+        df = pl.DataFrame({"market_type": ["DYNASTY", "REDRAFT"], "v": [1, 2]})
+        mod.write_parquet(df, "gs://b/silver/fantasy/x/data.parquet")
+        mod.write_parquet(df, "gs://b/silver/fantasy/y", partition_by=["market_type"])
+        assert pl.read_parquet(mod.lake_uri("b", "silver/fantasy/x/data.parquet")).height == 2
+        assert (local_lake / "b/silver/fantasy/y/market_type=DYNASTY").is_dir()
+
+
+class TestScanDataset:
+    DF = pl.DataFrame({"market_type": ["DYNASTY", "DYNASTY", "REDRAFT"], "v": [1, 2, 3],
+                       "w": ["a", "b", "c"]})
+
+    def test_partitioned_dataset_prunes_partitions(self, local_lake):
+        mod.write_parquet(self.DF, "gs://b/silver/fantasy/x", partition_by=["market_type"])
+        # a filtered scan never opens the other partition, so a corrupt file there is harmless
+        for f in (local_lake / "b/silver/fantasy/x/market_type=REDRAFT").iterdir():
+            f.write_bytes(b"not parquet")
+        out = (mod.scan_dataset("gs://b/silver/fantasy/x")
+               .filter(pl.col("market_type") == "DYNASTY").select("v").collect())
+        assert sorted(out["v"].to_list()) == [1, 2]
+
+    def test_single_object(self, local_lake):
+        mod.write_parquet(self.DF, "gs://b/silver/fantasy/x")
+        out = (mod.scan_dataset("gs://b/silver/fantasy/x")
+               .filter(pl.col("market_type") == "REDRAFT").select("w").collect())
+        assert out.to_dict(as_series=False) == {"w": ["c"]}
+
+
+class TestWriteDataset:
+    def test_partitions_sorts_and_replaces(self, local_lake):
+        mod.write_parquet(pl.DataFrame({"old": [1]}), "gs://b/silver/fantasy/x")   # legacy object
+        df = pl.DataFrame({"market_type": ["DYNASTY"] * 4 + ["REDRAFT"],
+                           "qb_format": ["SF", "SF", "1QB", "SF", "SF"],
+                           "player_id": ["2", "1", "1", "1", "9"],
+                           "valuation_date": ["2025-01-02", "2025-01-01", "2025-01-01",
+                                              "2025-01-02", "2025-01-01"]})
+        mod.write_dataset(df, "gs://b/silver/fantasy/x", ["market_type", "qb_format"],
+                          ["player_id", "valuation_date"], row_group_size=1)
+        root = local_lake / "b/silver/fantasy/x"
+        assert sorted(p.parent.relative_to(root).as_posix() for p in root.rglob("*.parquet")) == [
+            "market_type=DYNASTY/qb_format=1QB", "market_type=DYNASTY/qb_format=SF",
+            "market_type=REDRAFT/qb_format=SF"]
+        (sf,) = (root / "market_type=DYNASTY/qb_format=SF").glob("*.parquet")
+        assert pl.read_parquet(sf)["player_id"].to_list() == ["1", "1", "2"]
+        import pyarrow.parquet as pq
+        meta = pq.ParquetFile(sf).metadata
+        assert meta.num_row_groups == 3 and meta.row_group(0).column(0).statistics.has_min_max
+
+        # a rewrite drops partitions that no longer exist
+        mod.write_dataset(df.filter(pl.col("market_type") == "DYNASTY"), "gs://b/silver/fantasy/x",
+                          ["market_type", "qb_format"], ["player_id", "valuation_date"])
+        assert not list((root / "market_type=REDRAFT").rglob("*.parquet"))
+        out = mod.scan_dataset("gs://b/silver/fantasy/x").filter(pl.col("qb_format") == "1QB").collect()
+        assert out.height == 1
+
+    def test_failed_write_leaves_the_old_dataset(self, local_lake, monkeypatch):
+        uri = "gs://b/silver/fantasy/x"
+        df = pl.DataFrame({"market_type": ["DYNASTY", "REDRAFT"], "v": [1, 2]})
+        mod.write_dataset(df, uri, ["market_type"], ["v"])
+        upload = mod._upload_with_retry
+        calls = []
+
+        def flaky(blob, path, name):
+            calls.append(name)
+            if len(calls) == 2:
+                raise OSError("connection reset")
+            upload(blob, path, name)
+
+        monkeypatch.setattr(mod, "_upload_with_retry", flaky)
+        with pytest.raises(OSError):
+            mod.write_dataset(df.with_columns(pl.col("v") * 10), uri, ["market_type"], ["v"])
+        assert sorted(mod.scan_dataset(uri).collect()["v"].to_list()) == [1, 2]
+        assert [p.name for p in (local_lake / "b/silver/fantasy").iterdir()] == ["x"]
+
+
+class TestSinkParquet:
+    def test_streams_plan_over_the_object_it_replaces(self, local_lake):
+        uri = "gs://b/silver/fantasy/ledger"
+        mod.write_parquet(pl.DataFrame({"k": [3, 1, 2], "v": ["c", "a", "b"]}), uri)
+        lf = mod.scan_dataset(uri).filter(pl.col("k") > 1).sort("k")
+        mod.sink_parquet(lf, uri)
+        assert mod.scan_dataset(uri).collect().to_dict(as_series=False) == {"k": [2, 3], "v": ["b", "c"]}
+        assert not [p for p in (local_lake / "b/silver/fantasy").iterdir() if p.name != "ledger"]
+
+    def test_plain_local_path(self, tmp_path):
+        out = tmp_path / "nested" / "ledger.parquet"
+        mod.sink_parquet(pl.LazyFrame({"k": [1]}), str(out))
+        assert pl.read_parquet(out)["k"].to_list() == [1]
+        assert [p.name for p in out.parent.iterdir()] == ["ledger.parquet"]